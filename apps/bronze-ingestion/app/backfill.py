@@ -0,0 +1,109 @@
+"""
+Checkpoint manifest for resumable multi-date bronze backfills.
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from botocore.exceptions import ClientError
+from hoopstat_observability import get_logger
+
+from .s3_manager import BronzeS3Manager
+
+logger = get_logger(__name__)
+
+
+def date_range(start_date: date, end_date: date) -> list[date]:
+    """Return every date from start_date to end_date inclusive."""
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+
+
+class BackfillCheckpoint:
+    """
+    Progress manifest for a backfill over a date range.
+
+    Stored at ``_metadata/backfill/<start>-to-<end>.json`` so an interrupted
+    run over the same range resumes from the dates it had not finished.
+    A date is only marked complete once every one of its games was stored;
+    dates with failed games are retried on the next run.
+    """
+
+    def __init__(self, s3_manager: BronzeS3Manager, start_date: date, end_date: date):
+        """
+        Initialize the checkpoint for a date range.
+
+        Args:
+            s3_manager: S3 manager used to persist the manifest
+            start_date: First date of the backfill range
+            end_date: Last date of the backfill range
+        """
+        self.s3_manager = s3_manager
+        self.start_date = start_date
+        self.end_date = end_date
+        self.key = (
+            f"_metadata/backfill/{start_date.isoformat()}-to-{end_date.isoformat()}"
+            ".json"
+        )
+        self.completed_dates: set[str] = set()
+        self.failed_games: dict[str, list[str]] = {}
+
+    def load(self) -> None:
+        """Load existing progress from S3, if any."""
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=self.key
+            )
+            manifest = json.loads(response["Body"].read().decode("utf-8"))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            logger.info(f"No backfill checkpoint at {self.key}, starting fresh")
+            return
+
+        self.completed_dates = set(manifest.get("completed_dates", []))
+        self.failed_games = manifest.get("failed_games", {})
+        logger.info(
+            f"Resuming backfill from checkpoint {self.key}",
+            extra={
+                "completed_dates": len(self.completed_dates),
+                "dates_with_failures": len(self.failed_games),
+            },
+        )
+
+    def is_complete(self, target_date: date) -> bool:
+        """Check whether a date was fully ingested by an earlier run."""
+        return target_date.isoformat() in self.completed_dates
+
+    def record_date(self, target_date: date, failed_game_ids: list[str]) -> None:
+        """Record the outcome of ingesting a date."""
+        date_str = target_date.isoformat()
+        if failed_game_ids:
+            self.failed_games[date_str] = failed_game_ids
+            self.completed_dates.discard(date_str)
+        else:
+            self.failed_games.pop(date_str, None)
+            self.completed_dates.add(date_str)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the checkpoint manifest."""
+        return {
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "completed_dates": sorted(self.completed_dates),
+            "failed_games": self.failed_games,
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+        }
+
+    def save(self) -> None:
+        """Persist progress to S3."""
+        self.s3_manager.s3_client.put_object(
+            Bucket=self.s3_manager.bucket_name,
+            Key=self.key,
+            Body=json.dumps(self.to_dict(), indent=2).encode("utf-8"),
+            ContentType="application/json",
+        )
+        logger.debug(f"Saved backfill checkpoint to {self.key}")
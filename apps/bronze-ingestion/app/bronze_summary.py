@@ -3,33 +3,78 @@ Bronze layer summary manager for generating metadata and insights.
 """
 
 import json
+import threading
 from datetime import date, datetime
 from typing import Any
 
+from botocore.exceptions import ClientError
+from hoopstat_data.compression import (
+    COMPRESSION_GZIP,
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
 from hoopstat_observability import get_logger
 
+from .corrections import LEAGUE_METADATA_PREFIX
 from .s3_manager import BronzeS3Manager
 
 logger = get_logger(__name__)
 
+# Running manifest of exact per-entity totals of the raw/ objects
+MANIFEST_KEY = "_metadata/bronze_manifest.json"
+MANIFEST_VERSION = "2.0"
+
+# Attempts to apply a run's writes to a manifest other runs keep changing
+MAX_MANIFEST_ATTEMPTS = 5
+
+
+class ManifestConflictError(Exception):
+    """Raised when the manifest changed since it was read."""
+
+
+# Summary of the NBA; other leagues write _metadata/leagues/<league>/summary.json
+SUMMARY_KEY = "_metadata/summary.json"
+
+
+def summary_key(league: str | None = None) -> str:
+    """Get the key of a league's bronze summary; each one triggers silver."""
+    return f"{LEAGUE_METADATA_PREFIX}{league}/summary.json" if league else SUMMARY_KEY
+
 
 class BronzeSummaryManager:
-    """Manager for generating and storing bronze layer summary data."""
+    """
+    Manager for generating and storing bronze layer summary data.
+
+    Safe to share between league threads: updates are serialized, so each
+    run's write events are applied to the manifest exactly once. Separate
+    processes are kept apart by conditional writes of the manifest.
+    """
 
     def __init__(self, s3_manager: BronzeS3Manager):
         """Initialize the summary manager."""
         self.s3_manager = s3_manager
+        self._lock = threading.Lock()
 
     def generate_summary(
-        self, target_date: date, games_count: int, successful_box_scores: int
+        self,
+        target_date: date,
+        games_count: int,
+        successful_box_scores: int,
+        schedule_rows: int | None = None,
+        league: str | None = None,
     ) -> dict[str, Any]:
         """
         Generate comprehensive bronze layer summary data.
 
         Args:
             target_date: The date that was processed
-            games_count: Number of games found for the date
+            games_count: Number of unique games found for the date
             successful_box_scores: Number of box scores successfully ingested
+            schedule_rows: Number of schedule rows (one per team per game)
+                the games were collapsed from, if known
+            league: League the run ingested, or None for the NBA
 
         Returns:
             Dictionary containing bronze layer summary
@@ -50,11 +95,13 @@ class BronzeSummaryManager:
                 "summary_version": "1.0",
                 "generated_at": datetime.utcnow().isoformat() + "Z",
                 "bronze_layer_stats": {
+                    **({"league": league} if league else {}),
                     "last_ingestion_date": target_date.isoformat(),
                     "last_successful_run": datetime.utcnow().isoformat() + "Z",
                     "total_entities": len(bronze_stats["entities"]),
                     "entities": bronze_stats["entities"],
                     "data_quality": {
+                        "last_run_schedule_rows": schedule_rows,
                         "last_run_games_count": games_count,
                         "last_run_successful_box_scores": successful_box_scores,
                         "last_run_success_rate": round(box_score_success_rate, 2),
@@ -83,19 +130,20 @@ class BronzeSummaryManager:
             logger.error(f"Failed to generate bronze summary for {target_date}: {e}")
             raise
 
-    def store_summary(self, summary: dict[str, Any]) -> str:
+    def store_summary(self, summary: dict[str, Any], league: str | None = None) -> str:
         """
         Store bronze layer summary to S3.
 
         Args:
             summary: Summary data dictionary to store
+            league: League the summary is for, or None for the NBA
 
         Returns:
             S3 key where summary was stored
         """
         try:
             # Store summary at well-known location for easy access
-            key = "_metadata/summary.json"
+            key = summary_key(league)
 
             # Convert summary to JSON bytes
             summary_json = json.dumps(summary, indent=2, default=str)
@@ -124,24 +172,38 @@ class BronzeSummaryManager:
             raise
 
     def update_bronze_summary(
-        self, target_date: date, games_count: int, successful_box_scores: int
+        self,
+        target_date: date,
+        games_count: int,
+        successful_box_scores: int,
+        schedule_rows: int | None = None,
+        league: str | None = None,
     ) -> str:
         """
         Generate and store bronze layer summary in one operation.
 
         Args:
             target_date: The date that was processed
-            games_count: Number of games found for the date
+            games_count: Number of unique games found for the date
             successful_box_scores: Number of box scores successfully ingested
+            schedule_rows: Number of schedule rows (one per team per game)
+                the games were collapsed from, if known
+            league: League the run ingested, or None for the NBA
 
         Returns:
             S3 key where summary was stored
         """
         try:
-            summary = self.generate_summary(
-                target_date, games_count, successful_box_scores
-            )
-            key = self.store_summary(summary)
+            extra = {"league": league} if league else {}
+            with self._lock:
+                summary = self.generate_summary(
+                    target_date,
+                    games_count,
+                    successful_box_scores,
+                    schedule_rows,
+                    **extra,
+                )
+                key = self.store_summary(summary, **extra)
 
             logger.info(
                 f"Bronze layer summary updated successfully for {target_date}",
@@ -160,7 +222,18 @@ class BronzeSummaryManager:
 
     def _collect_bronze_statistics(self, target_date: date) -> dict[str, Any]:
         """
-        Collect current bronze layer statistics.
+        Collect current bronze layer statistics from the incremental manifest.
+
+        The manifest holds only per-entity totals. Writes recorded by the S3
+        manager since the last update carry the size of the object they
+        replaced, so they are applied as a delta and the cost is proportional
+        to this run's writes rather than to the size of the bronze layer. The
+        manifest is only built from a full listing of raw/ when it does not
+        exist yet.
+
+        The manifest is written back conditionally on the ETag it was read
+        with; if another run changed it in between, the delta is applied
+        again to a fresh read.
 
         Args:
             target_date: Reference date for statistics collection
@@ -169,38 +242,30 @@ class BronzeSummaryManager:
             Dictionary with entities and storage information
         """
         try:
-            # Get entities that have data for the target date
-            entities_for_date = self.s3_manager.list_entities_for_date(target_date)
-
-            # Collect statistics for each entity
-            entities_stats = {}
-            total_files = 0
-            estimated_size_mb = 0.0
-
-            for entity in entities_for_date:
-                entity_stats = self._get_entity_statistics(entity, target_date)
-                entities_stats[entity] = entity_stats
-                total_files += entity_stats["file_count"]
-                estimated_size_mb += entity_stats["estimated_size_mb"]
-
-            # Also check for any additional entities by scanning the raw/ prefix
-            all_entities = self._scan_all_entities()
-            for entity in all_entities:
-                if entity not in entities_stats:
-                    # This entity doesn't have data for target_date, but exists
-                    entity_stats = self._get_entity_latest_statistics(entity)
-                    if entity_stats:  # Only include if it has some data
-                        entities_stats[entity] = entity_stats
-                        total_files += entity_stats["file_count"]
-                        estimated_size_mb += entity_stats["estimated_size_mb"]
-
-            return {
-                "entities": entities_stats,
-                "storage_info": {
-                    "total_files": total_files,
-                    "estimated_size_mb": round(estimated_size_mb, 2),
-                },
-            }
+            events = self.s3_manager.get_write_events()
+            for attempt in range(1, MAX_MANIFEST_ATTEMPTS + 1):
+                manifest, etag = self._load_manifest()
+
+                if manifest is None:
+                    # The listing already includes this run's writes
+                    manifest = self._build_manifest_from_listing()
+                else:
+                    self._apply_write_events(manifest, events)
+
+                try:
+                    self._store_manifest(manifest, etag)
+                    break
+                except ManifestConflictError:
+                    if attempt == MAX_MANIFEST_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        "Bronze manifest changed while updating, retrying "
+                        f"({attempt}/{MAX_MANIFEST_ATTEMPTS})"
+                    )
+
+            self.s3_manager.clear_write_events(len(events))
+
+            return self._statistics_from_manifest(manifest)
 
         except Exception as e:
             logger.error(f"Failed to collect bronze statistics: {e}")
@@ -210,97 +275,167 @@ class BronzeSummaryManager:
                 "storage_info": {"total_files": 0, "estimated_size_mb": 0.0},
             }
 
-    def _get_entity_statistics(self, entity: str, target_date: date) -> dict[str, Any]:
-        """Get statistics for a specific entity on a specific date."""
-        try:
-            date_str = target_date.strftime("%Y-%m-%d")
-            prefix = f"raw/{entity}/{date_str}/"
+    def _load_manifest(self) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Load the bronze manifest.
 
-            # List objects for this entity/date combination
-            response = self.s3_manager.s3_client.list_objects_v2(
-                Bucket=self.s3_manager.bucket_name, Prefix=prefix
+        Returns:
+            Tuple of (manifest, ETag); (None, None) if it has not been built yet
+        """
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=MANIFEST_KEY
             )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                logger.info("No bronze manifest found, building it from a listing")
+                return None, None
+            raise
 
-            file_count = response.get("KeyCount", 0)
-            total_size = sum(obj.get("Size", 0) for obj in response.get("Contents", []))
-            size_mb = total_size / (1024 * 1024) if total_size > 0 else 0.0
-
-            # Get the latest modified time
-            last_modified = None
-            if response.get("Contents"):
-                last_modified = max(
-                    obj["LastModified"] for obj in response["Contents"]
-                ).isoformat()
+        manifest = decode_json(response["Body"].read(), object_encoding(response))
+        # Version 1.0 manifests also mapped every object to its size
+        manifest.pop("objects", None)
+        manifest["manifest_version"] = MANIFEST_VERSION
+        return manifest, response["ETag"]
 
-            return {
-                "last_updated": last_modified,
-                "file_count": file_count,
-                "estimated_size_mb": round(size_mb, 2),
-                "last_processed_date": target_date.isoformat(),
-            }
+    def _store_manifest(self, manifest: dict[str, Any], etag: str | None) -> None:
+        """
+        Store the bronze manifest as compact, gzip-compressed JSON.
 
-        except Exception as e:
-            logger.warning(f"Failed to get statistics for entity {entity}: {e}")
-            return {
-                "last_updated": None,
-                "file_count": 0,
-                "estimated_size_mb": 0.0,
-                "last_processed_date": target_date.isoformat(),
-            }
+        Args:
+            manifest: Manifest to store
+            etag: ETag the manifest was read with, or None if it did not exist
 
-    def _get_entity_latest_statistics(self, entity: str) -> dict[str, Any] | None:
-        """Get latest statistics for an entity (no target_date data)."""
+        Raises:
+            ManifestConflictError: If the manifest changed since it was read
+        """
+        manifest["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
         try:
-            prefix = f"raw/{entity}/"
-
-            # List objects for this entity
-            response = self.s3_manager.s3_client.list_objects_v2(
+            self.s3_manager.s3_client.put_object(
                 Bucket=self.s3_manager.bucket_name,
-                Prefix=prefix,
-                MaxKeys=100,  # Limit to avoid expensive calls
+                Key=MANIFEST_KEY,
+                Body=encode_json(manifest, COMPRESSION_GZIP),
+                ContentType="application/json",
+                **storage_put_args(COMPRESSION_GZIP, {"type": "bronze_layer_manifest"}),
+                **condition,
             )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ):
+                raise ManifestConflictError(
+                    "Bronze manifest changed while it was being updated"
+                ) from e
+            raise
 
-            if not response.get("Contents"):
-                return None
-
-            file_count = response.get("KeyCount", 0)
-            total_size = sum(obj.get("Size", 0) for obj in response.get("Contents", []))
-            size_mb = total_size / (1024 * 1024) if total_size > 0 else 0.0
-
-            # Get the latest modified time
-            last_modified = max(
-                obj["LastModified"] for obj in response["Contents"]
-            ).isoformat()
-
-            return {
-                "last_updated": last_modified,
-                "file_count": file_count,
-                "estimated_size_mb": round(size_mb, 2),
-                "last_processed_date": None,  # No data for current target date
-            }
-
-        except Exception as e:
-            logger.warning(f"Failed to get latest statistics for entity {entity}: {e}")
-            return None
-
-    def _scan_all_entities(self) -> list[str]:
-        """Scan for all entities in the bronze layer."""
-        try:
-            prefix = "raw/"
-
-            response = self.s3_manager.s3_client.list_objects_v2(
-                Bucket=self.s3_manager.bucket_name, Prefix=prefix, Delimiter="/"
+    @staticmethod
+    def _new_manifest() -> dict[str, Any]:
+        """Create an empty manifest."""
+        return {"manifest_version": MANIFEST_VERSION, "entities": {}}
+
+    @staticmethod
+    def _record_object(
+        manifest: dict[str, Any],
+        entity: str,
+        date_str: str,
+        size: int,
+        previous_size: int | None,
+        written_at: str | None,
+    ) -> None:
+        """Add one object write to the manifest, keeping totals exact."""
+        stats = manifest["entities"].setdefault(
+            entity,
+            {
+                "file_count": 0,
+                "size_bytes": 0,
+                "last_updated": None,
+                "last_processed_date": None,
+            },
+        )
+
+        if previous_size is None:
+            stats["file_count"] += 1
+            stats["size_bytes"] += size
+        else:
+            # Overwrite of an existing object
+            stats["size_bytes"] += size - previous_size
+
+        if written_at and (
+            stats["last_updated"] is None or written_at > stats["last_updated"]
+        ):
+            stats["last_updated"] = written_at
+        if (
+            stats["last_processed_date"] is None
+            or date_str > stats["last_processed_date"]
+        ):
+            stats["last_processed_date"] = date_str
+
+    def _apply_write_events(
+        self, manifest: dict[str, Any], events: list[dict[str, Any]]
+    ) -> None:
+        """Apply this run's write events to the manifest's totals."""
+        for event in events:
+            self._record_object(
+                manifest,
+                event["entity"],
+                event["date"],
+                event["size"],
+                event["previous_size"],
+                event["written_at"],
             )
 
-            entities = []
-            for common_prefix in response.get("CommonPrefixes", []):
-                entity_prefix = common_prefix["Prefix"]
-                # Extract entity name from prefix like "raw/schedule/"
-                entity = entity_prefix.replace("raw/", "").rstrip("/")
-                entities.append(entity)
-
-            return entities
-
-        except Exception as e:
-            logger.warning(f"Failed to scan all entities: {e}")
-            return []
+    def _build_manifest_from_listing(self) -> dict[str, Any]:
+        """Build the manifest from one full paginated listing of raw/."""
+        manifest = self._new_manifest()
+        paginator = self.s3_manager.s3_client.get_paginator("list_objects_v2")
+
+        for page in paginator.paginate(
+            Bucket=self.s3_manager.bucket_name, Prefix="raw/"
+        ):
+            for obj in page.get("Contents", []):
+                # Key format: raw/[<league>/]<entity>/YYYY-MM-DD/<file>
+                parts = obj["Key"].split("/")
+                if len(parts) not in (4, 5):
+                    continue
+                entity = "/".join(parts[1:-2])
+                date_str = parts[-2]
+                last_modified = obj.get("LastModified")
+                self._record_object(
+                    manifest,
+                    entity,
+                    date_str,
+                    obj.get("Size", 0),
+                    None,
+                    last_modified.isoformat() if last_modified else None,
+                )
+
+        return manifest
+
+    @staticmethod
+    def _statistics_from_manifest(manifest: dict[str, Any]) -> dict[str, Any]:
+        """Convert manifest totals into the summary's statistics format."""
+        entities_stats = {}
+        total_files = 0
+        total_size = 0
+
+        for entity, stats in sorted(manifest["entities"].items()):
+            entities_stats[entity] = {
+                "last_updated": stats["last_updated"],
+                "file_count": stats["file_count"],
+                "size_bytes": stats["size_bytes"],
+                "estimated_size_mb": round(stats["size_bytes"] / (1024 * 1024), 2),
+                "last_processed_date": stats["last_processed_date"],
+            }
+            total_files += stats["file_count"]
+            total_size += stats["size_bytes"]
+
+        return {
+            "entities": entities_stats,
+            "storage_info": {
+                "total_files": total_files,
+                "total_size_bytes": total_size,
+                "estimated_size_mb": round(total_size / (1024 * 1024), 2),
+            },
+        }
@@ -0,0 +1,561 @@
+"""
+Compiled single-pass validation for NBA API responses.
+
+The JSON schemas in ``schemas.py`` are compiled once into a tree of checker
+functions. Domain checks (game counts, date consistency, game IDs, result set
+row widths, player counts) are attached to schema locations as hooks, so a
+payload is shape-checked, measured and domain-checked in a single traversal.
+Problems are reported as structured issues with stable codes rather than
+free text.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from typing import Any
+
+from hoopstat_data.validation import validate_game_stats
+
+from .schemas import get_schema
+
+
+class IssueCode(Enum):
+    """Stable codes for validation issues."""
+
+    # Shape problems found by the compiled schema
+    MISSING_FIELD = "missing_field"
+    WRONG_TYPE = "wrong_type"
+    INVALID_FORMAT = "invalid_format"
+    OUT_OF_RANGE = "out_of_range"
+    TOO_FEW_ITEMS = "too_few_items"
+    UNKNOWN_FORMAT = "unknown_format"
+
+    # Domain checks
+    ROW_LENGTH_MISMATCH = "row_length_mismatch"
+    INVALID_GAME_ID = "invalid_game_id"
+    GAME_ID_MISMATCH = "game_id_mismatch"
+    DATE_INCONSISTENT = "date_inconsistent"
+    FEWER_GAMES_THAN_EXPECTED = "fewer_games_than_expected"
+    UNREALISTIC_VALUE = "unrealistic_value"
+    GAME_VALIDATION_FAILED = "game_validation_failed"
+
+    # The validator itself failed on an unexpected payload
+    VALIDATION_ERROR = "validation_error"
+
+
+# Codes that mean the payload does not have the expected shape
+SCHEMA_ISSUE_CODES = frozenset(
+    {
+        IssueCode.MISSING_FIELD,
+        IssueCode.WRONG_TYPE,
+        IssueCode.INVALID_FORMAT,
+        IssueCode.OUT_OF_RANGE,
+        IssueCode.TOO_FEW_ITEMS,
+        IssueCode.UNKNOWN_FORMAT,
+        IssueCode.VALIDATION_ERROR,
+    }
+)
+
+# Maximum row width mismatches reported per result set
+_MAX_ROW_ISSUES = 3
+
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+_NUMERIC_TYPES = (int, float)
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A single validation problem at a location in the payload."""
+
+    code: IssueCode
+    path: str
+    message: str
+
+    def to_dict(self) -> dict[str, str]:
+        """Convert to a JSON-serializable dictionary."""
+        return {"code": self.code.value, "path": self.path, "message": self.message}
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating one payload."""
+
+    issues: list[ValidationIssue] = field(default_factory=list)
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def schema_valid(self) -> bool:
+        """Whether the payload has the expected shape."""
+        return not any(issue.code in SCHEMA_ISSUE_CODES for issue in self.issues)
+
+    @property
+    def codes(self) -> list[str]:
+        """Issue codes in the order the issues were found."""
+        return [issue.code.value for issue in self.issues]
+
+
+class _Run:
+    """Mutable state for one validation traversal."""
+
+    __slots__ = ("context", "issues", "metrics", "scratch")
+
+    def __init__(self, context: dict[str, Any]):
+        self.context = context
+        self.issues: list[ValidationIssue] = []
+        self.metrics: dict[str, Any] = {}
+        self.scratch: dict[str, Any] = {}
+
+    def add(self, code: IssueCode, path: str, message: str) -> None:
+        self.issues.append(ValidationIssue(code, path or "/", message))
+
+    def add_schema(self, code: IssueCode, path: str, detail: str) -> None:
+        path = path or "/"
+        self.issues.append(
+            ValidationIssue(code, path, f"Schema validation failed at {path}: {detail}")
+        )
+
+    def has_schema_issues(self) -> bool:
+        return any(issue.code in SCHEMA_ISSUE_CODES for issue in self.issues)
+
+    def fork(self) -> "_Run":
+        return _Run(self.context)
+
+    def merge(self, other: "_Run") -> None:
+        self.issues.extend(other.issues)
+        self.metrics.update(other.metrics)
+        self.scratch.update(other.scratch)
+
+
+Checker = Callable[[Any, str, _Run], None]
+Hook = Callable[[Any, str, _Run], None]
+
+
+def _compile(schema: dict[str, Any], pointer: str, hooks: dict[str, Hook]) -> Checker:
+    """
+    Compile a JSON schema node into a checker function.
+
+    Supports the keywords used by ``schemas.py``: type, enum, required,
+    properties, items, minItems, minimum, maximum, minLength, maxLength,
+    pattern and oneOf. ``pointer`` is the node's location with ``*`` for
+    array items and selects the hook run on values at that location.
+    """
+    if "oneOf" in schema:
+        return _compile_one_of(schema, pointer, hooks)
+
+    type_names = schema.get("type")
+    if isinstance(type_names, str):
+        type_names = [type_names]
+    allowed = (
+        tuple(t for name in type_names for t in _JSON_TYPES[name])
+        if type_names
+        else None
+    )
+    expected = " or ".join(type_names) if type_names else ""
+    # Like jsonschema, a whole-number float such as 5.0 is an integer
+    integral_floats = allowed is not None and "integer" in type_names
+
+    enum = schema.get("enum")
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    has_string_checks = (
+        min_length is not None or max_length is not None or pattern is not None
+    )
+    has_range_checks = minimum is not None or maximum is not None
+
+    required = tuple(schema.get("required", ()))
+    properties = tuple(
+        (name, f"/{name}", _compile(sub, f"{pointer}/{name}", hooks))
+        for name, sub in schema.get("properties", {}).items()
+    )
+    items = (
+        _compile(schema["items"], f"{pointer}/*", hooks) if "items" in schema else None
+    )
+    min_items = schema.get("minItems")
+    hook = hooks.get(pointer)
+
+    def check(value: Any, path: str, run: _Run) -> None:
+        value_type = type(value)
+        # Exact type match: JSON booleans must not pass as integers
+        if (
+            allowed is not None
+            and value_type not in allowed
+            and not (integral_floats and value_type is float and value.is_integer())
+        ):
+            run.add_schema(
+                IssueCode.WRONG_TYPE,
+                path,
+                f"expected {expected}, got {value_type.__name__}",
+            )
+            return
+
+        if enum is not None and value not in enum:
+            run.add_schema(
+                IssueCode.INVALID_FORMAT, path, f"{value!r} is not one of {enum}"
+            )
+
+        if has_string_checks and value_type is str:
+            if min_length is not None and len(value) < min_length:
+                run.add_schema(
+                    IssueCode.INVALID_FORMAT, path, f"shorter than {min_length}"
+                )
+            if max_length is not None and len(value) > max_length:
+                run.add_schema(
+                    IssueCode.INVALID_FORMAT, path, f"longer than {max_length}"
+                )
+            if pattern is not None and not pattern.search(value):
+                run.add_schema(
+                    IssueCode.INVALID_FORMAT,
+                    path,
+                    f"{value!r} does not match {pattern.pattern!r}",
+                )
+
+        if has_range_checks and value_type in _NUMERIC_TYPES:
+            if minimum is not None and value < minimum:
+                run.add_schema(
+                    IssueCode.OUT_OF_RANGE, path, f"{value} is less than {minimum}"
+                )
+            if maximum is not None and value > maximum:
+                run.add_schema(
+                    IssueCode.OUT_OF_RANGE, path, f"{value} is greater than {maximum}"
+                )
+
+        # Hooks run before children so they can prepare per-node state
+        if hook is not None:
+            hook(value, path, run)
+
+        if value_type is dict:
+            for name in required:
+                if name not in value:
+                    run.add_schema(
+                        IssueCode.MISSING_FIELD,
+                        path,
+                        f"missing required field '{name}'",
+                    )
+            for name, suffix, sub_check in properties:
+                if name in value:
+                    sub_check(value[name], path + suffix, run)
+
+        elif value_type is list:
+            if min_items is not None and len(value) < min_items:
+                run.add_schema(
+                    IssueCode.TOO_FEW_ITEMS,
+                    path,
+                    f"expected at least {min_items} items, got {len(value)}",
+                )
+            if items is not None:
+                for index, item in enumerate(value):
+                    items(item, f"{path}/{index}", run)
+
+    return check
+
+
+def _compile_one_of(
+    schema: dict[str, Any], pointer: str, hooks: dict[str, Hook]
+) -> Checker:
+    """
+    Compile a ``oneOf`` node; the first branch without shape issues wins.
+
+    When no branch matches, the issues of the closest branch are reported,
+    or a single UNKNOWN_FORMAT issue if every branch is only missing its
+    required top-level fields.
+    """
+    base = {key: value for key, value in schema.items() if key != "oneOf"}
+    branches = [
+        _compile({**base, **branch}, pointer, hooks) for branch in schema["oneOf"]
+    ]
+
+    def check(value: Any, path: str, run: _Run) -> None:
+        attempts = []
+        for branch in branches:
+            attempt = run.fork()
+            branch(value, path, attempt)
+            if not attempt.has_schema_issues():
+                run.merge(attempt)
+                return
+            attempts.append(attempt)
+
+        location = path or "/"
+        informative = [
+            attempt
+            for attempt in attempts
+            if any(
+                issue.code is not IssueCode.MISSING_FIELD or issue.path != location
+                for issue in attempt.issues
+            )
+        ]
+        if not informative:
+            run.add_schema(
+                IssueCode.UNKNOWN_FORMAT,
+                path,
+                "payload matches none of the expected formats",
+            )
+            return
+        run.merge(min(informative, key=lambda attempt: len(attempt.issues)))
+
+    return check
+
+
+class CompiledValidator:
+    """
+    Validator compiled once from a JSON schema plus domain-check hooks.
+
+    ``hooks`` maps schema locations (``""`` for the root, ``/name`` for
+    properties and ``/*`` for array items) to functions called with each
+    value found there; ``finish`` runs once after the traversal.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        hooks: dict[str, Hook] | None = None,
+        finish: Callable[[Any, _Run], None] | None = None,
+    ):
+        """
+        Compile the validator.
+
+        Args:
+            schema: JSON schema describing the expected payload shape
+            hooks: Domain checks keyed by schema location
+            finish: Optional check run once after the traversal
+        """
+        self._check = _compile(schema, "", hooks or {})
+        self._finish = finish
+
+    def validate(
+        self, payload: Any, context: dict[str, Any] | None = None
+    ) -> ValidationReport:
+        """
+        Validate a payload in one traversal.
+
+        Args:
+            payload: Parsed API response
+            context: Optional expectations (target_date, expected_game_id,
+                expected_min_games)
+
+        Returns:
+            ValidationReport with structured issues and metrics
+        """
+        run = _Run(context or {})
+        try:
+            self._check(payload, "", run)
+            if self._finish is not None:
+                self._finish(payload, run)
+        except Exception as e:
+            run.add(IssueCode.VALIDATION_ERROR, "", f"Validation error: {e}")
+        return ValidationReport(issues=run.issues, metrics=run.metrics)
+
+
+# -- Domain checks -------------------------------------------------------------
+
+
+def _index_at(path: str, position: int) -> str:
+    """Get the path segment at ``position`` (1-based after the leading '/')."""
+    return path.split("/")[position]
+
+
+def _check_game_id(game_id: Any, path: str, run: _Run) -> None:
+    """Check a game ID's format and that it is the one that was requested."""
+    if not isinstance(game_id, str) or not game_id.isdigit():
+        run.add(IssueCode.INVALID_GAME_ID, path, f"Invalid game ID format: {game_id}")
+
+    expected_id = run.context.get("expected_game_id")
+    if expected_id is not None and game_id != expected_id:
+        run.add(
+            IssueCode.GAME_ID_MISMATCH,
+            path,
+            f"Game ID mismatch: expected {expected_id}, got {game_id}",
+        )
+
+
+def check_schedule_game(
+    game: dict[str, Any], label: str
+) -> tuple[IssueCode, str] | None:
+    """
+    Check one schedule row for plausible values.
+
+    Args:
+        game: LeagueGameFinder row
+        label: Name used for the row in issue messages
+
+    Returns:
+        Issue code and message for the first problem, or None if it is valid
+    """
+    game_stats = {
+        "game_id": game.get("GAME_ID"),
+        # The schedule has one team per row, so PTS stands in for both scores
+        "home_score": game.get("PTS", 0),
+        "away_score": game.get("PTS", 0),
+    }
+    if not validate_game_stats(game_stats):
+        return IssueCode.GAME_VALIDATION_FAILED, f"Game validation failed for {label}"
+
+    points = game.get("PTS")
+    if points is not None and (points < 0 or points > 200):
+        return (
+            IssueCode.UNREALISTIC_VALUE,
+            f"Unrealistic points value for {label}: {points}",
+        )
+
+    return None
+
+
+def _schedule_root(schedule: list, path: str, run: _Run) -> None:
+    run.metrics["game_count"] = len(schedule)
+    run.scratch["valid_games"] = 0
+    run.scratch["inconsistent_dates"] = []
+
+    min_games = run.context.get("expected_min_games")
+    if min_games is not None and len(schedule) < min_games:
+        run.add(
+            IssueCode.FEWER_GAMES_THAN_EXPECTED,
+            path,
+            f"Fewer games than expected: {len(schedule)} < {min_games}",
+        )
+
+
+def _schedule_game(game: dict, path: str, run: _Run) -> None:
+    target_date = run.context.get("target_date")
+    game_date_str = game.get("GAME_DATE")
+    if target_date and game_date_str:
+        try:
+            game_date = datetime.strptime(game_date_str, "%Y-%m-%d").date()
+            if game_date != target_date:
+                run.scratch["inconsistent_dates"].append(game_date_str)
+        except (TypeError, ValueError):
+            run.scratch["inconsistent_dates"].append(f"invalid_format:{game_date_str}")
+
+    problem = check_schedule_game(game, f"game_{_index_at(path, 1)}")
+    if problem is None:
+        run.scratch["valid_games"] += 1
+    else:
+        run.add(problem[0], path, problem[1])
+
+
+def _schedule_finish(schedule: Any, run: _Run) -> None:
+    if "valid_games" not in run.scratch:
+        return
+
+    if run.context.get("target_date"):
+        inconsistent_dates = run.scratch["inconsistent_dates"]
+        run.metrics["date_consistency"] = not inconsistent_dates
+        if inconsistent_dates:
+            run.add(
+                IssueCode.DATE_INCONSISTENT,
+                "",
+                f"Date inconsistencies found: {inconsistent_dates[:5]}...",
+            )
+
+    valid_games = run.scratch["valid_games"]
+    run.metrics["valid_games"] = valid_games
+    run.metrics["game_validity_ratio"] = (
+        valid_games / len(schedule) if schedule else 0.0
+    )
+
+
+def _player_count(team: Any) -> int:
+    players = team.get("players") if isinstance(team, dict) else None
+    return len(players) if isinstance(players, list) else 0
+
+
+def _box_score_v3(box_score: dict, path: str, run: _Run) -> None:
+    home_count = _player_count(box_score.get("homeTeam"))
+    away_count = _player_count(box_score.get("awayTeam"))
+
+    run.metrics["team_count"] = 2
+    run.metrics["home_player_count"] = home_count
+    run.metrics["away_player_count"] = away_count
+    run.metrics["total_player_count"] = home_count + away_count
+
+    if "gameId" in box_score:
+        _check_game_id(box_score["gameId"], f"{path}/gameId", run)
+
+
+def _result_sets(result_sets: list, path: str, run: _Run) -> None:
+    run.metrics["result_set_count"] = len(result_sets)
+    run.scratch["row_widths"] = {}
+
+
+def _result_set(result_set: dict, path: str, run: _Run) -> None:
+    set_id = f"result_set_{_index_at(path, 2)}"
+    headers = result_set.get("headers", [])
+    rows = result_set.get("rowSet", [])
+
+    run.metrics[f"{set_id}_header_count"] = len(headers)
+    run.metrics[f"{set_id}_row_count"] = len(rows)
+    if rows and headers:
+        run.metrics[f"{set_id}_inconsistent_rows"] = 0
+        run.scratch["row_widths"][set_id] = len(headers)
+
+
+def _result_set_row(row: list, path: str, run: _Run) -> None:
+    set_id = f"result_set_{_index_at(path, 2)}"
+    width = run.scratch["row_widths"].get(set_id)
+    if width is None or len(row) == width:
+        return
+
+    run.metrics[f"{set_id}_inconsistent_rows"] += 1
+    if run.metrics[f"{set_id}_inconsistent_rows"] <= _MAX_ROW_ISSUES:
+        run.add(
+            IssueCode.ROW_LENGTH_MISMATCH,
+            path,
+            f"{set_id} row {_index_at(path, 4)} has {len(row)} values but "
+            f"{width} headers",
+        )
+
+
+def _parameters(parameters: dict, path: str, run: _Run) -> None:
+    game_id = parameters.get("GameID")
+    if game_id:
+        _check_game_id(game_id, f"{path}/GameID", run)
+
+
+_HOOKS: dict[str, dict[str, Hook]] = {
+    "schedule": {"": _schedule_root, "/*": _schedule_game},
+    "box_score": {
+        "/boxScoreTraditional": _box_score_v3,
+        "/resultSets": _result_sets,
+        "/resultSets/*": _result_set,
+        "/resultSets/*/rowSet/*": _result_set_row,
+        "/parameters": _parameters,
+    },
+}
+
+_FINISHERS: dict[str, Callable[[Any, _Run], None]] = {
+    "schedule": _schedule_finish,
+}
+
+
+@cache
+def get_compiled_validator(response_type: str) -> CompiledValidator:
+    """
+    Get the process-wide compiled validator for a response type.
+
+    Args:
+        response_type: Type of response ('schedule', 'box_score', 'base')
+
+    Returns:
+        CompiledValidator, compiled on first use
+
+    Raises:
+        ValueError: If response_type is not supported
+    """
+    return CompiledValidator(
+        get_schema(response_type),
+        hooks=_HOOKS.get(response_type),
+        finish=_FINISHERS.get(response_type),
+    )
@@ -21,6 +21,17 @@ class BronzeIngestionConfig(ConfigManager):
         description="S3 bucket name for bronze layer storage",
     )
 
+    # League configuration
+    leagues: str = config_field(
+        default="nba",
+        env_var="INGESTION_LEAGUES",
+        pattern="^(nba|wnba)(,(nba|wnba))*$",
+        description=(
+            "Comma-separated leagues ingested concurrently by one run, "
+            "e.g. nba,wnba during the months both seasons overlap"
+        ),
+    )
+
     # Rate limiting configuration
     api_requests_per_minute: int = config_field(
         default=30,
@@ -32,5 +43,128 @@ class BronzeIngestionConfig(ConfigManager):
     max_retries: int = config_field(
         default=3,
         env_var="MAX_RETRIES",
-        description="Maximum number of retries for failed operations",
+        ge=0,
+        description="Maximum number of retries of one NBA API request",
+    )
+
+    retry_budget: int = config_field(
+        default=30,
+        env_var="RETRY_BUDGET",
+        ge=0,
+        description=(
+            "Retries shared by all NBA API requests of one run, across leagues"
+        ),
+    )
+
+    circuit_breaker_threshold: int = config_field(
+        default=5,
+        env_var="CIRCUIT_BREAKER_THRESHOLD",
+        ge=1,
+        description=(
+            "Consecutive failed NBA API attempts after which the run stops "
+            "calling the API and defers the remaining games"
+        ),
     )
+
+    deadline_reserve_seconds: int = config_field(
+        default=60,
+        env_var="DEADLINE_RESERVE_SECONDS",
+        ge=0,
+        description=(
+            "Seconds before the Lambda deadline after which no NBA API call "
+            "is started, leaving time to store results and record deferrals"
+        ),
+    )
+
+    # Concurrency configuration
+    max_workers: int = config_field(
+        default=1,
+        env_var="INGESTION_MAX_WORKERS",
+        ge=1,
+        description=(
+            "Number of games fetched, validated and stored concurrently "
+            "(1 = sequential); all workers share one API rate limiter"
+        ),
+    )
+
+    # Stat-correction recheck configuration
+    recheck_lookback_days: int = config_field(
+        default=3,
+        env_var="RECHECK_LOOKBACK_DAYS",
+        ge=1,
+        description=(
+            "Number of days, ending yesterday, whose stored box scores are "
+            "re-fetched to detect stat corrections"
+        ),
+    )
+
+    # Live polling configuration
+    live_poll_interval_seconds: int = config_field(
+        default=60,
+        env_var="LIVE_POLL_INTERVAL_SECONDS",
+        ge=10,
+        description="Seconds between polls of today's in-progress games",
+    )
+
+    live_max_duration_minutes: int = config_field(
+        default=360,
+        env_var="LIVE_MAX_DURATION_MINUTES",
+        ge=1,
+        description=(
+            "Upper bound on one live polling run, in case games never report "
+            "a final status"
+        ),
+    )
+
+    # Player dimension enrichment configuration
+    player_info_ttl_days: int = config_field(
+        default=90,
+        env_var="PLAYER_INFO_TTL_DAYS",
+        ge=1,
+        description=(
+            "Age in days after which a player dimension entry is refetched "
+            "from CommonPlayerInfo"
+        ),
+    )
+
+    player_info_max_refreshes: int = config_field(
+        default=5,
+        env_var="PLAYER_INFO_MAX_REFRESHES",
+        ge=0,
+        description=(
+            "Upper bound on stale player dimension entries refetched per run, "
+            "on top of players seen for the first time"
+        ),
+    )
+
+    # NBA API response cache configuration
+    nba_api_cache_path: str | None = config_field(
+        default=None,
+        env_var="NBA_API_CACHE_PATH",
+        description=(
+            "Path of the on-disk NBA API response cache (SQLite); "
+            "caching is disabled when unset"
+        ),
+    )
+
+    nba_api_cache_max_mb: int = config_field(
+        default=512,
+        env_var="NBA_API_CACHE_MAX_MB",
+        description="Size bound of the NBA API response cache in megabytes",
+    )
+
+    # Storage configuration
+    bronze_compression: str = config_field(
+        default="none",
+        env_var="BRONZE_COMPRESSION",
+        pattern="^(none|gzip|zstd)$",
+        description=(
+            "Encoding of bronze and quarantine JSON objects: none "
+            "(pretty-printed), gzip or zstd (compact JSON, compressed)"
+        ),
+    )
+
+    @property
+    def league_names(self) -> list[str]:
+        """Configured leagues in order, without duplicates."""
+        return list(dict.fromkeys(self.leagues.split(",")))
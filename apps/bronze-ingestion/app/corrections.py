@@ -0,0 +1,103 @@
+"""
+Stat-correction detection for bronze layer box scores.
+
+Every bronze object is written with a canonical content hash in its S3
+metadata. A recheck re-fetches recent games and compares hashes, so only
+games whose stats were corrected are rewritten and sent downstream.
+"""
+
+import hashlib
+import json
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any
+
+from hoopstat_observability import get_logger
+
+if TYPE_CHECKING:
+    from .s3_manager import BronzeS3Manager
+
+logger = get_logger(__name__)
+
+# Object metadata key holding the canonical content hash
+CONTENT_HASH_METADATA_KEY = "content_hash"
+
+# Correction notices end in summary.json so the existing bronze bucket
+# notification (prefix _metadata/, suffix summary.json) triggers silver
+CORRECTIONS_PREFIX = "_metadata/corrections/"
+
+# Metadata of leagues other than the NBA: _metadata/leagues/<league>/...
+LEAGUE_METADATA_PREFIX = "_metadata/leagues/"
+
+# Top-level fields that change on every fetch without the stats changing:
+# the client's fetch timestamp and the NBA API's request metadata
+_VOLATILE_FIELDS = frozenset({"fetch_date", "meta"})
+
+
+def content_hash(data: Any) -> str:
+    """
+    Compute the canonical content hash of a payload.
+
+    Keys are sorted and separators fixed, so the hash does not depend on key
+    order or on the storage encoding. Volatile top-level fields are ignored.
+
+    Args:
+        data: JSON-serializable payload
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in _VOLATILE_FIELDS}
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def correction_key(target_date: date, league: str | None = None) -> str:
+    """Get the key of a league's correction notice for a date."""
+    prefix = (
+        f"{LEAGUE_METADATA_PREFIX}{league}/corrections/"
+        if league
+        else CORRECTIONS_PREFIX
+    )
+    return f"{prefix}{target_date.isoformat()}/summary.json"
+
+
+def store_correction_notice(
+    s3_manager: "BronzeS3Manager",
+    target_date: date,
+    game_ids: list[str],
+    games_checked: int,
+    league: str | None = None,
+) -> str:
+    """
+    Record the games corrected on a date, triggering silver for that date.
+
+    Args:
+        s3_manager: S3 manager for the bronze bucket
+        target_date: Date the corrected games were played
+        game_ids: IDs of the games whose box scores changed
+        games_checked: Number of games rechecked for the date
+        league: League segment of the notice key, or None for the NBA
+
+    Returns:
+        S3 key of the notice
+    """
+    key = correction_key(target_date, league)
+    notice = {
+        "date": target_date.isoformat(),
+        "corrected_game_ids": sorted(game_ids),
+        "games_checked": games_checked,
+        "detected_at": datetime.now(UTC).isoformat(),
+    }
+    s3_manager.s3_client.put_object(
+        Bucket=s3_manager.bucket_name,
+        Key=key,
+        Body=json.dumps(notice, indent=2).encode("utf-8"),
+        ContentType="application/json",
+        Metadata={"type": "bronze_correction_notice"},
+    )
+    logger.info(
+        f"Stored correction notice for {target_date}",
+        extra={"s3_key": key, "corrected_games": len(game_ids)},
+    )
+    return key
@@ -0,0 +1,117 @@
+"""
+Record of box scores a run could not fetch within its retry budget.
+"""
+
+import json
+from datetime import UTC, date, datetime
+from typing import Any
+
+from botocore.exceptions import ClientError
+from hoopstat_observability import get_logger
+
+from .corrections import LEAGUE_METADATA_PREFIX
+from .s3_manager import BronzeS3Manager
+
+logger = get_logger(__name__)
+
+# Deferred games of the NBA; other leagues write
+# _metadata/leagues/<league>/deferred_games.json
+DEFERRED_GAMES_KEY = "_metadata/deferred_games.json"
+
+
+def deferred_games_key(league: str | None = None) -> str:
+    """Get the key of a league's deferred games record."""
+    if league:
+        return f"{LEAGUE_METADATA_PREFIX}{league}/deferred_games.json"
+    return DEFERRED_GAMES_KEY
+
+
+class DeferredGames:
+    """
+    Games left unfetched because the retry budget ran out, by date.
+
+    A run that hits its deadline or opens the circuit breaker records the
+    games it did not get to; later runs fetch them first from the remaining
+    budget and drop them from the record once stored.
+    """
+
+    def __init__(self, s3_manager: BronzeS3Manager, league: str | None = None):
+        """
+        Initialize the record.
+
+        Args:
+            s3_manager: S3 manager used to persist the record
+            league: League segment of the record key, or None for the NBA
+        """
+        self.s3_manager = s3_manager
+        self.key = deferred_games_key(league)
+        self.games: dict[str, dict[str, Any]] = {}
+        # Saving before a successful load would drop other dates' games
+        self.loaded = False
+        self.changed = False
+
+    def load(self) -> None:
+        """Load the record from S3, if any."""
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=self.key
+            )
+            record = json.loads(response["Body"].read().decode("utf-8"))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            record = {}
+
+        self.games = record.get("games", {})
+        self.loaded = True
+        self.changed = False
+
+    def dates(self) -> list[date]:
+        """Dates with deferred games, oldest first."""
+        return [date.fromisoformat(date_str) for date_str in sorted(self.games)]
+
+    def game_ids(self, target_date: date) -> list[str]:
+        """Deferred game IDs of a date."""
+        return self.games.get(target_date.isoformat(), {}).get("game_ids", [])
+
+    def record_date(
+        self, target_date: date, game_ids: list[str], reason: str | None = None
+    ) -> None:
+        """
+        Replace a date's deferred games; an empty list resolves the date.
+
+        Args:
+            target_date: Date the games were played
+            game_ids: Games still to be fetched
+            reason: Why they were not fetched, e.g. ``deadline``
+        """
+        date_str = target_date.isoformat()
+        if not game_ids:
+            if self.games.pop(date_str, None) is not None:
+                self.changed = True
+            return
+
+        self.changed = True
+        self.games[date_str] = {
+            "game_ids": sorted(game_ids),
+            "reason": reason,
+            "deferred_at": datetime.now(UTC).isoformat(),
+        }
+
+    def save(self) -> None:
+        """Persist the record to S3."""
+        record = {
+            "games": self.games,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        self.s3_manager.s3_client.put_object(
+            Bucket=self.s3_manager.bucket_name,
+            Key=self.key,
+            Body=json.dumps(record, indent=2).encode("utf-8"),
+            ContentType="application/json",
+        )
+        self.changed = False
+        logger.debug(
+            f"Saved deferred games to {self.key}",
+            extra={"dates": len(self.games)},
+        )
@@ -2,36 +2,137 @@
 Date-scoped ingestion logic for bronze layer.
 """
 
-from datetime import date
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any
+from zoneinfo import ZoneInfo
 
-from hoopstat_nba_api import NBAClient
+from hoopstat_nba_api import (
+    GAME_LOG_SOURCE,
+    GAME_STATUS_FINAL,
+    GAME_STATUS_IN_PROGRESS,
+    LEAGUE_IDS,
+    NBAClient,
+    ResponseCache,
+    RetryPolicy,
+)
 from hoopstat_observability import get_logger
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .backfill import BackfillCheckpoint, date_range
 from .bronze_summary import BronzeSummaryManager
 from .config import BronzeIngestionConfig
+from .corrections import content_hash, store_correction_notice
+from .deferred import DeferredGames
+from .player_info import PlayerDimension, player_ids_from_box_score
 from .quarantine import DataQuarantine
 from .s3_manager import BronzeS3Manager
+from .schedule import normalize_schedule
 from .validation import DataValidator
 
 logger = get_logger(__name__)
 
+# Game dates follow the league's local calendar: a 7pm ET tip-off is already
+# the next day in UTC
+LEAGUE_TIMEZONE = ZoneInfo("America/New_York")
+
+# League stored under the original, unprefixed bronze keys
+DEFAULT_LEAGUE = "nba"
+
 
 class DateScopedIngestion:
     """Date-scoped NBA data ingestion for bronze layer."""
 
-    def __init__(self, config: BronzeIngestionConfig | None = None):
-        """Initialize the ingestion system."""
+    def __init__(
+        self,
+        config: BronzeIngestionConfig | None = None,
+        league: str = DEFAULT_LEAGUE,
+        shared_with: "DateScopedIngestion | None" = None,
+        remaining_time: Callable[[], float] | None = None,
+    ):
+        """
+        Initialize the ingestion system.
+
+        Args:
+            config: Ingestion configuration, loaded from the environment if
+                not given
+            league: League to ingest, a key of ``LEAGUE_IDS``
+            shared_with: Another league's ingestion whose response cache, S3
+                manager, quarantine, summary manager and retry policy are
+                reused, so concurrent leagues don't race on the same metadata
+                objects and draw on one retry budget
+            remaining_time: Callable returning the seconds left before the
+                invocation must end, e.g. from the Lambda context; no API
+                call is started within ``deadline_reserve_seconds`` of it
+        """
         self.config = config or BronzeIngestionConfig.load()
-        self.nba_client = NBAClient()
-        self.s3_manager = BronzeS3Manager(
-            bucket_name=self.config.bronze_bucket, region_name=self.config.aws_region
+        self.league = league
+        # Bronze keys and summaries carry a league segment except for the NBA
+        self._league_args = {} if league == DEFAULT_LEAGUE else {"league": league}
+
+        if shared_with is not None:
+            self.response_cache = shared_with.response_cache
+            self.retry_policy = shared_with.retry_policy
+        else:
+            self.response_cache = self._build_response_cache()
+            self.retry_policy = self._build_retry_policy(remaining_time)
+        # Each league has its own client and therefore its own rate limiter;
+        # retries are only made by the client, under the shared policy
+        self.nba_client = NBAClient(
+            cache=self.response_cache,
+            league_id=LEAGUE_IDS[league],
+            retry_policy=self.retry_policy,
         )
         self.validator = DataValidator()
-        self.quarantine = DataQuarantine(self.s3_manager)
-        self.summary_manager = BronzeSummaryManager(self.s3_manager)
+
+        if shared_with is not None:
+            self.s3_manager = shared_with.s3_manager
+            self.quarantine = shared_with.quarantine
+            self.summary_manager = shared_with.summary_manager
+        else:
+            self.s3_manager = BronzeS3Manager(
+                bucket_name=self.config.bronze_bucket,
+                region_name=self.config.aws_region,
+                compression=self.config.bronze_compression,
+            )
+            self.quarantine = DataQuarantine(
+                self.s3_manager, compression=self.config.bronze_compression
+            )
+            self.summary_manager = BronzeSummaryManager(self.s3_manager)
+        self.deferred_games = DeferredGames(self.s3_manager, **self._league_args)
+        self.player_dimension = PlayerDimension(
+            self.s3_manager,
+            self.nba_client,
+            ttl=timedelta(days=self.config.player_info_ttl_days),
+            max_refreshes=self.config.player_info_max_refreshes,
+            **self._league_args,
+        )
         self.records_processed = 0
+        self.game_results: list[dict[str, Any]] = []
+
+    def _build_response_cache(self) -> ResponseCache | None:
+        """Create the on-disk NBA API response cache if one is configured."""
+        if not self.config.nba_api_cache_path:
+            return None
+
+        logger.info(f"Using NBA API response cache at {self.config.nba_api_cache_path}")
+        return ResponseCache(
+            self.config.nba_api_cache_path,
+            max_size_bytes=self.config.nba_api_cache_max_mb * 1024 * 1024,
+        )
+
+    def _build_retry_policy(
+        self, remaining_time: Callable[[], float] | None
+    ) -> RetryPolicy:
+        """Create the retry policy shared by every NBA API call of the run."""
+        return RetryPolicy(
+            max_attempts=self.config.max_retries + 1,
+            max_total_retries=self.config.retry_budget,
+            remaining_time=remaining_time,
+            reserve_seconds=self.config.deadline_reserve_seconds,
+            failure_threshold=self.config.circuit_breaker_threshold,
+        )
 
     def run(self, target_date: date, dry_run: bool = False) -> bool:
         """
@@ -45,56 +146,78 @@ class DateScopedIngestion:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Starting ingestion for {target_date}")
+            logger.info(
+                f"Starting ingestion for {target_date}", extra={"league": self.league}
+            )
 
             # Step 1: Fetch and validate schedule for the date
-            games = self._fetch_and_validate_schedule(target_date)
+            schedule_rows = self._fetch_and_validate_schedule(target_date)
+            games = normalize_schedule(schedule_rows)
 
             # Step 2: Early exit if no games for this date
             if not games:
                 logger.info(f"No games found for {target_date}, exiting successfully")
 
-                # Still update bronze summary even with no games (unless dry run)
+                # Still catch up deferred games and update bronze summary even
+                # with no games (unless dry run)
                 if not dry_run:
-                    self.summary_manager.update_bronze_summary(target_date, 0, 0)
+                    caught_up_results = self._catch_up_deferred_games(target_date)
+                    self._record_deferred_games(target_date, [])
+                    self._enrich_player_dimension(caught_up_results)
+                    self.summary_manager.update_bronze_summary(
+                        target_date, 0, 0, **self._league_args
+                    )
 
                 return True
 
-            logger.info(f"Found {len(games)} games for {target_date}")
+            logger.info(
+                f"Found {len(games)} games for {target_date} "
+                f"in {len(schedule_rows)} schedule rows"
+            )
 
             # Step 3: Validate completeness and data quality
-            self._validate_ingestion_completeness(games, target_date)
+            self._validate_ingestion_completeness(schedule_rows, target_date)
 
             # Step 4: Store schedule as JSON (if validation passed)
             if not dry_run:
-                self._store_schedule(games, target_date)
+                self._store_schedule(schedule_rows, target_date)
             else:
                 logger.info("Dry run: would store schedule data")
 
-            # Step 5: Fetch and validate box scores for each game
-            successful_box_scores = 0
-            for game in games:
-                game_id = str(game.get("GAME_ID", ""))
-                if game_id:
-                    box_score = self._fetch_and_validate_box_score(game_id, target_date)
-                    if box_score and not dry_run:
-                        self._store_box_score(box_score, game_id, target_date)
-                        successful_box_scores += 1
-                    elif box_score:
-                        logger.info(
-                            f"Dry run: would store box score for game {game_id}"
-                        )
-                        successful_box_scores += 1
+            # Step 5: Fetch, validate and store the box score of each unique game
+            self.game_results = self._ingest_box_scores(
+                [game["game_id"] for game in games], target_date, dry_run
+            )
+            successful_box_scores = sum(
+                1 for game_result in self.game_results if game_result["success"]
+            )
+
+            # Fetch games earlier runs ran out of budget for, then record the
+            # games this run could not get to (unless dry run)
+            caught_up_results = []
+            if not dry_run:
+                caught_up_results = self._catch_up_deferred_games(target_date)
+                self._record_deferred_games(target_date, self.game_results)
 
             # Step 6: Log final ingestion metrics
-            self._log_ingestion_summary(target_date, len(games), successful_box_scores)
+            self._log_ingestion_summary(
+                target_date, len(games), successful_box_scores, len(schedule_rows)
+            )
 
             # Step 7: Generate and store bronze layer summary (unless dry run)
             if not dry_run:
                 self.summary_manager.update_bronze_summary(
-                    target_date, len(games), successful_box_scores
+                    target_date,
+                    len(games),
+                    successful_box_scores,
+                    schedule_rows=len(schedule_rows),
+                    **self._league_args,
                 )
 
+            # Step 8: Look up players seen for the first time (unless dry run)
+            if not dry_run:
+                self._enrich_player_dimension(self.game_results + caught_up_results)
+
             self.records_processed = successful_box_scores
             logger.info(f"Ingestion completed for {target_date}")
             return True
@@ -103,9 +226,695 @@ class DateScopedIngestion:
             logger.error(f"Ingestion failed for {target_date}: {e}")
             return False
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
+    def backfill(
+        self, start_date: date, end_date: date, dry_run: bool = False
+    ) -> dict[str, Any]:
+        """
+        Ingest a range of dates in one run, fetching only missing box scores.
+
+        Existing ``raw/box/<date>/`` keys for the whole range are listed once
+        up front, so only games without a stored box score are fetched.
+        Progress is checkpointed after every date; rerunning the same range
+        skips dates an earlier run already completed.
+
+        Args:
+            start_date: First date to ingest (inclusive)
+            end_date: Last date to ingest (inclusive)
+            dry_run: If True, don't write data or checkpoints to S3
+
+        Returns:
+            Report with per-run counts and end-to-end throughput
+        """
+        started = time.perf_counter()
+        dates = date_range(start_date, end_date)
+
+        checkpoint = BackfillCheckpoint(self.s3_manager, start_date, end_date)
+        checkpoint.load()
+
+        existing = self.s3_manager.list_game_ids_by_date(
+            "box", start_date, end_date, **self._league_args
+        )
+        logger.info(
+            f"Planned backfill from {start_date} to {end_date}",
+            extra={
+                "total_dates": len(dates),
+                "completed_dates": len(checkpoint.completed_dates),
+                "stored_box_scores": sum(len(ids) for ids in existing.values()),
+            },
+        )
+
+        report = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "dates_total": len(dates),
+            "dates_skipped": 0,
+            "dates_processed": 0,
+            "dates_failed": 0,
+            "schedule_rows": 0,
+            "games_found": 0,
+            "games_already_stored": 0,
+            "box_scores_fetched": 0,
+            "box_scores_failed": 0,
+        }
+
+        for target_date in dates:
+            if checkpoint.is_complete(target_date):
+                report["dates_skipped"] += 1
+                continue
+
+            try:
+                schedule_rows = self._fetch_and_validate_schedule(target_date)
+            except Exception as e:
+                # Leave the date unfinished so the next run retries it
+                logger.error(
+                    f"Backfill could not fetch schedule for {target_date}: {e}"
+                )
+                report["dates_failed"] += 1
+                continue
+
+            game_ids = [game["game_id"] for game in normalize_schedule(schedule_rows)]
+            stored = existing.get(target_date.isoformat(), set())
+            missing = [game_id for game_id in game_ids if game_id not in stored]
+
+            if schedule_rows and not dry_run:
+                try:
+                    self._store_schedule(schedule_rows, target_date)
+                except Exception as e:
+                    # Leave the date unfinished so the next run retries it
+                    logger.error(
+                        f"Backfill could not store schedule for {target_date}: {e}"
+                    )
+                    report["dates_failed"] += 1
+                    continue
+
+            results = self._ingest_box_scores(missing, target_date, dry_run)
+            failed = [r["game_id"] for r in results if not r["success"]]
+
+            report["dates_processed"] += 1
+            report["schedule_rows"] += len(schedule_rows)
+            report["games_found"] += len(game_ids)
+            report["games_already_stored"] += len(game_ids) - len(missing)
+            report["box_scores_fetched"] += len(results) - len(failed)
+            report["box_scores_failed"] += len(failed)
+
+            checkpoint.record_date(target_date, failed)
+            if not dry_run:
+                checkpoint.save()
+
+            logger.info(
+                f"Backfilled {target_date}",
+                extra={
+                    "games": len(game_ids),
+                    "fetched": len(results) - len(failed),
+                    "already_stored": len(game_ids) - len(missing),
+                    "failed": len(failed),
+                },
+            )
+
+        if not dry_run and report["dates_processed"]:
+            self.summary_manager.update_bronze_summary(
+                end_date,
+                report["games_found"],
+                report["box_scores_fetched"],
+                **self._league_args,
+            )
+
+        elapsed = time.perf_counter() - started
+        report["elapsed_seconds"] = round(elapsed, 2)
+        report["box_scores_per_minute"] = (
+            round(report["box_scores_fetched"] / elapsed * 60, 2) if elapsed else 0.0
+        )
+        report["dates_per_minute"] = (
+            round(report["dates_processed"] / elapsed * 60, 2) if elapsed else 0.0
+        )
+        self.records_processed = report["box_scores_fetched"]
+
+        logger.info(f"Backfill completed for {start_date} to {end_date}", extra=report)
+        return report
+
+    def bulk_backfill(
+        self, season: str, season_type: str = "Regular Season", dry_run: bool = False
+    ) -> dict[str, Any]:
+        """
+        Load a whole season's box scores from its season-wide game logs.
+
+        Instead of one ``BoxScoreTraditionalV3`` request per game, the
+        season's team and player game logs are fetched once and split into
+        the per-game layout (``raw/box/<date>/<game_id>.json``, ADR-031). The
+        box scores are V3-shaped, so silver reads them like fetched ones, and
+        are tagged ``source=league_game_log`` in the payload and the object
+        metadata. Games that already have a stored box score are left alone,
+        so rerunning the same season resumes where a failed run stopped.
+
+        Args:
+            season: Season in ``YYYY-YY`` form, e.g. ``"2023-24"``
+            season_type: ``"Regular Season"``, ``"Playoffs"``, etc.
+            dry_run: If True, don't write data to S3
+
+        Returns:
+            Report with per-run counts and end-to-end throughput
+        """
+        started = time.perf_counter()
+        box_scores = [
+            box_score
+            for box_score in self.nba_client.get_season_box_scores(season, season_type)
+            if box_score.get("game_date")
+        ]
+
+        report = {
+            "season": season,
+            "season_type": season_type,
+            "source": GAME_LOG_SOURCE,
+            "dates_total": 0,
+            "games_found": len(box_scores),
+            "games_already_stored": 0,
+            "box_scores_stored": 0,
+            "box_scores_failed": 0,
+        }
+
+        pending = []
+        if box_scores:
+            dates = sorted({box_score["game_date"] for box_score in box_scores})
+            report["dates_total"] = len(dates)
+            existing = self.s3_manager.list_game_ids_by_date(
+                "box",
+                date.fromisoformat(dates[0]),
+                date.fromisoformat(dates[-1]),
+                **self._league_args,
+            )
+            pending = [
+                box_score
+                for box_score in box_scores
+                if box_score["game_id"]
+                not in existing.get(box_score["game_date"], set())
+            ]
+            report["games_already_stored"] = len(box_scores) - len(pending)
+
+        logger.info(
+            f"Planned bulk backfill for {season} {season_type}",
+            extra={k: report[k] for k in ("games_found", "games_already_stored")},
+        )
+
+        max_workers = min(self.config.max_workers, len(pending))
+        if max_workers <= 1:
+            results = [self._ingest_log_box_score(b, dry_run) for b in pending]
+        else:
+            # Only S3 writes happen here; the NBA API was called twice above
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="bulk-box-score"
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda box_score: self._ingest_log_box_score(
+                            box_score, dry_run
+                        ),
+                        pending,
+                    )
+                )
+
+        report["box_scores_stored"] = sum(results)
+        report["box_scores_failed"] = len(results) - report["box_scores_stored"]
+
+        if not dry_run and report["box_scores_stored"]:
+            self.summary_manager.update_bronze_summary(
+                date.fromisoformat(max(b["game_date"] for b in box_scores)),
+                report["games_found"],
+                report["box_scores_stored"],
+                **self._league_args,
+            )
+
+        elapsed = time.perf_counter() - started
+        report["elapsed_seconds"] = round(elapsed, 2)
+        report["box_scores_per_minute"] = (
+            round(report["box_scores_stored"] / elapsed * 60, 2) if elapsed else 0.0
+        )
+        self.records_processed = report["box_scores_stored"]
+
+        logger.info(f"Bulk backfill completed for {season}", extra=report)
+        return report
+
+    def recheck(
+        self,
+        end_date: date | None = None,
+        lookback_days: int | None = None,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Re-fetch recent box scores and rewrite only the corrected ones.
+
+        Every box score stored for the lookback window is fetched again,
+        bypassing the response cache, and its canonical content hash is
+        compared with the hash recorded on the stored object. Only games
+        whose stats changed are rewritten, and one correction notice is
+        written per date with changes so silver reprocesses just those dates.
+
+        Args:
+            end_date: Last date to recheck, defaults to yesterday (UTC)
+            lookback_days: Number of days to recheck, ending at ``end_date``;
+                defaults to ``recheck_lookback_days``
+            dry_run: If True, detect corrections without writing anything
+
+        Returns:
+            Report with per-run counts and the corrected game IDs by date
+        """
+        started = time.perf_counter()
+        end_date = end_date or datetime.utcnow().date() - timedelta(days=1)
+        lookback_days = lookback_days or self.config.recheck_lookback_days
+        start_date = end_date - timedelta(days=lookback_days - 1)
+
+        stored = self.s3_manager.list_game_ids_by_date(
+            "box", start_date, end_date, **self._league_args
+        )
+        report = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "dates_checked": len(stored),
+            "games_checked": 0,
+            "games_unchanged": 0,
+            "games_corrected": 0,
+            "games_failed": 0,
+            "corrected_game_ids": {},
+        }
+
+        for date_str, game_ids in sorted(stored.items()):
+            target_date = date.fromisoformat(date_str)
+            results = self._run_per_game(
+                sorted(game_ids),
+                lambda game_id, target_date=target_date: self._recheck_box_score(
+                    game_id, target_date, dry_run
+                ),
+                target_date,
+            )
+            corrected = [r["game_id"] for r in results if r["status"] == "corrected"]
+
+            report["games_checked"] += len(results)
+            report["games_corrected"] += len(corrected)
+            report["games_unchanged"] += sum(
+                r["status"] == "unchanged" for r in results
+            )
+            report["games_failed"] += sum(r["status"] == "failed" for r in results)
+
+            if corrected:
+                report["corrected_game_ids"][date_str] = corrected
+                if not dry_run:
+                    store_correction_notice(
+                        self.s3_manager,
+                        target_date,
+                        corrected,
+                        len(results),
+                        **self._league_args,
+                    )
+
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+        self.records_processed = report["games_corrected"]
+
+        logger.info(f"Recheck completed for {start_date} to {end_date}", extra=report)
+        return report
+
+    def live(
+        self,
+        target_date: date | None = None,
+        poll_interval: float | None = None,
+        max_duration: float | None = None,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Poll a day's games while they are in progress, writing only changes.
+
+        Each round fetches the scoreboard, then the box score of every game in
+        progress. Requests go through the shared client, so they are paced by
+        its rate limiter and sent with conditional headers; an unchanged game
+        usually costs a 304. A box score is validated and written only when
+        its canonical content hash differs from the stored object, so S3
+        writes, validation and silver runs scale with changes, not polls.
+        Each round that writes changes stores a correction notice naming the
+        changed games, so silver merges just those games. The bronze summary
+        is updated once the run ends, which rebuilds the date in silver.
+        A game is polled once more after it goes final and then dropped. The
+        run ends when every game is final or ``max_duration`` has passed.
+
+        Args:
+            target_date: Date to poll, defaults to today in league time
+            poll_interval: Seconds between rounds, defaults to
+                ``live_poll_interval_seconds``
+            max_duration: Seconds before the run stops, defaults to
+                ``live_max_duration_minutes``
+            dry_run: If True, detect changes without writing anything
+
+        Returns:
+            Report with poll, fetch and write counts
+        """
+        started = time.monotonic()
+        target_date = target_date or datetime.now(LEAGUE_TIMEZONE).date()
+        poll_interval = poll_interval or self.config.live_poll_interval_seconds
+        max_duration = max_duration or self.config.live_max_duration_minutes * 60
+        deadline = started + max_duration
+
+        # Last written content hash per game; seeded from S3 on first sight
+        hashes: dict[str, str | None] = {}
+        finished: set[str] = set()
+        report = {
+            "date": target_date.isoformat(),
+            "polls": 0,
+            "box_scores_fetched": 0,
+            "box_scores_written": 0,
+            "box_scores_unchanged": 0,
+            "box_scores_failed": 0,
+            "games_final": 0,
+            "completed": False,
+        }
+
+        logger.info(
+            f"Starting live polling for {target_date}",
+            extra={"poll_interval": poll_interval, "max_duration": max_duration},
+        )
+
+        while True:
+            report["polls"] += 1
+            games = self.nba_client.get_scoreboard(target_date)
+            statuses = {str(game["gameId"]): game.get("gameStatus") for game in games}
+
+            to_poll = [
+                game_id
+                for game_id, status in statuses.items()
+                if status == GAME_STATUS_IN_PROGRESS
+                or (status == GAME_STATUS_FINAL and game_id not in finished)
+            ]
+            results = self._run_per_game(
+                to_poll,
+                lambda game_id: self._poll_live_box_score(
+                    game_id, target_date, hashes, dry_run
+                ),
+                target_date,
+            )
+
+            written = []
+            for result in results:
+                report["box_scores_fetched"] += result["status"] != "failed"
+                report[f"box_scores_{result['status']}"] += 1
+                if result["status"] == "written":
+                    written.append(result["game_id"])
+                if (
+                    result["status"] != "failed"
+                    and statuses[result["game_id"]] == GAME_STATUS_FINAL
+                ):
+                    finished.add(result["game_id"])
+
+            # Changed box scores reach silver through a correction notice,
+            # which merges just those games into the date's silver data
+            if written and not dry_run:
+                store_correction_notice(
+                    self.s3_manager,
+                    target_date,
+                    written,
+                    len(to_poll),
+                    **self._league_args,
+                )
+
+            report["games_final"] = len(finished)
+            remaining = [game_id for game_id in statuses if game_id not in finished]
+            if not remaining:
+                report["completed"] = True
+                break
+            if time.monotonic() + poll_interval > deadline:
+                logger.warning(
+                    f"Live polling for {target_date} reached its time limit",
+                    extra={"games_remaining": len(remaining)},
+                )
+                break
+
+            time.sleep(poll_interval)
+
+        if report["box_scores_written"] and not dry_run:
+            self.summary_manager.update_bronze_summary(
+                target_date,
+                len(statuses),
+                sum(digest is not None for digest in hashes.values()),
+                **self._league_args,
+            )
+
+        report["elapsed_seconds"] = round(time.monotonic() - started, 2)
+        self.records_processed = report["box_scores_written"]
+
+        logger.info(f"Live polling finished for {target_date}", extra=report)
+        return report
+
+    def _poll_live_box_score(
+        self,
+        game_id: str,
+        target_date: date,
+        hashes: dict[str, str | None],
+        dry_run: bool,
+    ) -> dict[str, Any]:
+        """Fetch one in-game box score and store it if its content changed."""
+        try:
+            box_score = self._fetch_box_score(game_id, refresh=True)
+            if box_score is None:
+                return {"game_id": game_id, "status": "failed"}
+
+            if game_id not in hashes:
+                hashes[game_id] = self.s3_manager.get_content_hash(
+                    "box", target_date, game_id, **self._league_args
+                )
+            digest = content_hash(box_score)
+            if digest == hashes[game_id]:
+                return {"game_id": game_id, "status": "unchanged"}
+
+            if not self._validate_box_score(
+                box_score, game_id, target_date, "get_box_score"
+            ):
+                return {"game_id": game_id, "status": "failed"}
+
+            if dry_run:
+                logger.info(f"Dry run: would store live box score for game {game_id}")
+            else:
+                self._store_box_score(box_score, game_id, target_date)
+            hashes[game_id] = digest
+            return {"game_id": game_id, "status": "written"}
+
+        except Exception as e:
+            logger.warning(f"Failed to poll live box score for game {game_id}: {e}")
+            return {"game_id": game_id, "status": "failed"}
+
+    def _recheck_box_score(
+        self, game_id: str, target_date: date, dry_run: bool
+    ) -> dict[str, Any]:
+        """Re-fetch one box score and rewrite it if its content changed."""
+        try:
+            box_score = self._fetch_and_validate_box_score(
+                game_id, target_date, refresh=True
+            )
+            if box_score is None:
+                return {"game_id": game_id, "status": "failed"}
+
+            stored_hash = self.s3_manager.get_content_hash(
+                "box", target_date, game_id, **self._league_args
+            )
+            if content_hash(box_score) == stored_hash:
+                return {"game_id": game_id, "status": "unchanged"}
+
+            logger.info(
+                f"Detected stat correction for game {game_id}",
+                extra={"game_id": game_id, "target_date": target_date.isoformat()},
+            )
+            if not dry_run:
+                self._store_box_score(box_score, game_id, target_date)
+            return {"game_id": game_id, "status": "corrected"}
+
+        except Exception as e:
+            logger.warning(f"Failed to recheck box score for game {game_id}: {e}")
+            return {"game_id": game_id, "status": "failed"}
+
+    def _catch_up_deferred_games(self, target_date: date) -> list[dict[str, Any]]:
+        """
+        Fetch the games earlier runs deferred, within the remaining budget.
+
+        Each date with games stored this way gets a correction notice, so
+        silver reprocesses that date rather than waiting for a rerun.
+
+        Returns:
+            Per-game results of the deferred games that were attempted
+        """
+        try:
+            self.deferred_games.load()
+        except Exception as e:
+            logger.warning(f"Failed to load deferred games: {e}")
+            return []
+
+        results: list[dict[str, Any]] = []
+        for deferred_date in self.deferred_games.dates():
+            if deferred_date == target_date:
+                # Rerunning a date fetches all of its games anyway
+                continue
+            if self.retry_policy.blocked_reason() is not None:
+                break
+
+            game_ids = self.deferred_games.game_ids(deferred_date)
+            date_results = self._ingest_box_scores(game_ids, deferred_date, False)
+            stored = [r["game_id"] for r in date_results if r["success"]]
+            # Games that failed for other reasons were quarantined or logged
+            # like any other failure and are not deferred again
+            self.deferred_games.record_date(
+                deferred_date,
+                [r["game_id"] for r in date_results if r.get("deferred")],
+                self.retry_policy.blocked_reason(),
+            )
+            if stored:
+                store_correction_notice(
+                    self.s3_manager,
+                    deferred_date,
+                    stored,
+                    len(game_ids),
+                    **self._league_args,
+                )
+
+            logger.info(
+                f"Caught up deferred games for {deferred_date}",
+                extra={"deferred": len(game_ids), "stored": len(stored)},
+            )
+            results.extend(date_results)
+
+        return results
+
+    def _record_deferred_games(
+        self, target_date: date, game_results: list[dict[str, Any]]
+    ) -> None:
+        """Record the games of a date the retry budget left unfetched."""
+        if not self.deferred_games.loaded:
+            return
+
+        deferred = [r["game_id"] for r in game_results if r.get("deferred")]
+        reason = self.retry_policy.blocked_reason()
+        self.deferred_games.record_date(target_date, deferred, reason)
+
+        if deferred:
+            logger.warning(
+                f"Deferred {len(deferred)} games for {target_date} to a later run",
+                extra={"reason": reason, "retry_budget": self.retry_policy.get_stats()},
+            )
+        if self.deferred_games.changed:
+            try:
+                self.deferred_games.save()
+            except Exception as e:
+                logger.error(f"Failed to record deferred games for {target_date}: {e}")
+
+    def _enrich_player_dimension(self, game_results: list[dict[str, Any]]) -> None:
+        """Add the players of the ingested box scores to the player dimension."""
+        player_ids = set()
+        for game_result in game_results:
+            player_ids.update(game_result.get("player_ids", ()))
+        if not player_ids:
+            return
+
+        try:
+            self.player_dimension.enrich(player_ids)
+        except Exception as e:
+            # Enrichment is best effort; missing players are retried next run
+            logger.warning(f"Failed to enrich player dimension: {e}")
+
+    def _ingest_log_box_score(self, box_score: dict[str, Any], dry_run: bool) -> bool:
+        """Validate and store one box score built from season game logs."""
+        game_id = box_score["game_id"]
+        target_date = date.fromisoformat(box_score["game_date"])
+
+        try:
+            if not self._validate_box_score(
+                box_score, game_id, target_date, "get_season_box_scores"
+            ):
+                return False
+
+            if dry_run:
+                logger.info(f"Dry run: would store box score for game {game_id}")
+            else:
+                self._store_box_score(
+                    box_score, game_id, target_date, source=GAME_LOG_SOURCE
+                )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to bulk load box score for game {game_id}: {e}")
+            return False
+
+    def _ingest_box_scores(
+        self, game_ids: list[str], target_date: date, dry_run: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch, validate and store box scores for a list of games.
+
+        With ``max_workers`` greater than one, games are processed through a
+        bounded thread pool. All workers share ``self.nba_client`` and
+        therefore its rate limiter, so the overall request rate to the NBA API
+        is the same as a sequential run; only HTTP and S3 latency overlap.
+
+        Args:
+            game_ids: Game IDs to ingest, in schedule order
+            target_date: Date the games belong to
+            dry_run: If True, don't write data to S3
+
+        Returns:
+            Per-game results in the same order as ``game_ids``
+        """
+        return self._run_per_game(
+            game_ids,
+            lambda game_id: self._ingest_box_score(game_id, target_date, dry_run),
+            target_date,
+        )
+
+    def _run_per_game(
+        self,
+        game_ids: list[str],
+        work: Callable[[str], dict[str, Any]],
+        target_date: date,
+    ) -> list[dict[str, Any]]:
+        """Run ``work`` for each game, concurrently up to ``max_workers``."""
+        max_workers = min(self.config.max_workers, len(game_ids))
+
+        if max_workers <= 1:
+            return [work(game_id) for game_id in game_ids]
+
+        logger.info(
+            f"Ingesting {len(game_ids)} box scores with {max_workers} workers",
+            extra={"target_date": target_date.isoformat(), "max_workers": max_workers},
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="box-score"
+        ) as executor:
+            # executor.map yields results in submission order
+            return list(executor.map(work, game_ids))
+
+    def _ingest_box_score(
+        self, game_id: str, target_date: date, dry_run: bool
+    ) -> dict[str, Any]:
+        """Fetch, validate and store the box score for a single game."""
+        if self.retry_policy.blocked_reason() is not None:
+            # Out of time or the API is failing; leave it for a later run
+            return {"game_id": game_id, "success": False, "deferred": True}
+
+        box_score = self._fetch_and_validate_box_score(game_id, target_date)
+
+        if box_score is None:
+            # A fetch cut short by the retry budget is deferred, too
+            deferred = self.retry_policy.blocked_reason() is not None
+            return {"game_id": game_id, "success": False, "deferred": deferred}
+
+        if dry_run:
+            logger.info(f"Dry run: would store box score for game {game_id}")
+            return {"game_id": game_id, "success": True}
+
+        try:
+            self._store_box_score(box_score, game_id, target_date)
+        except Exception:
+            # Already logged; the game is failed like one that couldn't be
+            # fetched, and the other games go on
+            return {"game_id": game_id, "success": False, "deferred": False}
+
+        return {
+            "game_id": game_id,
+            "success": True,
+            "player_ids": player_ids_from_box_score(box_score),
+        }
+
     def _fetch_schedule(self, target_date: date) -> list[dict[str, Any]]:
         """Fetch games schedule for the target date."""
         try:
@@ -165,14 +974,14 @@ class DateScopedIngestion:
             )
             raise
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    def _fetch_box_score(self, game_id: str) -> dict[str, Any] | None:
-        """Fetch box score for a specific game."""
+    def _fetch_box_score(
+        self, game_id: str, refresh: bool = False
+    ) -> dict[str, Any] | None:
+        """Fetch box score for a specific game, bypassing the cache on refresh."""
         try:
             logger.debug(f"Fetching box score for game {game_id}")
-            box_score = self.nba_client.get_box_score(game_id)
+            extra = {"refresh": True} if refresh else {}
+            box_score = self.nba_client.get_box_score(game_id, **extra)
             logger.debug(f"Successfully fetched box score for game {game_id}")
             return box_score
         except Exception as e:
@@ -180,50 +989,20 @@ class DateScopedIngestion:
             return None
 
     def _fetch_and_validate_box_score(
-        self, game_id: str, target_date: date
+        self, game_id: str, target_date: date, refresh: bool = False
     ) -> dict[str, Any] | None:
         """Fetch and validate box score for a specific game."""
         try:
             # Fetch raw box score data
-            raw_box_score = self._fetch_box_score(game_id)
+            raw_box_score = self._fetch_box_score(game_id, refresh)
 
             if raw_box_score is None:
                 return None
 
-            # Validate the box score data
-            validation_context = {
-                "expected_game_id": game_id,
-                "target_date": target_date,
-            }
-
-            validation_result = self.validator.validate_api_response(
-                raw_box_score, "box_score", validation_context
-            )
-
-            # Handle validation failures
-            if self.quarantine.should_quarantine(validation_result):
-                self.quarantine.quarantine_api_response(
-                    raw_box_score,
-                    validation_result,
-                    "get_box_score",
-                    target_date,
-                    {"game_id": game_id},
-                )
-
-                # If validation completely failed, return None
-                if not validation_result.get("valid", False):
-                    logger.warning(f"Box score validation failed for game {game_id}")
-                    return None
-
-            # Log validation success
-            logger.debug(
-                f"Box score validation completed for game {game_id}",
-                extra={
-                    "game_id": game_id,
-                    "validation_valid": validation_result.get("valid", False),
-                    "issues_count": len(validation_result.get("issues", [])),
-                },
-            )
+            if not self._validate_box_score(
+                raw_box_score, game_id, target_date, "get_box_score"
+            ):
+                return None
 
             return raw_box_score
 
@@ -233,12 +1012,61 @@ class DateScopedIngestion:
             )
             return None
 
+    def _validate_box_score(
+        self,
+        box_score: dict[str, Any],
+        game_id: str,
+        target_date: date,
+        api_method: str,
+    ) -> bool:
+        """
+        Validate a box score, quarantining it if needed.
+
+        Returns:
+            False if the box score failed validation and must not be stored
+        """
+        validation_context = {
+            "expected_game_id": game_id,
+            "target_date": target_date,
+        }
+
+        validation_result = self.validator.validate_api_response(
+            box_score, "box_score", validation_context
+        )
+
+        # Handle validation failures
+        if self.quarantine.should_quarantine(validation_result):
+            self.quarantine.quarantine_api_response(
+                box_score,
+                validation_result,
+                api_method,
+                target_date,
+                {"game_id": game_id},
+            )
+
+            # If validation completely failed, don't store it
+            if not validation_result.get("valid", False):
+                logger.warning(f"Box score validation failed for game {game_id}")
+                return False
+
+        # Log validation success
+        logger.debug(
+            f"Box score validation completed for game {game_id}",
+            extra={
+                "game_id": game_id,
+                "validation_valid": validation_result.get("valid", False),
+                "issues_count": len(validation_result.get("issues", [])),
+            },
+        )
+
+        return True
+
     def _store_schedule(self, games: list[dict[str, Any]], target_date: date) -> None:
         """Store schedule data as JSON in S3 with date-based partitioning."""
         try:
             # Store as JSON (no DataFrame conversion needed)
             self.s3_manager.store_json(
-                games, entity="schedule", target_date=target_date
+                games, entity="schedule", target_date=target_date, **self._league_args
             )
             logger.info(f"Stored schedule data for {target_date}")
 
@@ -247,16 +1075,24 @@ class DateScopedIngestion:
             raise
 
     def _store_box_score(
-        self, box_score: dict[str, Any], game_id: str, target_date: date
+        self,
+        box_score: dict[str, Any],
+        game_id: str,
+        target_date: date,
+        source: str | None = None,
     ) -> None:
         """Store box score data as JSON in S3 with date-based partitioning."""
         try:
             # Store raw nested box score structure as JSON (ADR-031: one file per game)
+            # Tag the source on the object only when it isn't the live API
+            extra = {"metadata": {"source": source}} if source else {}
             self.s3_manager.store_json(
                 box_score,
                 entity="box",
                 target_date=target_date,
                 game_id=game_id,
+                **extra,
+                **self._league_args,
             )
             logger.debug(f"Stored box score for game {game_id}")
 
@@ -294,7 +1130,11 @@ class DateScopedIngestion:
             logger.error(f"Error validating completeness for {target_date}: {e}")
 
     def _log_ingestion_summary(
-        self, target_date: date, games_count: int, successful_box_scores: int
+        self,
+        target_date: date,
+        games_count: int,
+        successful_box_scores: int,
+        schedule_rows: int | None = None,
     ) -> None:
         """Log summary metrics for the ingestion run."""
         try:
@@ -308,6 +1148,7 @@ class DateScopedIngestion:
                 f"Ingestion summary for {target_date}",
                 extra={
                     "target_date": target_date.isoformat(),
+                    "schedule_rows": schedule_rows,
                     "total_games": games_count,
                     "successful_box_scores": successful_box_scores,
                     "box_score_success_rate": round(box_score_success_rate, 2),
@@ -316,5 +1157,16 @@ class DateScopedIngestion:
                 },
             )
 
+            if self.response_cache is not None:
+                logger.info(
+                    f"NBA API response cache statistics for {target_date}",
+                    extra=self.response_cache.get_stats(),
+                )
+
+            logger.info(
+                f"NBA API retry budget for {target_date}",
+                extra=self.retry_policy.get_stats(),
+            )
+
         except Exception as e:
             logger.error(f"Error logging ingestion summary for {target_date}: {e}")
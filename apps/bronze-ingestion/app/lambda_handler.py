@@ -14,6 +14,7 @@ from typing import Any
 from hoopstat_observability import get_logger
 
 from .ingestion import DateScopedIngestion
+from .multi_league import MultiLeagueIngestion
 
 logger = get_logger(__name__)
 
@@ -87,8 +88,11 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         if dry_run:
             logger.info("Dry run mode - no data will be written")
 
-        # Create and run ingestion
-        ingestion = DateScopedIngestion()
+        # Create and run ingestion for every configured league; API calls stop
+        # before the invocation times out so results are stored
+        ingestion = MultiLeagueIngestion(
+            remaining_time=lambda: context.get_remaining_time_in_millis() / 1000
+        )
         success = ingestion.run(target_date=target_date, dry_run=dry_run)
 
         # Calculate execution time
@@ -13,6 +13,7 @@ import click
 from hoopstat_observability import get_logger
 
 from .ingestion import DateScopedIngestion
+from .multi_league import MultiLeagueIngestion
 from .quarantine_cli import quarantine
 
 logger = get_logger(__name__)
@@ -35,7 +36,7 @@ def cli(debug: bool) -> None:
 )
 @click.option("--dry-run", is_flag=True, help="Run without making changes")
 def ingest(date: datetime | None, dry_run: bool) -> None:
-    """Ingest NBA data for the specified date."""
+    """Ingest data for the specified date in every configured league."""
     # Default to today (UTC) if no date provided
     target_date = date.date() if date else datetime.utcnow().date()
 
@@ -45,7 +46,7 @@ def ingest(date: datetime | None, dry_run: bool) -> None:
         logger.info("Dry run mode - no data will be written")
 
     try:
-        ingestion = DateScopedIngestion()
+        ingestion = MultiLeagueIngestion()
         success = ingestion.run(target_date=target_date, dry_run=dry_run)
 
         if success:
@@ -59,6 +60,187 @@ def ingest(date: datetime | None, dry_run: bool) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--start",
+    "start",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="First date to ingest (YYYY-MM-DD)",
+)
+@click.option(
+    "--end",
+    "end",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Last date to ingest (YYYY-MM-DD), inclusive",
+)
+@click.option("--dry-run", is_flag=True, help="Run without making changes")
+def backfill(start: datetime, end: datetime, dry_run: bool) -> None:
+    """Ingest a date range, fetching only box scores not already stored."""
+    start_date = start.date()
+    end_date = end.date()
+
+    if end_date < start_date:
+        logger.error("Backfill end date must not be before start date")
+        sys.exit(1)
+
+    logger.info(f"Starting bronze layer backfill from {start_date} to {end_date}")
+
+    if dry_run:
+        logger.info("Dry run mode - no data will be written")
+
+    try:
+        ingestion = DateScopedIngestion()
+        report = ingestion.backfill(start_date, end_date, dry_run=dry_run)
+
+        logger.info(
+            f"Backfill finished: {report['box_scores_fetched']} box scores in "
+            f"{report['elapsed_seconds']}s "
+            f"({report['box_scores_per_minute']} per minute)"
+        )
+
+        if report["box_scores_failed"] or report["dates_failed"]:
+            logger.error(
+                "Bronze layer backfill incomplete; rerun the same range to resume"
+            )
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Bronze layer backfill failed: {e}")
+        sys.exit(1)
+
+
+@cli.command("bulk-backfill")
+@click.option(
+    "--season",
+    required=True,
+    help="Season to load in YYYY-YY form, e.g. 2023-24",
+)
+@click.option(
+    "--season-type",
+    type=click.Choice(["Regular Season", "Playoffs", "Pre Season", "All Star"]),
+    default="Regular Season",
+    show_default=True,
+    help="Part of the season to load",
+)
+@click.option("--dry-run", is_flag=True, help="Run without making changes")
+def bulk_backfill(season: str, season_type: str, dry_run: bool) -> None:
+    """Load a whole season from season-wide game logs instead of per game."""
+    logger.info(f"Starting bronze layer bulk backfill for {season} {season_type}")
+
+    if dry_run:
+        logger.info("Dry run mode - no data will be written")
+
+    try:
+        ingestion = DateScopedIngestion()
+        report = ingestion.bulk_backfill(season, season_type, dry_run=dry_run)
+
+        logger.info(
+            f"Bulk backfill finished: {report['box_scores_stored']} of "
+            f"{report['games_found']} box scores stored "
+            f"({report['games_already_stored']} already stored) in "
+            f"{report['elapsed_seconds']}s "
+            f"({report['box_scores_per_minute']} per minute)"
+        )
+
+        if report["box_scores_failed"]:
+            logger.error(
+                "Bronze layer bulk backfill incomplete; rerun the same season to resume"
+            )
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Bronze layer bulk backfill failed: {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--end-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Last date to recheck (YYYY-MM-DD), defaults to yesterday (UTC)",
+)
+@click.option(
+    "--lookback-days",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of days to recheck, defaults to RECHECK_LOOKBACK_DAYS",
+)
+@click.option("--dry-run", is_flag=True, help="Detect corrections without writing")
+def recheck(
+    end_date: datetime | None, lookback_days: int | None, dry_run: bool
+) -> None:
+    """Re-fetch recent box scores and rewrite only stat-corrected games."""
+    logger.info("Starting bronze layer stat-correction recheck")
+
+    if dry_run:
+        logger.info("Dry run mode - no data will be written")
+
+    try:
+        ingestion = DateScopedIngestion()
+        report = ingestion.recheck(
+            end_date=end_date.date() if end_date else None,
+            lookback_days=lookback_days,
+            dry_run=dry_run,
+        )
+
+        logger.info(
+            f"Recheck finished: {report['games_corrected']} of "
+            f"{report['games_checked']} games corrected from "
+            f"{report['start_date']} to {report['end_date']}"
+        )
+
+        if report["games_failed"]:
+            logger.error(f"Recheck could not fetch {report['games_failed']} games")
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Bronze layer recheck failed: {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Date to poll (YYYY-MM-DD), defaults to today (US Eastern)",
+)
+@click.option(
+    "--interval",
+    type=click.IntRange(min=10),
+    default=None,
+    help="Seconds between polls, defaults to LIVE_POLL_INTERVAL_SECONDS",
+)
+@click.option("--dry-run", is_flag=True, help="Detect changes without writing")
+def live(date: datetime | None, interval: int | None, dry_run: bool) -> None:
+    """Poll today's games while in progress, writing only changed box scores."""
+    logger.info("Starting bronze layer live polling")
+
+    if dry_run:
+        logger.info("Dry run mode - no data will be written")
+
+    try:
+        ingestion = DateScopedIngestion()
+        report = ingestion.live(
+            target_date=date.date() if date else None,
+            poll_interval=interval,
+            dry_run=dry_run,
+        )
+
+        logger.info(
+            f"Live polling finished: {report['box_scores_written']} writes from "
+            f"{report['box_scores_fetched']} box score fetches over "
+            f"{report['polls']} polls"
+        )
+
+    except Exception as e:
+        logger.error(f"Bronze layer live polling failed: {e}")
+        sys.exit(1)
+
+
 @cli.command()
 def status() -> None:
     """Check the status of the bronze layer ingestion pipeline."""
@@ -0,0 +1,124 @@
+"""
+Multi-league ingestion for bronze layer.
+
+During the months the NBA and WNBA seasons overlap, every configured league
+is ingested for a date by one process instead of one invocation per league.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any
+
+from hoopstat_observability import get_logger
+
+from .config import BronzeIngestionConfig
+from .ingestion import DateScopedIngestion
+
+logger = get_logger(__name__)
+
+
+class MultiLeagueIngestion:
+    """
+    Ingest all configured leagues for a date concurrently.
+
+    Each league runs its own ``DateScopedIngestion`` on its own thread with
+    its own NBA client, so each league has a separate rate-limit budget and
+    the leagues' fetch phases overlap. The leagues share one S3 manager,
+    quarantine, summary manager and retry policy, so the invocation has a
+    single retry budget and deadline. Each league still writes its own bronze
+    summary, which triggers one silver run per league.
+    """
+
+    def __init__(
+        self,
+        config: BronzeIngestionConfig | None = None,
+        remaining_time: Callable[[], float] | None = None,
+    ):
+        """
+        Initialize one date-scoped ingestion per configured league.
+
+        Args:
+            config: Ingestion configuration, loaded from the environment if
+                not given
+            remaining_time: Callable returning the seconds left before the
+                invocation must end, e.g. from the Lambda context
+        """
+        self.config = config or BronzeIngestionConfig.load()
+        self.leagues = self.config.league_names
+
+        first = DateScopedIngestion(
+            self.config, league=self.leagues[0], remaining_time=remaining_time
+        )
+        self.ingestions = {self.leagues[0]: first}
+        for league in self.leagues[1:]:
+            self.ingestions[league] = DateScopedIngestion(
+                self.config, league=league, shared_with=first
+            )
+
+        self.records_processed = 0
+        self.league_results: dict[str, dict[str, Any]] = {}
+
+    def run(self, target_date: date, dry_run: bool = False) -> bool:
+        """
+        Run every league's ingestion for a date.
+
+        A league that fails does not stop the others; its result is
+        reported and the run as a whole fails.
+
+        Args:
+            target_date: Date to fetch data for
+            dry_run: If True, don't write data to S3
+
+        Returns:
+            True if every league succeeded, False otherwise
+        """
+        logger.info(
+            f"Starting ingestion for {target_date}", extra={"leagues": self.leagues}
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.leagues), thread_name_prefix="league"
+        ) as executor:
+            successes = list(
+                executor.map(
+                    lambda league: self._run_league(league, target_date, dry_run),
+                    self.leagues,
+                )
+            )
+
+        self.league_results = {
+            league: {
+                "success": success,
+                "records_processed": self.ingestions[league].records_processed,
+            }
+            for league, success in zip(self.leagues, successes, strict=True)
+        }
+        self.records_processed = sum(
+            result["records_processed"] for result in self.league_results.values()
+        )
+
+        failed = [
+            league
+            for league, result in self.league_results.items()
+            if not result["success"]
+        ]
+        if failed:
+            logger.error(
+                f"Ingestion failed for {target_date} in {failed}",
+                extra={"league_results": self.league_results},
+            )
+        else:
+            logger.info(
+                f"Ingestion completed for {target_date}",
+                extra={"league_results": self.league_results},
+            )
+        return not failed
+
+    def _run_league(self, league: str, target_date: date, dry_run: bool) -> bool:
+        """Run one league's ingestion, isolating its failures."""
+        try:
+            return self.ingestions[league].run(target_date, dry_run)
+        except Exception as e:
+            logger.error(f"{league.upper()} ingestion failed for {target_date}: {e}")
+            return False
@@ -0,0 +1,230 @@
+"""
+Incremental player-dimension enrichment for the bronze layer.
+
+A persistent player dimension (position, height, draft data, ...) is kept in
+the bronze bucket. After an ingestion run only players that appear in the
+new box scores but are missing from the dimension are looked up with
+``CommonPlayerInfo``, plus a few of the stalest entries, so each daily run
+costs at most a handful of extra API calls instead of a sweep of every player.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from botocore.exceptions import ClientError
+from hoopstat_data.compression import (
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
+from hoopstat_nba_api import NBAClient
+from hoopstat_observability import get_logger
+
+from .corrections import LEAGUE_METADATA_PREFIX
+from .s3_manager import BronzeS3Manager
+
+logger = get_logger(__name__)
+
+# Player dimension of the NBA; other leagues write
+# _metadata/leagues/<league>/player_dimension.json
+PLAYER_DIMENSION_KEY = "_metadata/player_dimension.json"
+PLAYER_DIMENSION_VERSION = "1.0"
+
+# CommonPlayerInfo columns kept in the dimension, by dimension field
+_PLAYER_INFO_FIELDS = {
+    "name": "DISPLAY_FIRST_LAST",
+    "position": "POSITION",
+    "height": "HEIGHT",
+    "weight": "WEIGHT",
+    "birthdate": "BIRTHDATE",
+    "country": "COUNTRY",
+    "school": "SCHOOL",
+    "jersey": "JERSEY",
+    "team_id": "TEAM_ID",
+    "team_abbreviation": "TEAM_ABBREVIATION",
+    "from_year": "FROM_YEAR",
+    "to_year": "TO_YEAR",
+    "draft_year": "DRAFT_YEAR",
+    "draft_round": "DRAFT_ROUND",
+    "draft_number": "DRAFT_NUMBER",
+}
+
+
+def player_dimension_key(league: str | None = None) -> str:
+    """Get the key of a league's player dimension."""
+    if league:
+        return f"{LEAGUE_METADATA_PREFIX}{league}/player_dimension.json"
+    return PLAYER_DIMENSION_KEY
+
+
+def player_ids_from_box_score(box_score: dict[str, Any]) -> set[int]:
+    """
+    Get the IDs of the players listed in a V3 box score.
+
+    Args:
+        box_score: ``BoxScoreTraditionalV3`` response
+
+    Returns:
+        Person IDs of both teams' players
+    """
+    game = box_score.get("boxScoreTraditional") or {}
+    player_ids = set()
+    for team_key in ("homeTeam", "awayTeam"):
+        for player in (game.get(team_key) or {}).get("players") or []:
+            person_id = player.get("personId")
+            if isinstance(person_id, int):
+                player_ids.add(person_id)
+    return player_ids
+
+
+def parse_player_info(response: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a ``CommonPlayerInfo`` response into a dimension entry.
+
+    Args:
+        response: Raw ``CommonPlayerInfo`` response
+
+    Returns:
+        Dimension fields; columns missing from the response are None
+
+    Raises:
+        ValueError: If the response has no player row
+    """
+    result_set = next(
+        (
+            result_set
+            for result_set in response.get("resultSets", [])
+            if result_set.get("name") == "CommonPlayerInfo"
+        ),
+        None,
+    )
+    rows = (result_set or {}).get("rowSet") or []
+    if not rows:
+        raise ValueError("CommonPlayerInfo response has no player row")
+
+    row = dict(zip(result_set.get("headers", []), rows[0], strict=False))
+    return {field: row.get(column) for field, column in _PLAYER_INFO_FIELDS.items()}
+
+
+class PlayerDimension:
+    """
+    Persistent player dimension enriched incrementally from box scores.
+
+    Entries are keyed by player ID and record when they were fetched. An
+    entry older than ``ttl`` is stale; at most ``max_refreshes`` stale
+    entries, oldest first, are refetched per run, so a long TTL spreads the
+    refresh of the whole dimension over many runs.
+    """
+
+    def __init__(
+        self,
+        s3_manager: BronzeS3Manager,
+        nba_client: NBAClient,
+        ttl: timedelta,
+        max_refreshes: int,
+        league: str | None = None,
+    ):
+        """
+        Initialize the player dimension.
+
+        Args:
+            s3_manager: S3 manager for the bronze bucket
+            nba_client: Client used to fetch player info
+            ttl: Age after which an entry is refreshed
+            max_refreshes: Upper bound on stale entries refreshed per run
+            league: League segment of the dimension key, or None for the NBA
+        """
+        self.s3_manager = s3_manager
+        self.nba_client = nba_client
+        self.ttl = ttl
+        self.max_refreshes = max_refreshes
+        self.key = player_dimension_key(league)
+
+    def enrich(self, player_ids: set[int]) -> dict[str, Any]:
+        """
+        Add missing players to the dimension and refresh the stalest entries.
+
+        Args:
+            player_ids: IDs of the players in this run's box scores
+
+        Returns:
+            Report with the number of players known, missing, added,
+            refreshed and failed
+        """
+        players = self._load()
+        now = datetime.now(UTC)
+
+        missing = sorted(
+            player_id for player_id in player_ids if str(player_id) not in players
+        )
+        stale_before = (now - self.ttl).isoformat()
+        stale = sorted(
+            (entry["fetched_at"], int(player_id))
+            for player_id, entry in players.items()
+            if entry["fetched_at"] < stale_before
+        )[: self.max_refreshes]
+
+        report = {
+            "players_known": len(players),
+            "players_missing": len(missing),
+            "players_added": 0,
+            "players_refreshed": 0,
+            "players_failed": 0,
+        }
+        lookups = [(player_id, "players_added") for player_id in missing]
+        lookups += [(player_id, "players_refreshed") for _, player_id in stale]
+        for player_id, outcome in lookups:
+            try:
+                info = parse_player_info(self.nba_client.get_player_info(player_id))
+            except Exception as e:
+                # Missing players are retried by the next run
+                logger.warning(f"Failed to fetch info for player {player_id}: {e}")
+                report["players_failed"] += 1
+                continue
+
+            players[str(player_id)] = {
+                "player_id": player_id,
+                **info,
+                "fetched_at": now.isoformat(),
+            }
+            report[outcome] += 1
+
+        if report["players_added"] or report["players_refreshed"]:
+            self._store(players)
+
+        logger.info(f"Player dimension enrichment for {self.key}", extra=report)
+        return report
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load the dimension's entries by player ID, empty if none exist yet."""
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=self.key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                logger.info(f"No player dimension at {self.key}, starting empty")
+                return {}
+            raise
+
+        dimension = decode_json(response["Body"].read(), object_encoding(response))
+        return dimension.get("players", {})
+
+    def _store(self, players: dict[str, dict[str, Any]]) -> None:
+        """Store the dimension in the bucket's configured encoding."""
+        dimension = {
+            "dimension_version": PLAYER_DIMENSION_VERSION,
+            "player_count": len(players),
+            "updated_at": datetime.now(UTC).isoformat(),
+            "players": players,
+        }
+        compression = self.s3_manager.compression
+        self.s3_manager.s3_client.put_object(
+            Bucket=self.s3_manager.bucket_name,
+            Key=self.key,
+            Body=encode_json(dimension, compression),
+            ContentType="application/json",
+            **storage_put_args(compression, {"type": "bronze_player_dimension"}),
+        )
+        logger.debug(f"Stored player dimension with {len(players)} players")
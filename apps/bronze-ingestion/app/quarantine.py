@@ -5,17 +5,75 @@ Provides functionality to quarantine invalid data for manual review
 and investigation while ensuring the ingestion pipeline continues.
 """
 
+import gzip
 import json
-from datetime import date, datetime
+import re
+import threading
+import zlib
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from botocore.exceptions import ClientError
+from hoopstat_data.compression import (
+    COMPRESSION_NONE,
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
 from hoopstat_observability import get_logger
 
+from .compiled_validation import SCHEMA_ISSUE_CODES, IssueCode
 from .s3_manager import BronzeS3Manager
 
 logger = get_logger(__name__)
 
+# Per-day quarantine index objects: _metadata/quarantine_index/YYYY-MM-DD.json
+QUARANTINE_INDEX_PREFIX = "_metadata/quarantine_index/"
+QUARANTINE_INDEX_VERSION = 1
+
+# Attempts to update an index that other processes keep changing
+MAX_INDEX_ATTEMPTS = 5
+
+# Compacted day archive: quarantine/year=/month=/day=/archive.ndjson.gz holds
+# one gzip member per record, so any record can be read with a ranged GET
+QUARANTINE_ARCHIVE_NAME = "archive.ndjson.gz"
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+
+# Read size when walking an archive's gzip members
+_ARCHIVE_READ_CHUNK = 64 * 1024
+
+_KEY_DATE_PATTERN = re.compile(r"year=(\d{4})/month=(\d{1,2})/day=(\d{1,2})/")
+
+
+class QuarantineIndexConflictError(Exception):
+    """Raised when a day's quarantine index changed since it was read."""
+
+
+class QuarantineArchiveConflictError(Exception):
+    """Raised when a day's archive changed while it was being compacted."""
+
+
+def quarantine_key_date(quarantine_key: str) -> date | None:
+    """
+    Get the date partition of a quarantine key.
+
+    Args:
+        quarantine_key: Key like quarantine/year=YYYY/month=MM/day=DD/...
+
+    Returns:
+        The partition date, or None if the key has no date partition
+    """
+    match = _KEY_DATE_PATTERN.search(quarantine_key)
+    if match is None:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    return date(year, month, day)
+
 
 class ErrorClassification(Enum):
     """
@@ -73,13 +131,44 @@ _CLASSIFICATION_KEYWORDS: dict[ErrorClassification, list[str]] = {
 }
 
 
+# Classification of structured issue codes from DataValidator
+_ISSUE_CODE_CLASSIFICATIONS: dict[IssueCode, ErrorClassification] = {
+    IssueCode.MISSING_FIELD: ErrorClassification.SCHEMA_CHANGE,
+    IssueCode.WRONG_TYPE: ErrorClassification.SCHEMA_CHANGE,
+    IssueCode.TOO_FEW_ITEMS: ErrorClassification.SCHEMA_CHANGE,
+    IssueCode.UNKNOWN_FORMAT: ErrorClassification.SCHEMA_CHANGE,
+    IssueCode.ROW_LENGTH_MISMATCH: ErrorClassification.SCHEMA_CHANGE,
+    IssueCode.INVALID_FORMAT: ErrorClassification.DATA_QUALITY,
+    IssueCode.OUT_OF_RANGE: ErrorClassification.DATA_QUALITY,
+    IssueCode.INVALID_GAME_ID: ErrorClassification.DATA_QUALITY,
+    IssueCode.GAME_ID_MISMATCH: ErrorClassification.DATA_QUALITY,
+    IssueCode.DATE_INCONSISTENT: ErrorClassification.DATA_QUALITY,
+    IssueCode.FEWER_GAMES_THAN_EXPECTED: ErrorClassification.DATA_QUALITY,
+    IssueCode.UNREALISTIC_VALUE: ErrorClassification.DATA_QUALITY,
+    IssueCode.GAME_VALIDATION_FAILED: ErrorClassification.DATA_QUALITY,
+    IssueCode.VALIDATION_ERROR: ErrorClassification.UNKNOWN,
+}
+
+# Issue codes that quarantine data even when validation passed
+_CRITICAL_ISSUE_CODES = SCHEMA_ISSUE_CODES | {IssueCode.INVALID_GAME_ID}
+
+
+def _issue_codes(validation_result: dict[str, Any]) -> list[IssueCode] | None:
+    """Get the structured issue codes of a validation result, if it has them."""
+    codes = validation_result.get("issue_codes")
+    if codes is None:
+        return None
+    return [IssueCode(code) for code in codes]
+
+
 def classify_quarantine_error(
     validation_result: dict[str, Any],
 ) -> ErrorClassification:
     """
     Classify quarantine error based on validation issues.
 
-    Inspects the validation issues list and returns the most severe
+    Uses the structured issue codes when the result has them, otherwise
+    matches keywords in the issue messages, and returns the most severe
     matching ErrorClassification. When multiple issue types are present,
     the highest-severity classification wins.
 
@@ -89,6 +178,15 @@ def classify_quarantine_error(
     Returns:
         The most severe ErrorClassification matching the issues.
     """
+    codes = _issue_codes(validation_result)
+    if codes is not None:
+        matched_classifications = {
+            _ISSUE_CODE_CLASSIFICATIONS[code] for code in codes
+        } - {ErrorClassification.UNKNOWN}
+        if not matched_classifications:
+            return ErrorClassification.UNKNOWN
+        return max(matched_classifications, key=lambda c: _SEVERITY_ORDER.index(c))
+
     issues = validation_result.get("issues", [])
 
     if not issues:
@@ -117,18 +215,33 @@ class DataQuarantine:
     Manages quarantining of invalid data for manual review.
 
     Stores invalid data in a structured way with metadata about
-    validation failures for investigation and debugging.
+    validation failures for investigation and debugging. Each record's
+    metadata is also appended to a per-day index object, so listing and
+    summarising quarantine reads one small object per day instead of every
+    record.
+
+    Finished days can be compacted into a single gzip NDJSON archive. The
+    day's index then doubles as the archive's offset table, and records are
+    read back with ranged GETs.
     """
 
-    def __init__(self, s3_manager: BronzeS3Manager):
+    def __init__(
+        self, s3_manager: BronzeS3Manager, compression: str = COMPRESSION_NONE
+    ):
         """
         Initialize the data quarantine system.
 
         Args:
             s3_manager: S3 manager for storing quarantined data
+            compression: Storage encoding for quarantine records ("none",
+                "gzip" or "zstd")
         """
         self.s3_manager = s3_manager
+        self.compression = compression
         self.quarantine_prefix = "quarantine"
+        # Serializes read-modify-write updates of the index objects within
+        # this process; other processes are kept apart by conditional writes
+        self._index_lock = threading.Lock()
 
     def quarantine_data(
         self,
@@ -179,7 +292,23 @@ class DataQuarantine:
             )
 
             # Store in S3 quarantine area
-            self._store_quarantine_record(quarantine_record, quarantine_key)
+            size = self._store_quarantine_record(quarantine_record, quarantine_key)
+
+            self._index_record(
+                target_date,
+                {
+                    "key": quarantine_key,
+                    "data_type": data_type,
+                    "target_date": target_date.isoformat(),
+                    "error_classification": classification.value,
+                    "issues_count": quarantine_record["metadata"]["issues_count"],
+                    "status": "quarantined",
+                    "size": size,
+                    "quarantined_at": quarantine_record["metadata"][
+                        "quarantine_timestamp"
+                    ],
+                },
+            )
 
             # Log quarantine action
             logger.warning(
@@ -238,77 +367,707 @@ class DataQuarantine:
         """Generate a structured key for quarantined data."""
         return (
             f"{self.quarantine_prefix}/"
-            f"year={target_date.year}/"
-            f"month={target_date.month:02d}/"
-            f"day={target_date.day:02d}/"
+            f"{self._date_prefix(target_date)}"
             f"{data_type}/"
             f"quarantine_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}.json"
         )
 
-    def _store_quarantine_record(self, record: dict[str, Any], key: str) -> None:
-        """Store quarantine record in S3."""
+    def _store_quarantine_record(self, record: dict[str, Any], key: str) -> int:
+        """Store quarantine record in S3 and return its stored size in bytes."""
         try:
-            # Convert to JSON string
-            json_data = json.dumps(record, default=str, indent=2)
+            # Convert to JSON bytes in the configured encoding
+            json_bytes = encode_json(record, self.compression, default=str)
 
             # Store in S3
             self.s3_manager.s3_client.put_object(
                 Bucket=self.s3_manager.bucket_name,
                 Key=key,
-                Body=json_data.encode("utf-8"),
+                Body=json_bytes,
                 ContentType="application/json",
-                Metadata={
-                    "quarantine_timestamp": datetime.utcnow().isoformat(),
-                    "data_type": record["metadata"]["data_type"],
-                    "issues_count": str(record["metadata"]["issues_count"]),
-                },
+                **storage_put_args(
+                    self.compression,
+                    {
+                        "quarantine_timestamp": datetime.utcnow().isoformat(),
+                        "data_type": record["metadata"]["data_type"],
+                        "issues_count": str(record["metadata"]["issues_count"]),
+                    },
+                ),
             )
 
             logger.debug(f"Quarantine record stored at {key}")
+            return len(json_bytes)
 
         except Exception as e:
             logger.error(f"Failed to store quarantine record at {key}: {e}")
             raise
 
+    def _index_key(self, index_date: date) -> str:
+        """Get the S3 key of a day's index object."""
+        return f"{QUARANTINE_INDEX_PREFIX}{index_date.isoformat()}.json"
+
+    @staticmethod
+    def _new_index(index_date: date) -> dict[str, Any]:
+        """Create an empty index for a day."""
+        return {
+            "version": QUARANTINE_INDEX_VERSION,
+            "date": index_date.isoformat(),
+            "records": {},
+        }
+
+    def _load_index(self, index_date: date) -> dict[str, Any] | None:
+        """Load a day's index, or None if it has not been written yet."""
+        return self._load_index_with_etag(index_date)[0]
+
+    def _load_index_with_etag(
+        self, index_date: date
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Load a day's index along with its ETag.
+
+        Returns:
+            Tuple of (index, ETag); (None, None) if it has not been written yet
+        """
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=self._index_key(index_date)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None, None
+            raise
+        index = decode_json(response["Body"].read(), object_encoding(response))
+        return index, response["ETag"]
+
+    def _store_index(
+        self, index_date: date, index: dict[str, Any], etag: str | None
+    ) -> None:
+        """
+        Write a day's index back to S3.
+
+        Args:
+            index_date: Day of the index
+            index: Index to store
+            etag: ETag the index was read with, or None if it did not exist
+
+        Raises:
+            QuarantineIndexConflictError: If the index changed since it was read
+        """
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        try:
+            self.s3_manager.s3_client.put_object(
+                Bucket=self.s3_manager.bucket_name,
+                Key=self._index_key(index_date),
+                Body=encode_json(index, self.compression),
+                ContentType="application/json",
+                **storage_put_args(self.compression),
+                **condition,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ):
+                raise QuarantineIndexConflictError(
+                    f"Quarantine index for {index_date} changed while it was "
+                    "being updated"
+                ) from e
+            raise
+
+    def _update_index(
+        self, index_date: date, update: Callable[[dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """
+        Apply a change to a day's index with a conditional write.
+
+        If another process wrote the index between the read and the write,
+        the change is applied again to a fresh read. A day's first index
+        also takes in the records already stored for the day, so records
+        quarantined before indexing existed stay visible.
+
+        Args:
+            index_date: Day of the index
+            update: Function that changes the loaded index in place
+
+        Returns:
+            The index as stored
+
+        Raises:
+            QuarantineIndexConflictError: If the index kept changing for
+                every attempt
+        """
+        with self._index_lock:
+            for attempt in range(1, MAX_INDEX_ATTEMPTS + 1):
+                index, etag = self._load_index_with_etag(index_date)
+                if index is None:
+                    index = self._new_index(index_date)
+                    update(index)
+                    self._add_unindexed_records(index_date, index)
+                else:
+                    update(index)
+                try:
+                    self._store_index(index_date, index, etag)
+                    return index
+                except QuarantineIndexConflictError:
+                    if attempt == MAX_INDEX_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        f"Quarantine index for {index_date} changed while "
+                        f"updating, retrying ({attempt}/{MAX_INDEX_ATTEMPTS})"
+                    )
+
+    def _add_unindexed_records(self, index_date: date, index: dict[str, Any]) -> None:
+        """
+        Add a day's stored records that are missing from its new index.
+
+        One listing of the day's partition; only records missing from the
+        index are read, so a day whose first record is being indexed costs no
+        extra reads.
+        """
+        archived = {}
+        for obj in self._list_day_objects(index_date):
+            if self._is_archive_key(obj["Key"]):
+                archived = self._entries_from_archive(obj["Key"])
+            elif obj["Key"] not in index["records"]:
+                index["records"][obj["Key"]] = self._entry_from_record(obj)
+        # Loose records were written after the archive and take precedence
+        for key, entry in archived.items():
+            index["records"].setdefault(key, entry)
+
+    def _index_record(self, index_date: date, entry: dict[str, Any]) -> None:
+        """Add or update a record's entry in its day's index."""
+
+        def merge(index: dict[str, Any]) -> None:
+            existing = index["records"].get(entry["key"], {})
+            index["records"][entry["key"]] = {**existing, **entry}
+
+        try:
+            self._update_index(index_date, merge)
+        except Exception as e:
+            # The record itself is stored; `quarantine reindex` can recover it
+            logger.error(
+                f"Failed to index quarantine record {entry['key']}: {e}",
+                extra={"quarantine_key": entry["key"]},
+            )
+
+    def record_status(self, quarantine_key: str, status: str) -> None:
+        """
+        Record a quarantine record's new status in its day's index.
+
+        Args:
+            quarantine_key: S3 key of the quarantine record
+            status: New record status
+        """
+        index_date = quarantine_key_date(quarantine_key)
+        if index_date is None:
+            logger.warning(
+                f"Cannot index quarantine key without date: {quarantine_key}"
+            )
+            return
+        self._index_record(index_date, {"key": quarantine_key, "status": status})
+
+    def rebuild_index(self, target_date: date | None = None) -> int:
+        """
+        Rebuild the index objects from the quarantine records themselves.
+
+        Lists the quarantine area (paginated) and reads every record once;
+        compacted archives are walked member by member to recover offsets.
+        Use it for records written before indexing existed, or after an
+        index update failed.
+
+        Args:
+            target_date: Only rebuild this day's index (default: all days)
+
+        Returns:
+            Number of records indexed
+        """
+        prefix = f"{self.quarantine_prefix}/"
+        if target_date:
+            prefix += self._date_prefix(target_date)
+
+        indexes: dict[date, dict[str, Any]] = {}
+        archived: dict[date, dict[str, dict[str, Any]]] = {}
+        paginator = self.s3_manager.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.s3_manager.bucket_name, Prefix=prefix
+        ):
+            for obj in page.get("Contents", []):
+                index_date = quarantine_key_date(obj["Key"])
+                if index_date is None:
+                    continue
+                index = indexes.setdefault(index_date, self._new_index(index_date))
+                if self._is_archive_key(obj["Key"]):
+                    archived[index_date] = self._entries_from_archive(obj["Key"])
+                else:
+                    index["records"][obj["Key"]] = self._entry_from_record(obj)
+
+        # Loose records were written after the archive and take precedence
+        for index_date, entries in archived.items():
+            index = indexes[index_date]
+            index["records"] = {**entries, **index["records"]}
+
+        # Entries indexed since the listing are kept; the records themselves
+        # take precedence over every other entry
+        for index_date, index in indexes.items():
+            self._update_index(
+                index_date,
+                lambda current, rebuilt=index: current["records"].update(
+                    rebuilt["records"]
+                ),
+            )
+
+        indexed = sum(len(index["records"]) for index in indexes.values())
+        logger.info(
+            f"Rebuilt {len(indexes)} quarantine index(es) with {indexed} records"
+        )
+        return indexed
+
+    def _entry_from_record(self, obj: dict[str, Any]) -> dict[str, Any]:
+        """Build an index entry by reading a listed quarantine record."""
+        response = self.s3_manager.s3_client.get_object(
+            Bucket=self.s3_manager.bucket_name, Key=obj["Key"]
+        )
+        record = decode_json(response["Body"].read(), object_encoding(response))
+        return self._record_entry(
+            obj["Key"], record, obj["Size"], obj["LastModified"].isoformat()
+        )
+
+    @staticmethod
+    def _record_entry(
+        key: str,
+        record: dict[str, Any],
+        size: int,
+        stored_at: str | None = None,
+    ) -> dict[str, Any]:
+        """Build an index entry from a quarantine record's metadata."""
+        metadata = record.get("metadata", {})
+        return {
+            "key": key,
+            "data_type": metadata.get("data_type", "unknown"),
+            "target_date": metadata.get("target_date"),
+            "error_classification": metadata.get("error_classification", "unknown"),
+            "issues_count": metadata.get("issues_count", 0),
+            "status": metadata.get("status", "quarantined"),
+            "size": size,
+            "quarantined_at": metadata.get("quarantine_timestamp") or stored_at,
+        }
+
+    def _archive_key(self, target_date: date) -> str:
+        """Get the S3 key of a day's compacted archive."""
+        return (
+            f"{self.quarantine_prefix}/{self._date_prefix(target_date)}"
+            f"{QUARANTINE_ARCHIVE_NAME}"
+        )
+
+    @staticmethod
+    def _is_archive_key(key: str) -> bool:
+        """Check whether a key is a compacted day archive."""
+        return key.endswith(f"/{QUARANTINE_ARCHIVE_NAME}")
+
+    def _entries_from_archive(self, archive_key: str) -> dict[str, dict[str, Any]]:
+        """Build index entries for every record in an archive."""
+        response = self.s3_manager.s3_client.get_object(
+            Bucket=self.s3_manager.bucket_name, Key=archive_key
+        )
+        body = memoryview(response["Body"].read())
+
+        entries = {}
+        offset = 0
+        while offset < len(body):
+            # Decompress one gzip member; whatever it did not consume
+            # belongs to the next member
+            decompressor = zlib.decompressobj(wbits=31)
+            chunks = []
+            position = offset
+            while not decompressor.eof and position < len(body):
+                chunk = body[position : position + _ARCHIVE_READ_CHUNK]
+                chunks.append(decompressor.decompress(chunk))
+                position += len(chunk)
+            length = position - len(decompressor.unused_data) - offset
+
+            line = json.loads(b"".join(chunks))
+            entries[line["key"]] = {
+                **self._record_entry(line["key"], line["record"], length),
+                "archive": archive_key,
+                "offset": offset,
+                "length": length,
+            }
+            offset += length
+
+        return entries
+
+    @staticmethod
+    def _date_prefix(target_date: date) -> str:
+        """Get the year=/month=/day=/ partition path for a date."""
+        return (
+            f"year={target_date.year}/"
+            f"month={target_date.month:02d}/"
+            f"day={target_date.day:02d}/"
+        )
+
+    def _list_index_dates(self) -> list[date]:
+        """List the days that have an index object."""
+        index_dates = []
+        paginator = self.s3_manager.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.s3_manager.bucket_name, Prefix=QUARANTINE_INDEX_PREFIX
+        ):
+            for obj in page.get("Contents", []):
+                name = obj["Key"][len(QUARANTINE_INDEX_PREFIX) :].removesuffix(".json")
+                try:
+                    index_dates.append(date.fromisoformat(name))
+                except ValueError:
+                    continue
+        return sorted(index_dates)
+
+    def _list_quarantine_dates(self) -> list[date]:
+        """
+        List the days with a quarantine partition.
+
+        Walks the year=/month=/day=/ prefixes with a delimiter, so the number
+        of requests grows with the number of days, not of records.
+        """
+        paginator = self.s3_manager.s3_client.get_paginator("list_objects_v2")
+        prefixes = [f"{self.quarantine_prefix}/"]
+        for _ in ("year", "month", "day"):
+            prefixes = [
+                common["Prefix"]
+                for prefix in prefixes
+                for page in paginator.paginate(
+                    Bucket=self.s3_manager.bucket_name, Prefix=prefix, Delimiter="/"
+                )
+                for common in page.get("CommonPrefixes", [])
+            ]
+        return sorted(
+            day for day in map(quarantine_key_date, prefixes) if day is not None
+        )
+
+    def _list_days(self) -> list[date]:
+        """List every day with an index or a quarantine partition."""
+        return sorted(
+            set(self._list_index_dates()) | set(self._list_quarantine_dates())
+        )
+
+    def _index_entries(self, target_date: date | None = None) -> list[dict[str, Any]]:
+        """Get the index entries for one day, or for every quarantined day."""
+        if target_date is None:
+            index_dates = self._list_index_dates()
+            indexed = set(index_dates)
+            for day in self._list_quarantine_dates():
+                # Records written before indexing existed
+                if day not in indexed and self.rebuild_index(day):
+                    index_dates.append(day)
+            indexes = [self._load_index(day) for day in sorted(index_dates)]
+        else:
+            index = self._load_index(target_date)
+            if index is None and self.rebuild_index(target_date):
+                # Records written before indexing existed
+                index = self._load_index(target_date)
+            indexes = [index]
+
+        return [
+            entry
+            for index in indexes
+            if index is not None
+            for entry in index["records"].values()
+        ]
+
+    def get_quarantined_record(self, quarantine_key: str) -> dict[str, Any] | None:
+        """
+        Read a quarantine record, whether loose or compacted into an archive.
+
+        A loose object at the key takes precedence: replays rewrite records
+        at their original key, after the day may have been compacted.
+
+        Args:
+            quarantine_key: Key the record was quarantined under
+
+        Returns:
+            The quarantine record, or None if it does not exist
+        """
+        try:
+            response = self.s3_manager.s3_client.get_object(
+                Bucket=self.s3_manager.bucket_name, Key=quarantine_key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            return self.get_archived_record(quarantine_key)
+        return decode_json(response["Body"].read(), object_encoding(response))
+
+    def get_archived_record(self, quarantine_key: str) -> dict[str, Any] | None:
+        """
+        Read a compacted quarantine record with a ranged GET on its archive.
+
+        Args:
+            quarantine_key: Key the record was quarantined under
+
+        Returns:
+            The quarantine record, or None if the day's index has no archive
+            offset for it
+        """
+        index_date = quarantine_key_date(quarantine_key)
+        index = self._load_index(index_date) if index_date else None
+        entry = index["records"].get(quarantine_key) if index else None
+        if not entry or not entry.get("archive"):
+            return None
+
+        end = entry["offset"] + entry["length"] - 1
+        response = self.s3_manager.s3_client.get_object(
+            Bucket=self.s3_manager.bucket_name,
+            Key=entry["archive"],
+            Range=f"bytes={entry['offset']}-{end}",
+        )
+        return json.loads(gzip.decompress(response["Body"].read()))["record"]
+
+    def compact_day(self, target_date: date) -> int:
+        """
+        Merge a finished day's loose quarantine records into its archive.
+
+        Each record is appended to ``archive.ndjson.gz`` as its own gzip
+        member (so the archive is also a plain multi-member gzip NDJSON
+        file), its offset and length are recorded in the day's index, and
+        the loose objects are deleted in batches. Records quarantined for the
+        day after an earlier compaction are appended on the next run.
+
+        The archive and the index are written conditionally. If another
+        compaction of the day replaced the archive first, the day is compacted
+        again from a fresh listing. Loose records are deleted only once the
+        index points at their archived copies, and a record rewritten while
+        its day was being compacted is kept loose for the next run.
+
+        Args:
+            target_date: Day to compact
+
+        Returns:
+            Number of records moved into the archive
+
+        Raises:
+            QuarantineArchiveConflictError: If the archive kept changing for
+                every attempt
+        """
+        for attempt in range(1, MAX_INDEX_ATTEMPTS + 1):
+            try:
+                return self._compact_day_once(target_date)
+            except QuarantineArchiveConflictError:
+                if attempt == MAX_INDEX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Quarantine archive for {target_date} changed while "
+                    f"compacting, retrying ({attempt}/{MAX_INDEX_ATTEMPTS})"
+                )
+
+    def _compact_day_once(self, target_date: date) -> int:
+        """Compact a day once; see ``compact_day``."""
+        s3_client = self.s3_manager.s3_client
+        bucket = self.s3_manager.bucket_name
+        loose = [
+            obj
+            for obj in self._list_day_objects(target_date)
+            if not self._is_archive_key(obj["Key"])
+        ]
+        if not loose:
+            return 0
+
+        archive_key = self._archive_key(target_date)
+        try:
+            response = s3_client.get_object(Bucket=bucket, Key=archive_key)
+            archive = bytearray(response["Body"].read())
+            archive_etag = response["ETag"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            archive = bytearray()
+            archive_etag = None
+
+        entries = {}
+        etags = {}
+        for obj in loose:
+            try:
+                response = s3_client.get_object(Bucket=bucket, Key=obj["Key"])
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in (
+                    "NoSuchKey",
+                    "404",
+                ):
+                    raise
+                # Compacted by another run since the listing
+                continue
+            record = decode_json(response["Body"].read(), object_encoding(response))
+            line = json.dumps(
+                {"key": obj["Key"], "record": record},
+                separators=(",", ":"),
+                default=str,
+            )
+            # mtime=0 keeps each member deterministic for identical records
+            member = gzip.compress(line.encode("utf-8") + b"\n", mtime=0)
+            entries[obj["Key"]] = {
+                **self._record_entry(
+                    obj["Key"], record, len(member), obj["LastModified"].isoformat()
+                ),
+                "archive": archive_key,
+                "offset": len(archive),
+                "length": len(member),
+            }
+            etags[obj["Key"]] = response["ETag"]
+            archive += member
+        if not entries:
+            return 0
+
+        condition = {"IfMatch": archive_etag} if archive_etag else {"IfNoneMatch": "*"}
+        try:
+            s3_client.put_object(
+                Bucket=bucket,
+                Key=archive_key,
+                Body=bytes(archive),
+                ContentType="application/x-ndjson",
+                Metadata={"format": "ndjson", "compression": "gzip"},
+                **condition,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ):
+                raise QuarantineArchiveConflictError(
+                    f"Quarantine archive {archive_key} changed while compacting"
+                ) from e
+            raise
+
+        # A record rewritten since it was read stays loose, and its index
+        # entry keeps pointing at the rewrite
+        current = {
+            obj["Key"]: obj["ETag"] for obj in self._list_day_objects(target_date)
+        }
+        archived = {
+            key: entry
+            for key, entry in entries.items()
+            if current.get(key) == etags[key]
+        }
+
+        def merge(index: dict[str, Any]) -> None:
+            for key, entry in archived.items():
+                index["records"][key] = {**index["records"].get(key, {}), **entry}
+
+        # Deleting only after the index write keeps every record reachable
+        self._update_index(target_date, merge)
+        self._delete_keys(list(archived))
+
+        logger.info(
+            f"Compacted {len(archived)} quarantine records for {target_date}",
+            extra={"archive_key": archive_key, "archive_size": len(archive)},
+        )
+        return len(archived)
+
+    def compact(self, before: date | None = None) -> dict[str, int]:
+        """
+        Compact every quarantined day before a date.
+
+        Args:
+            before: Compact days strictly before this date (default: today
+                UTC, so the current day keeps receiving loose records)
+
+        Returns:
+            Mapping of YYYY-MM-DD dates to the number of records compacted,
+            for days that had loose records
+        """
+        before = before or datetime.utcnow().date()
+        compacted = {}
+        for index_date in self._list_days():
+            if index_date >= before:
+                break
+            count = self.compact_day(index_date)
+            if count:
+                compacted[index_date.isoformat()] = count
+        return compacted
+
+    def cleanup_old_quarantine_data(self, retention_days: int = 30) -> int:
+        """
+        Delete quarantine days older than the retention period.
+
+        Whole days go at once: the archive, any loose records and the
+        day's index, in batched DeleteObjects requests. Days quarantined
+        before indexing existed are deleted too.
+
+        Args:
+            retention_days: Number of days of quarantine to keep
+
+        Returns:
+            Number of objects deleted
+        """
+        cutoff = datetime.utcnow().date() - timedelta(days=retention_days)
+        deleted = 0
+        index_dates = set(self._list_index_dates())
+        for index_date in self._list_days():
+            if index_date >= cutoff:
+                break
+            keys = [obj["Key"] for obj in self._list_day_objects(index_date)]
+            if index_date in index_dates:
+                keys.append(self._index_key(index_date))
+            self._delete_keys(keys)
+            deleted += len(keys)
+
+        logger.info(
+            f"Deleted {deleted} quarantine objects older than {cutoff}",
+            extra={"retention_days": retention_days},
+        )
+        return deleted
+
+    def _list_day_objects(self, target_date: date) -> list[dict[str, Any]]:
+        """List every object stored under a day's quarantine partition."""
+        paginator = self.s3_manager.s3_client.get_paginator("list_objects_v2")
+        return [
+            obj
+            for page in paginator.paginate(
+                Bucket=self.s3_manager.bucket_name,
+                Prefix=f"{self.quarantine_prefix}/{self._date_prefix(target_date)}",
+            )
+            for obj in page.get("Contents", [])
+        ]
+
+    def _delete_keys(self, keys: list[str]) -> None:
+        """Delete objects in batches of up to 1000 keys."""
+        for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+            batch = keys[start : start + _DELETE_BATCH_SIZE]
+            self.s3_manager.s3_client.delete_objects(
+                Bucket=self.s3_manager.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+
     def list_quarantined_data(
         self, target_date: date | None = None, data_type: str | None = None
     ) -> list[dict[str, Any]]:
         """
         List quarantined data for review.
 
+        Reads only the per-day index objects; a day without an index (records
+        quarantined before indexing existed) is indexed on first access.
+
         Args:
             target_date: Optional date filter
             data_type: Optional data type filter
 
         Returns:
-            List of quarantine metadata records
+            List of quarantine metadata records (key, size, last_modified,
+            data_type, target_date, error_classification, issues_count, status)
         """
         try:
-            # Build prefix for listing
-            prefix = self.quarantine_prefix
-            if target_date:
-                prefix += (
-                    f"/year={target_date.year}/"
-                    f"month={target_date.month:02d}/"
-                    f"day={target_date.day:02d}/"
-                )
-                if data_type:
-                    prefix += f"{data_type}/"
-
-            # List objects in quarantine area
-            response = self.s3_manager.s3_client.list_objects_v2(
-                Bucket=self.s3_manager.bucket_name, Prefix=prefix
-            )
-
-            quarantine_items = []
-            for obj in response.get("Contents", []):
-                item_info = {
-                    "key": obj["Key"],
-                    "size": obj["Size"],
-                    "last_modified": obj["LastModified"].isoformat(),
-                    "metadata": obj.get("Metadata", {}),
+            quarantine_items = [
+                {
+                    "key": entry["key"],
+                    "size": entry.get("size", 0),
+                    "last_modified": entry.get("quarantined_at"),
+                    "data_type": entry.get("data_type", "unknown"),
+                    "target_date": entry.get("target_date"),
+                    "error_classification": entry.get(
+                        "error_classification", "unknown"
+                    ),
+                    "issues_count": entry.get("issues_count", 0),
+                    "status": entry.get("status", "quarantined"),
                 }
-                quarantine_items.append(item_info)
+                for entry in self._index_entries(target_date)
+                if data_type is None or entry.get("data_type") == data_type
+            ]
+            quarantine_items.sort(key=lambda item: item["key"])
 
             logger.info(f"Found {len(quarantine_items)} quarantined items")
             return quarantine_items
@@ -328,30 +1087,29 @@ class DataQuarantine:
             Summary statistics dictionary
         """
         try:
-            # For now, provide a simple summary based on listing
-            # In production, this could be enhanced with more detailed analytics
-
             all_items = self.list_quarantined_data()
 
             summary = {
                 "total_quarantined": len(all_items),
                 "by_data_type": {},
+                "by_classification": {},
+                "by_status": {},
                 "recent_items": [],
                 "summary_date": datetime.utcnow().isoformat(),
             }
 
-            # Categorize by data type (extracted from key)
             for item in all_items:
-                key_parts = item["key"].split("/")
-                if len(key_parts) >= 5:  # quarantine/year=/month=/day=/type/
-                    data_type = key_parts[4]
-                    summary["by_data_type"][data_type] = (
-                        summary["by_data_type"].get(data_type, 0) + 1
-                    )
+                for field, counts in (
+                    ("data_type", summary["by_data_type"]),
+                    ("error_classification", summary["by_classification"]),
+                    ("status", summary["by_status"]),
+                ):
+                    value = item.get(field, "unknown")
+                    counts[value] = counts.get(value, 0) + 1
 
             # Get most recent items (up to 10)
             sorted_items = sorted(
-                all_items, key=lambda x: x["last_modified"], reverse=True
+                all_items, key=lambda x: x["last_modified"] or "", reverse=True
             )
             summary["recent_items"] = sorted_items[:10]
 
@@ -365,6 +1123,8 @@ class DataQuarantine:
             return {
                 "total_quarantined": 0,
                 "by_data_type": {},
+                "by_classification": {},
+                "by_status": {},
                 "recent_items": [],
                 "error": str(e),
                 "summary_date": datetime.utcnow().isoformat(),
@@ -385,6 +1145,10 @@ class DataQuarantine:
             return True
 
         # Quarantine if there are critical issues (even if validation passed)
+        codes = _issue_codes(validation_result)
+        if codes is not None:
+            return any(code in _CRITICAL_ISSUE_CODES for code in codes)
+
         issues = validation_result.get("issues", [])
         critical_keywords = ["schema", "missing", "inconsistent", "invalid"]
 
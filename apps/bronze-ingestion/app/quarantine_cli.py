@@ -1,8 +1,8 @@
 """
 CLI commands for reviewing quarantined data.
 
-Provides commands to list, summarize, and inspect quarantined payloads
-from the bronze layer ingestion pipeline.
+Provides commands to list, summarize, inspect, reindex, compact, clean up and
+replay quarantined payloads from the bronze layer ingestion pipeline.
 """
 
 import json
@@ -13,6 +13,7 @@ from typing import Any
 import click
 from hoopstat_observability import get_logger
 
+from .config import BronzeIngestionConfig
 from .quarantine import DataQuarantine, ErrorClassification
 from .replay import (
     BatchReplayResult,
@@ -40,10 +41,26 @@ _VALID_CLASSIFICATIONS = [c.value for c in ErrorClassification]
 _VALID_DATA_TYPES = ["schedule", "box_score"]
 
 
+def _get_config() -> BronzeIngestionConfig:
+    """Load the bronze ingestion configuration."""
+    return BronzeIngestionConfig.load()
+
+
+def _get_s3_manager(config: BronzeIngestionConfig) -> BronzeS3Manager:
+    """Create a BronzeS3Manager from configuration."""
+    return BronzeS3Manager(
+        bucket_name=config.bronze_bucket,
+        region_name=config.aws_region,
+        compression=config.bronze_compression,
+    )
+
+
 def _get_quarantine() -> DataQuarantine:
     """Create a DataQuarantine instance with default S3 configuration."""
-    s3_manager = BronzeS3Manager()
-    return DataQuarantine(s3_manager)
+    config = _get_config()
+    return DataQuarantine(
+        _get_s3_manager(config), compression=config.bronze_compression
+    )
 
 
 def _format_classification(classification_value: str) -> str:
@@ -84,37 +101,30 @@ def _parse_data_type_from_key(key: str) -> str:
 
 
 def _fetch_record(quarantine: DataQuarantine, key: str) -> dict[str, Any] | None:
-    """Fetch and parse a quarantine record from S3."""
+    """Fetch and parse a quarantine record, loose or from its day archive."""
     try:
-        response = quarantine.s3_manager.s3_client.get_object(
-            Bucket=quarantine.s3_manager.bucket_name,
-            Key=key,
-        )
-        body = response["Body"].read().decode("utf-8")
-        return json.loads(body)
+        record = quarantine.get_quarantined_record(key)
+        if record is None:
+            logger.error(f"Quarantine record not found: {key}")
+        return record
     except Exception as e:
         logger.error(f"Failed to fetch quarantine record {key}: {e}")
         return None
 
 
-def _enrich_items(
-    quarantine: DataQuarantine, items: list[dict[str, Any]]
-) -> list[dict[str, Any]]:
-    """Enrich quarantine list items with classification and issue count."""
-    enriched = []
-    for item in items:
-        record = _fetch_record(quarantine, item["key"])
-        metadata = record.get("metadata", {}) if record else {}
-        enriched.append(
-            {
-                **item,
-                "date": _parse_date_from_key(item["key"]),
-                "data_type": _parse_data_type_from_key(item["key"]),
-                "error_classification": metadata.get("error_classification", "unknown"),
-                "issues_count": metadata.get("issues_count", 0),
-            }
-        )
-    return enriched
+def _enrich_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Add display fields to quarantine index items without fetching records."""
+    return [
+        {
+            **item,
+            "date": _parse_date_from_key(item["key"]),
+            "data_type": item.get("data_type")
+            or _parse_data_type_from_key(item["key"]),
+            "error_classification": item.get("error_classification", "unknown"),
+            "issues_count": item.get("issues_count", 0),
+        }
+        for item in items
+    ]
 
 
 def _format_table(items: list[dict[str, Any]]) -> str:
@@ -156,9 +166,7 @@ def _format_table(items: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _format_summary(
-    summary: dict[str, Any], enriched_items: list[dict[str, Any]]
-) -> str:
+def _format_summary(summary: dict[str, Any]) -> str:
     """Format quarantine summary for display."""
     lines = []
     lines.append("Quarantine Summary")
@@ -167,11 +175,7 @@ def _format_summary(
     lines.append(f"Summary date: {summary['summary_date']}")
     lines.append("")
 
-    # Group by classification
-    by_classification: dict[str, int] = {}
-    for item in enriched_items:
-        cls = item.get("error_classification", "unknown")
-        by_classification[cls] = by_classification.get(cls, 0) + 1
+    by_classification = dict(summary.get("by_classification", {}))
 
     # Separate transient from non-transient
     transient_count = by_classification.pop(ErrorClassification.TRANSIENT.value, 0)
@@ -344,9 +348,9 @@ def quarantine_list(
             click.echo("No quarantined items found.")
             return
 
-        enriched = _enrich_items(q, items)
+        enriched = _enrich_items(items)
 
-        # Apply classification filter (post-fetch since it requires record content)
+        # Apply classification filter from the indexed classification
         if filter_classification:
             enriched = [
                 item
@@ -384,10 +388,7 @@ def quarantine_summary() -> None:
             )
             sys.exit(1)
 
-        items = q.list_quarantined_data()
-        enriched = _enrich_items(q, items)
-
-        click.echo(_format_summary(summary, enriched))
+        click.echo(_format_summary(summary))
 
     except Exception as e:
         logger.error(f"Failed to generate quarantine summary: {e}")
@@ -423,16 +424,104 @@ def quarantine_inspect(s3_key: str, full: bool) -> None:
         sys.exit(1)
 
 
+@quarantine.command("reindex")
+@click.option(
+    "--date",
+    "filter_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Only rebuild the index for this date (YYYY-MM-DD).",
+)
+def quarantine_reindex(filter_date: datetime | None) -> None:
+    """Rebuild quarantine index objects from the quarantined records."""
+    logger.info(
+        "Rebuilding quarantine index",
+        extra={"date": filter_date.date().isoformat() if filter_date else None},
+    )
+
+    try:
+        q = _get_quarantine()
+        indexed = q.rebuild_index(filter_date.date() if filter_date else None)
+        click.echo(f"Indexed {indexed} quarantined records.")
+
+    except Exception as e:
+        logger.error(f"Failed to rebuild quarantine index: {e}")
+        click.echo(f"Error: Failed to rebuild quarantine index: {e}", err=True)
+        sys.exit(1)
+
+
+@quarantine.command("compact")
+@click.option(
+    "--date",
+    "filter_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Only compact this date (YYYY-MM-DD); default: every day before today.",
+)
+def quarantine_compact(filter_date: datetime | None) -> None:
+    """Merge finished days' quarantine records into daily NDJSON.gz archives."""
+    logger.info(
+        "Compacting quarantine",
+        extra={"date": filter_date.date().isoformat() if filter_date else None},
+    )
+
+    try:
+        q = _get_quarantine()
+        if filter_date:
+            count = q.compact_day(filter_date.date())
+            compacted = {filter_date.date().isoformat(): count} if count else {}
+        else:
+            compacted = q.compact()
+
+        for day, count in compacted.items():
+            click.echo(f"{day}: archived {count} records")
+        click.echo(
+            f"Compacted {sum(compacted.values())} records across {len(compacted)} days."
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to compact quarantine: {e}")
+        click.echo(f"Error: Failed to compact quarantine: {e}", err=True)
+        sys.exit(1)
+
+
+@quarantine.command("cleanup")
+@click.option(
+    "--retention-days",
+    type=click.IntRange(min=1),
+    default=30,
+    show_default=True,
+    help="Delete quarantine days older than this many days.",
+)
+def quarantine_cleanup(retention_days: int) -> None:
+    """Delete whole quarantine days past the retention period."""
+    logger.info("Cleaning up quarantine", extra={"retention_days": retention_days})
+
+    try:
+        q = _get_quarantine()
+        deleted = q.cleanup_old_quarantine_data(retention_days)
+        click.echo(f"Deleted {deleted} quarantine objects.")
+
+    except Exception as e:
+        logger.error(f"Failed to clean up quarantine: {e}")
+        click.echo(f"Error: Failed to clean up quarantine: {e}", err=True)
+        sys.exit(1)
+
+
 def _get_replay_orchestrator(
     silver_processing_dir: str | None = None,
 ) -> ReplayOrchestrator:
     """Create a ReplayOrchestrator with default configuration."""
-    s3_manager = BronzeS3Manager()
-    quarantine_instance = DataQuarantine(s3_manager)
+    config = _get_config()
+    s3_manager = _get_s3_manager(config)
+    quarantine_instance = DataQuarantine(
+        s3_manager, compression=config.bronze_compression
+    )
     return ReplayOrchestrator(
         s3_manager=s3_manager,
         quarantine=quarantine_instance,
         silver_processing_dir=silver_processing_dir,
+        compression=config.bronze_compression,
     )
 
 
@@ -466,6 +555,8 @@ def _format_batch_summary(batch_result: BatchReplayResult) -> str:
     lines.append(f"Succeeded: {batch_result.succeeded}")
     lines.append(f"Failed:    {batch_result.failed}")
     lines.append(f"Skipped:   {batch_result.skipped}")
+    if batch_result.silver_dates:
+        lines.append(f"Silver reprocessed: {', '.join(batch_result.silver_dates)}")
     lines.append("")
     lines.append("Details:")
     lines.append("-" * 40)
@@ -509,6 +600,13 @@ def _format_batch_summary(batch_result: BatchReplayResult) -> str:
     default=False,
     help="Force replay of already-resolved records.",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of records replayed in parallel during batch replay.",
+)
 def quarantine_replay(
     s3_key: str | None,
     filter_classification: str | None,
@@ -516,11 +614,13 @@ def quarantine_replay(
     dry_run: bool,
     transform_name: str | None,
     force: bool,
+    concurrency: int,
 ) -> None:
     """Replay quarantined data through the Bronze-to-Silver pipeline.
 
     Provide an S3_KEY to replay a single file, or use --classification
-    or --date to replay matching files in batch.
+    or --date to replay matching files in batch. Batch replays run Silver
+    processing once per affected date.
     """
     # Validate that at least one selection method is provided
     if s3_key is None and filter_classification is None and filter_date is None:
@@ -540,6 +640,7 @@ def quarantine_replay(
             "dry_run": dry_run,
             "transform": transform_name,
             "force": force,
+            "concurrency": concurrency,
         },
     )
 
@@ -578,7 +679,7 @@ def quarantine_replay(
 
             # Apply classification filter if specified
             if filter_classification:
-                enriched = _enrich_items(q, items)
+                enriched = _enrich_items(items)
                 items = [
                     item
                     for item in enriched
@@ -595,6 +696,7 @@ def quarantine_replay(
                 transform_override=transform_override,
                 dry_run=dry_run,
                 force=force,
+                concurrency=concurrency,
             )
             click.echo(_format_batch_summary(batch_result))
             if batch_result.failed > 0:
@@ -13,17 +13,26 @@ State machine for quarantine records:
     resolved    -> replaying (only with force=True; re-processing after logic changes)
 """
 
-import json
 import os
 import subprocess
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 
+from botocore.exceptions import ClientError
+from hoopstat_data.compression import (
+    COMPRESSION_NONE,
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
 from hoopstat_observability import get_logger
 
-from .quarantine import DataQuarantine, ErrorClassification
+from .quarantine import DataQuarantine, ErrorClassification, quarantine_key_date
 from .s3_manager import BronzeS3Manager
 from .transforms import (
     IdentityTransform,
@@ -73,6 +82,18 @@ class BatchReplayResult:
     failed: int = 0
     skipped: int = 0
     results: list[ReplayResult] = field(default_factory=list)
+    silver_dates: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _PendingReplay:
+    """A replay written to Bronze and waiting for Silver processing."""
+
+    s3_key: str
+    record: dict[str, Any]
+    transform_applied: str
+    transform_metadata: dict[str, Any]
+    target_date: str
 
 
 def get_transform_by_name(name: str) -> ReplayTransform:
@@ -110,6 +131,7 @@ class ReplayOrchestrator:
         s3_manager: BronzeS3Manager,
         quarantine: DataQuarantine,
         silver_processing_dir: str | None = None,
+        compression: str = COMPRESSION_NONE,
     ):
         """
         Initialize the replay orchestrator.
@@ -119,10 +141,13 @@ class ReplayOrchestrator:
             quarantine: DataQuarantine instance for record management.
             silver_processing_dir: Path to the silver-processing app directory.
                 If None, silver processing invocation is skipped.
+            compression: Storage encoding for updated quarantine records.
+                Records are read in whatever encoding they were stored with.
         """
         self.s3_manager = s3_manager
         self.quarantine = quarantine
         self.silver_processing_dir = silver_processing_dir
+        self.compression = compression
 
     def replay_single(
         self,
@@ -154,6 +179,30 @@ class ReplayOrchestrator:
         Returns:
             ReplayResult with success/failure details.
         """
+        outcome = self._replay_to_bronze(s3_key, transform_override, dry_run, force)
+        if isinstance(outcome, ReplayResult):
+            return outcome
+
+        # Step 7: Invoke Silver processing
+        silver_success = self._invoke_silver_processing(outcome.target_date)
+
+        # Step 8: Update quarantine record status
+        return self._complete_replay(outcome, silver_success)
+
+    def _replay_to_bronze(
+        self,
+        s3_key: str,
+        transform_override: ReplayTransform | None,
+        dry_run: bool,
+        force: bool,
+    ) -> ReplayResult | _PendingReplay:
+        """
+        Run replay steps 1-6 for one record.
+
+        Returns:
+            A final ReplayResult if the replay ended early (skipped, failed or
+            dry run), otherwise the pending replay awaiting Silver processing.
+        """
         logger.info(
             "Starting replay",
             extra={"s3_key": s3_key, "dry_run": dry_run, "force": force},
@@ -266,14 +315,25 @@ class ReplayOrchestrator:
                 transform_applied=applied_transform_type,
             )
 
-        # Step 7: Invoke Silver processing
-        target_date_str = metadata.get("target_date", "")
-        silver_success = self._invoke_silver_processing(target_date_str)
+        return _PendingReplay(
+            s3_key=s3_key,
+            record=record,
+            transform_applied=applied_transform_type,
+            transform_metadata=transform_metadata,
+            target_date=metadata.get("target_date", ""),
+        )
+
+    def _complete_replay(
+        self, pending: _PendingReplay, silver_success: bool
+    ) -> ReplayResult:
+        """Record the outcome of Silver processing on a pending replay."""
+        s3_key = pending.s3_key
+        record = pending.record
+        applied_transform_type = pending.transform_applied
 
-        # Step 8: Update quarantine record status
         if silver_success:
             self._update_quarantine_resolved(
-                s3_key, record, applied_transform_type, transform_metadata
+                s3_key, record, applied_transform_type, pending.transform_metadata
             )
             logger.info(
                 "Replay succeeded",
@@ -314,34 +374,89 @@ class ReplayOrchestrator:
         transform_override: ReplayTransform | None = None,
         dry_run: bool = False,
         force: bool = False,
+        concurrency: int = 1,
     ) -> BatchReplayResult:
         """
-        Replay multiple quarantined files sequentially.
+        Replay multiple quarantined files with a bounded worker pool.
+
+        Records are fetched, transformed and written to Bronze by up to
+        ``concurrency`` workers. Silver processing is deferred: it runs once
+        per affected date, as soon as every item for that date has been
+        written, and its outcome resolves or fails all of that date's records.
+
+        Items carrying an index ``status`` that cannot be replayed (already
+        replaying, or resolved without force) are skipped without fetching
+        their records.
 
         Args:
             items: List of quarantine item dicts (must have 'key' field).
             transform_override: Optional transform override for all items.
             dry_run: If True, validate without writing.
             force: If True, allow replaying records in 'resolved' status.
+            concurrency: Maximum number of records replayed at once.
 
         Returns:
-            BatchReplayResult with summary counts and individual results.
+            BatchReplayResult with summary counts and individual results,
+            in the order of ``items``.
         """
         batch_result = BatchReplayResult(total=len(items))
 
         logger.info(
             "Starting batch replay",
-            extra={"total_items": len(items), "dry_run": dry_run, "force": force},
+            extra={
+                "total_items": len(items),
+                "dry_run": dry_run,
+                "force": force,
+                "concurrency": concurrency,
+            },
         )
 
-        for item in items:
-            s3_key = item["key"]
-            result = self.replay_single(
-                s3_key,
-                transform_override=transform_override,
-                dry_run=dry_run,
-                force=force,
-            )
+        results: dict[int, ReplayResult] = {}
+        pending_by_date: dict[str, list[tuple[int, _PendingReplay]]] = defaultdict(list)
+        remaining_by_date = Counter(self._item_date(item) for item in items)
+        silver_runs: dict[str, Future] = {}
+
+        def start_silver(target_date: str) -> None:
+            if pending_by_date.get(target_date) and target_date not in silver_runs:
+                silver_runs[target_date] = executor.submit(
+                    self._invoke_silver_processing, target_date
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="replay"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._replay_item, item, transform_override, dry_run, force
+                ): position
+                for position, item in enumerate(items)
+            }
+
+            for future in as_completed(futures):
+                position = futures[future]
+                outcome = future.result()
+                if isinstance(outcome, ReplayResult):
+                    results[position] = outcome
+                else:
+                    pending_by_date[outcome.target_date].append((position, outcome))
+
+                item_date = self._item_date(items[position])
+                remaining_by_date[item_date] -= 1
+                if remaining_by_date[item_date] == 0:
+                    start_silver(item_date)
+
+            # Dates whose records did not match their key's date
+            for target_date in list(pending_by_date):
+                start_silver(target_date)
+
+            for target_date, silver_run in silver_runs.items():
+                silver_success = silver_run.result()
+                for position, pending in pending_by_date[target_date]:
+                    results[position] = self._complete_replay(pending, silver_success)
+
+        batch_result.silver_dates = sorted(silver_runs)
+        for position in range(len(items)):
+            result = results[position]
             batch_result.results.append(result)
             if result.skipped:
                 batch_result.skipped += 1
@@ -357,20 +472,56 @@ class ReplayOrchestrator:
                 "succeeded": batch_result.succeeded,
                 "failed": batch_result.failed,
                 "skipped": batch_result.skipped,
+                "silver_runs": len(batch_result.silver_dates),
             },
         )
 
         return batch_result
 
+    def _replay_item(
+        self,
+        item: dict[str, Any],
+        transform_override: ReplayTransform | None,
+        dry_run: bool,
+        force: bool,
+    ) -> ReplayResult | _PendingReplay:
+        """Replay one batch item up to the Bronze write."""
+        s3_key = item["key"]
+        if "status" in item:
+            skip_result = self._check_status_transition(s3_key, item["status"], force)
+            if skip_result is not None:
+                return skip_result
+        try:
+            return self._replay_to_bronze(s3_key, transform_override, dry_run, force)
+        except Exception as e:
+            error_msg = f"Replay failed: {e}"
+            logger.error(error_msg, extra={"s3_key": s3_key})
+            return ReplayResult(s3_key=s3_key, success=False, error=error_msg)
+
+    @staticmethod
+    def _item_date(item: dict[str, Any]) -> str:
+        """Get a batch item's target date from its index entry or key."""
+        if item.get("target_date"):
+            return item["target_date"]
+        key_date = quarantine_key_date(item["key"])
+        return key_date.isoformat() if key_date else ""
+
     def _fetch_record(self, s3_key: str) -> dict[str, Any] | None:
-        """Fetch and parse a quarantine record from S3."""
+        """Fetch and parse a quarantine record, loose or from its day archive."""
         try:
             response = self.s3_manager.s3_client.get_object(
                 Bucket=self.s3_manager.bucket_name,
                 Key=s3_key,
             )
-            body = response["Body"].read().decode("utf-8")
-            return json.loads(body)
+            return decode_json(response["Body"].read(), object_encoding(response))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                # The record's day was compacted
+                archived = self.quarantine.get_archived_record(s3_key)
+                if archived is not None:
+                    return archived
+            logger.error(f"Failed to fetch quarantine record {s3_key}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Failed to fetch quarantine record {s3_key}: {e}")
             return None
@@ -651,13 +802,18 @@ class ReplayOrchestrator:
     def _store_updated_record(self, s3_key: str, record: dict[str, Any]) -> None:
         """Write the updated quarantine record back to S3."""
         try:
-            json_data = json.dumps(record, default=str, indent=2)
             self.s3_manager.s3_client.put_object(
                 Bucket=self.s3_manager.bucket_name,
                 Key=s3_key,
-                Body=json_data.encode("utf-8"),
+                Body=encode_json(record, self.compression, default=str),
                 ContentType="application/json",
+                **storage_put_args(self.compression),
             )
             logger.debug(f"Updated quarantine record at {s3_key}")
         except Exception as e:
             logger.error(f"Failed to update quarantine record at {s3_key}: {e}")
+            return
+
+        self.quarantine.record_status(
+            s3_key, record["metadata"].get("status", "quarantined")
+        )
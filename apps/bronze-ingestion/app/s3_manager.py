@@ -2,22 +2,55 @@
 S3 manager for bronze layer with JSON storage (ADR-025).
 """
 
-import json
-from datetime import date
+import threading
+from datetime import UTC, date, datetime
+from typing import Any
 
 import boto3
+from botocore.exceptions import ClientError
+from hoopstat_data.compression import (
+    COMPRESSION_NONE,
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
 from hoopstat_observability import get_logger
 
+from .corrections import CONTENT_HASH_METADATA_KEY, content_hash
+
 logger = get_logger(__name__)
 
 
 class BronzeS3Manager:
     """S3 manager for bronze layer with JSON storage (ADR-025)."""
 
-    def __init__(self, bucket_name: str, region_name: str = "us-east-1"):
-        """Initialize S3 manager."""
+    def __init__(
+        self,
+        bucket_name: str,
+        region_name: str = "us-east-1",
+        compression: str = COMPRESSION_NONE,
+    ):
+        """
+        Initialize S3 manager.
+
+        Args:
+            bucket_name: Bronze bucket name
+            region_name: AWS region name
+            compression: Storage encoding for JSON objects: "none"
+                (pretty-printed), "gzip" or "zstd" (compact, compressed)
+        """
         self.bucket_name = bucket_name
         self.region_name = region_name
+        self.compression = compression
+
+        # Running manifest of objects written this run, consumed by the
+        # bronze summary instead of re-listing raw/
+        self._write_events: list[dict[str, Any]] = []
+        self._write_events_lock = threading.Lock()
+        # Object sizes of each raw/ date partition written to, listed once
+        # before the first write so every event knows what it replaced
+        self._partition_sizes: dict[str, dict[str, int]] = {}
 
         try:
             self.s3_client = boto3.client("s3", region_name=region_name)
@@ -26,8 +59,31 @@ class BronzeS3Manager:
             logger.error(f"Failed to initialize S3 client: {e}")
             raise
 
+    @staticmethod
+    def raw_prefix(entity: str, league: str | None = None) -> str:
+        """
+        Get the key prefix of an entity's raw objects.
+
+        The NBA keeps the original ``raw/<entity>/`` layout; every other
+        league gets its own segment, ``raw/<league>/<entity>/``.
+
+        Args:
+            entity: Entity type (schedule, box, etc.)
+            league: League segment, or None for the NBA layout
+
+        Returns:
+            Key prefix ending in a slash
+        """
+        return f"raw/{league}/{entity}/" if league else f"raw/{entity}/"
+
     def store_json(
-        self, data: dict, entity: str, target_date: date, game_id: str | None = None
+        self,
+        data: dict,
+        entity: str,
+        target_date: date,
+        game_id: str | None = None,
+        metadata: dict[str, str] | None = None,
+        league: str | None = None,
     ) -> str:
         """
         Store dictionary as JSON in S3 following ADR-025 JSON storage format.
@@ -38,22 +94,27 @@ class BronzeS3Manager:
             target_date: Date for partitioning
             game_id: Optional game ID for file naming (ADR-031). If provided,
                     uses {game_id}.json; otherwise uses data.json
+            metadata: Optional extra S3 object metadata, e.g. the data source.
+                The payload's canonical content hash is always recorded.
+            league: League segment of the key, or None for the NBA layout
 
         Returns:
             S3 key where data was stored
         """
         # Key structure per ADR-031 and ADR-032: one file per game instance
-        # s3://<bronze-bucket>/raw/<entity>/YYYY-MM-DD/{game_id}.json
+        # s3://<bronze-bucket>/raw/[<league>/]<entity>/YYYY-MM-DD/{game_id}.json
         # For non-game entities, use data.json as default
         # ADR-032: Use URL-safe characters only (no underscores or equals signs)
         date_str = target_date.strftime("%Y-%m-%d")
         filename = f"{game_id}.json" if game_id else "data.json"
-        key = f"raw/{entity}/{date_str}/{filename}"
+        key = f"{self.raw_prefix(entity, league)}{date_str}/{filename}"
 
         try:
-            # Convert dictionary to JSON bytes
-            json_str = json.dumps(data, indent=2)
-            json_bytes = json_str.encode("utf-8")
+            # Convert dictionary to JSON bytes in the configured encoding;
+            # the key keeps its .json name and the encoding is recorded on
+            # the object so readers can decompress transparently
+            json_bytes = encode_json(data, self.compression)
+            previous_size = self._previous_size(key)
 
             # Upload to S3
             self.s3_client.put_object(
@@ -61,11 +122,22 @@ class BronzeS3Manager:
                 Key=key,
                 Body=json_bytes,
                 ContentType="application/json",
-                Metadata={
-                    "entity": entity,
-                    "date": date_str,
-                    "format": "json",
-                },
+                **storage_put_args(
+                    self.compression,
+                    {
+                        **(metadata or {}),
+                        CONTENT_HASH_METADATA_KEY: content_hash(data),
+                        "entity": entity,
+                        "date": date_str,
+                        "format": "json",
+                    },
+                ),
+            )
+
+            # Manifest totals are kept per league-qualified entity
+            manifest_entity = f"{league}/{entity}" if league else entity
+            self._record_write(
+                manifest_entity, date_str, key, len(json_bytes), previous_size
             )
 
             logger.info(f"Stored JSON data to s3://{self.bucket_name}/{key}")
@@ -75,6 +147,121 @@ class BronzeS3Manager:
             logger.error(f"Failed to store JSON data to S3: {e}")
             raise
 
+    def get_content_hash(
+        self,
+        entity: str,
+        target_date: date,
+        game_id: str,
+        league: str | None = None,
+    ) -> str | None:
+        """
+        Get the content hash of a stored per-game object.
+
+        Reads the hash recorded in the object's metadata at write time.
+        Objects written before hashes were recorded are downloaded and
+        hashed instead.
+
+        Args:
+            entity: Entity type (e.g., box)
+            target_date: Date the object is partitioned under
+            game_id: Game ID the object is named after
+            league: League segment of the key, or None for the NBA layout
+
+        Returns:
+            Hex content hash, or None if no object is stored
+        """
+        key = (
+            f"{self.raw_prefix(entity, league)}"
+            f"{target_date.strftime('%Y-%m-%d')}/{game_id}.json"
+        )
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            stored_hash = head.get("Metadata", {}).get(CONTENT_HASH_METADATA_KEY)
+            if stored_hash:
+                return stored_hash
+
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            return content_hash(
+                decode_json(response["Body"].read(), object_encoding(response))
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+    def _previous_size(self, key: str) -> int | None:
+        """
+        Get the size of the object a write to ``key`` will replace.
+
+        The key's date partition is listed on its first write, so the cost
+        is one paginated listing per partition rather than one request per
+        object.
+
+        Returns:
+            Size in bytes, or None if the key does not exist yet
+        """
+        partition = key.rsplit("/", 1)[0] + "/"
+        with self._write_events_lock:
+            sizes = self._partition_sizes.get(partition)
+            if sizes is None:
+                paginator = self.s3_client.get_paginator("list_objects_v2")
+                sizes = {
+                    obj["Key"]: obj["Size"]
+                    for page in paginator.paginate(
+                        Bucket=self.bucket_name, Prefix=partition
+                    )
+                    for obj in page.get("Contents", [])
+                }
+                self._partition_sizes[partition] = sizes
+            return sizes.get(key)
+
+    def _record_write(
+        self,
+        entity: str,
+        date_str: str,
+        key: str,
+        size: int,
+        previous_size: int | None = None,
+    ) -> None:
+        """Record a successful write in the running manifest."""
+        event = {
+            "entity": entity,
+            "date": date_str,
+            "key": key,
+            "size": size,
+            "previous_size": previous_size,
+            "written_at": datetime.now(UTC).isoformat(),
+        }
+        with self._write_events_lock:
+            self._write_events.append(event)
+            sizes = self._partition_sizes.get(key.rsplit("/", 1)[0] + "/")
+            if sizes is not None:
+                sizes[key] = size
+
+    def get_write_events(self) -> list[dict[str, Any]]:
+        """
+        Get the writes recorded since the events were last cleared.
+
+        Returns:
+            List of write events (entity, date, key, size, previous_size,
+            written_at) in write order; previous_size is None for new objects
+        """
+        with self._write_events_lock:
+            return list(self._write_events)
+
+    def clear_write_events(self, count: int) -> None:
+        """
+        Drop the first ``count`` recorded writes once they have been applied.
+
+        Writes recorded after ``get_write_events`` was called are kept. Once
+        every write has been applied, the listed partition sizes are dropped
+        so a later run lists them afresh.
+        """
+        with self._write_events_lock:
+            del self._write_events[:count]
+            if not self._write_events:
+                self._partition_sizes.clear()
+
     def check_exists(self, entity: str, target_date: date) -> bool:
         """Check if data already exists for entity and date."""
         date_str = target_date.strftime("%Y-%m-%d")
@@ -118,3 +305,51 @@ class BronzeS3Manager:
             logger.error(f"Failed to list entities for date {target_date}: {e}")
 
         return entities
+
+    def list_game_ids_by_date(
+        self,
+        entity: str,
+        start_date: date,
+        end_date: date,
+        league: str | None = None,
+    ) -> dict[str, set[str]]:
+        """
+        List stored per-game files for a date range in one paginated listing.
+
+        Args:
+            entity: Entity type (e.g., box)
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            league: League segment of the keys, or None for the NBA layout
+
+        Returns:
+            Mapping of YYYY-MM-DD date strings to the game IDs stored for them
+        """
+        prefix = self.raw_prefix(entity, league)
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+
+        game_ids_by_date: dict[str, set[str]] = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            # Keys sort by date, so start listing just before the range
+            StartAfter=f"{prefix}{start_str}",
+        )
+
+        for page in pages:
+            for obj in page.get("Contents", []):
+                # Key format: <prefix>YYYY-MM-DD/<game_id>.json
+                parts = obj["Key"][len(prefix) :].split("/")
+                if len(parts) != 2:
+                    continue
+                date_str, filename = parts
+                if date_str > end_str:
+                    return game_ids_by_date
+                if date_str < start_str or filename == "data.json":
+                    continue
+                game_id = filename.split(".", 1)[0]
+                game_ids_by_date.setdefault(date_str, set()).add(game_id)
+
+        return game_ids_by_date
@@ -0,0 +1,71 @@
+"""
+Schedule normalization for bronze layer ingestion.
+
+LeagueGameFinder returns one row per team per game. Ingestion works per game,
+so the team rows are collapsed into one record per game before box scores are
+fetched.
+"""
+
+from typing import Any
+
+# MATCHUP separators: "LAL vs. BOS" is a home row, "LAL @ BOS" an away row
+_HOME_SEPARATOR = " vs. "
+_AWAY_SEPARATOR = " @ "
+
+
+def _side(row: dict[str, Any]) -> str | None:
+    """Get whether a team row is the home or away side of its game."""
+    matchup = row.get("MATCHUP") or ""
+    if _HOME_SEPARATOR in matchup:
+        return "home"
+    if _AWAY_SEPARATOR in matchup:
+        return "away"
+    return None
+
+
+def normalize_schedule(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Collapse LeagueGameFinder team rows into one record per game.
+
+    Args:
+        rows: Schedule rows, one per team per game
+
+    Returns:
+        Game records in first-seen order with game_id, game_date, season_id,
+        home/away team IDs and abbreviations, the home-side matchup and the
+        number of team rows seen for the game. Rows without a GAME_ID are
+        dropped.
+    """
+    games: dict[str, dict[str, Any]] = {}
+
+    for row in rows:
+        game_id = row.get("GAME_ID")
+        if not game_id:
+            continue
+        game_id = str(game_id)
+
+        game = games.get(game_id)
+        if game is None:
+            game = games[game_id] = {
+                "game_id": game_id,
+                "game_date": row.get("GAME_DATE"),
+                "season_id": row.get("SEASON_ID"),
+                "home_team_id": None,
+                "home_team_abbreviation": None,
+                "away_team_id": None,
+                "away_team_abbreviation": None,
+                "matchup": row.get("MATCHUP"),
+                "team_rows": 0,
+            }
+        game["team_rows"] += 1
+
+        side = _side(row)
+        if side is None:
+            # Without a MATCHUP, fill whichever side is still free
+            side = "home" if game["home_team_id"] is None else "away"
+        game[f"{side}_team_id"] = row.get("TEAM_ID")
+        game[f"{side}_team_abbreviation"] = row.get("TEAM_ABBREVIATION")
+        if side == "home" and row.get("MATCHUP"):
+            game["matchup"] = row["MATCHUP"]
+
+    return list(games.values())
@@ -5,15 +5,17 @@ Provides validation functions that integrate JSON schema validation
 with existing data quality checks from hoopstat-data library.
 """
 
-from datetime import date, datetime
+from datetime import datetime
 from typing import Any
 
-import jsonschema
 from hoopstat_data.quality import calculate_data_quality_score
-from hoopstat_data.validation import validate_game_stats
 from hoopstat_observability import get_logger
 
-from .schemas import get_schema
+from .compiled_validation import (
+    IssueCode,
+    check_schedule_game,
+    get_compiled_validator,
+)
 
 logger = get_logger(__name__)
 
@@ -29,6 +31,9 @@ class DataValidator:
     Data validator for NBA API responses and ingested data.
 
     Combines JSON schema validation with domain-specific data quality checks.
+    API responses are checked by a validator compiled once per response type
+    (see ``compiled_validation``); results carry structured issue codes next
+    to the human-readable issue messages.
     """
 
     def __init__(self):
@@ -50,259 +55,61 @@ class DataValidator:
             context: Optional context for validation (e.g., expected date)
 
         Returns:
-            Validation result dictionary with metrics and issues
+            Validation result dictionary with metrics, issue messages, issue
+            codes and per-issue details (code, path, message)
         """
         result = {
             "valid": True,
             "issues": [],
+            "issue_codes": [],
+            "issue_details": [],
             "metrics": {},
             "response_type": response_type,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
         try:
-            # Schema validation
-            schema = get_schema(response_type)
-            jsonschema.validate(response_data, schema)
-            result["metrics"]["schema_valid"] = True
-            logger.debug(f"Schema validation passed for {response_type}")
-
-        except jsonschema.ValidationError as e:
-            result["valid"] = False
-            result["issues"].append(f"Schema validation failed: {e.message}")
-            result["metrics"]["schema_valid"] = False
-            logger.warning(f"Schema validation failed for {response_type}: {e.message}")
-
+            validator = get_compiled_validator(response_type)
         except Exception as e:
             result["valid"] = False
             result["issues"].append(f"Schema validation error: {str(e)}")
+            result["issue_codes"].append(IssueCode.VALIDATION_ERROR.value)
             result["metrics"]["schema_valid"] = False
             logger.error(f"Schema validation error for {response_type}: {e}")
+            return result
 
-        # Type-specific validation
-        if response_type == "schedule":
-            self._validate_schedule_data(response_data, result, context)
-        elif response_type == "box_score":
-            self._validate_box_score_data(response_data, result, context)
-
-        # Log validation results
-        self._log_validation_metrics(result)
-
-        return result
-
-    def _validate_schedule_data(
-        self, schedule_data: list[dict], result: dict, context: dict[str, Any] | None
-    ) -> None:
-        """Validate schedule-specific data quality."""
-        if not isinstance(schedule_data, list):
-            result["valid"] = False
-            result["issues"].append("Schedule data is not a list")
-            return
-
-        result["metrics"]["game_count"] = len(schedule_data)
-
-        # Check expected game count if context provided
-        if context and "expected_min_games" in context:
-            min_games = context["expected_min_games"]
-            if len(schedule_data) < min_games:
-                result["issues"].append(
-                    f"Fewer games than expected: {len(schedule_data)} < {min_games}"
-                )
+        # Shape, metrics and domain checks in a single traversal
+        report = validator.validate(response_data, context)
 
-        # Validate date consistency
-        target_date = context.get("target_date") if context else None
-        if target_date:
-            self._validate_date_consistency(schedule_data, target_date, result)
+        result["valid"] = report.schema_valid
+        result["issues"] = [issue.message for issue in report.issues]
+        result["issue_codes"] = report.codes
+        result["issue_details"] = [issue.to_dict() for issue in report.issues]
+        result["metrics"] = {"schema_valid": report.schema_valid, **report.metrics}
 
-        # Validate individual game records
-        valid_games = 0
-        for i, game in enumerate(schedule_data):
-            if self._validate_individual_game(game, result, f"game_{i}"):
-                valid_games += 1
-
-        result["metrics"]["valid_games"] = valid_games
-        result["metrics"]["game_validity_ratio"] = (
-            valid_games / len(schedule_data) if schedule_data else 0.0
-        )
-
-    def _validate_box_score_data(
-        self, box_score_data: dict, result: dict, context: dict[str, Any] | None
-    ) -> None:
-        """Validate box score-specific data quality."""
-        if not isinstance(box_score_data, dict):
-            result["valid"] = False
-            result["issues"].append("Box score data is not a dictionary")
-            return
-
-        # Check which format we have: V3 (boxScoreTraditional) or legacy (resultSets)
-        if "boxScoreTraditional" in box_score_data:
-            # V3 format validation
-            self._validate_box_score_v3_format(box_score_data, result, context)
-        elif "resultSets" in box_score_data:
-            # Legacy format validation
-            self._validate_box_score_legacy_format(box_score_data, result, context)
-        else:
-            result["valid"] = False
-            result["issues"].append(
-                "Box score data missing both 'boxScoreTraditional' and 'resultSets'"
+        if not report.schema_valid:
+            logger.warning(
+                f"Schema validation failed for {response_type}: {result['issues'][0]}"
             )
 
-    def _validate_box_score_v3_format(
-        self, box_score_data: dict, result: dict, context: dict[str, Any] | None
-    ) -> None:
-        """Validate V3 format box score with boxScoreTraditional structure."""
-        box_score = box_score_data.get("boxScoreTraditional", {})
-
-        # Get team data - schema validation ensures these exist and have required fields
-        home_team = box_score.get("homeTeam", {})
-        away_team = box_score.get("awayTeam", {})
-
-        # Count teams and players for metrics
-        result["metrics"]["team_count"] = 2
-        result["metrics"]["home_player_count"] = len(home_team.get("players", []))
-        result["metrics"]["away_player_count"] = len(away_team.get("players", []))
-        result["metrics"]["total_player_count"] = (
-            result["metrics"]["home_player_count"]
-            + result["metrics"]["away_player_count"]
-        )
+        # Log validation results
+        self._log_validation_metrics(result)
 
-        # Extract and validate game metadata
-        game_id = box_score.get("gameId")
-        if game_id:
-            game_metadata = {"game_id": game_id}
-            self._validate_game_metadata(game_metadata, result, context)
-        else:
-            result["issues"].append("Missing gameId in V3 box score")
-
-    def _validate_box_score_legacy_format(
-        self, box_score_data: dict, result: dict, context: dict[str, Any] | None
-    ) -> None:
-        """Validate legacy format box score with resultSets structure."""
-        result_sets = box_score_data.get("resultSets", [])
-        result["metrics"]["result_set_count"] = len(result_sets)
-
-        if not result_sets:
-            result["valid"] = False
-            result["issues"].append("No result sets found in box score")
-            return
-
-        # Validate each result set
-        for i, result_set in enumerate(result_sets):
-            self._validate_result_set(result_set, result, f"result_set_{i}")
-
-        # Extract game metadata for validation
-        game_metadata = self._extract_game_metadata(box_score_data)
-        if game_metadata:
-            self._validate_game_metadata(game_metadata, result, context)
-
-    def _validate_date_consistency(
-        self, schedule_data: list[dict], target_date: date, result: dict
-    ) -> None:
-        """Validate that schedule data is for the expected date."""
-        inconsistent_dates = []
-
-        for game in schedule_data:
-            game_date_str = game.get("GAME_DATE")
-            if game_date_str:
-                try:
-                    game_date = datetime.strptime(game_date_str, "%Y-%m-%d").date()
-                    if game_date != target_date:
-                        inconsistent_dates.append(game_date_str)
-                except ValueError:
-                    inconsistent_dates.append(f"invalid_format:{game_date_str}")
-
-        if inconsistent_dates:
-            result["issues"].append(
-                f"Date inconsistencies found: {inconsistent_dates[:5]}..."
-            )
-            result["metrics"]["date_consistency"] = False
-        else:
-            result["metrics"]["date_consistency"] = True
+        return result
 
     def _validate_individual_game(self, game: dict, result: dict, game_id: str) -> bool:
         """Validate an individual game record."""
         try:
-            # Use existing validation from hoopstat-data
-            game_stats = {
-                "game_id": game.get("GAME_ID"),
-                "home_score": game.get("PTS", 0),
-                "away_score": game.get(
-                    "PTS", 0
-                ),  # Note: schedule doesn't have both scores
-            }
-
-            # Basic validation using existing tools
-            if not validate_game_stats(game_stats):
-                result["issues"].append(f"Game validation failed for {game_id}")
-                return False
-
-            # Check for reasonable values
-            points = game.get("PTS")
-            if points is not None and (points < 0 or points > 200):
-                result["issues"].append(
-                    f"Unrealistic points value for {game_id}: {points}"
-                )
-                return False
-
-            return True
-
+            problem = check_schedule_game(game, game_id)
         except Exception as e:
             result["issues"].append(f"Error validating {game_id}: {str(e)}")
             return False
 
-    def _validate_result_set(self, result_set: dict, result: dict, set_id: str) -> None:
-        """Validate a result set from box score data."""
-        headers = result_set.get("headers", [])
-        rows = result_set.get("rowSet", [])
-
-        result["metrics"][f"{set_id}_header_count"] = len(headers)
-        result["metrics"][f"{set_id}_row_count"] = len(rows)
-
-        # Validate row consistency
-        if rows and headers:
-            inconsistent_rows = 0
-            for i, row in enumerate(rows):
-                if len(row) != len(headers):
-                    inconsistent_rows += 1
-                    if inconsistent_rows <= 3:  # Limit issue reporting
-                        result["issues"].append(
-                            f"{set_id} row {i} has {len(row)} values but "
-                            f"{len(headers)} headers"
-                        )
-
-            result["metrics"][f"{set_id}_inconsistent_rows"] = inconsistent_rows
-
-    def _extract_game_metadata(self, box_score_data: dict) -> dict[str, Any] | None:
-        """Extract game metadata from box score for validation."""
-        try:
-            parameters = box_score_data.get("parameters", {})
-            game_id = parameters.get("GameID")
-
-            if game_id:
-                return {"game_id": game_id}
-
-        except Exception as e:
-            logger.warning(f"Failed to extract game metadata: {e}")
-
-        return None
-
-    def _validate_game_metadata(
-        self, metadata: dict, result: dict, context: dict[str, Any] | None
-    ) -> None:
-        """Validate game metadata consistency."""
-        game_id = metadata.get("game_id")
-
-        # Validate game ID format
-        if game_id and not game_id.isdigit():
-            result["issues"].append(f"Invalid game ID format: {game_id}")
+        if problem is not None:
+            result["issues"].append(problem[1])
+            return False
 
-        # Check context consistency
-        if context and "expected_game_id" in context:
-            expected_id = context["expected_game_id"]
-            if game_id != expected_id:
-                result["issues"].append(
-                    f"Game ID mismatch: expected {expected_id}, got {game_id}"
-                )
+        return True
 
     def _log_validation_metrics(self, result: dict) -> None:
         """Log validation metrics for monitoring."""
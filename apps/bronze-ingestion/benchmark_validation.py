@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark API response validation on a synthetic season of box scores.
+
+Compares plain ``jsonschema.validate`` (the schema step the bronze layer used
+before responses were validated in a single compiled pass) with the compiled
+box score validator, which also collects metrics and runs domain checks.
+"""
+
+import argparse
+import time
+
+import jsonschema
+
+from app.compiled_validation import get_compiled_validator
+from app.schemas import get_schema
+
+GAMES_PER_SEASON = 1230
+PLAYERS_PER_TEAM = 13
+
+
+def _team(team_id: int, game_number: int) -> dict:
+    return {
+        "teamId": team_id,
+        "teamCity": "City",
+        "teamName": "Team",
+        "teamTricode": "TST",
+        "teamSlug": "team",
+        "players": [
+            {
+                "personId": 200000 + team_id % 100 * 100 + n,
+                "firstName": "Player",
+                "familyName": str(n),
+                "statistics": {
+                    "minutes": "PT24M00.00S",
+                    "points": (game_number + n) % 30,
+                    "reboundsTotal": n % 12,
+                    "assists": n % 9,
+                    "steals": n % 3,
+                    "blocks": n % 2,
+                    "turnovers": n % 4,
+                    "fieldGoalsMade": n % 11,
+                    "fieldGoalsAttempted": n % 11 + 5,
+                },
+            }
+            for n in range(PLAYERS_PER_TEAM)
+        ],
+        "statistics": {"points": 110, "reboundsTotal": 44, "assists": 25},
+    }
+
+
+def generate_season(games: int = GAMES_PER_SEASON) -> list[dict]:
+    """Generate V3 box score payloads for a season's worth of games."""
+    return [
+        {
+            "boxScoreTraditional": {
+                "gameId": f"00223{n:05d}",
+                "homeTeam": _team(1610612737 + n % 30, n),
+                "awayTeam": _team(1610612737 + (n + 1) % 30, n),
+            }
+        }
+        for n in range(1, games + 1)
+    ]
+
+
+def _time(label: str, validate, payloads: list[dict]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        validate(payload)
+    elapsed = time.perf_counter() - start
+    per_payload_us = elapsed / len(payloads) * 1_000_000
+    print(f"{label:<32} {elapsed:8.3f}s  {per_payload_us:10.1f} us/payload")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=GAMES_PER_SEASON)
+    args = parser.parse_args()
+
+    payloads = generate_season(args.games)
+    schema = get_schema("box_score")
+    compiled = get_compiled_validator("box_score")
+
+    print(f"Validating {len(payloads)} box scores\n")
+    baseline = _time(
+        "jsonschema.validate (schema only)",
+        lambda payload: jsonschema.validate(payload, schema),
+        payloads,
+    )
+    single_pass = _time("compiled (schema + checks)", compiled.validate, payloads)
+    print(f"\nSpeedup: {baseline / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
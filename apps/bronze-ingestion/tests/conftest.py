@@ -0,0 +1,60 @@
+"""Shared pytest fixtures for bronze-ingestion tests."""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.config import BronzeIngestionConfig
+from app.ingestion import DateScopedIngestion
+from app.s3_manager import BronzeS3Manager
+
+# Bronze bucket created in the mocked S3 account
+BUCKET = "test-bronze-bucket"
+
+
+@pytest.fixture
+def s3_manager():
+    """Create a BronzeS3Manager against a mocked S3 bucket."""
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield BronzeS3Manager(BUCKET)
+
+
+@pytest.fixture
+def make_ingestion(s3_manager):
+    """
+    Create ingestion instances writing to mocked S3.
+
+    The NBA client, validator, quarantine and summary manager are mocks;
+    every response validates and nothing is quarantined.
+    """
+
+    def make(remaining_time=None, **settings):
+        config = BronzeIngestionConfig(
+            bronze_bucket=BUCKET, aws_region="us-east-1", **settings
+        )
+        with (
+            patch("app.ingestion.NBAClient"),
+            patch("app.ingestion.BronzeS3Manager", return_value=s3_manager),
+            patch("app.ingestion.DataValidator"),
+            patch("app.ingestion.DataQuarantine"),
+            patch("app.ingestion.BronzeSummaryManager"),
+        ):
+            ingestion = DateScopedIngestion(config, remaining_time=remaining_time)
+
+        ingestion.validator.validate_api_response.return_value = {
+            "valid": True,
+            "issues": [],
+        }
+        ingestion.quarantine.should_quarantine.return_value = False
+        return ingestion
+
+    return make
+
+
+@pytest.fixture
+def ingestion(make_ingestion):
+    """Create an ingestion instance writing to mocked S3."""
+    return make_ingestion()
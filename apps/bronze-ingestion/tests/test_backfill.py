@@ -0,0 +1,303 @@
+"""Tests for the resumable multi-date backfill."""
+
+import json
+from datetime import date
+from unittest.mock import Mock, patch
+
+from hoopstat_nba_api import box_scores_from_game_logs
+
+from app.backfill import BackfillCheckpoint, date_range
+from app.validation import DataValidator
+from tests.conftest import BUCKET
+
+
+def _put(s3_manager, key):
+    s3_manager.s3_client.put_object(Bucket=BUCKET, Key=key, Body=b"{}")
+
+
+class TestDateRange:
+    """Test the date range helper."""
+
+    def test_inclusive_range(self):
+        """Test that both ends of the range are included."""
+        assert date_range(date(2024, 1, 30), date(2024, 2, 1)) == [
+            date(2024, 1, 30),
+            date(2024, 1, 31),
+            date(2024, 2, 1),
+        ]
+
+
+class TestListGameIdsByDate:
+    """Test listing stored game IDs for a date range."""
+
+    def test_lists_only_dates_in_range(self, s3_manager):
+        """Test grouping by date and ignoring keys outside the range."""
+        for key in [
+            "raw/box/2024-01-14/0022300001.json",
+            "raw/box/2024-01-15/0022300002.json",
+            "raw/box/2024-01-15/0022300003.json",
+            "raw/box/2024-01-16/0022300004.json",
+            "raw/box/2024-01-17/0022300005.json",
+            "raw/schedule/2024-01-15/data.json",
+        ]:
+            _put(s3_manager, key)
+
+        result = s3_manager.list_game_ids_by_date(
+            "box", date(2024, 1, 15), date(2024, 1, 16)
+        )
+
+        assert result == {
+            "2024-01-15": {"0022300002", "0022300003"},
+            "2024-01-16": {"0022300004"},
+        }
+
+
+class TestBackfillCheckpoint:
+    """Test the backfill checkpoint manifest."""
+
+    def test_load_without_manifest(self, s3_manager):
+        """Test that a missing manifest starts a fresh checkpoint."""
+        checkpoint = BackfillCheckpoint(s3_manager, date(2024, 1, 1), date(2024, 1, 31))
+        checkpoint.load()
+
+        assert checkpoint.completed_dates == set()
+        assert checkpoint.key == "_metadata/backfill/2024-01-01-to-2024-01-31.json"
+
+    def test_save_and_resume(self, s3_manager):
+        """Test that progress survives across runs."""
+        checkpoint = BackfillCheckpoint(s3_manager, date(2024, 1, 1), date(2024, 1, 31))
+        checkpoint.record_date(date(2024, 1, 1), [])
+        checkpoint.record_date(date(2024, 1, 2), ["0022300010"])
+        checkpoint.save()
+
+        resumed = BackfillCheckpoint(s3_manager, date(2024, 1, 1), date(2024, 1, 31))
+        resumed.load()
+
+        assert resumed.is_complete(date(2024, 1, 1))
+        assert not resumed.is_complete(date(2024, 1, 2))
+        assert resumed.failed_games == {"2024-01-02": ["0022300010"]}
+
+    def test_retried_date_clears_failures(self, s3_manager):
+        """Test that a date completed on retry drops its failed games."""
+        checkpoint = BackfillCheckpoint(s3_manager, date(2024, 1, 1), date(2024, 1, 31))
+        checkpoint.record_date(date(2024, 1, 2), ["0022300010"])
+        checkpoint.record_date(date(2024, 1, 2), [])
+
+        assert checkpoint.is_complete(date(2024, 1, 2))
+        assert checkpoint.failed_games == {}
+
+
+class TestDateScopedIngestionBackfill:
+    """Test DateScopedIngestion.backfill."""
+
+    @staticmethod
+    def _schedule(target_date):
+        # Two team rows per game, as LeagueGameFinder returns them
+        day = target_date.day
+        return [
+            {"GAME_ID": f"0022300{day}{n}", "TEAM_ID": team}
+            for n in (1, 2)
+            for team in (1, 2)
+        ]
+
+    def test_fetches_only_missing_games(self, ingestion, s3_manager):
+        """Test that stored box scores are not fetched again."""
+        _put(s3_manager, "raw/box/2024-01-15/0022300151.json")
+        ingestion.nba_client.get_games_for_date.side_effect = self._schedule
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id: {
+            "game_id": game_id
+        }
+
+        report = ingestion.backfill(date(2024, 1, 15), date(2024, 1, 16))
+
+        fetched = [c.args[0] for c in ingestion.nba_client.get_box_score.call_args_list]
+        assert fetched == ["0022300152", "0022300161", "0022300162"]
+        assert report["dates_processed"] == 2
+        assert report["games_found"] == 4
+        assert report["games_already_stored"] == 1
+        assert report["box_scores_fetched"] == 3
+        assert report["box_scores_failed"] == 0
+        assert "box_scores_per_minute" in report
+
+        manifest = json.loads(
+            s3_manager.s3_client.get_object(
+                Bucket=BUCKET, Key="_metadata/backfill/2024-01-15-to-2024-01-16.json"
+            )["Body"].read()
+        )
+        assert manifest["completed_dates"] == ["2024-01-15", "2024-01-16"]
+        ingestion.summary_manager.update_bronze_summary.assert_called_once_with(
+            date(2024, 1, 16), 4, 3
+        )
+
+    def test_resume_skips_completed_dates(self, ingestion, s3_manager):
+        """Test that a rerun only retries dates with failures."""
+        ingestion.nba_client.get_games_for_date.side_effect = self._schedule
+
+        def flaky_box_score(game_id):
+            if game_id == "0022300162":
+                raise Exception("API Error")
+            return {"game_id": game_id}
+
+        ingestion.nba_client.get_box_score.side_effect = flaky_box_score
+        first = ingestion.backfill(date(2024, 1, 15), date(2024, 1, 16))
+        assert first["box_scores_failed"] == 1
+
+        ingestion.nba_client.get_games_for_date.reset_mock()
+        ingestion.nba_client.get_box_score.reset_mock(side_effect=True)
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id: {
+            "game_id": game_id
+        }
+        second = ingestion.backfill(date(2024, 1, 15), date(2024, 1, 16))
+
+        ingestion.nba_client.get_games_for_date.assert_called_once_with(
+            date(2024, 1, 16)
+        )
+        ingestion.nba_client.get_box_score.assert_called_once_with("0022300162")
+        assert second["dates_skipped"] == 1
+        assert second["box_scores_fetched"] == 1
+
+    def test_store_failures_do_not_stop_the_range(self, ingestion, s3_manager):
+        """Test that S3 write errors fail only their game or date."""
+        ingestion.nba_client.get_games_for_date.side_effect = self._schedule
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id: {
+            "game_id": game_id
+        }
+        store_json = s3_manager.store_json
+
+        def flaky_store_json(data, entity, target_date, game_id=None, **kwargs):
+            if (entity, target_date.day) == ("schedule", 16) or game_id == (
+                "0022300152"
+            ):
+                raise Exception("S3 Error")
+            return store_json(data, entity, target_date, game_id, **kwargs)
+
+        with patch.object(s3_manager, "store_json", side_effect=flaky_store_json):
+            report = ingestion.backfill(date(2024, 1, 15), date(2024, 1, 17))
+
+        assert report["dates_processed"] == 2
+        assert report["dates_failed"] == 1
+        assert report["box_scores_fetched"] == 3
+        assert report["box_scores_failed"] == 1
+        assert "box_scores_per_minute" in report
+
+        checkpoint = BackfillCheckpoint(
+            s3_manager, date(2024, 1, 15), date(2024, 1, 17)
+        )
+        checkpoint.load()
+        assert not checkpoint.is_complete(date(2024, 1, 15))
+        assert not checkpoint.is_complete(date(2024, 1, 16))
+        assert checkpoint.is_complete(date(2024, 1, 17))
+
+    def test_dry_run_writes_nothing(self, ingestion, s3_manager):
+        """Test that a dry run leaves S3 untouched."""
+        ingestion.nba_client.get_games_for_date.side_effect = self._schedule
+        ingestion.nba_client.get_box_score.return_value = Mock()
+
+        report = ingestion.backfill(date(2024, 1, 15), date(2024, 1, 15), True)
+
+        assert report["box_scores_fetched"] == 2
+        listing = s3_manager.s3_client.list_objects_v2(Bucket=BUCKET)
+        assert listing.get("KeyCount", 0) == 0
+
+
+class TestDateScopedIngestionBulkBackfill:
+    """Test DateScopedIngestion.bulk_backfill."""
+
+    @staticmethod
+    def _season_box_scores(season, season_type):
+        # One game on each of two dates, built the way the client builds them
+        team_rows = []
+        player_rows = []
+        for game_id, game_date in (
+            ("0022300061", "2023-10-25"),
+            ("0022300071", "2023-10-26"),
+        ):
+            for team_id, matchup in (
+                (1610612738, "BOS vs. LAL"),
+                (1610612747, "LAL @ BOS"),
+            ):
+                team_rows.append(
+                    {
+                        "GAME_ID": game_id,
+                        "GAME_DATE": game_date,
+                        "TEAM_ID": team_id,
+                        "TEAM_ABBREVIATION": matchup[:3],
+                        "MATCHUP": matchup,
+                        "PTS": 100,
+                        "REB": 40,
+                        "AST": 20,
+                    }
+                )
+                player_rows.append(
+                    {
+                        "GAME_ID": game_id,
+                        "TEAM_ID": team_id,
+                        "PLAYER_ID": team_id % 1000,
+                        "PLAYER_NAME": "Player",
+                        "MIN": 30,
+                        "PTS": 20,
+                    }
+                )
+        return box_scores_from_game_logs(team_rows, player_rows, season=season)
+
+    def test_stores_missing_games_with_source(self, ingestion, s3_manager):
+        """Test that log box scores land in the per-game layout, tagged."""
+        _put(s3_manager, "raw/box/2023-10-25/0022300061.json")
+        ingestion.nba_client.get_season_box_scores.side_effect = self._season_box_scores
+        # Validate with the real validator: the built payloads must pass
+        ingestion.validator = DataValidator()
+
+        report = ingestion.bulk_backfill("2023-24")
+
+        ingestion.nba_client.get_season_box_scores.assert_called_once_with(
+            "2023-24", "Regular Season"
+        )
+        ingestion.nba_client.get_box_score.assert_not_called()
+        assert report["games_found"] == 2
+        assert report["dates_total"] == 2
+        assert report["games_already_stored"] == 1
+        assert report["box_scores_stored"] == 1
+        assert report["box_scores_failed"] == 0
+
+        stored = s3_manager.s3_client.get_object(
+            Bucket=BUCKET, Key="raw/box/2023-10-26/0022300071.json"
+        )
+        assert stored["Metadata"]["source"] == "league_game_log"
+        assert stored["Metadata"]["entity"] == "box"
+        body = json.loads(stored["Body"].read())
+        assert body["source"] == "league_game_log"
+        assert body["boxScoreTraditional"]["homeTeam"]["teamName"] == "Celtics"
+        ingestion.summary_manager.update_bronze_summary.assert_called_once_with(
+            date(2023, 10, 26), 2, 1
+        )
+
+    def test_invalid_box_scores_are_not_stored(self, ingestion, s3_manager):
+        """Test that box scores failing validation are counted as failed."""
+        ingestion.nba_client.get_season_box_scores.side_effect = self._season_box_scores
+        ingestion.validator.validate_api_response.return_value = {
+            "valid": False,
+            "issues": ["Schema validation failed"],
+        }
+        ingestion.quarantine.should_quarantine.return_value = True
+
+        report = ingestion.bulk_backfill("2023-24", "Playoffs")
+
+        assert report["box_scores_failed"] == 2
+        assert ingestion.quarantine.quarantine_api_response.call_count == 2
+        assert (
+            ingestion.quarantine.quarantine_api_response.call_args.args[2]
+            == "get_season_box_scores"
+        )
+        listing = s3_manager.s3_client.list_objects_v2(Bucket=BUCKET)
+        assert listing.get("KeyCount", 0) == 0
+
+    def test_dry_run_writes_nothing(self, ingestion, s3_manager):
+        """Test that a dry run leaves S3 untouched."""
+        ingestion.nba_client.get_season_box_scores.side_effect = self._season_box_scores
+
+        report = ingestion.bulk_backfill("2023-24", dry_run=True)
+
+        assert report["box_scores_stored"] == 2
+        listing = s3_manager.s3_client.list_objects_v2(Bucket=BUCKET)
+        assert listing.get("KeyCount", 0) == 0
+        ingestion.summary_manager.update_bronze_summary.assert_not_called()
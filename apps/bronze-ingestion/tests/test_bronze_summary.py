@@ -2,13 +2,16 @@
 Tests for bronze layer summary functionality.
 """
 
+import gzip
 import json
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.bronze_summary import BronzeSummaryManager
+from app.bronze_summary import MANIFEST_KEY, MANIFEST_VERSION, BronzeSummaryManager
+from app.s3_manager import BronzeS3Manager
+from tests.conftest import BUCKET
 
 
 class TestBronzeSummaryManager:
@@ -172,122 +175,11 @@ class TestBronzeSummaryManager:
 
         # Verify both methods were called
         mock_generate.assert_called_once_with(
-            target_date, games_count, successful_box_scores
+            target_date, games_count, successful_box_scores, None
         )
         mock_store.assert_called_once_with(mock_summary)
         assert key == "_metadata/summary.json"
 
-    def test_collect_bronze_statistics(self, summary_manager, mock_s3_manager):
-        """Test bronze statistics collection."""
-        target_date = date(2024, 1, 15)
-
-        # Mock list_entities_for_date
-        mock_s3_manager.list_entities_for_date.return_value = ["schedule", "box_scores"]
-
-        # Mock entity statistics calls
-        with patch.object(summary_manager, "_get_entity_statistics") as mock_get_stats:
-            with patch.object(
-                summary_manager,
-                "_scan_all_entities",
-                return_value=["schedule", "box_scores"],
-            ):
-                mock_get_stats.side_effect = [
-                    {
-                        "last_updated": "2024-01-15T14:30:22Z",
-                        "file_count": 1,
-                        "estimated_size_mb": 0.5,
-                        "last_processed_date": "2024-01-15",
-                    },
-                    {
-                        "last_updated": "2024-01-15T14:30:22Z",
-                        "file_count": 3,
-                        "estimated_size_mb": 5.2,
-                        "last_processed_date": "2024-01-15",
-                    },
-                ]
-
-                stats = summary_manager._collect_bronze_statistics(target_date)
-
-        # Verify statistics structure
-        assert "entities" in stats
-        assert "storage_info" in stats
-
-        # Verify entity data
-        assert len(stats["entities"]) == 2
-        assert "schedule" in stats["entities"]
-        assert "box_scores" in stats["entities"]
-
-        # Verify storage totals
-        assert stats["storage_info"]["total_files"] == 4  # 1 + 3
-        assert stats["storage_info"]["estimated_size_mb"] == 5.7  # 0.5 + 5.2
-
-    def test_get_entity_statistics(self, summary_manager, mock_s3_manager):
-        """Test getting statistics for a specific entity."""
-        target_date = date(2024, 1, 15)
-        entity = "schedule"
-
-        # Mock S3 response
-        mock_response = {
-            "KeyCount": 2,
-            "Contents": [
-                {"Size": 1024, "LastModified": datetime(2024, 1, 15, 14, 30, 22)},
-                {"Size": 2048, "LastModified": datetime(2024, 1, 15, 14, 25, 10)},
-            ],
-        }
-        mock_s3_manager.s3_client.list_objects_v2.return_value = mock_response
-
-        stats = summary_manager._get_entity_statistics(entity, target_date)
-
-        # Verify S3 call
-        mock_s3_manager.s3_client.list_objects_v2.assert_called_once_with(
-            Bucket="test-bronze-bucket", Prefix="raw/schedule/2024-01-15/"
-        )
-
-        # Verify statistics
-        assert stats["file_count"] == 2
-        assert stats["estimated_size_mb"] == round(3072 / (1024 * 1024), 2)  # ~0.003 MB
-        assert stats["last_updated"] == "2024-01-15T14:30:22"
-        assert stats["last_processed_date"] == "2024-01-15"
-
-    def test_get_entity_statistics_no_data(self, summary_manager, mock_s3_manager):
-        """Test getting statistics when entity has no data."""
-        target_date = date(2024, 1, 15)
-        entity = "schedule"
-
-        # Mock empty S3 response
-        mock_response = {"KeyCount": 0, "Contents": []}
-        mock_s3_manager.s3_client.list_objects_v2.return_value = mock_response
-
-        stats = summary_manager._get_entity_statistics(entity, target_date)
-
-        # Verify empty statistics
-        assert stats["file_count"] == 0
-        assert stats["estimated_size_mb"] == 0.0
-        assert stats["last_updated"] is None
-        assert stats["last_processed_date"] == "2024-01-15"
-
-    def test_scan_all_entities(self, summary_manager, mock_s3_manager):
-        """Test scanning for all entities in bronze layer."""
-        # Mock S3 response for prefix listing
-        mock_response = {
-            "CommonPrefixes": [
-                {"Prefix": "raw/schedule/"},
-                {"Prefix": "raw/box/"},
-                {"Prefix": "raw/players/"},
-            ]
-        }
-        mock_s3_manager.s3_client.list_objects_v2.return_value = mock_response
-
-        entities = summary_manager._scan_all_entities()
-
-        # Verify S3 call
-        mock_s3_manager.s3_client.list_objects_v2.assert_called_once_with(
-            Bucket="test-bronze-bucket", Prefix="raw/", Delimiter="/"
-        )
-
-        # Verify entities list
-        assert entities == ["schedule", "box", "players"]
-
     def test_error_handling_in_generate_summary(self, summary_manager):
         """Test error handling in generate_summary method."""
         target_date = date(2024, 1, 15)
@@ -306,9 +198,10 @@ class TestBronzeSummaryManager:
     ):
         """Test error handling in _collect_bronze_statistics method."""
         target_date = date(2024, 1, 15)
+        mock_s3_manager.get_write_events.return_value = []
 
-        # Mock S3 manager to raise an exception
-        mock_s3_manager.list_entities_for_date.side_effect = Exception(
+        # Mock S3 to raise an error other than a missing manifest
+        mock_s3_manager.s3_client.get_object.side_effect = Exception(
             "S3 connection error"
         )
 
@@ -319,3 +212,138 @@ class TestBronzeSummaryManager:
             "entities": {},
             "storage_info": {"total_files": 0, "estimated_size_mb": 0.0},
         }
+        # Pending writes are kept for the next update
+        mock_s3_manager.clear_write_events.assert_not_called()
+
+
+class TestIncrementalBronzeStatistics:
+    """Test bronze statistics maintained from write events."""
+
+    @pytest.fixture
+    def summary_manager(self, s3_manager):
+        """Create a BronzeSummaryManager backed by mocked S3."""
+        return BronzeSummaryManager(s3_manager)
+
+    @staticmethod
+    def _listed_totals(s3_manager):
+        """Compute per-entity file counts and sizes with a full listing."""
+        totals = {}
+        paginator = s3_manager.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=BUCKET, Prefix="raw/"):
+            for obj in page.get("Contents", []):
+                entity = obj["Key"].split("/")[1]
+                count, size = totals.get(entity, (0, 0))
+                totals[entity] = (count + 1, size + obj["Size"])
+        return totals
+
+    def test_bootstraps_from_listing(self, summary_manager, s3_manager):
+        """Test that the first update builds exact totals from a listing."""
+        for n in range(150):
+            s3_manager.store_json(
+                {"game": n}, "box", date(2024, 1, 1 + n % 28), f"00223{n:05d}"
+            )
+        s3_manager.store_json({"games": []}, "schedule", date(2024, 1, 15))
+
+        stats = summary_manager._collect_bronze_statistics(date(2024, 1, 15))
+
+        totals = self._listed_totals(s3_manager)
+        assert stats["entities"]["box"]["file_count"] == 150
+        assert stats["entities"]["box"]["size_bytes"] == totals["box"][1]
+        assert stats["entities"]["schedule"]["file_count"] == 1
+        assert stats["entities"]["box"]["last_processed_date"] == "2024-01-28"
+        assert stats["storage_info"]["total_files"] == 151
+        assert s3_manager.get_write_events() == []
+
+    def test_merges_write_events_without_listing(self, summary_manager, s3_manager):
+        """Test that later updates only apply this run's writes."""
+        s3_manager.store_json({"game": 1}, "box", date(2024, 1, 14), "0022300001")
+        summary_manager._collect_bronze_statistics(date(2024, 1, 14))
+
+        # New game, plus an overwrite of an existing game with a larger payload
+        s3_manager.store_json({"game": 2}, "box", date(2024, 1, 15), "0022300002")
+        s3_manager.store_json(
+            {"game": 1, "corrected": True}, "box", date(2024, 1, 14), "0022300001"
+        )
+
+        with patch.object(
+            s3_manager.s3_client,
+            "get_paginator",
+            side_effect=AssertionError("raw/ should not be listed"),
+        ):
+            stats = summary_manager._collect_bronze_statistics(date(2024, 1, 15))
+
+        totals = self._listed_totals(s3_manager)
+        assert stats["entities"]["box"]["file_count"] == 2
+        assert stats["entities"]["box"]["size_bytes"] == totals["box"][1]
+        assert stats["entities"]["box"]["last_processed_date"] == "2024-01-15"
+        assert stats["storage_info"]["total_size_bytes"] == totals["box"][1]
+
+    def test_manifest_is_compressed(self, summary_manager, s3_manager):
+        """Test that the manifest is stored as gzip-compressed JSON."""
+        s3_manager.store_json({"game": 1}, "box", date(2024, 1, 14), "0022300001")
+        summary_manager._collect_bronze_statistics(date(2024, 1, 14))
+
+        response = s3_manager.s3_client.get_object(Bucket=BUCKET, Key=MANIFEST_KEY)
+        assert response["Metadata"]["compression"] == "gzip"
+        manifest = json.loads(gzip.decompress(response["Body"].read()))
+        size = len(json.dumps({"game": 1}, indent=2))
+        assert "objects" not in manifest
+        assert manifest["entities"]["box"]["file_count"] == 1
+        assert manifest["entities"]["box"]["size_bytes"] == size
+
+    def test_upgrades_version_1_manifest(self, summary_manager, s3_manager):
+        """Test that a manifest mapping every object keeps only its totals."""
+        s3_manager.store_json({"game": 1}, "box", date(2024, 1, 14), "0022300001")
+        summary_manager._collect_bronze_statistics(date(2024, 1, 14))
+        manifest, _ = summary_manager._load_manifest()
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key=MANIFEST_KEY,
+            Body=json.dumps(
+                {
+                    **manifest,
+                    "manifest_version": "1.0",
+                    "objects": {"raw/box/2024-01-14/0022300001.json": 14},
+                }
+            ).encode("utf-8"),
+        )
+
+        s3_manager.store_json({"game": 2}, "box", date(2024, 1, 15), "0022300002")
+        stats = summary_manager._collect_bronze_statistics(date(2024, 1, 15))
+
+        assert stats["entities"]["box"]["file_count"] == 2
+        manifest, _ = summary_manager._load_manifest()
+        assert "objects" not in manifest
+        assert manifest["manifest_version"] == MANIFEST_VERSION
+
+    def test_concurrent_update_is_retried(self, summary_manager, s3_manager):
+        """Test that a run's writes survive another run updating the manifest."""
+        s3_manager.store_json({"game": 1}, "box", date(2024, 1, 14), "0022300001")
+        summary_manager._collect_bronze_statistics(date(2024, 1, 14))
+
+        # Another process's run adds a game after this run read the manifest
+        other_manager = BronzeS3Manager(BUCKET)
+        other_summary = BronzeSummaryManager(other_manager)
+        load_manifest = summary_manager._load_manifest
+        raced = []
+
+        def load_then_race():
+            loaded = load_manifest()
+            if not raced:
+                raced.append(True)
+                other_manager.store_json(
+                    {"game": 3}, "box", date(2024, 1, 16), "0022300003"
+                )
+                other_summary._collect_bronze_statistics(date(2024, 1, 16))
+            return loaded
+
+        s3_manager.store_json({"game": 2}, "box", date(2024, 1, 15), "0022300002")
+        with patch.object(
+            summary_manager, "_load_manifest", side_effect=load_then_race
+        ) as loads:
+            stats = summary_manager._collect_bronze_statistics(date(2024, 1, 15))
+
+        assert loads.call_count == 2
+        totals = self._listed_totals(s3_manager)
+        assert stats["entities"]["box"]["file_count"] == 3
+        assert stats["entities"]["box"]["size_bytes"] == totals["box"][1]
@@ -19,6 +19,15 @@ class TestBronzeSummaryIntegration:
         config = MagicMock()
         config.bronze_bucket = "test-bronze-bucket"
         config.aws_region = "us-east-1"
+        config.max_workers = 1
+        config.nba_api_cache_path = None
+        config.bronze_compression = "none"
+        config.player_info_ttl_days = 90
+        config.player_info_max_refreshes = 5
+        config.max_retries = 3
+        config.retry_budget = 30
+        config.circuit_breaker_threshold = 5
+        config.deadline_reserve_seconds = 60
         return config
 
     @pytest.fixture
@@ -122,6 +131,7 @@ class TestBronzeSummaryIntegration:
             target_date,
             3,
             3,  # 3 games, 3 successful box scores
+            schedule_rows=3,
         )
 
     def test_summary_handles_partial_box_score_failures(self, ingestion):
@@ -174,4 +184,5 @@ class TestBronzeSummaryIntegration:
             target_date,
             3,
             2,  # 3 games, 2 successful box scores
+            schedule_rows=3,
         )
@@ -0,0 +1,183 @@
+"""Tests for the single-pass compiled validator."""
+
+from datetime import date
+
+from app.compiled_validation import (
+    CompiledValidator,
+    IssueCode,
+    check_schedule_game,
+    get_compiled_validator,
+)
+
+
+def _team(team_id: int, player_count: int) -> dict:
+    return {
+        "teamId": team_id,
+        "players": [
+            {"personId": 1000 + n, "statistics": {"points": n}}
+            for n in range(player_count)
+        ],
+        "statistics": {"points": 100},
+    }
+
+
+def _v3_box_score(game_id: str = "0022400001") -> dict:
+    return {
+        "boxScoreTraditional": {
+            "gameId": game_id,
+            "homeTeam": _team(1610612738, 3),
+            "awayTeam": _team(1610612752, 2),
+        }
+    }
+
+
+def _schedule_game(**overrides) -> dict:
+    game = {
+        "GAME_ID": "0022400001",
+        "GAME_DATE": "2024-01-15",
+        "TEAM_ID": 1610612738,
+        "PTS": 110,
+    }
+    game.update(overrides)
+    return game
+
+
+class TestCompiledValidator:
+    """Test the generic schema compiler."""
+
+    def test_missing_field_code_and_path(self):
+        """Test that missing required fields report their location."""
+        validator = CompiledValidator(
+            {
+                "type": "object",
+                "required": ["a"],
+                "properties": {"a": {"type": "object", "required": ["b"]}},
+            }
+        )
+
+        report = validator.validate({"a": {}})
+
+        assert not report.schema_valid
+        assert report.issues[0].code is IssueCode.MISSING_FIELD
+        assert report.issues[0].path == "/a"
+
+    def test_bool_is_not_integer(self):
+        """Test that booleans are rejected where integers are expected."""
+        validator = CompiledValidator({"type": "integer"})
+
+        report = validator.validate(True)
+
+        assert report.codes == [IssueCode.WRONG_TYPE.value]
+
+    def test_whole_number_float_is_integer(self):
+        """Test that integers accept 5.0 but not 5.5, as jsonschema does."""
+        validator = CompiledValidator({"type": "integer", "minimum": 0})
+
+        assert validator.validate(5.0).schema_valid
+        assert validator.validate(5.5).codes == [IssueCode.WRONG_TYPE.value]
+        assert validator.validate(False).codes == [IssueCode.WRONG_TYPE.value]
+
+    def test_hook_exception_is_reported(self):
+        """Test that a failing domain check becomes a validation error."""
+
+        def explode(value, path, run):
+            raise RuntimeError("boom")
+
+        validator = CompiledValidator({"type": "object"}, hooks={"": explode})
+
+        report = validator.validate({})
+
+        assert report.codes == [IssueCode.VALIDATION_ERROR.value]
+        assert "boom" in report.issues[0].message
+
+
+class TestBoxScoreValidation:
+    """Test box score validation."""
+
+    def test_v3_metrics_in_one_pass(self):
+        """Test that V3 payloads produce player metrics and no issues."""
+        report = get_compiled_validator("box_score").validate(_v3_box_score())
+
+        assert report.schema_valid
+        assert report.issues == []
+        assert report.metrics["home_player_count"] == 3
+        assert report.metrics["away_player_count"] == 2
+        assert report.metrics["total_player_count"] == 5
+
+    def test_v3_game_id_mismatch(self):
+        """Test that an unexpected gameId is flagged without failing schema."""
+        report = get_compiled_validator("box_score").validate(
+            _v3_box_score(), {"expected_game_id": "0022400002"}
+        )
+
+        assert report.schema_valid
+        assert report.codes == [IssueCode.GAME_ID_MISMATCH.value]
+
+    def test_v3_missing_team_reports_branch_issue(self):
+        """Test that the closest oneOf branch explains the failure."""
+        payload = _v3_box_score()
+        del payload["boxScoreTraditional"]["awayTeam"]
+
+        report = get_compiled_validator("box_score").validate(payload)
+
+        assert not report.schema_valid
+        assert report.issues[0].code is IssueCode.MISSING_FIELD
+        assert report.issues[0].path == "/boxScoreTraditional"
+
+    def test_unrecognised_payload_is_unknown_format(self):
+        """Test that payloads matching no known format are reported as such."""
+        report = get_compiled_validator("box_score").validate({"something": 1})
+
+        assert report.codes == [IssueCode.UNKNOWN_FORMAT.value]
+
+    def test_legacy_row_length_mismatch(self):
+        """Test that short rows are counted and reported with their path."""
+        payload = {
+            "resultSets": [
+                {
+                    "name": "PlayerStats",
+                    "headers": ["GAME_ID", "PLAYER_ID", "PTS"],
+                    "rowSet": [["0022400001", 1, 10], ["0022400001", 2]],
+                }
+            ],
+            "parameters": {"GameID": "0022400001"},
+        }
+
+        report = get_compiled_validator("box_score").validate(payload)
+
+        assert report.schema_valid
+        assert report.metrics["result_set_0_row_count"] == 2
+        assert report.metrics["result_set_0_inconsistent_rows"] == 1
+        assert report.issues[0].code is IssueCode.ROW_LENGTH_MISMATCH
+        assert report.issues[0].path == "/resultSets/0/rowSet/1"
+
+    def test_validator_is_compiled_once(self):
+        """Test that the compiled validator is shared per response type."""
+        assert get_compiled_validator("box_score") is get_compiled_validator(
+            "box_score"
+        )
+
+
+class TestScheduleValidation:
+    """Test schedule validation."""
+
+    def test_date_consistency_and_game_counts(self):
+        """Test schedule metrics computed during the traversal."""
+        schedule = [_schedule_game(), _schedule_game(GAME_DATE="2024-01-16")]
+
+        report = get_compiled_validator("schedule").validate(
+            schedule, {"target_date": date(2024, 1, 15)}
+        )
+
+        assert report.schema_valid
+        assert report.metrics["valid_games"] == 2
+        assert report.metrics["date_consistency"] is False
+        assert IssueCode.DATE_INCONSISTENT.value in report.codes
+
+    def test_unrealistic_score(self):
+        """Test that implausible scores are flagged per game."""
+        assert check_schedule_game(_schedule_game(PTS=400), "Game 0") == (
+            IssueCode.UNREALISTIC_VALUE,
+            "Unrealistic points value for Game 0: 400",
+        )
+        assert check_schedule_game(_schedule_game(), "Game 0") is None
@@ -0,0 +1,140 @@
+"""Tests for content-hash change detection of stat corrections."""
+
+import gzip
+import json
+from datetime import date
+
+from app.corrections import content_hash, correction_key
+from tests.conftest import BUCKET
+
+
+def _box_score(game_id, points, fetch_date="2024-01-15T08:00:00"):
+    return {
+        "boxScoreTraditional": {"gameId": game_id, "homeTeam": {"points": points}},
+        "game_id": game_id,
+        "fetch_date": fetch_date,
+        "meta": {"time": fetch_date},
+    }
+
+
+class TestContentHash:
+    """Test the canonical content hash."""
+
+    def test_ignores_key_order_and_fetch_metadata(self):
+        """Test that refetching unchanged stats gives the same hash."""
+        first = _box_score("0022300001", 100)
+        second = dict(reversed(list(_box_score("0022300001", 100, "later").items())))
+
+        assert content_hash(first) == content_hash(second)
+
+    def test_changes_with_stats(self):
+        """Test that a corrected stat changes the hash."""
+        assert content_hash(_box_score("0022300001", 100)) != content_hash(
+            _box_score("0022300001", 102)
+        )
+
+
+class TestStoredContentHash:
+    """Test reading content hashes of stored objects."""
+
+    def test_store_json_records_hash(self, s3_manager):
+        """Test that writes record the hash in the object metadata."""
+        data = _box_score("0022300001", 100)
+        s3_manager.store_json(data, "box", date(2024, 1, 14), "0022300001")
+
+        assert s3_manager.get_content_hash(
+            "box", date(2024, 1, 14), "0022300001"
+        ) == content_hash(data)
+
+    def test_legacy_object_is_hashed_from_body(self, s3_manager):
+        """Test that objects written without a hash are downloaded and hashed."""
+        data = _box_score("0022300001", 100)
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key="raw/box/2024-01-14/0022300001.json",
+            Body=gzip.compress(json.dumps(data).encode("utf-8")),
+            Metadata={"compression": "gzip"},
+        )
+
+        assert s3_manager.get_content_hash(
+            "box", date(2024, 1, 14), "0022300001"
+        ) == content_hash(data)
+
+    def test_missing_object(self, s3_manager):
+        """Test that a game without a stored object has no hash."""
+        assert s3_manager.get_content_hash("box", date(2024, 1, 14), "0") is None
+
+
+class TestRecheck:
+    """Test DateScopedIngestion.recheck."""
+
+    def _store(self, s3_manager, game_id, points, day=14):
+        s3_manager.store_json(
+            _box_score(game_id, points), "box", date(2024, 1, day), game_id
+        )
+
+    def test_rewrites_only_corrected_games(self, ingestion, s3_manager):
+        """Test that unchanged games are neither rewritten nor triggered."""
+        self._store(s3_manager, "0022300001", 100)
+        self._store(s3_manager, "0022300002", 90)
+        self._store(s3_manager, "0022300003", 95, day=13)
+        written = len(s3_manager.get_write_events())
+        # Only game 0022300002 had its points corrected (90 -> 92)
+        points = {"0022300001": 100, "0022300002": 92, "0022300003": 95}
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id, refresh: (
+            _box_score(game_id, points[game_id], fetch_date="2024-01-16T08:00:00")
+        )
+
+        report = ingestion.recheck(end_date=date(2024, 1, 14), lookback_days=2)
+
+        assert report["dates_checked"] == 2
+        assert report["games_checked"] == 3
+        assert report["games_unchanged"] == 2
+        assert report["games_corrected"] == 1
+        assert report["corrected_game_ids"] == {"2024-01-14": ["0022300002"]}
+        ingestion.nba_client.get_box_score.assert_any_call("0022300001", refresh=True)
+
+        rewrites = s3_manager.get_write_events()[written:]
+        assert [event["key"] for event in rewrites] == [
+            "raw/box/2024-01-14/0022300002.json"
+        ]
+        notice = json.loads(
+            s3_manager.s3_client.get_object(
+                Bucket=BUCKET, Key=correction_key(date(2024, 1, 14))
+            )["Body"].read()
+        )
+        assert notice["corrected_game_ids"] == ["0022300002"]
+        assert notice["games_checked"] == 2
+        listing = s3_manager.s3_client.list_objects_v2(
+            Bucket=BUCKET, Prefix="_metadata/corrections/"
+        )
+        assert listing["KeyCount"] == 1
+
+    def test_dry_run_writes_nothing(self, ingestion, s3_manager):
+        """Test that a dry run reports corrections without writing."""
+        self._store(s3_manager, "0022300001", 100)
+        written = len(s3_manager.get_write_events())
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id, refresh: (
+            _box_score(game_id, 101)
+        )
+
+        report = ingestion.recheck(
+            end_date=date(2024, 1, 14), lookback_days=1, dry_run=True
+        )
+
+        assert report["games_corrected"] == 1
+        assert len(s3_manager.get_write_events()) == written
+        listing = s3_manager.s3_client.list_objects_v2(
+            Bucket=BUCKET, Prefix="_metadata/"
+        )
+        assert listing["KeyCount"] == 0
+
+    def test_fetch_failures_are_counted(self, ingestion, s3_manager):
+        """Test that games that cannot be re-fetched are reported as failed."""
+        self._store(s3_manager, "0022300001", 100)
+        ingestion.nba_client.get_box_score.side_effect = Exception("API Error")
+
+        report = ingestion.recheck(end_date=date(2024, 1, 14), lookback_days=1)
+
+        assert report["games_failed"] == 1
+        assert report["games_corrected"] == 0
@@ -0,0 +1,173 @@
+"""Tests for deferring games the retry budget left unfetched."""
+
+import json
+from datetime import date
+
+import pytest
+
+from app.corrections import correction_key
+from app.deferred import DEFERRED_GAMES_KEY, DeferredGames, deferred_games_key
+from tests.conftest import BUCKET
+
+GAME_DATE = date(2024, 1, 15)
+NEXT_DATE = date(2024, 1, 16)
+GAME_IDS = ["0022300001", "0022300002", "0022300003"]
+
+
+def _schedule(game_ids):
+    return [{"GAME_ID": game_id, "TEAM_ID": 1, "WL": "W"} for game_id in game_ids]
+
+
+def _box_score(game_id):
+    return {"boxScoreTraditional": {"gameId": game_id}, "game_id": game_id}
+
+
+@pytest.fixture
+def make_ingestion(make_ingestion):
+    """Create ingestion instances serving GAME_IDS on GAME_DATE."""
+
+    def make(remaining_time=None, **settings):
+        ingestion = make_ingestion(remaining_time, **settings)
+        ingestion.nba_client.get_games_for_date.side_effect = lambda d: (
+            _schedule(GAME_IDS) if d == GAME_DATE else []
+        )
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id, **_: (
+            _box_score(game_id)
+        )
+        return ingestion
+
+    return make
+
+
+def _deferred(s3_manager):
+    body = s3_manager.s3_client.get_object(Bucket=BUCKET, Key=DEFERRED_GAMES_KEY)
+    return json.loads(body["Body"].read())["games"]
+
+
+def _stored_game_ids(s3_manager, target_date):
+    return s3_manager.list_game_ids_by_date("box", target_date, target_date).get(
+        target_date.isoformat(), set()
+    )
+
+
+class TestDeferredGames:
+    """Test the deferred games record."""
+
+    def test_key_per_league(self):
+        """Test that non-NBA leagues get their own record."""
+        assert deferred_games_key() == DEFERRED_GAMES_KEY
+        assert (
+            deferred_games_key("wnba") == "_metadata/leagues/wnba/deferred_games.json"
+        )
+
+    def test_record_round_trip(self, s3_manager):
+        """Test that recorded dates persist and an empty list resolves a date."""
+        record = DeferredGames(s3_manager)
+        record.load()
+        assert record.dates() == []
+
+        record.record_date(NEXT_DATE, ["b"], "deadline")
+        record.record_date(GAME_DATE, ["c", "a"], "circuit_open")
+        record.save()
+
+        loaded = DeferredGames(s3_manager)
+        loaded.load()
+        assert loaded.dates() == [GAME_DATE, NEXT_DATE]
+        assert loaded.game_ids(GAME_DATE) == ["a", "c"]
+        assert loaded.games[GAME_DATE.isoformat()]["reason"] == "circuit_open"
+
+        loaded.record_date(GAME_DATE, [])
+        assert loaded.dates() == [NEXT_DATE]
+
+
+class TestIngestionDeferral:
+    """Test deferral and catch-up in DateScopedIngestion.run."""
+
+    def test_schedule_fetch_is_retried_only_by_the_client(self, make_ingestion):
+        """Test that a failed schedule fetch is not retried on top of the client."""
+        ingestion = make_ingestion()
+        ingestion.nba_client.get_games_for_date.side_effect = Exception("API Error")
+
+        assert ingestion.run(GAME_DATE) is False
+        assert ingestion.nba_client.get_games_for_date.call_count == 1
+
+    def test_games_past_the_deadline_are_deferred(self, make_ingestion, s3_manager):
+        """Test that no box score is fetched once the deadline is reached."""
+        remaining = [600.0]
+        ingestion = make_ingestion(remaining_time=lambda: remaining[0])
+
+        def get_box_score(game_id, **_):
+            # The first game uses up the invocation's time
+            remaining[0] = 30.0
+            return _box_score(game_id)
+
+        ingestion.nba_client.get_box_score.side_effect = get_box_score
+
+        assert ingestion.run(GAME_DATE) is True
+
+        assert ingestion.nba_client.get_box_score.call_count == 1
+        assert _stored_game_ids(s3_manager, GAME_DATE) == {GAME_IDS[0]}
+        deferred = _deferred(s3_manager)[GAME_DATE.isoformat()]
+        assert deferred["game_ids"] == GAME_IDS[1:]
+        assert deferred["reason"] == "deadline"
+
+    def test_open_circuit_defers_remaining_games(self, make_ingestion, s3_manager):
+        """Test that repeated failures stop calling the API for the run."""
+        ingestion = make_ingestion(circuit_breaker_threshold=1)
+
+        def get_box_score(game_id, **_):
+            # The client reports every failed attempt to the shared policy
+            ingestion.retry_policy.record_failure()
+            raise Exception("API Error")
+
+        ingestion.nba_client.get_box_score.side_effect = get_box_score
+
+        assert ingestion.run(GAME_DATE) is True
+
+        assert ingestion.nba_client.get_box_score.call_count == 1
+        assert [r.get("deferred") for r in ingestion.game_results] == [
+            True,
+            True,
+            True,
+        ]
+        deferred = _deferred(s3_manager)[GAME_DATE.isoformat()]
+        assert deferred["reason"] == "circuit_open"
+
+    def test_later_run_catches_up_deferred_games(self, make_ingestion, s3_manager):
+        """Test that the next run stores deferred games and triggers silver."""
+        record = DeferredGames(s3_manager)
+        record.record_date(GAME_DATE, GAME_IDS[1:], "deadline")
+        record.save()
+
+        ingestion = make_ingestion()
+        assert ingestion.run(NEXT_DATE) is True
+
+        assert _stored_game_ids(s3_manager, GAME_DATE) == set(GAME_IDS[1:])
+        assert _deferred(s3_manager) == {}
+        notice = s3_manager.s3_client.get_object(
+            Bucket=BUCKET, Key=correction_key(GAME_DATE)
+        )
+        corrected = json.loads(notice["Body"].read())["corrected_game_ids"]
+        assert corrected == GAME_IDS[1:]
+
+    def test_rerun_of_deferred_date_resolves_it(self, make_ingestion, s3_manager):
+        """Test that rerunning a date with deferred games clears its record."""
+        record = DeferredGames(s3_manager)
+        record.record_date(GAME_DATE, GAME_IDS[1:], "deadline")
+        record.save()
+
+        ingestion = make_ingestion()
+        assert ingestion.run(GAME_DATE) is True
+
+        # Each game was fetched once, by the rerun itself
+        assert ingestion.nba_client.get_box_score.call_count == len(GAME_IDS)
+        assert _deferred(s3_manager) == {}
+
+    def test_dry_run_records_nothing(self, make_ingestion, s3_manager):
+        """Test that a dry run neither catches up nor records deferrals."""
+        ingestion = make_ingestion(remaining_time=lambda: 0.0)
+
+        assert ingestion.run(GAME_DATE, dry_run=True) is True
+
+        listing = s3_manager.s3_client.list_objects_v2(Bucket=BUCKET)
+        assert listing.get("KeyCount", 0) == 0
@@ -155,6 +155,38 @@ class TestClassifyQuarantineError:
         result = {"issues": ["SCHEMA validation FAILED"]}
         assert classify_quarantine_error(result) == ErrorClassification.SCHEMA_CHANGE
 
+    def test_issue_codes_schema_change(self):
+        """Test that structural issue codes classify as schema changes."""
+        result = {
+            "issues": ["Schema validation failed at /boxScoreTraditional: ..."],
+            "issue_codes": ["missing_field"],
+        }
+        assert classify_quarantine_error(result) == ErrorClassification.SCHEMA_CHANGE
+
+    def test_issue_codes_take_precedence_over_keywords(self):
+        """Test that codes are used instead of matching message text."""
+        result = {
+            "issues": ["Request timeout while reading schema"],
+            "issue_codes": ["invalid_game_id"],
+        }
+        assert classify_quarantine_error(result) == ErrorClassification.DATA_QUALITY
+
+    def test_issue_codes_most_severe_wins(self):
+        """Test that the most severe code-based classification wins."""
+        result = {
+            "issues": ["a", "b"],
+            "issue_codes": ["date_inconsistent", "row_length_mismatch"],
+        }
+        assert classify_quarantine_error(result) == ErrorClassification.SCHEMA_CHANGE
+
+    def test_issue_codes_validation_error_is_unknown(self):
+        """Test that validator failures are left unclassified."""
+        result = {
+            "issues": ["Validation error: boom"],
+            "issue_codes": ["validation_error"],
+        }
+        assert classify_quarantine_error(result) == ErrorClassification.UNKNOWN
+
     def test_multiple_issues_most_severe_wins(self):
         """Test that the most severe classification wins with multiple issues."""
         result = {
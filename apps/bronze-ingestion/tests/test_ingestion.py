@@ -383,3 +383,125 @@ class TestDateScopedIngestion:
         assert parsed_data[0]["TEAM_ABBREVIATION"] == "LAL"
         assert parsed_data[1]["GAME_ID"] == "1234567891"
         assert parsed_data[1]["TEAM_ABBREVIATION"] == "GSW"
+
+    @patch("app.ingestion.DataValidator")
+    @patch("app.ingestion.DataQuarantine")
+    @patch("app.ingestion.NBAClient")
+    @patch("app.ingestion.BronzeS3Manager")
+    def test_concurrent_box_score_ingestion_preserves_order(
+        self, mock_s3_manager, mock_nba_client, mock_quarantine, mock_validator
+    ):
+        """Test that a worker pool ingests every game and keeps schedule order."""
+        import time
+
+        config = BronzeIngestionConfig(
+            bronze_bucket="test-bucket", aws_region="us-east-1", max_workers=4
+        )
+
+        game_ids = [f"002230{i:04d}" for i in range(8)]
+        mock_games = [
+            {"GAME_ID": game_id, "GAME_DATE": "2023-12-25", "TEAM_ID": 1610612747}
+            for game_id in game_ids
+        ]
+
+        def fetch_box_score(game_id):
+            # Finish earlier games last so completion order differs from input
+            time.sleep(0.01 * (len(game_ids) - game_ids.index(game_id)))
+            if game_id == game_ids[3]:
+                raise Exception("API Error")
+            return {"boxScoreTraditional": {"gameId": game_id}}
+
+        mock_client_instance = Mock()
+        mock_client_instance.get_games_for_date.return_value = mock_games
+        mock_client_instance.get_box_score.side_effect = fetch_box_score
+        mock_nba_client.return_value = mock_client_instance
+
+        mock_s3_instance = Mock()
+        mock_s3_manager.return_value = mock_s3_instance
+
+        mock_validator_instance = Mock()
+        mock_validator_instance.validate_api_response.return_value = {
+            "valid": True,
+            "issues": [],
+            "metrics": {},
+        }
+        mock_validator.return_value = mock_validator_instance
+
+        mock_quarantine_instance = Mock()
+        mock_quarantine_instance.should_quarantine.return_value = False
+        mock_quarantine.return_value = mock_quarantine_instance
+
+        ingestion = DateScopedIngestion(config)
+        result = ingestion.run(date(2023, 12, 25), dry_run=False)
+
+        assert result is True
+        assert [r["game_id"] for r in ingestion.game_results] == game_ids
+        assert [r["success"] for r in ingestion.game_results] == [
+            game_id != game_ids[3] for game_id in game_ids
+        ]
+        assert ingestion.records_processed == 7
+
+        stored_game_ids = {
+            call.kwargs["game_id"]
+            for call in mock_s3_instance.store_json.call_args_list
+            if call.kwargs["entity"] == "box"
+        }
+        assert stored_game_ids == set(game_ids) - {game_ids[3]}
+
+    @patch("app.ingestion.DataValidator")
+    @patch("app.ingestion.DataQuarantine")
+    @patch("app.ingestion.NBAClient")
+    @patch("app.ingestion.BronzeS3Manager")
+    def test_team_rows_fetch_each_game_once(
+        self, mock_s3_manager, mock_nba_client, mock_quarantine, mock_validator
+    ):
+        """Test that both team rows of a game lead to a single box score fetch."""
+        config = BronzeIngestionConfig(
+            bronze_bucket="test-bucket", aws_region="us-east-1"
+        )
+
+        schedule_rows = [
+            {"GAME_ID": game_id, "TEAM_ID": team_id, "MATCHUP": matchup}
+            for game_id, team_id, matchup in [
+                ("0022300001", 1610612747, "LAL vs. BOS"),
+                ("0022300001", 1610612738, "BOS @ LAL"),
+                ("0022300002", 1610612744, "GSW vs. DEN"),
+                ("0022300002", 1610612743, "DEN @ GSW"),
+            ]
+        ]
+        mock_client_instance = Mock()
+        mock_client_instance.get_games_for_date.return_value = schedule_rows
+        mock_client_instance.get_box_score.return_value = {"resultSets": []}
+        mock_nba_client.return_value = mock_client_instance
+
+        mock_s3_instance = Mock()
+        mock_s3_manager.return_value = mock_s3_instance
+
+        mock_validator.return_value.validate_api_response.return_value = {
+            "valid": True,
+            "issues": [],
+            "metrics": {},
+        }
+        mock_quarantine.return_value.should_quarantine.return_value = False
+
+        ingestion = DateScopedIngestion(config)
+        ingestion.summary_manager = Mock()
+        result = ingestion.run(date(2023, 12, 25), dry_run=False)
+
+        assert result is True
+        fetched = [
+            call.args[0] for call in mock_client_instance.get_box_score.call_args_list
+        ]
+        assert fetched == ["0022300001", "0022300002"]
+
+        # The raw schedule rows are still stored unchanged
+        schedule_call = next(
+            call
+            for call in mock_s3_instance.store_json.call_args_list
+            if call.kwargs["entity"] == "schedule"
+        )
+        assert schedule_call.args[0] == schedule_rows
+
+        ingestion.summary_manager.update_bronze_summary.assert_called_once_with(
+            date(2023, 12, 25), 2, 2, schedule_rows=4
+        )
@@ -35,7 +35,7 @@ class TestLambdaHandler:
         context.function_name = "test-function"
 
         # Mock the ingestion class and its run method
-        with patch("app.lambda_handler.DateScopedIngestion") as mock_ingestion_class:
+        with patch("app.lambda_handler.MultiLeagueIngestion") as mock_ingestion_class:
             mock_ingestion = MagicMock()
             mock_ingestion.run.return_value = True
             mock_ingestion_class.return_value = mock_ingestion
@@ -56,6 +56,11 @@ class TestLambdaHandler:
                 target_date=date(2024, 12, 25), dry_run=True
             )
 
+            # API calls are bounded by the invocation's remaining time
+            context.get_remaining_time_in_millis.return_value = 90_000
+            remaining_time = mock_ingestion_class.call_args.kwargs["remaining_time"]
+            assert remaining_time() == 90.0
+
     def test_lambda_handler_with_missing_date(self):
         """Test Lambda handler when no date is provided (should use today)."""
         # Arrange
@@ -71,7 +76,7 @@ class TestLambdaHandler:
 
         today = date(2024, 12, 25)  # Use a fixed date for predictable testing
 
-        with patch("app.lambda_handler.DateScopedIngestion") as mock_ingestion_class:
+        with patch("app.lambda_handler.MultiLeagueIngestion") as mock_ingestion_class:
             mock_ingestion = MagicMock()
             mock_ingestion.run.return_value = True
             mock_ingestion_class.return_value = mock_ingestion
@@ -132,7 +137,7 @@ class TestLambdaHandler:
         context.aws_request_id = "test-request-id"
         context.function_name = "test-function"
 
-        with patch("app.lambda_handler.DateScopedIngestion") as mock_ingestion_class:
+        with patch("app.lambda_handler.MultiLeagueIngestion") as mock_ingestion_class:
             mock_ingestion = MagicMock()
             mock_ingestion.run.return_value = False  # Simulate failure
             mock_ingestion_class.return_value = mock_ingestion
@@ -159,7 +164,7 @@ class TestLambdaHandler:
         context.aws_request_id = "test-request-id"
         context.function_name = "test-function"
 
-        with patch("app.lambda_handler.DateScopedIngestion") as mock_ingestion_class:
+        with patch("app.lambda_handler.MultiLeagueIngestion") as mock_ingestion_class:
             mock_ingestion_class.side_effect = RuntimeError("Test error")
 
             # Act
@@ -0,0 +1,171 @@
+"""Tests for live polling of in-progress games."""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+from hoopstat_nba_api import (
+    GAME_STATUS_FINAL,
+    GAME_STATUS_IN_PROGRESS,
+    GAME_STATUS_SCHEDULED,
+)
+
+from app.corrections import correction_key, store_correction_notice
+from tests.conftest import BUCKET
+
+
+def _box_score(game_id, points, fetch_date="2024-01-15T08:00:00"):
+    return {
+        "boxScoreTraditional": {"gameId": game_id, "homeTeam": {"points": points}},
+        "game_id": game_id,
+        "fetch_date": fetch_date,
+        "meta": {"time": fetch_date},
+    }
+
+
+class TestLivePolling:
+    """Test DateScopedIngestion.live."""
+
+    def _run(self, ingestion, rounds, **kwargs):
+        """Run live polling over scripted rounds of (status, points) per game."""
+        round_number = {"value": -1}
+
+        def get_scoreboard(target_date):
+            round_number["value"] += 1
+            games = rounds[round_number["value"]]
+            return [
+                {"gameId": game_id, "gameStatus": status}
+                for game_id, (status, _) in games.items()
+            ]
+
+        def get_box_score(game_id, refresh):
+            points = rounds[round_number["value"]][game_id][1]
+            return _box_score(game_id, points, fetch_date=str(round_number["value"]))
+
+        ingestion.nba_client.get_scoreboard.side_effect = get_scoreboard
+        ingestion.nba_client.get_box_score.side_effect = get_box_score
+        # Sleeping advances a fake clock instead of waiting
+        clock = {"now": 0.0}
+        with (
+            patch("app.ingestion.time.monotonic", side_effect=lambda: clock["now"]),
+            patch(
+                "app.ingestion.time.sleep",
+                side_effect=lambda seconds: clock.update(now=clock["now"] + seconds),
+            ) as mock_sleep,
+        ):
+            report = ingestion.live(
+                target_date=date(2024, 1, 15), poll_interval=30, **kwargs
+            )
+        return report, mock_sleep
+
+    def test_writes_only_changed_box_scores(self, ingestion, s3_manager):
+        """Test that polls without stat changes write nothing."""
+        rounds = [
+            {
+                "0022300001": (GAME_STATUS_IN_PROGRESS, 10),
+                "0022300002": (GAME_STATUS_SCHEDULED, None),
+            },
+            {
+                "0022300001": (GAME_STATUS_IN_PROGRESS, 10),
+                "0022300002": (GAME_STATUS_IN_PROGRESS, 5),
+            },
+            {
+                "0022300001": (GAME_STATUS_FINAL, 20),
+                "0022300002": (GAME_STATUS_IN_PROGRESS, 5),
+            },
+            {
+                "0022300001": (GAME_STATUS_FINAL, 20),
+                "0022300002": (GAME_STATUS_FINAL, 7),
+            },
+        ]
+
+        report, mock_sleep = self._run(ingestion, rounds)
+
+        assert report["completed"] is True
+        assert report["polls"] == 4
+        assert report["box_scores_fetched"] == 6
+        assert report["box_scores_written"] == 4
+        assert report["box_scores_unchanged"] == 2
+        assert report["games_final"] == 2
+        assert mock_sleep.call_count == 3
+        # A final game is fetched once after going final, then dropped
+        fetched = [c.args[0] for c in ingestion.nba_client.get_box_score.call_args_list]
+        assert fetched.count("0022300001") == 3
+        keys = [event["key"] for event in s3_manager.get_write_events()]
+        assert keys == [
+            "raw/box/2024-01-15/0022300001.json",
+            "raw/box/2024-01-15/0022300002.json",
+            "raw/box/2024-01-15/0022300001.json",
+            "raw/box/2024-01-15/0022300002.json",
+        ]
+        # The summary is updated once, when the run ends
+        ingestion.summary_manager.update_bronze_summary.assert_called_once_with(
+            date(2024, 1, 15), 2, 2
+        )
+
+    def test_changed_games_are_sent_to_silver(self, ingestion, s3_manager):
+        """Test that each round with changes names its games in a notice."""
+        rounds = [
+            {
+                "0022300001": (GAME_STATUS_IN_PROGRESS, 10),
+                "0022300002": (GAME_STATUS_IN_PROGRESS, 5),
+            },
+            {
+                "0022300001": (GAME_STATUS_IN_PROGRESS, 10),
+                "0022300002": (GAME_STATUS_IN_PROGRESS, 8),
+            },
+            {
+                "0022300001": (GAME_STATUS_FINAL, 31),
+                "0022300002": (GAME_STATUS_FINAL, 8),
+            },
+        ]
+
+        with patch(
+            "app.ingestion.store_correction_notice", wraps=store_correction_notice
+        ) as mock_notice:
+            self._run(ingestion, rounds)
+
+        assert [sorted(c.args[2]) for c in mock_notice.call_args_list] == [
+            ["0022300001", "0022300002"],
+            ["0022300002"],
+            ["0022300001"],
+        ]
+        notice = s3_manager.s3_client.get_object(
+            Bucket=BUCKET, Key=correction_key(date(2024, 1, 15))
+        )
+        body = json.loads(notice["Body"].read())
+        assert body["corrected_game_ids"] == ["0022300001"]
+
+    def test_stored_box_score_is_not_rewritten(self, ingestion, s3_manager):
+        """Test that a restarted run compares against the stored object."""
+        s3_manager.store_json(
+            _box_score("0022300001", 20), "box", date(2024, 1, 15), "0022300001"
+        )
+        written = len(s3_manager.get_write_events())
+
+        report, _ = self._run(ingestion, [{"0022300001": (GAME_STATUS_FINAL, 20)}])
+
+        assert report["box_scores_unchanged"] == 1
+        assert len(s3_manager.get_write_events()) == written
+        ingestion.summary_manager.update_bronze_summary.assert_not_called()
+
+    def test_stops_at_time_limit(self, ingestion, s3_manager):
+        """Test that a game that never goes final cannot poll forever."""
+        rounds = [{"0022300001": (GAME_STATUS_IN_PROGRESS, n)} for n in range(10)]
+
+        report, _ = self._run(ingestion, rounds, max_duration=100)
+
+        assert report["completed"] is False
+        assert report["polls"] == 4
+
+    def test_dry_run_writes_nothing(self, ingestion, s3_manager):
+        """Test that dry runs detect changes without writing."""
+        with patch("app.ingestion.store_correction_notice") as mock_notice:
+            report, _ = self._run(
+                ingestion, [{"0022300001": (GAME_STATUS_FINAL, 20)}], dry_run=True
+            )
+
+        assert report["box_scores_written"] == 1
+        assert s3_manager.get_write_events() == []
+        ingestion.summary_manager.update_bronze_summary.assert_not_called()
+        mock_notice.assert_not_called()
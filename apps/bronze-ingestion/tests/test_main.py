@@ -26,7 +26,7 @@ class TestCLI:
         result = self.runner.invoke(cli, ["--debug", "--help"])
         assert result.exit_code == 0
 
-    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.MultiLeagueIngestion")
     @patch("app.main.get_logger")
     def test_ingest_command(self, mock_logger, mock_ingestion_class):
         """Test the ingest command runs successfully."""
@@ -49,7 +49,7 @@ class TestCLI:
         # Should default to today's date
         assert isinstance(call_args[1]["target_date"], type(datetime.utcnow().date()))
 
-    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.MultiLeagueIngestion")
     @patch("app.main.get_logger")
     def test_ingest_command_with_date(self, mock_logger, mock_ingestion_class):
         """Test the ingest command with custom date."""
@@ -73,7 +73,7 @@ class TestCLI:
         assert call_args[1]["dry_run"] is True
         assert str(call_args[1]["target_date"]) == "2023-12-25"
 
-    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.MultiLeagueIngestion")
     @patch("app.main.get_logger")
     def test_ingest_command_failure(self, mock_logger, mock_ingestion_class):
         """Test the ingest command handles failures."""
@@ -104,6 +104,138 @@ class TestCLI:
         result = self.runner.invoke(cli, ["status"])
         assert result.exit_code == 0
 
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_backfill_command(self, mock_logger, mock_ingestion_class):
+        """Test the backfill command passes the date range through."""
+        mock_logger.return_value = Mock()
+
+        mock_ingestion = Mock()
+        mock_ingestion.backfill.return_value = {
+            "dates_failed": 0,
+            "box_scores_fetched": 5,
+            "box_scores_failed": 0,
+            "elapsed_seconds": 12.0,
+            "box_scores_per_minute": 25.0,
+        }
+        mock_ingestion_class.return_value = mock_ingestion
+
+        result = self.runner.invoke(
+            cli, ["backfill", "--start", "2024-01-01", "--end", "2024-01-02"]
+        )
+        assert result.exit_code == 0
+
+        args = mock_ingestion.backfill.call_args[0]
+        assert [str(arg) for arg in args[:2]] == ["2024-01-01", "2024-01-02"]
+
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_backfill_command_rejects_reversed_range(
+        self, mock_logger, mock_ingestion_class
+    ):
+        """Test the backfill command rejects an end date before the start."""
+        mock_logger.return_value = Mock()
+
+        result = self.runner.invoke(
+            cli, ["backfill", "--start", "2024-01-02", "--end", "2024-01-01"]
+        )
+        assert result.exit_code != 0
+        mock_ingestion_class.return_value.backfill.assert_not_called()
+
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_bulk_backfill_command(self, mock_logger, mock_ingestion_class):
+        """Test the bulk-backfill command passes the season through."""
+        mock_logger.return_value = Mock()
+
+        mock_ingestion = Mock()
+        mock_ingestion.bulk_backfill.return_value = {
+            "games_found": 1230,
+            "games_already_stored": 0,
+            "box_scores_stored": 1230,
+            "box_scores_failed": 0,
+            "elapsed_seconds": 90.0,
+            "box_scores_per_minute": 820.0,
+        }
+        mock_ingestion_class.return_value = mock_ingestion
+
+        result = self.runner.invoke(
+            cli, ["bulk-backfill", "--season", "2023-24", "--season-type", "Playoffs"]
+        )
+        assert result.exit_code == 0
+        mock_ingestion.bulk_backfill.assert_called_once_with(
+            "2023-24", "Playoffs", dry_run=False
+        )
+
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_bulk_backfill_command_fails_on_failed_games(
+        self, mock_logger, mock_ingestion_class
+    ):
+        """Test the bulk-backfill command exits non-zero when games fail."""
+        mock_logger.return_value = Mock()
+        mock_ingestion_class.return_value.bulk_backfill.return_value = {
+            "games_found": 2,
+            "games_already_stored": 0,
+            "box_scores_stored": 1,
+            "box_scores_failed": 1,
+            "elapsed_seconds": 1.0,
+            "box_scores_per_minute": 60.0,
+        }
+
+        result = self.runner.invoke(cli, ["bulk-backfill", "--season", "2023-24"])
+        assert result.exit_code == 1
+
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_recheck_command(self, mock_logger, mock_ingestion_class):
+        """Test the recheck command passes the window through."""
+        mock_logger.return_value = Mock()
+
+        mock_ingestion = Mock()
+        mock_ingestion.recheck.return_value = {
+            "start_date": "2024-01-13",
+            "end_date": "2024-01-14",
+            "games_checked": 20,
+            "games_corrected": 1,
+            "games_failed": 0,
+        }
+        mock_ingestion_class.return_value = mock_ingestion
+
+        result = self.runner.invoke(
+            cli, ["recheck", "--end-date", "2024-01-14", "--lookback-days", "2"]
+        )
+        assert result.exit_code == 0
+
+        kwargs = mock_ingestion.recheck.call_args.kwargs
+        assert str(kwargs["end_date"]) == "2024-01-14"
+        assert kwargs["lookback_days"] == 2
+        assert kwargs["dry_run"] is False
+
+    @patch("app.main.DateScopedIngestion")
+    @patch("app.main.get_logger")
+    def test_live_command(self, mock_logger, mock_ingestion_class):
+        """Test the live command passes the date and interval through."""
+        mock_logger.return_value = Mock()
+
+        mock_ingestion = Mock()
+        mock_ingestion.live.return_value = {
+            "polls": 12,
+            "box_scores_fetched": 40,
+            "box_scores_written": 9,
+        }
+        mock_ingestion_class.return_value = mock_ingestion
+
+        result = self.runner.invoke(
+            cli, ["live", "--date", "2024-01-15", "--interval", "30"]
+        )
+        assert result.exit_code == 0
+
+        kwargs = mock_ingestion.live.call_args.kwargs
+        assert str(kwargs["target_date"]) == "2024-01-15"
+        assert kwargs["poll_interval"] == 30
+        assert kwargs["dry_run"] is False
+
 
 class TestMain:
     """Test the main entry point."""
@@ -0,0 +1,154 @@
+"""Tests for concurrent multi-league ingestion."""
+
+import json
+import threading
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.config import BronzeIngestionConfig
+from app.multi_league import MultiLeagueIngestion
+from tests.conftest import BUCKET
+
+DAY = date(2024, 6, 1)
+
+# One game per league; WNBA game IDs start with 10
+GAME_IDS = {"00": "0042300401", "10": "1022400101"}
+
+
+def _client(league_id, barrier=None):
+    """Build a fake NBAClient serving one game for its league."""
+    game_id = GAME_IDS[league_id]
+    client = Mock(league_id=league_id)
+
+    def get_games_for_date(target_date):
+        if barrier is not None:
+            # Both leagues must be fetching at the same time to get past this
+            barrier.wait()
+        return [
+            {
+                "GAME_ID": game_id,
+                "GAME_DATE": target_date.isoformat(),
+                "TEAM_ID": team_id,
+                "MATCHUP": matchup,
+            }
+            for team_id, matchup in ((1, "AAA vs. BBB"), (2, "BBB @ AAA"))
+        ]
+
+    client.get_games_for_date.side_effect = get_games_for_date
+    client.get_box_score.side_effect = lambda game_id: {
+        "boxScoreTraditional": {"gameId": game_id},
+        "game_id": game_id,
+    }
+    return client
+
+
+@pytest.fixture
+def make_ingestion(s3_manager):
+    """Create a multi-league ingestion writing to mocked S3."""
+
+    def make(leagues="nba,wnba", barrier=None):
+        config = BronzeIngestionConfig(
+            bronze_bucket=BUCKET, aws_region="us-east-1", leagues=leagues
+        )
+        with (
+            patch(
+                "app.ingestion.NBAClient",
+                side_effect=lambda cache, league_id, retry_policy: _client(
+                    league_id, barrier
+                ),
+            ),
+            patch("app.ingestion.BronzeS3Manager", return_value=s3_manager),
+            patch("app.ingestion.DataValidator") as mock_validator,
+        ):
+            mock_validator.return_value.validate_api_response.return_value = {
+                "valid": True,
+                "issues": [],
+            }
+            return MultiLeagueIngestion(config)
+
+    return make
+
+
+def _keys(s3_manager, prefix):
+    listing = s3_manager.s3_client.list_objects_v2(Bucket=BUCKET, Prefix=prefix)
+    return sorted(obj["Key"] for obj in listing.get("Contents", []))
+
+
+def _summary(s3_manager, key):
+    body = s3_manager.s3_client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+    return json.loads(body)["bronze_layer_stats"]
+
+
+class TestMultiLeagueIngestion:
+    """Test MultiLeagueIngestion."""
+
+    def test_leagues_share_storage_but_not_clients(self, make_ingestion):
+        """Test that leagues get their own client and share S3 state."""
+        ingestion = make_ingestion()
+        nba, wnba = ingestion.ingestions["nba"], ingestion.ingestions["wnba"]
+
+        assert ingestion.leagues == ["nba", "wnba"]
+        assert nba.nba_client.league_id == "00"
+        assert wnba.nba_client.league_id == "10"
+        assert wnba.s3_manager is nba.s3_manager
+        assert wnba.quarantine is nba.quarantine
+        assert wnba.summary_manager is nba.summary_manager
+        # One retry budget and deadline for the whole invocation
+        assert wnba.retry_policy is nba.retry_policy
+
+    def test_leagues_run_concurrently(self, make_ingestion, s3_manager):
+        """Test that both leagues' fetch phases overlap."""
+        ingestion = make_ingestion(barrier=threading.Barrier(2, timeout=5))
+
+        assert ingestion.run(DAY) is True
+        assert ingestion.records_processed == 2
+
+    def test_each_league_has_its_own_keys_and_summary(self, make_ingestion, s3_manager):
+        """Test that the WNBA is partitioned by league and triggers separately."""
+        ingestion = make_ingestion()
+
+        assert ingestion.run(DAY) is True
+
+        assert _keys(s3_manager, "raw/box/") == ["raw/box/2024-06-01/0042300401.json"]
+        assert _keys(s3_manager, "raw/wnba/") == [
+            "raw/wnba/box/2024-06-01/1022400101.json",
+            "raw/wnba/schedule/2024-06-01/data.json",
+        ]
+        assert _keys(s3_manager, "raw/schedule/") == [
+            "raw/schedule/2024-06-01/data.json"
+        ]
+
+        nba = _summary(s3_manager, "_metadata/summary.json")
+        wnba = _summary(s3_manager, "_metadata/leagues/wnba/summary.json")
+        assert nba["last_ingestion_date"] == "2024-06-01"
+        assert wnba["last_ingestion_date"] == "2024-06-01"
+        assert "league" not in nba
+        assert wnba["league"] == "wnba"
+        assert wnba["data_quality"]["last_run_successful_box_scores"] == 1
+        # The manifest counts every league's writes exactly once
+        assert wnba["entities"]["wnba/box"]["file_count"] == 1
+        assert wnba["entities"]["box"]["file_count"] == 1
+
+    def test_failed_league_does_not_stop_the_others(self, make_ingestion, s3_manager):
+        """Test that one league raising leaves the other league's run intact."""
+        ingestion = make_ingestion()
+        ingestion.ingestions["wnba"].run = Mock(side_effect=RuntimeError("boom"))
+
+        assert ingestion.run(DAY) is False
+
+        assert ingestion.league_results["nba"]["success"] is True
+        assert ingestion.league_results["wnba"]["success"] is False
+        assert _keys(s3_manager, "raw/box/") == ["raw/box/2024-06-01/0042300401.json"]
+        assert _keys(s3_manager, "_metadata/leagues/") == []
+
+    def test_single_league_keeps_original_layout(self, make_ingestion, s3_manager):
+        """Test that the default configuration behaves like a plain run."""
+        ingestion = make_ingestion(leagues="nba")
+
+        assert ingestion.run(DAY) is True
+
+        assert list(ingestion.ingestions) == ["nba"]
+        assert _keys(s3_manager, "raw/wnba/") == []
+        assert _keys(s3_manager, "_metadata/summary.json") == ["_metadata/summary.json"]
@@ -0,0 +1,260 @@
+"""Tests for incremental player dimension enrichment."""
+
+import json
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.player_info import (
+    PLAYER_DIMENSION_KEY,
+    PlayerDimension,
+    parse_player_info,
+    player_dimension_key,
+    player_ids_from_box_score,
+)
+from app.s3_manager import BronzeS3Manager
+from tests.conftest import BUCKET
+
+PLAYER_INFO_HEADERS = [
+    "PERSON_ID",
+    "DISPLAY_FIRST_LAST",
+    "POSITION",
+    "HEIGHT",
+    "WEIGHT",
+    "DRAFT_YEAR",
+    "DRAFT_ROUND",
+    "DRAFT_NUMBER",
+]
+
+
+def _player_info(player_id, position="Guard"):
+    return {
+        "resultSets": [
+            {
+                "name": "CommonPlayerInfo",
+                "headers": PLAYER_INFO_HEADERS,
+                "rowSet": [
+                    [player_id, f"Player {player_id}", position, "6-6", "210"]
+                    + ["2019", "1", "3"]
+                ],
+            },
+            {"name": "PlayerHeadlineStats", "headers": [], "rowSet": []},
+        ],
+        "player_id": player_id,
+    }
+
+
+def _box_score(game_id, home_ids, away_ids):
+    def team(ids):
+        return {"players": [{"personId": i, "statistics": {}} for i in ids]}
+
+    return {
+        "boxScoreTraditional": {
+            "gameId": game_id,
+            "homeTeam": team(home_ids),
+            "awayTeam": team(away_ids),
+        },
+        "game_id": game_id,
+    }
+
+
+@pytest.fixture
+def nba_client():
+    """Create an NBA client mock answering CommonPlayerInfo lookups."""
+    client = Mock()
+    client.get_player_info.side_effect = _player_info
+    return client
+
+
+@pytest.fixture
+def dimension(s3_manager, nba_client):
+    """Create a player dimension with a 90-day TTL."""
+    return PlayerDimension(
+        s3_manager, nba_client, ttl=timedelta(days=90), max_refreshes=2
+    )
+
+
+def _stored_players(s3_manager, key=PLAYER_DIMENSION_KEY):
+    response = s3_manager.s3_client.get_object(Bucket=BUCKET, Key=key)
+    return json.loads(response["Body"].read())["players"]
+
+
+class TestPlayerInfoParsing:
+    """Test extracting player IDs and CommonPlayerInfo fields."""
+
+    def test_player_ids_from_box_score(self):
+        """Test that both teams' players are collected."""
+        box_score = _box_score("0022300001", [1, 2], [3])
+        assert player_ids_from_box_score(box_score) == {1, 2, 3}
+
+    def test_player_ids_from_box_score_without_players(self):
+        """Test that a box score without player lists yields no IDs."""
+        assert player_ids_from_box_score({"boxScoreTraditional": {}}) == set()
+
+    def test_parse_player_info(self):
+        """Test that the CommonPlayerInfo row is mapped to dimension fields."""
+        info = parse_player_info(_player_info(201939))
+
+        assert info["name"] == "Player 201939"
+        assert info["position"] == "Guard"
+        assert info["height"] == "6-6"
+        assert info["draft_year"] == "2019"
+        assert info["draft_number"] == "3"
+        # Columns the response lacks are kept as None
+        assert info["school"] is None
+
+    def test_parse_player_info_without_rows(self):
+        """Test that an empty response is rejected."""
+        with pytest.raises(ValueError, match="no player row"):
+            parse_player_info({"resultSets": [{"name": "CommonPlayerInfo"}]})
+
+    def test_player_dimension_key(self):
+        """Test that non-NBA leagues get their own dimension."""
+        assert player_dimension_key() == PLAYER_DIMENSION_KEY
+        assert (
+            player_dimension_key("wnba")
+            == "_metadata/leagues/wnba/player_dimension.json"
+        )
+
+
+class TestPlayerDimension:
+    """Test incremental enrichment of the stored dimension."""
+
+    def test_first_run_adds_every_player(self, dimension, s3_manager, nba_client):
+        """Test that an empty dimension looks up every player once."""
+        report = dimension.enrich({1, 2, 3})
+
+        assert report["players_added"] == 3
+        assert nba_client.get_player_info.call_count == 3
+        players = _stored_players(s3_manager)
+        assert sorted(players) == ["1", "2", "3"]
+        assert players["2"]["position"] == "Guard"
+        assert players["2"]["player_id"] == 2
+
+    def test_only_new_players_are_looked_up(self, dimension, nba_client):
+        """Test that known players cost no API calls."""
+        dimension.enrich({1, 2})
+        nba_client.get_player_info.reset_mock()
+
+        report = dimension.enrich({1, 2, 3})
+
+        nba_client.get_player_info.assert_called_once_with(3)
+        assert report["players_known"] == 2
+        assert report["players_added"] == 1
+        assert report["players_refreshed"] == 0
+
+    def test_known_players_write_nothing(self, dimension, s3_manager):
+        """Test that the dimension is not rewritten when nothing changed."""
+        dimension.enrich({1})
+        with patch.object(s3_manager.s3_client, "put_object") as put_object:
+            dimension.enrich({1})
+
+        put_object.assert_not_called()
+
+    def test_stale_entries_are_refreshed_oldest_first(
+        self, dimension, s3_manager, nba_client
+    ):
+        """Test that at most max_refreshes stale entries are refetched."""
+        dimension.enrich({1, 2, 3, 4})
+        players = _stored_players(s3_manager)
+        old = datetime.now(UTC) - timedelta(days=100)
+        for player_id, age in (("1", 3), ("2", 1), ("3", 2)):
+            players[player_id]["fetched_at"] = (old - timedelta(days=age)).isoformat()
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key=PLAYER_DIMENSION_KEY,
+            Body=json.dumps({"players": players}).encode("utf-8"),
+        )
+        nba_client.get_player_info.reset_mock()
+
+        report = dimension.enrich({4})
+
+        assert [c.args[0] for c in nba_client.get_player_info.call_args_list] == [
+            1,
+            3,
+        ]
+        assert report["players_refreshed"] == 2
+        refreshed = _stored_players(s3_manager)
+        assert refreshed["1"]["fetched_at"] > players["1"]["fetched_at"]
+        assert refreshed["2"]["fetched_at"] == players["2"]["fetched_at"]
+
+    def test_failed_lookup_is_retried_next_run(self, dimension, nba_client):
+        """Test that a player whose lookup failed stays missing."""
+        nba_client.get_player_info.side_effect = [
+            _player_info(1),
+            Exception("API Error"),
+        ]
+        report = dimension.enrich({1, 2})
+
+        assert report["players_added"] == 1
+        assert report["players_failed"] == 1
+
+        nba_client.get_player_info.side_effect = _player_info
+        nba_client.get_player_info.reset_mock()
+        dimension.enrich({1, 2})
+
+        nba_client.get_player_info.assert_called_once_with(2)
+
+    def test_compressed_dimension_round_trips(self, nba_client):
+        """Test that the dimension follows the bucket's storage encoding."""
+        with mock_aws():
+            boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+            s3_manager = BronzeS3Manager(BUCKET, compression="gzip")
+            dimension = PlayerDimension(
+                s3_manager, nba_client, ttl=timedelta(days=90), max_refreshes=0
+            )
+            dimension.enrich({1})
+            nba_client.get_player_info.reset_mock()
+
+            response = s3_manager.s3_client.get_object(
+                Bucket=BUCKET, Key=PLAYER_DIMENSION_KEY
+            )
+            assert response["Metadata"]["compression"] == "gzip"
+
+            dimension.enrich({1})
+            nba_client.get_player_info.assert_not_called()
+
+
+class TestIngestionEnrichment:
+    """Test that ingestion runs enrich the dimension with new players."""
+
+    @pytest.fixture
+    def ingestion(self, ingestion):
+        """Create an ingestion instance serving two games with players."""
+        ingestion.nba_client.get_games_for_date.return_value = [
+            {"GAME_ID": "0022300001", "TEAM_ID": 1, "WL": "W"},
+            {"GAME_ID": "0022300002", "TEAM_ID": 2, "WL": "L"},
+        ]
+        ingestion.nba_client.get_box_score.side_effect = lambda game_id, **_: (
+            _box_score(game_id, [1, 2], [3])
+            if game_id == "0022300001"
+            else _box_score(game_id, [3, 4], [5])
+        )
+        ingestion.nba_client.get_player_info.side_effect = _player_info
+        return ingestion
+
+    def test_run_adds_players_of_new_box_scores(self, ingestion, s3_manager):
+        """Test that a run looks up each new player exactly once."""
+        assert ingestion.run(date(2024, 1, 15)) is True
+
+        assert ingestion.nba_client.get_player_info.call_count == 5
+        assert sorted(_stored_players(s3_manager)) == ["1", "2", "3", "4", "5"]
+
+        ingestion.nba_client.get_player_info.reset_mock()
+        assert ingestion.run(date(2024, 1, 15)) is True
+        ingestion.nba_client.get_player_info.assert_not_called()
+
+    def test_dry_run_skips_enrichment(self, ingestion):
+        """Test that a dry run looks up no players."""
+        assert ingestion.run(date(2024, 1, 15), dry_run=True) is True
+        ingestion.nba_client.get_player_info.assert_not_called()
+
+    def test_enrichment_failure_does_not_fail_run(self, ingestion):
+        """Test that a broken dimension only logs a warning."""
+        with patch.object(
+            ingestion.player_dimension, "enrich", side_effect=Exception("S3 error")
+        ):
+            assert ingestion.run(date(2024, 1, 15)) is True
@@ -1,12 +1,17 @@
 """Tests for the quarantine module."""
 
+import gzip
 import json
 from datetime import date, datetime
 from unittest.mock import Mock, patch
 
 import pytest
 
-from app.quarantine import DataQuarantine
+from app.quarantine import QUARANTINE_INDEX_PREFIX, DataQuarantine
+from tests.conftest import BUCKET
+
+FAILED_SCHEMA = {"valid": False, "issues": ["Schema validation failed"]}
+TIMEOUT = {"valid": False, "issues": ["Connection timeout"]}
 
 
 class TestDataQuarantine:
@@ -104,6 +109,22 @@ class TestDataQuarantine:
         parsed = json.loads(body)
         assert parsed["data"]["test"] == "data"
 
+    def test_store_quarantine_record_compressed(self):
+        """Test storing a compact, gzip-compressed quarantine record."""
+        quarantine = DataQuarantine(self.mock_s3_manager, compression="gzip")
+        record = {
+            "data": {"test": "data"},
+            "metadata": {"data_type": "box_score", "issues_count": 2},
+        }
+
+        quarantine._store_quarantine_record(record, "test/quarantine/key.json")
+
+        call_args = self.mock_s3_manager.s3_client.put_object.call_args
+        assert call_args[1]["ContentEncoding"] == "gzip"
+        assert call_args[1]["Metadata"]["compression"] == "gzip"
+        assert call_args[1]["Metadata"]["data_type"] == "box_score"
+        assert json.loads(gzip.decompress(call_args[1]["Body"])) == record
+
     def test_store_quarantine_record_s3_error(self):
         """Test handling S3 errors during quarantine storage."""
         self.mock_s3_manager.s3_client.put_object.side_effect = Exception("S3 Error")
@@ -121,93 +142,14 @@ class TestDataQuarantine:
         with pytest.raises(Exception, match="S3 Error"):
             self.quarantine._store_quarantine_record(record, key)
 
-    def test_list_quarantined_data_success(self):
-        """Test listing quarantined data."""
-        mock_response = {
-            "Contents": [
-                {
-                    "Key": "quarantine/year=2023/month=12/day=25/schedule/file1.json",
-                    "Size": 1024,
-                    "LastModified": datetime(2023, 12, 25, 10, 0, 0),
-                    "Metadata": {"data_type": "schedule"},
-                },
-                {
-                    "Key": "quarantine/year=2023/month=12/day=25/box_score/file2.json",
-                    "Size": 2048,
-                    "LastModified": datetime(2023, 12, 25, 11, 0, 0),
-                    "Metadata": {"data_type": "box_score"},
-                },
-            ]
-        }
-
-        self.mock_s3_manager.s3_client.list_objects_v2.return_value = mock_response
-
-        result = self.quarantine.list_quarantined_data(date(2023, 12, 25))
-
-        assert len(result) == 2
-        assert (
-            result[0]["key"]
-            == "quarantine/year=2023/month=12/day=25/schedule/file1.json"
-        )
-        assert result[0]["size"] == 1024
-        assert (
-            result[1]["key"]
-            == "quarantine/year=2023/month=12/day=25/box_score/file2.json"
-        )
-
-    def test_list_quarantined_data_with_filters(self):
-        """Test listing quarantined data with date and type filters."""
-        target_date = date(2023, 12, 25)
-        data_type = "schedule"
-
-        self.mock_s3_manager.s3_client.list_objects_v2.return_value = {"Contents": []}
-
-        self.quarantine.list_quarantined_data(target_date, data_type)
-
-        # Verify the prefix includes date and type filters
-        call_args = self.mock_s3_manager.s3_client.list_objects_v2.call_args
-        prefix = call_args[1]["Prefix"]
-
-        assert "year=2023" in prefix
-        assert "month=12" in prefix
-        assert "day=25" in prefix
-        assert "schedule" in prefix
-
     def test_list_quarantined_data_s3_error(self):
         """Test handling S3 errors when listing quarantined data."""
-        self.mock_s3_manager.s3_client.list_objects_v2.side_effect = Exception(
-            "S3 Error"
-        )
+        self.mock_s3_manager.s3_client.get_paginator.side_effect = Exception("S3 Error")
 
         result = self.quarantine.list_quarantined_data()
 
         assert result == []
 
-    def test_get_quarantine_summary(self):
-        """Test getting quarantine summary statistics."""
-        mock_items = [
-            {
-                "key": "quarantine/year=2023/month=12/day=25/schedule/file1.json",
-                "last_modified": "2023-12-25T10:00:00",
-            },
-            {
-                "key": "quarantine/year=2023/month=12/day=25/box_score/file2.json",
-                "last_modified": "2023-12-25T11:00:00",
-            },
-        ]
-
-        with patch.object(
-            self.quarantine, "list_quarantined_data", return_value=mock_items
-        ):
-            summary = self.quarantine.get_quarantine_summary()
-
-        assert summary["total_quarantined"] == 2
-        assert "schedule" in summary["by_data_type"]
-        assert "box_score" in summary["by_data_type"]
-        assert summary["by_data_type"]["schedule"] == 1
-        assert summary["by_data_type"]["box_score"] == 1
-        assert len(summary["recent_items"]) == 2
-
     def test_get_quarantine_summary_error(self):
         """Test error handling in quarantine summary."""
         with patch.object(
@@ -248,6 +190,26 @@ class TestDataQuarantine:
         should_quarantine = self.quarantine.should_quarantine(validation_result)
         assert should_quarantine is True
 
+    def test_should_quarantine_critical_issue_codes(self):
+        """Test that invalid game IDs quarantine data that passed the schema."""
+        validation_result = {
+            "valid": True,
+            "issues": ["Invalid game ID format: 12ab"],
+            "issue_codes": ["invalid_game_id"],
+        }
+
+        assert self.quarantine.should_quarantine(validation_result) is True
+
+    def test_should_quarantine_non_critical_issue_codes(self):
+        """Test that data quality warnings alone do not quarantine data."""
+        validation_result = {
+            "valid": True,
+            "issues": ["Date inconsistencies found: ['2024-01-16']..."],
+            "issue_codes": ["date_inconsistent", "game_id_mismatch"],
+        }
+
+        assert self.quarantine.should_quarantine(validation_result) is False
+
     def test_quarantine_data_exception_handling(self):
         """Test exception handling during quarantine process."""
         self.mock_s3_manager.s3_client.put_object.side_effect = Exception("S3 Error")
@@ -261,3 +223,425 @@ class TestDataQuarantine:
         )
 
         assert "quarantine_failed" in quarantine_key
+
+
+class TestQuarantineIndex:
+    """Test the per-day quarantine index."""
+
+    def _counting_get_object(self, s3_manager):
+        """Wrap get_object so calls can be counted."""
+        calls = []
+        original = s3_manager.s3_client.get_object
+
+        def get_object(**kwargs):
+            calls.append(kwargs["Key"])
+            return original(**kwargs)
+
+        s3_manager.s3_client.get_object = get_object
+        return calls
+
+    def test_quarantine_data_appends_to_index(self, s3_manager):
+        """Test that each quarantined record is added to its day's index."""
+        quarantine = DataQuarantine(s3_manager, compression="gzip")
+        first = quarantine.quarantine_data(
+            {"a": 1}, TIMEOUT, "box_score", date(2024, 1, 15)
+        )
+        second = quarantine.quarantine_data(
+            {"b": 2}, FAILED_SCHEMA, "schedule", date(2024, 1, 15)
+        )
+
+        items = quarantine.list_quarantined_data(date(2024, 1, 15))
+
+        assert [item["key"] for item in items] == sorted([first, second])
+        by_key = {item["key"]: item for item in items}
+        assert by_key[first]["error_classification"] == "transient"
+        assert by_key[first]["data_type"] == "box_score"
+        assert by_key[first]["status"] == "quarantined"
+        assert by_key[first]["issues_count"] == 1
+        assert by_key[second]["error_classification"] == "schema_change"
+        assert by_key[second]["size"] > 0
+
+    def test_listing_reads_only_indexes(self, s3_manager):
+        """Test that listing a month costs one GET per day, not per record."""
+        quarantine = DataQuarantine(s3_manager)
+        for day in (1, 2):
+            for _ in range(5):
+                quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, day))
+        calls = self._counting_get_object(s3_manager)
+
+        items = quarantine.list_quarantined_data(data_type="box_score")
+
+        assert len(items) == 10
+        assert all(key.startswith(QUARANTINE_INDEX_PREFIX) for key in calls)
+        assert len(calls) == 2
+
+    def test_data_type_filter(self, s3_manager):
+        """Test filtering indexed items by data type."""
+        quarantine = DataQuarantine(s3_manager)
+        quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, 15))
+        quarantine.quarantine_data({}, TIMEOUT, "schedule", date(2024, 1, 15))
+
+        items = quarantine.list_quarantined_data(date(2024, 1, 15), "schedule")
+
+        assert [item["data_type"] for item in items] == ["schedule"]
+
+    def test_record_status_updates_index(self, s3_manager):
+        """Test that status changes are reflected in the index."""
+        quarantine = DataQuarantine(s3_manager)
+        key = quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, 15))
+
+        quarantine.record_status(key, "resolved")
+
+        summary = quarantine.get_quarantine_summary()
+        assert summary["total_quarantined"] == 1
+        assert summary["by_status"] == {"resolved": 1}
+        assert summary["by_classification"] == {"transient": 1}
+        assert summary["by_data_type"] == {"box_score": 1}
+
+    def test_concurrent_index_update_is_retried(self, s3_manager):
+        """Test that an entry indexed by another process isn't overwritten."""
+        quarantine = DataQuarantine(s3_manager)
+        first = quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, 15))
+
+        # Another process indexes a record after this one read the index
+        other = DataQuarantine(s3_manager)
+        load_index = quarantine._load_index_with_etag
+        raced = []
+
+        def load_then_race(index_date):
+            loaded = load_index(index_date)
+            if not raced:
+                raced.append(
+                    other.quarantine_data({}, TIMEOUT, "schedule", date(2024, 1, 15))
+                )
+            return loaded
+
+        with patch.object(
+            quarantine, "_load_index_with_etag", side_effect=load_then_race
+        ) as loads:
+            quarantine.record_status(first, "resolved")
+
+        assert loads.call_count == 2
+        items = quarantine.list_quarantined_data(date(2024, 1, 15))
+        by_key = {item["key"]: item for item in items}
+        assert sorted(by_key) == sorted([first, raced[0]])
+        assert by_key[first]["status"] == "resolved"
+
+    def test_unindexed_day_is_rebuilt_on_access(self, s3_manager):
+        """Test that records written before indexing are indexed when listed."""
+        quarantine = DataQuarantine(s3_manager)
+        # More than one page of legacy records, with no index
+        for n in range(1001):
+            s3_manager.s3_client.put_object(
+                Bucket=BUCKET,
+                Key=(
+                    "quarantine/year=2024/month=01/day=15/schedule/"
+                    f"quarantine_{n:06d}.json"
+                ),
+                Body=json.dumps(
+                    {"metadata": {"data_type": "schedule", "issues_count": 1}}
+                ).encode("utf-8"),
+            )
+
+        items = quarantine.list_quarantined_data(date(2024, 1, 15))
+
+        assert len(items) == 1001
+        assert items[0]["error_classification"] == "unknown"
+        assert quarantine._load_index(date(2024, 1, 15)) is not None
+
+    def test_unindexed_day_is_rebuilt_when_listing_all_days(self, s3_manager):
+        """Test that undated listings include days written before indexing."""
+        quarantine = DataQuarantine(s3_manager)
+        indexed = quarantine.quarantine_data(
+            {}, TIMEOUT, "box_score", date(2024, 1, 14)
+        )
+        legacy = "quarantine/year=2024/month=01/day=15/schedule/quarantine_000001.json"
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key=legacy,
+            Body=json.dumps(
+                {"metadata": {"data_type": "schedule", "issues_count": 1}}
+            ).encode("utf-8"),
+        )
+
+        items = quarantine.list_quarantined_data()
+
+        assert [item["key"] for item in items] == [indexed, legacy]
+        assert quarantine._load_index(date(2024, 1, 15)) is not None
+        summary = quarantine.get_quarantine_summary()
+        assert summary["by_data_type"] == {"box_score": 1, "schedule": 1}
+
+    def test_first_indexed_record_keeps_earlier_records(self, s3_manager):
+        """Test that a day's first index includes records stored before it."""
+        quarantine = DataQuarantine(s3_manager)
+        legacy = "quarantine/year=2024/month=01/day=15/schedule/quarantine_000001.json"
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key=legacy,
+            Body=json.dumps(
+                {"metadata": {"data_type": "schedule", "issues_count": 1}}
+            ).encode("utf-8"),
+        )
+
+        new = quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, 15))
+
+        items = quarantine.list_quarantined_data(date(2024, 1, 15))
+        assert [item["key"] for item in items] == sorted([legacy, new])
+
+    def test_rebuild_index_all_days(self, s3_manager):
+        """Test rebuilding every day's index from the records."""
+        quarantine = DataQuarantine(s3_manager)
+        keys = [
+            quarantine.quarantine_data({}, TIMEOUT, "box_score", date(2024, 1, day))
+            for day in (14, 15)
+        ]
+        for day in (14, 15):
+            s3_manager.s3_client.delete_object(
+                Bucket=BUCKET, Key=quarantine._index_key(date(2024, 1, day))
+            )
+
+        assert quarantine.rebuild_index() == 2
+        items = quarantine.list_quarantined_data()
+        assert [item["key"] for item in items] == keys
+        assert items[0]["error_classification"] == "transient"
+
+
+class TestQuarantineCompaction:
+    """Test compacting quarantine days into NDJSON.gz archives."""
+
+    DAY = date(2024, 1, 15)
+
+    def _quarantine_records(self, quarantine, count, day=DAY):
+        return [
+            quarantine.quarantine_data({"n": n}, TIMEOUT, "box_score", day)
+            for n in range(count)
+        ]
+
+    def _day_keys(self, s3_manager, day=DAY):
+        listing = s3_manager.s3_client.list_objects_v2(
+            Bucket=BUCKET,
+            Prefix=f"quarantine/{DataQuarantine._date_prefix(day)}",
+        )
+        return [obj["Key"] for obj in listing.get("Contents", [])]
+
+    def test_compact_day_replaces_records_with_archive(self, s3_manager):
+        """Test that a day's records end up in a single archive object."""
+        quarantine = DataQuarantine(s3_manager, compression="gzip")
+        keys = self._quarantine_records(quarantine, 3)
+
+        assert quarantine.compact_day(self.DAY) == 3
+
+        archive_key = quarantine._archive_key(self.DAY)
+        assert self._day_keys(s3_manager) == [archive_key]
+        body = s3_manager.s3_client.get_object(Bucket=BUCKET, Key=archive_key)[
+            "Body"
+        ].read()
+        # The archive is a plain multi-member gzip NDJSON file
+        lines = gzip.decompress(body).decode("utf-8").splitlines()
+        assert [json.loads(line)["key"] for line in lines] == sorted(keys)
+
+        items = quarantine.list_quarantined_data(self.DAY)
+        assert [item["key"] for item in items] == sorted(keys)
+
+    def test_archived_record_read_with_ranged_get(self, s3_manager):
+        """Test that one archived record is read back with a ranged GET."""
+        quarantine = DataQuarantine(s3_manager)
+        keys = self._quarantine_records(quarantine, 3)
+        quarantine.compact_day(self.DAY)
+        ranges = []
+        original = s3_manager.s3_client.get_object
+
+        def get_object(**kwargs):
+            ranges.append(kwargs.get("Range"))
+            return original(**kwargs)
+
+        s3_manager.s3_client.get_object = get_object
+
+        record = quarantine.get_quarantined_record(keys[1])
+
+        assert record["data"] == {"n": 1}
+        assert record["metadata"]["error_classification"] == "transient"
+        assert ranges[-1] is not None and ranges[-1].startswith("bytes=")
+
+    def test_late_records_are_appended(self, s3_manager):
+        """Test that recompacting keeps earlier offsets and adds new records."""
+        quarantine = DataQuarantine(s3_manager)
+        first = self._quarantine_records(quarantine, 2)
+        quarantine.compact_day(self.DAY)
+        offsets = {
+            key: quarantine._load_index(self.DAY)["records"][key]["offset"]
+            for key in first
+        }
+
+        late = quarantine.quarantine_data({"n": 9}, TIMEOUT, "schedule", self.DAY)
+        assert quarantine.compact_day(self.DAY) == 1
+
+        index = quarantine._load_index(self.DAY)["records"]
+        assert {key: index[key]["offset"] for key in first} == offsets
+        assert quarantine.get_quarantined_record(late)["data"] == {"n": 9}
+        assert quarantine.get_quarantined_record(first[0])["data"] == {"n": 0}
+
+    def test_loose_rewrite_takes_precedence(self, s3_manager):
+        """Test that a record rewritten after compaction is read loose."""
+        quarantine = DataQuarantine(s3_manager)
+        (key,) = self._quarantine_records(quarantine, 1)
+        quarantine.compact_day(self.DAY)
+
+        record = quarantine.get_quarantined_record(key)
+        record["metadata"]["status"] = "resolved"
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET, Key=key, Body=json.dumps(record).encode("utf-8")
+        )
+
+        assert quarantine.get_quarantined_record(key)["metadata"]["status"] == (
+            "resolved"
+        )
+
+    def _before_archive_put(self, s3_manager, quarantine, action):
+        """Run ``action`` once, just before the day's archive is first written."""
+        original = s3_manager.s3_client.put_object
+        archive_key = quarantine._archive_key(self.DAY)
+        done = []
+
+        def put_object(**kwargs):
+            if kwargs["Key"] == archive_key and not done:
+                done.append(True)
+                action()
+            return original(**kwargs)
+
+        s3_manager.s3_client.put_object = put_object
+
+    def test_concurrent_compaction_keeps_every_record(self, s3_manager):
+        """Test that a compaction racing another one loses no archived record."""
+        quarantine = DataQuarantine(s3_manager)
+        keys = self._quarantine_records(quarantine, 2)
+        quarantine.compact_day(self.DAY)
+        late = self._quarantine_records(quarantine, 1)
+
+        # Another process quarantines and compacts the day first
+        other = DataQuarantine(s3_manager)
+        racing = []
+
+        def compact_elsewhere():
+            racing.extend(self._quarantine_records(other, 1))
+            other.compact_day(self.DAY)
+
+        self._before_archive_put(s3_manager, quarantine, compact_elsewhere)
+
+        quarantine.compact_day(self.DAY)
+
+        archive_key = quarantine._archive_key(self.DAY)
+        assert self._day_keys(s3_manager) == [archive_key]
+        records = [quarantine.get_quarantined_record(key) for key in keys + late]
+        records.append(quarantine.get_quarantined_record(racing[0]))
+        assert [record["data"] for record in records] == [
+            {"n": 0},
+            {"n": 1},
+            {"n": 0},
+            {"n": 0},
+        ]
+
+    def test_rewrite_during_compaction_stays_loose(self, s3_manager):
+        """Test that a record rewritten while compacting isn't deleted."""
+        quarantine = DataQuarantine(s3_manager)
+        keys = self._quarantine_records(quarantine, 2)
+
+        def resolve():
+            record = quarantine.get_quarantined_record(keys[0])
+            record["metadata"]["status"] = "resolved"
+            s3_manager.s3_client.put_object(
+                Bucket=BUCKET, Key=keys[0], Body=json.dumps(record).encode("utf-8")
+            )
+            quarantine.record_status(keys[0], "resolved")
+
+        self._before_archive_put(s3_manager, quarantine, resolve)
+
+        assert quarantine.compact_day(self.DAY) == 1
+
+        assert keys[0] in self._day_keys(s3_manager)
+        assert keys[1] not in self._day_keys(s3_manager)
+        record = quarantine.get_quarantined_record(keys[0])
+        assert record["metadata"]["status"] == "resolved"
+        entry = quarantine._load_index(self.DAY)["records"][keys[0]]
+        assert entry["status"] == "resolved"
+        assert "archive" not in entry
+
+    def test_rebuild_index_recovers_archive_offsets(self, s3_manager):
+        """Test that a lost index is rebuilt from the archive's members."""
+        quarantine = DataQuarantine(s3_manager)
+        keys = self._quarantine_records(quarantine, 3)
+        quarantine.compact_day(self.DAY)
+        before = quarantine._load_index(self.DAY)["records"]
+        s3_manager.s3_client.delete_object(
+            Bucket=BUCKET, Key=quarantine._index_key(self.DAY)
+        )
+
+        assert quarantine.rebuild_index(self.DAY) == 3
+
+        after = quarantine._load_index(self.DAY)["records"]
+        for key in keys:
+            for field in ("archive", "offset", "length", "error_classification"):
+                assert after[key][field] == before[key][field]
+
+    def test_replay_reads_archived_records(self, s3_manager):
+        """Test that the replay path falls back to the archive."""
+        from app.replay import ReplayOrchestrator
+
+        quarantine = DataQuarantine(s3_manager)
+        (key,) = self._quarantine_records(quarantine, 1)
+        quarantine.compact_day(self.DAY)
+
+        orchestrator = ReplayOrchestrator(s3_manager, quarantine)
+
+        assert orchestrator._fetch_record(key)["data"] == {"n": 0}
+        assert orchestrator._fetch_record(key + ".missing") is None
+
+    def test_compact_skips_today(self, s3_manager):
+        """Test that the default compaction leaves the current day loose."""
+        quarantine = DataQuarantine(s3_manager)
+        self._quarantine_records(quarantine, 2)
+        self._quarantine_records(quarantine, 1, day=date(2024, 1, 16))
+
+        compacted = quarantine.compact(before=date(2024, 1, 16))
+
+        assert compacted == {"2024-01-15": 2}
+        assert len(self._day_keys(s3_manager, date(2024, 1, 16))) == 1
+
+    def test_cleanup_deletes_whole_days(self, s3_manager):
+        """Test that retention deletes old days' archives and indexes."""
+        quarantine = DataQuarantine(s3_manager)
+        self._quarantine_records(quarantine, 3, day=date(2024, 1, 1))
+        quarantine.compact_day(date(2024, 1, 1))
+        self._quarantine_records(quarantine, 1, day=date(2024, 1, 1))
+        self._quarantine_records(quarantine, 1, day=date(2024, 1, 20))
+
+        with patch("app.quarantine.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2024, 1, 31)
+            deleted = quarantine.cleanup_old_quarantine_data(retention_days=14)
+
+        # archive + one loose record + index
+        assert deleted == 3
+        assert self._day_keys(s3_manager, date(2024, 1, 1)) == []
+        assert quarantine._list_index_dates() == [date(2024, 1, 20)]
+
+    def test_cleanup_deletes_unindexed_days(self, s3_manager):
+        """Test that retention deletes days quarantined before indexing."""
+        quarantine = DataQuarantine(s3_manager)
+        legacy = date(2024, 1, 2)
+        s3_manager.s3_client.put_object(
+            Bucket=BUCKET,
+            Key=(
+                f"quarantine/{DataQuarantine._date_prefix(legacy)}"
+                "schedule/quarantine_000001.json"
+            ),
+            Body=b"{}",
+        )
+        self._quarantine_records(quarantine, 1, day=date(2024, 1, 20))
+
+        with patch("app.quarantine.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2024, 1, 31)
+            deleted = quarantine.cleanup_old_quarantine_data(retention_days=14)
+
+        assert deleted == 1
+        assert self._day_keys(s3_manager, legacy) == []
+        assert len(self._day_keys(s3_manager, date(2024, 1, 20))) == 1
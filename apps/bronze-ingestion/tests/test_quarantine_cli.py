@@ -156,14 +156,10 @@ class TestSummaryFormatting:
             "total_quarantined": 3,
             "by_data_type": {"schedule": 1, "box_score": 2},
             "summary_date": "2023-12-25T10:00:00",
+            "by_classification": {"transient": 1, "schema_change": 2},
             "recent_items": [],
         }
-        enriched = [
-            {"error_classification": "transient"},
-            {"error_classification": "schema_change"},
-            {"error_classification": "schema_change"},
-        ]
-        result = _format_summary(summary, enriched)
+        result = _format_summary(summary)
 
         assert "Quarantine Summary" in result
         assert "Total quarantined: 3" in result
@@ -178,10 +174,10 @@ class TestSummaryFormatting:
             "total_quarantined": 1,
             "by_data_type": {"schedule": 1},
             "summary_date": "2023-12-25T10:00:00",
+            "by_classification": {"data_quality": 1},
             "recent_items": [],
         }
-        enriched = [{"error_classification": "data_quality"}]
-        result = _format_summary(summary, enriched)
+        result = _format_summary(summary)
         assert "Replay-safe (transient): 0" in result
         assert "Requires investigation:  1" in result
 
@@ -314,38 +310,27 @@ class TestQuarantineListCommand:
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_list_with_items(self, mock_get_q):
-        """List command displays items in table format."""
+        """List command displays indexed items in table format."""
         mock_q = Mock()
         mock_q.list_quarantined_data.return_value = [
             {
                 "key": "quarantine/year=2023/month=12/day=25/schedule/file1.json",
                 "size": 1024,
                 "last_modified": "2023-12-25T10:00:00",
-                "metadata": {},
+                "data_type": "schedule",
+                "error_classification": "transient",
+                "issues_count": 2,
+                "status": "quarantined",
             },
         ]
-        # Mock the S3 get_object for enrichment
-        mock_q.s3_manager.s3_client.get_object.return_value = {
-            "Body": Mock(
-                read=Mock(
-                    return_value=json.dumps(
-                        {
-                            "data": {},
-                            "metadata": {
-                                "error_classification": "transient",
-                                "issues_count": 2,
-                            },
-                        }
-                    ).encode("utf-8")
-                )
-            )
-        }
         mock_get_q.return_value = mock_q
 
         result = self.runner.invoke(cli, ["quarantine", "list"])
         assert result.exit_code == 0
         assert "schedule" in result.output
         assert "[REPLAY-SAFE] TRANSIENT" in result.output
+        # Classification comes from the index, not the records
+        mock_q.s3_manager.s3_client.get_object.assert_not_called()
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_list_with_date_filter(self, mock_get_q):
@@ -378,53 +363,24 @@ class TestQuarantineListCommand:
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_list_with_classification_filter(self, mock_get_q):
-        """List command filters items by classification post-fetch."""
+        """List command filters items by their indexed classification."""
         mock_q = Mock()
         mock_q.list_quarantined_data.return_value = [
             {
                 "key": "quarantine/year=2023/month=12/day=25/schedule/f1.json",
                 "size": 1024,
                 "last_modified": "2023-12-25T10:00:00",
-                "metadata": {},
+                "data_type": "schedule",
+                "error_classification": "transient",
+                "issues_count": 1,
             },
             {
                 "key": "quarantine/year=2023/month=12/day=25/box_score/f2.json",
                 "size": 2048,
                 "last_modified": "2023-12-25T11:00:00",
-                "metadata": {},
-            },
-        ]
-        # First item is transient, second is schema_change
-        mock_q.s3_manager.s3_client.get_object.side_effect = [
-            {
-                "Body": Mock(
-                    read=Mock(
-                        return_value=json.dumps(
-                            {
-                                "data": {},
-                                "metadata": {
-                                    "error_classification": "transient",
-                                    "issues_count": 1,
-                                },
-                            }
-                        ).encode("utf-8")
-                    )
-                )
-            },
-            {
-                "Body": Mock(
-                    read=Mock(
-                        return_value=json.dumps(
-                            {
-                                "data": {},
-                                "metadata": {
-                                    "error_classification": "schema_change",
-                                    "issues_count": 3,
-                                },
-                            }
-                        ).encode("utf-8")
-                    )
-                )
+                "data_type": "box_score",
+                "error_classification": "schema_change",
+                "issues_count": 3,
             },
         ]
         mock_get_q.return_value = mock_q
@@ -434,9 +390,9 @@ class TestQuarantineListCommand:
         )
         assert result.exit_code == 0
         assert "[REPLAY-SAFE] TRANSIENT" in result.output
-        assert "schema_change" not in result.output.lower().replace(
-            "[replay-safe] transient", ""
-        ).replace("[investigate] schema_change", "")
+        assert "f1.json" in result.output
+        assert "f2.json" not in result.output
+        mock_q.s3_manager.s3_client.get_object.assert_not_called()
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_list_json_output(self, mock_get_q):
@@ -447,24 +403,11 @@ class TestQuarantineListCommand:
                 "key": "quarantine/year=2023/month=12/day=25/schedule/file1.json",
                 "size": 1024,
                 "last_modified": "2023-12-25T10:00:00",
-                "metadata": {},
+                "data_type": "schedule",
+                "error_classification": "transient",
+                "issues_count": 2,
             },
         ]
-        mock_q.s3_manager.s3_client.get_object.return_value = {
-            "Body": Mock(
-                read=Mock(
-                    return_value=json.dumps(
-                        {
-                            "data": {},
-                            "metadata": {
-                                "error_classification": "transient",
-                                "issues_count": 2,
-                            },
-                        }
-                    ).encode("utf-8")
-                )
-            )
-        }
         mock_get_q.return_value = mock_q
 
         result = self.runner.invoke(cli, ["quarantine", "list", "--output", "json"])
@@ -475,6 +418,7 @@ class TestQuarantineListCommand:
         assert isinstance(parsed, list)
         assert len(parsed) == 1
         assert parsed[0]["error_classification"] == "transient"
+        assert parsed[0]["date"] == "2023-12-25"
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_list_s3_error(self, mock_get_q):
@@ -510,76 +454,10 @@ class TestQuarantineSummaryCommand:
         mock_q.get_quarantine_summary.return_value = {
             "total_quarantined": 3,
             "by_data_type": {"schedule": 1, "box_score": 2},
+            "by_classification": {"transient": 1, "schema_change": 2},
             "summary_date": "2023-12-25T10:00:00",
             "recent_items": [],
         }
-        mock_q.list_quarantined_data.return_value = [
-            {
-                "key": "quarantine/year=2023/month=12/day=25/schedule/f1.json",
-                "size": 1024,
-                "last_modified": "2023-12-25T10:00:00",
-                "metadata": {},
-            },
-            {
-                "key": "quarantine/year=2023/month=12/day=25/box_score/f2.json",
-                "size": 2048,
-                "last_modified": "2023-12-25T11:00:00",
-                "metadata": {},
-            },
-            {
-                "key": "quarantine/year=2023/month=12/day=25/box_score/f3.json",
-                "size": 1536,
-                "last_modified": "2023-12-25T12:00:00",
-                "metadata": {},
-            },
-        ]
-        mock_q.s3_manager.s3_client.get_object.side_effect = [
-            {
-                "Body": Mock(
-                    read=Mock(
-                        return_value=json.dumps(
-                            {
-                                "data": {},
-                                "metadata": {
-                                    "error_classification": "transient",
-                                    "issues_count": 1,
-                                },
-                            }
-                        ).encode("utf-8")
-                    )
-                )
-            },
-            {
-                "Body": Mock(
-                    read=Mock(
-                        return_value=json.dumps(
-                            {
-                                "data": {},
-                                "metadata": {
-                                    "error_classification": "schema_change",
-                                    "issues_count": 2,
-                                },
-                            }
-                        ).encode("utf-8")
-                    )
-                )
-            },
-            {
-                "Body": Mock(
-                    read=Mock(
-                        return_value=json.dumps(
-                            {
-                                "data": {},
-                                "metadata": {
-                                    "error_classification": "schema_change",
-                                    "issues_count": 3,
-                                },
-                            }
-                        ).encode("utf-8")
-                    )
-                )
-            },
-        ]
         mock_get_q.return_value = mock_q
 
         result = self.runner.invoke(cli, ["quarantine", "summary"])
@@ -588,6 +466,7 @@ class TestQuarantineSummaryCommand:
         assert "Total quarantined: 3" in result.output
         assert "Replay-safe (transient): 1" in result.output
         assert "Requires investigation:  2" in result.output
+        mock_q.list_quarantined_data.assert_not_called()
 
     @patch("app.quarantine_cli._get_quarantine")
     def test_summary_error(self, mock_get_q):
@@ -620,6 +499,97 @@ class TestQuarantineSummaryCommand:
         assert "aggregate counts" in result.output.lower()
 
 
+class TestQuarantineReindexCommand:
+    """Test the quarantine reindex CLI command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_reindex_date(self, mock_get_q):
+        """Reindex command rebuilds a single day's index."""
+        mock_q = Mock()
+        mock_q.rebuild_index.return_value = 4
+        mock_get_q.return_value = mock_q
+
+        result = self.runner.invoke(
+            cli, ["quarantine", "reindex", "--date", "2023-12-25"]
+        )
+
+        assert result.exit_code == 0
+        assert "Indexed 4 quarantined records." in result.output
+        mock_q.rebuild_index.assert_called_once_with(date(2023, 12, 25))
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_reindex_error(self, mock_get_q):
+        """Reindex command reports failures."""
+        mock_get_q.return_value.rebuild_index.side_effect = Exception("S3 down")
+
+        result = self.runner.invoke(cli, ["quarantine", "reindex"])
+
+        assert result.exit_code == 1
+
+
+class TestQuarantineCompactCommand:
+    """Test the quarantine compact CLI command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_compact_all_days(self, mock_get_q):
+        """Compact command archives every day before today."""
+        mock_get_q.return_value.compact.return_value = {
+            "2023-12-24": 2,
+            "2023-12-25": 3,
+        }
+
+        result = self.runner.invoke(cli, ["quarantine", "compact"])
+
+        assert result.exit_code == 0
+        assert "Compacted 5 records across 2 days." in result.output
+        mock_get_q.return_value.compact.assert_called_once_with()
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_compact_date(self, mock_get_q):
+        """Compact command archives a single day."""
+        mock_get_q.return_value.compact_day.return_value = 3
+
+        result = self.runner.invoke(
+            cli, ["quarantine", "compact", "--date", "2023-12-25"]
+        )
+
+        assert result.exit_code == 0
+        assert "Compacted 3 records across 1 days." in result.output
+        mock_get_q.return_value.compact_day.assert_called_once_with(date(2023, 12, 25))
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_cleanup(self, mock_get_q):
+        """Cleanup command deletes days past the retention period."""
+        mock_get_q.return_value.cleanup_old_quarantine_data.return_value = 7
+
+        result = self.runner.invoke(
+            cli, ["quarantine", "cleanup", "--retention-days", "14"]
+        )
+
+        assert result.exit_code == 0
+        assert "Deleted 7 quarantine objects." in result.output
+        mock_get_q.return_value.cleanup_old_quarantine_data.assert_called_once_with(14)
+
+    @patch("app.quarantine_cli._get_quarantine")
+    def test_cleanup_error(self, mock_get_q):
+        """Cleanup command reports failures."""
+        mock_get_q.return_value.cleanup_old_quarantine_data.side_effect = Exception(
+            "S3 down"
+        )
+
+        result = self.runner.invoke(cli, ["quarantine", "cleanup"])
+
+        assert result.exit_code == 1
+
+
 class TestQuarantineInspectCommand:
     """Test the quarantine inspect CLI command."""
 
@@ -647,9 +617,7 @@ class TestQuarantineInspectCommand:
             },
         }
         mock_q = Mock()
-        mock_q.s3_manager.s3_client.get_object.return_value = {
-            "Body": Mock(read=Mock(return_value=json.dumps(record).encode("utf-8")))
-        }
+        mock_q.get_quarantined_record.return_value = record
         mock_get_q.return_value = mock_q
 
         s3_key = "quarantine/year=2023/month=12/day=25/schedule/file.json"
@@ -677,9 +645,7 @@ class TestQuarantineInspectCommand:
             },
         }
         mock_q = Mock()
-        mock_q.s3_manager.s3_client.get_object.return_value = {
-            "Body": Mock(read=Mock(return_value=json.dumps(record).encode("utf-8")))
-        }
+        mock_q.get_quarantined_record.return_value = record
         mock_get_q.return_value = mock_q
 
         s3_key = "quarantine/year=2023/month=12/day=25/box_score/file.json"
@@ -691,7 +657,7 @@ class TestQuarantineInspectCommand:
     def test_inspect_not_found(self, mock_get_q):
         """Inspect command handles missing records."""
         mock_q = Mock()
-        mock_q.s3_manager.s3_client.get_object.side_effect = Exception("NoSuchKey")
+        mock_q.get_quarantined_record.return_value = None
         mock_get_q.return_value = mock_q
 
         result = self.runner.invoke(
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
+from hoopstat_data.compression import decode_json, encode_json
 
 from app.main import cli
 from app.quarantine_cli import (
@@ -170,6 +171,32 @@ class TestFetchRecord:
         assert result is not None
         assert result["metadata"]["data_type"] == "box_score"
 
+    def test_fetch_compressed_record(self):
+        """Compressed records are decompressed transparently."""
+        s3_mgr = _mock_s3_manager()
+        record = _make_quarantine_record()
+        s3_mgr.s3_client.get_object.return_value = {
+            "Body": Mock(read=Mock(return_value=encode_json(record, "gzip"))),
+            "Metadata": {"compression": "gzip"},
+        }
+
+        orchestrator = ReplayOrchestrator(s3_mgr, _mock_quarantine(s3_mgr))
+        assert orchestrator._fetch_record("quarantine/key.json") == record
+
+    def test_store_updated_record_compressed(self):
+        """Updated records are written in the configured encoding."""
+        s3_mgr = _mock_s3_manager()
+        record = _make_quarantine_record()
+
+        orchestrator = ReplayOrchestrator(
+            s3_mgr, _mock_quarantine(s3_mgr), compression="gzip"
+        )
+        orchestrator._store_updated_record("quarantine/key.json", record)
+
+        put_kwargs = s3_mgr.s3_client.put_object.call_args.kwargs
+        assert put_kwargs["ContentEncoding"] == "gzip"
+        assert decode_json(put_kwargs["Body"]) == record
+
     def test_fetch_failure_returns_none(self):
         """Failed fetch returns None."""
         s3_mgr = _mock_s3_manager()
@@ -438,6 +465,16 @@ class TestReplaySingle:
 # -- ReplayOrchestrator.replay_batch -----------------------------------------
 
 
+def _records_by_key(s3_manager, records):
+    """Serve quarantine records from get_object by key."""
+
+    def get_object(Bucket, Key):
+        body = json.dumps(records[Key]).encode("utf-8")
+        return {"Body": Mock(read=Mock(return_value=body))}
+
+    s3_manager.s3_client.get_object.side_effect = get_object
+
+
 class TestReplayBatch:
     """Test batch replay operations."""
 
@@ -494,6 +531,33 @@ class TestReplayBatch:
         assert result.succeeded == 1
         assert result.failed == 1
 
+    def test_batch_skips_resolved_items_from_index(self):
+        """Indexed resolved items are skipped without fetching their records."""
+        record = _make_quarantine_record(game_id="001")
+        _setup_s3_get_object(self.s3_mgr, record)
+
+        items = [
+            {"key": "resolved.json", "status": "resolved"},
+            {"key": "pending.json", "status": "quarantined"},
+        ]
+        result = self.orchestrator.replay_batch(items)
+
+        assert result.skipped == 1
+        assert result.succeeded == 1
+        assert self.s3_mgr.s3_client.get_object.call_count == 1
+
+    def test_status_changes_update_index(self):
+        """Every status write is mirrored into the quarantine index."""
+        record = _make_quarantine_record(game_id="001")
+        _setup_s3_get_object(self.s3_mgr, record)
+
+        self.orchestrator.replay_single("quarantine/key.json")
+
+        statuses = [
+            call.args[1] for call in self.quarantine_mock.record_status.call_args_list
+        ]
+        assert statuses == ["replaying", "resolved"]
+
     def test_batch_empty_list(self):
         """Batch replay with empty list returns zeros."""
         result = self.orchestrator.replay_batch([])
@@ -539,6 +603,108 @@ class TestReplayBatch:
 # -- Silver Processing Invocation Tests ---------------------------------------
 
 
+class TestBatchSilverCoalescing:
+    """Test deferred, per-date Silver processing during batch replay."""
+
+    def setup_method(self):
+        """Set up an orchestrator with a Silver directory configured."""
+        self.s3_mgr = _mock_s3_manager()
+        self.s3_mgr.store_json = Mock(return_value="raw/box/2024-01-15/x.json")
+        self.quarantine_mock = _mock_quarantine(self.s3_mgr)
+        self.orchestrator = ReplayOrchestrator(
+            self.s3_mgr,
+            self.quarantine_mock,
+            silver_processing_dir="/apps/silver-processing",
+        )
+
+    def _items(self, dates_and_games):
+        records = {}
+        items = []
+        for target_date, game_id in dates_and_games:
+            key = f"{target_date}-{game_id}.json"
+            records[key] = _make_quarantine_record(
+                game_id=game_id, target_date=target_date
+            )
+            items.append({"key": key, "target_date": target_date})
+        _records_by_key(self.s3_mgr, records)
+        return items
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_silver_runs_once_per_date(self, concurrency):
+        """Silver is invoked once per affected date, not once per record."""
+        items = self._items(
+            [("2024-01-15", f"00{n}") for n in range(5)]
+            + [("2024-01-16", f"01{n}") for n in range(3)]
+        )
+
+        with patch.object(
+            self.orchestrator, "_invoke_silver_processing", return_value=True
+        ) as mock_silver:
+            result = self.orchestrator.replay_batch(items, concurrency=concurrency)
+
+        assert sorted(call.args[0] for call in mock_silver.call_args_list) == [
+            "2024-01-15",
+            "2024-01-16",
+        ]
+        assert result.silver_dates == ["2024-01-15", "2024-01-16"]
+        assert result.succeeded == 8
+        assert [r.s3_key for r in result.results] == [item["key"] for item in items]
+
+    def test_silver_failure_fails_that_dates_records(self):
+        """A failed Silver run marks only that date's records as failed."""
+        items = self._items([("2024-01-15", "001"), ("2024-01-16", "002")])
+
+        with patch.object(
+            self.orchestrator,
+            "_invoke_silver_processing",
+            side_effect=lambda target_date: target_date != "2024-01-15",
+        ):
+            result = self.orchestrator.replay_batch(items, concurrency=2)
+
+        assert [r.success for r in result.results] == [False, True]
+        assert result.failed == 1
+        statuses = {
+            call.args[0]: call.args[1]
+            for call in self.quarantine_mock.record_status.call_args_list
+        }
+        assert statuses == {
+            "2024-01-15-001.json": "failed",
+            "2024-01-16-002.json": "resolved",
+        }
+
+    def test_dry_run_skips_silver(self):
+        """Dry runs never invoke Silver processing."""
+        items = self._items([("2024-01-15", "001")])
+
+        with patch.object(self.orchestrator, "_invoke_silver_processing") as silver:
+            result = self.orchestrator.replay_batch(items, dry_run=True)
+
+        silver.assert_not_called()
+        assert result.silver_dates == []
+
+    def test_unexpected_error_fails_only_that_item(self):
+        """An exception replaying one record does not abort the batch."""
+        items = self._items([("2024-01-15", "001"), ("2024-01-15", "002")])
+        original = self.orchestrator._replay_to_bronze
+
+        def flaky(s3_key, *args):
+            if s3_key.endswith("001.json"):
+                raise RuntimeError("boom")
+            return original(s3_key, *args)
+
+        with (
+            patch.object(self.orchestrator, "_replay_to_bronze", side_effect=flaky),
+            patch.object(
+                self.orchestrator, "_invoke_silver_processing", return_value=True
+            ),
+        ):
+            result = self.orchestrator.replay_batch(items, concurrency=2)
+
+        assert result.failed == 1
+        assert result.succeeded == 1
+        assert "boom" in result.results[0].error
+
+
 class TestSilverProcessing:
     """Test Silver processing invocation."""
 
@@ -857,6 +1023,38 @@ class TestQuarantineReplayCommand:
             target_date=date(2024, 1, 15)
         )
 
+    @patch("app.quarantine_cli._get_replay_orchestrator")
+    def test_replay_concurrency_option(self, mock_get_orch):
+        """Batch replay passes --concurrency and reports Silver dates."""
+        mock_q = Mock()
+        mock_q.list_quarantined_data.return_value = [{"key": "k1.json"}]
+        mock_orch = Mock()
+        mock_orch.quarantine = mock_q
+        mock_orch.replay_batch.return_value = BatchReplayResult(
+            total=1,
+            succeeded=1,
+            results=[ReplayResult(s3_key="k1.json", success=True)],
+            silver_dates=["2024-01-15"],
+        )
+        mock_get_orch.return_value = mock_orch
+
+        result = self.runner.invoke(
+            cli,
+            ["quarantine", "replay", "--date", "2024-01-15", "--concurrency", "8"],
+        )
+
+        assert result.exit_code == 0
+        assert mock_orch.replay_batch.call_args.kwargs["concurrency"] == 8
+        assert "Silver reprocessed: 2024-01-15" in result.output
+
+    def test_replay_concurrency_must_be_positive(self):
+        """A concurrency below one is rejected."""
+        result = self.runner.invoke(
+            cli,
+            ["quarantine", "replay", "--date", "2024-01-15", "--concurrency", "0"],
+        )
+        assert result.exit_code != 0
+
     @patch("app.quarantine_cli._get_replay_orchestrator")
     def test_replay_no_matching_items(self, mock_get_orch):
         """Batch replay with no matching items shows message."""
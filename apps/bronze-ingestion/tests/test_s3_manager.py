@@ -1,5 +1,6 @@
 """Tests for the S3 manager module."""
 
+import gzip
 from datetime import date
 from unittest.mock import Mock, patch
 
@@ -8,6 +9,15 @@ import pytest
 from app.s3_manager import BronzeS3Manager
 
 
+def _s3_client(listing=()):
+    """Create a mocked S3 client whose date partitions list ``listing``."""
+    client = Mock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": list(listing)}
+    ]
+    return client
+
+
 class TestBronzeS3Manager:
     """Test the Bronze S3 manager functionality."""
 
@@ -90,7 +100,7 @@ class TestBronzeS3Manager:
     @patch("app.s3_manager.boto3.client")
     def test_store_json(self, mock_boto_client):
         """Test storing dictionary as JSON."""
-        mock_client = Mock()
+        mock_client = _s3_client()
         mock_boto_client.return_value = mock_client
 
         manager = BronzeS3Manager("test-bucket")
@@ -136,10 +146,30 @@ class TestBronzeS3Manager:
         assert parsed_data["teams"] == ["LAL", "GSW"]
         assert parsed_data["metadata"]["venue"] == "Staples Center"
 
+    @patch("app.s3_manager.boto3.client")
+    def test_store_json_gzip(self, mock_boto_client):
+        """Test storing compact gzip-compressed JSON with recorded encoding."""
+        mock_client = _s3_client()
+        mock_boto_client.return_value = mock_client
+
+        manager = BronzeS3Manager("test-bucket", compression="gzip")
+        test_data = {"game_id": "12345", "teams": ["LAL", "GSW"]}
+
+        key = manager.store_json(test_data, "box", date(2023, 12, 25), "12345")
+
+        assert key == "raw/box/2023-12-25/12345.json"
+        call_args = mock_client.put_object.call_args
+        assert call_args[1]["ContentEncoding"] == "gzip"
+        assert call_args[1]["Metadata"]["compression"] == "gzip"
+        assert call_args[1]["Metadata"]["entity"] == "box"
+
+        body = call_args[1]["Body"]
+        assert gzip.decompress(body) == b'{"game_id":"12345","teams":["LAL","GSW"]}'
+
     @patch("app.s3_manager.boto3.client")
     def test_store_json_with_game_id(self, mock_boto_client):
         """Test storing dictionary as JSON with game_id (ADR-031)."""
-        mock_client = Mock()
+        mock_client = _s3_client()
         mock_boto_client.return_value = mock_client
 
         manager = BronzeS3Manager("test-bucket")
@@ -171,7 +201,7 @@ class TestBronzeS3Manager:
     @patch("app.s3_manager.boto3.client")
     def test_store_json_s3_error(self, mock_boto_client):
         """Test handling of S3 errors during JSON storage."""
-        mock_client = Mock()
+        mock_client = _s3_client()
         mock_client.put_object.side_effect = Exception("S3 JSON Error")
         mock_boto_client.return_value = mock_client
 
@@ -183,3 +213,66 @@ class TestBronzeS3Manager:
         # Should raise exception
         with pytest.raises(Exception, match="S3 JSON Error"):
             manager.store_json(test_data, "test", target_date)
+
+        # Failed writes are not recorded
+        assert manager.get_write_events() == []
+
+    @patch("app.s3_manager.boto3.client")
+    def test_store_json_records_write_events(self, mock_boto_client):
+        """Test that each write is recorded in the running manifest."""
+        mock_boto_client.return_value = _s3_client()
+        manager = BronzeS3Manager("test-bucket")
+
+        manager.store_json({"a": 1}, "box", date(2023, 12, 25), "0022300001")
+        manager.store_json({"b": 2}, "schedule", date(2023, 12, 25))
+
+        events = manager.get_write_events()
+        assert [(e["entity"], e["date"], e["key"]) for e in events] == [
+            ("box", "2023-12-25", "raw/box/2023-12-25/0022300001.json"),
+            ("schedule", "2023-12-25", "raw/schedule/2023-12-25/data.json"),
+        ]
+        assert events[0]["size"] == len(b'{\n  "a": 1\n}')
+
+        # Clearing applied events keeps writes recorded afterwards
+        manager.store_json({"c": 3}, "box", date(2023, 12, 26), "0022300002")
+        manager.clear_write_events(len(events))
+        assert [e["key"] for e in manager.get_write_events()] == [
+            "raw/box/2023-12-26/0022300002.json"
+        ]
+
+    @patch("app.s3_manager.boto3.client")
+    def test_store_json_records_replaced_size(self, mock_boto_client):
+        """Test that overwrites record the size of the object they replace."""
+        key = "raw/box/2023-12-25/0022300001.json"
+        mock_client = _s3_client([{"Key": key, "Size": 40}])
+        mock_boto_client.return_value = mock_client
+        manager = BronzeS3Manager("test-bucket")
+
+        manager.store_json({"a": 1}, "box", date(2023, 12, 25), "0022300001")
+        manager.store_json({"a": 2}, "box", date(2023, 12, 25), "0022300001")
+        manager.store_json({"b": 1}, "box", date(2023, 12, 25), "0022300002")
+
+        events = manager.get_write_events()
+        assert [event["previous_size"] for event in events] == [
+            40,
+            len(b'{\n  "a": 1\n}'),
+            None,
+        ]
+        # The partition is listed once, before its first write
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix="raw/box/2023-12-25/"
+        )
+
+    @patch("app.s3_manager.boto3.client")
+    def test_store_json_with_league(self, mock_boto_client):
+        """Test that non-NBA leagues get their own key segment."""
+        mock_boto_client.return_value = _s3_client()
+        manager = BronzeS3Manager("test-bucket")
+
+        key = manager.store_json(
+            {"a": 1}, "box", date(2024, 6, 1), "1022400101", league="wnba"
+        )
+
+        assert key == "raw/wnba/box/2024-06-01/1022400101.json"
+        assert manager.get_write_events()[0]["entity"] == "wnba/box"
+        assert BronzeS3Manager.raw_prefix("box") == "raw/box/"
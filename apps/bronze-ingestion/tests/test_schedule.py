@@ -0,0 +1,69 @@
+"""Tests for schedule normalization."""
+
+from app.schedule import normalize_schedule
+
+
+def _row(game_id, team_id, abbreviation, matchup):
+    return {
+        "SEASON_ID": "22023",
+        "GAME_ID": game_id,
+        "GAME_DATE": "2023-12-25",
+        "TEAM_ID": team_id,
+        "TEAM_ABBREVIATION": abbreviation,
+        "MATCHUP": matchup,
+    }
+
+
+class TestNormalizeSchedule:
+    """Test collapsing team rows into game records."""
+
+    def test_collapses_team_rows(self):
+        """Test that home and away rows become one game record."""
+        rows = [
+            _row("0022300001", 1610612747, "LAL", "LAL @ BOS"),
+            _row("0022300001", 1610612738, "BOS", "BOS vs. LAL"),
+        ]
+
+        assert normalize_schedule(rows) == [
+            {
+                "game_id": "0022300001",
+                "game_date": "2023-12-25",
+                "season_id": "22023",
+                "home_team_id": 1610612738,
+                "home_team_abbreviation": "BOS",
+                "away_team_id": 1610612747,
+                "away_team_abbreviation": "LAL",
+                "matchup": "BOS vs. LAL",
+                "team_rows": 2,
+            }
+        ]
+
+    def test_keeps_first_seen_order(self):
+        """Test that games keep the order they first appear in."""
+        rows = [
+            _row("0022300002", 1, "AAA", "AAA vs. BBB"),
+            _row("0022300001", 3, "CCC", "CCC vs. DDD"),
+            _row("0022300002", 2, "BBB", "BBB @ AAA"),
+            _row("0022300001", 4, "DDD", "DDD @ CCC"),
+        ]
+
+        games = normalize_schedule(rows)
+
+        assert [game["game_id"] for game in games] == ["0022300002", "0022300001"]
+        assert [game["away_team_id"] for game in games] == [2, 4]
+
+    def test_single_row_and_missing_matchup(self):
+        """Test games with only one team row or no MATCHUP column."""
+        rows = [
+            {"GAME_ID": "0022300001", "TEAM_ID": 1},
+            {"GAME_ID": "0022300001", "TEAM_ID": 2},
+            {"GAME_ID": "0022300002", "TEAM_ID": 3},
+            {"TEAM_ID": 4},
+        ]
+
+        games = normalize_schedule(rows)
+
+        assert len(games) == 2
+        assert (games[0]["home_team_id"], games[0]["away_team_id"]) == (1, 2)
+        assert games[1]["team_rows"] == 1
+        assert games[1]["away_team_id"] is None
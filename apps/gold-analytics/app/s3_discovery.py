@@ -6,6 +6,7 @@ and loading them for processing, implementing retry logic per ADR-021.
 """
 
 import io
+import json
 import re
 from datetime import date, datetime
 from typing import Any
@@ -121,9 +122,60 @@ class S3DataDiscovery:
                 }
                 files.append(file_info)
 
+        # A partition rewritten after Silver switched output format still holds
+        # the file in the old format; read only the file Silver wrote last
+        if len(files) > 1:
+            files = [self._current_silver_file(target_date, file_type, files)]
+
         logger.info(f"Discovered {len(files)} {file_type} files for {target_date}")
         return files
 
+    def _current_silver_file(
+        self, target_date: date, file_type: str, files: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Pick the current file of a Silver partition stored in several formats.
+
+        The silver-ready marker of the date names the key Silver last wrote for
+        each dataset. Without a marker entry, the most recently modified file
+        is used, preferring Parquet when they were modified at the same time.
+
+        Args:
+            target_date: Date of the partition
+            file_type: Type of file ('player_stats' or 'team_stats')
+            files: Discovered files of the partition
+
+        Returns:
+            The file to read
+        """
+        marker_key = f"metadata/{target_date.strftime('%Y-%m-%d')}/silver-ready.json"
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.config.silver_bucket, Key=marker_key
+            )
+            marker = json.loads(response["Body"].read())
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            marker = {}
+
+        current_key = marker.get("dataset_keys", {}).get(file_type)
+        for file_info in files:
+            if file_info["key"] == current_key:
+                return file_info
+
+        logger.warning(
+            f"Silver-ready marker for {target_date} names no {file_type} file, "
+            "reading the most recently modified one"
+        )
+        return max(
+            files,
+            key=lambda file_info: (
+                file_info["last_modified"],
+                file_info["key"].endswith(".parquet"),
+            ),
+        )
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=5, max=60),
@@ -8,6 +8,7 @@ and consistency throughout the processing pipeline.
 from datetime import date
 
 import pandas as pd
+from hoopstat_data.quality import MAX_MINUTES_PLAYED, check_batch_quality
 from hoopstat_observability import get_logger
 
 logger = get_logger(__name__)
@@ -83,42 +84,18 @@ class DataValidator:
                 if duplicates > 0:
                     issues.append(f"Found {duplicates} duplicate player records")
 
-            # Check for negative values in statistics
-            numeric_columns = [
-                "points",
-                "rebounds",
-                "assists",
-                "field_goals_made",
-                "field_goals_attempted",
-            ]
-            for col in numeric_columns:
-                if col in df.columns:
-                    negative_count = (df[col] < 0).sum()
-                    if negative_count > 0:
-                        issues.append(
-                            f"Found {negative_count} negative values in {col}"
-                        )
-
-            # Check field goal logic (made <= attempted)
-            if (
-                "field_goals_made" in df.columns
-                and "field_goals_attempted" in df.columns
-            ):
-                invalid_fg = (
-                    df["field_goals_made"] > df["field_goals_attempted"]
-                ).sum()
-                if invalid_fg > 0:
-                    issues.append(
-                        f"Found {invalid_fg} records where FG made > FG attempted"
-                    )
-
-            # Check minutes played (should be reasonable)
-            if "minutes_played" in df.columns:
-                invalid_minutes = (df["minutes_played"] > 48).sum()
-                if invalid_minutes > 0:
-                    issues.append(
-                        f"Found {invalid_minutes} records with >48 minutes played"
-                    )
+            issues.extend(
+                self._batch_consistency_issues(
+                    df,
+                    [
+                        "points",
+                        "rebounds",
+                        "assists",
+                        "field_goals_made",
+                        "field_goals_attempted",
+                    ],
+                )
+            )
 
         return self._handle_validation_issues(issues, "silver_player_data", target_date)
 
@@ -160,36 +137,66 @@ class DataValidator:
                 if duplicates > 0:
                     issues.append(f"Found {duplicates} duplicate team records")
 
-            # Check for negative values in statistics
-            numeric_columns = [
-                "points",
-                "field_goals_made",
-                "field_goals_attempted",
-                "rebounds",
-            ]
-            for col in numeric_columns:
-                if col in df.columns:
-                    negative_count = (df[col] < 0).sum()
-                    if negative_count > 0:
-                        issues.append(
-                            f"Found {negative_count} negative values in {col}"
-                        )
-
-            # Check field goal logic
-            if (
-                "field_goals_made" in df.columns
-                and "field_goals_attempted" in df.columns
-            ):
-                invalid_fg = (
-                    df["field_goals_made"] > df["field_goals_attempted"]
-                ).sum()
-                if invalid_fg > 0:
-                    issues.append(
-                        f"Found {invalid_fg} records where FG made > FG attempted"
-                    )
+            issues.extend(
+                self._batch_consistency_issues(
+                    df,
+                    [
+                        "points",
+                        "field_goals_made",
+                        "field_goals_attempted",
+                        "rebounds",
+                    ],
+                )
+            )
 
         return self._handle_validation_issues(issues, "silver_team_data", target_date)
 
+    def _batch_consistency_issues(
+        self, df: pd.DataFrame, stat_columns: list[str]
+    ) -> list[str]:
+        """
+        Run the shared batch quality engine and describe consistency issues.
+
+        Args:
+            df: DataFrame containing Silver statistics
+            stat_columns: Columns checked for negative values and outliers
+
+        Returns:
+            List of consistency issue descriptions
+        """
+        summary = check_batch_quality(
+            df, required_fields=[], stat_columns=stat_columns
+        )["summary"]
+        issues = []
+
+        for col, count in summary["negative_values"].items():
+            issues.append(f"Found {count} negative values in {col}")
+
+        shooting_labels = {
+            "field_goals_made": "FG",
+            "three_pointers_made": "3PT",
+            "free_throws_made": "FT",
+        }
+        for col, count in summary["made_exceeds_attempted"].items():
+            label = shooting_labels.get(col, col)
+            issues.append(
+                f"Found {count} records where {label} made > {label} attempted"
+            )
+
+        if summary["minutes_out_of_range"]:
+            issues.append(
+                f"Found {summary['minutes_out_of_range']} records with minutes "
+                f"played outside 0-{MAX_MINUTES_PLAYED:g}"
+            )
+
+        if summary["outlier_rows"]:
+            logger.info(
+                f"Found {summary['outlier_rows']} rows with outlier statistics",
+                extra={"outliers": summary["outliers"]},
+            )
+
+        return issues
+
     def validate_gold_analytics(self, df: pd.DataFrame, data_type: str) -> bool:
         """
         Validate Gold layer analytics data.
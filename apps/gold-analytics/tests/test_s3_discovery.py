@@ -1,8 +1,89 @@
 """Tests for S3 discovery functions."""
 
+import io
+import json
 from datetime import date
 
-from app.s3_discovery import parse_s3_event_key
+import boto3
+import pandas as pd
+from moto import mock_aws
+
+from app.config import GoldAnalyticsConfig
+from app.s3_discovery import S3DataDiscovery, parse_s3_event_key
+
+
+class TestDiscoverSilverFiles:
+    """Test cases for S3DataDiscovery.discover_silver_files."""
+
+    @mock_aws
+    def test_prefers_parquet_over_json(self):
+        """Test a partition in both formats without a marker is read once."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-silver")
+        prefix = "silver/player_stats/2024-01-15/"
+        rows = pd.DataFrame({"player_id": ["1"], "points": [20]})
+        buffer = io.BytesIO()
+        rows.to_parquet(buffer)
+        s3_client.put_object(
+            Bucket="test-silver",
+            Key=f"{prefix}player_stats.json",
+            Body=rows.to_json(orient="records").encode("utf-8"),
+        )
+        s3_client.put_object(
+            Bucket="test-silver",
+            Key=f"{prefix}player_stats.parquet",
+            Body=buffer.getvalue(),
+        )
+
+        discovery = S3DataDiscovery(
+            GoldAnalyticsConfig(silver_bucket="test-silver", gold_bucket="test-gold")
+        )
+        files = discovery.discover_silver_files(date(2024, 1, 15), "player_stats")
+        df = discovery.load_all_silver_data(date(2024, 1, 15), "player_stats")
+
+        assert [f["key"] for f in files] == [f"{prefix}player_stats.parquet"]
+        assert len(df) == 1
+
+    @mock_aws
+    def test_reads_format_named_in_marker(self):
+        """Test a switch back to JSON output isn't hidden by stale Parquet."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-silver")
+        prefix = "silver/player_stats/2024-01-15/"
+        stale = pd.DataFrame({"player_id": ["1"], "points": [20]})
+        buffer = io.BytesIO()
+        stale.to_parquet(buffer)
+        s3_client.put_object(
+            Bucket="test-silver",
+            Key=f"{prefix}player_stats.parquet",
+            Body=buffer.getvalue(),
+        )
+        current = pd.DataFrame({"player_id": ["1", "2"], "points": [24, 9]})
+        s3_client.put_object(
+            Bucket="test-silver",
+            Key=f"{prefix}player_stats.json",
+            Body=current.to_json(orient="records").encode("utf-8"),
+        )
+        s3_client.put_object(
+            Bucket="test-silver",
+            Key="metadata/2024-01-15/silver-ready.json",
+            Body=json.dumps(
+                {
+                    "game_date": "2024-01-15",
+                    "format": "json",
+                    "dataset_keys": {"player_stats": f"{prefix}player_stats.json"},
+                }
+            ).encode("utf-8"),
+        )
+
+        discovery = S3DataDiscovery(
+            GoldAnalyticsConfig(silver_bucket="test-silver", gold_bucket="test-gold")
+        )
+        files = discovery.discover_silver_files(date(2024, 1, 15), "player_stats")
+        df = discovery.load_all_silver_data(date(2024, 1, 15), "player_stats")
+
+        assert [f["key"] for f in files] == [f"{prefix}player_stats.json"]
+        assert df["points"].tolist() == [24, 9]
 
 
 class TestParseS3EventKey:
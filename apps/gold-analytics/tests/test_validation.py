@@ -79,6 +79,31 @@ class TestDataValidator:
         with pytest.raises(DataQualityError, match="negative values in points"):
             validator.validate_silver_player_data(df, date(2024, 1, 1))
 
+    def test_validate_silver_player_data_shooting_and_minutes(self):
+        """Test validation of made/attempted pairs and minutes played."""
+        validator = DataValidator("strict")
+
+        df = pd.DataFrame(
+            {
+                "player_id": ["player_1", "player_2"],
+                "team_id": ["team_1", "team_2"],
+                "points": [25, 18],
+                "rebounds": [8, 6],
+                "assists": [5, 9],
+                "field_goals_made": [10, 7],
+                "field_goals_attempted": [18, 15],
+                "free_throws_made": [6, 2],
+                "free_throws_attempted": [4, 2],
+                "minutes_played": [35, 53],
+            }
+        )
+
+        with pytest.raises(DataQualityError) as exc_info:
+            validator.validate_silver_player_data(df, date(2024, 1, 1))
+
+        assert "1 records where FT made > FT attempted" in str(exc_info.value)
+        assert "1 records with minutes played outside 0-48" in str(exc_info.value)
+
     def test_validate_silver_player_data_lenient_mode(self):
         """Test validation in lenient mode allows issues."""
         validator = DataValidator("lenient")
@@ -0,0 +1,229 @@
+"""
+Multiprocess execution of Silver processing over a range of dates.
+
+Transforming a date is CPU-bound pure Python, so reprocessing a season in one
+process leaves all but one core idle. DateRangeExecutor shards the dates over
+a pool of worker processes, each with its own SilverProcessor and S3 clients,
+and writes the silver-ready markers from the parent in date order so Gold is
+never triggered out of sequence.
+"""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import date
+from typing import Any
+
+from hoopstat_observability import get_logger
+
+from .processors import SilverProcessor
+
+logger = get_logger(__name__)
+
+# Dates a worker processes before it is replaced, releasing any memory it grew
+DATES_PER_WORKER = 16
+
+# Processor built once per worker process by _init_worker
+_worker_processor: SilverProcessor | None = None
+
+
+def _workers_from_env() -> int:
+    """Get the worker count from SILVER_RANGE_WORKERS, defaulting to the CPUs."""
+    default = os.cpu_count() or 1
+    value = os.getenv("SILVER_RANGE_WORKERS")
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Invalid SILVER_RANGE_WORKERS {value!r}, using {default}")
+        return default
+
+
+def _init_worker(settings: dict[str, Any]) -> None:
+    """Build the worker's SilverProcessor, and with it its own S3 clients."""
+    global _worker_processor
+    _worker_processor = SilverProcessor(**settings)
+
+
+def _process_in_worker(
+    target_date: date, dry_run: bool, league: str | None
+) -> dict[str, Any]:
+    """Process one date in a worker; its marker is left to the parent."""
+    return _timed_result(_worker_processor, target_date, dry_run, league)
+
+
+def _timed_result(
+    processor: SilverProcessor, target_date: date, dry_run: bool, league: str | None
+) -> dict[str, Any]:
+    """Process a date without its marker and record how long it took."""
+    start = time.perf_counter()
+    result = processor.process_date_result(
+        target_date, dry_run=dry_run, league=league, write_marker=False
+    )
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+class DateRangeExecutor:
+    """
+    Process a range of dates into Silver across a pool of worker processes.
+
+    The processor settings are the shared, read-only configuration every
+    worker builds its SilverProcessor from. At most two dates per worker are
+    in flight, and workers return only a small result per date, so memory
+    stays bounded however long the range is.
+    """
+
+    def __init__(
+        self,
+        bronze_bucket: str,
+        silver_bucket: str | None = None,
+        max_workers: int | None = None,
+        **processor_settings: Any,
+    ) -> None:
+        """
+        Initialize the date range executor.
+
+        Args:
+            bronze_bucket: S3 bucket name for Bronze data
+            silver_bucket: S3 bucket name for Silver data
+            max_workers: Worker processes; defaults to SILVER_RANGE_WORKERS or
+                the number of CPUs. 1 processes the dates in this process.
+            **processor_settings: Further SilverProcessor arguments, e.g.
+                region_name, read_concurrency or output_format
+        """
+        self.settings = {
+            "bronze_bucket": bronze_bucket,
+            "silver_bucket": silver_bucket,
+            **processor_settings,
+        }
+        self.max_workers = max_workers or _workers_from_env()
+        # Writes the markers (and processes the dates when running serially)
+        self.processor = SilverProcessor(**self.settings)
+
+    def run(
+        self,
+        target_dates: list[date],
+        dry_run: bool = False,
+        league: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Process the dates and write their silver-ready markers in date order.
+
+        A date's marker is written once it and every earlier date have
+        finished; dates that fail get no marker.
+
+        Args:
+            target_dates: Dates to process
+            dry_run: If True, validate but don't write data
+            league: League to process; None for the NBA
+
+        Returns:
+            Report with per-date results, failed dates, markers written, the
+            number of workers used and the total time
+        """
+        dates = sorted(set(target_dates))
+        workers = min(self.max_workers, len(dates)) or 1
+        start = time.perf_counter()
+
+        results: dict[date, dict[str, Any]] = {}
+        markers: list[str] = []
+        next_marker = 0
+
+        def record(target_date: date, result: dict[str, Any]) -> None:
+            nonlocal next_marker
+            results[target_date] = result
+            while next_marker < len(dates) and dates[next_marker] in results:
+                ready = results[dates[next_marker]]
+                if ready["success"] and not dry_run:
+                    marker_key = self.processor.write_ready_marker(
+                        dates[next_marker], ready, league
+                    )
+                    ready["marker_key"] = marker_key
+                    if marker_key:
+                        markers.append(marker_key)
+                next_marker += 1
+
+        logger.info(
+            f"Processing {len(dates)} date(s) with {workers} worker(s)",
+            extra={"league": league or "nba", "dry_run": dry_run},
+        )
+
+        pool = self._start_pool(workers) if workers > 1 else None
+        if pool is None:
+            workers = 1
+            for target_date in dates:
+                record(
+                    target_date,
+                    _timed_result(self.processor, target_date, dry_run, league),
+                )
+        else:
+            with pool:
+                pending: dict[Future, date] = {}
+                for target_date in dates:
+                    future = pool.submit(
+                        _process_in_worker, target_date, dry_run, league
+                    )
+                    pending[future] = target_date
+                    if len(pending) >= 2 * workers:
+                        self._collect(pending, record)
+                while pending:
+                    self._collect(pending, record)
+
+        failures = [d.isoformat() for d in dates if not results[d]["success"]]
+        report = {
+            "dates": len(dates),
+            "succeeded": len(dates) - len(failures),
+            "failures": failures,
+            "markers": markers,
+            "workers": workers,
+            "seconds": round(time.perf_counter() - start, 3),
+            "results": {d.isoformat(): results[d] for d in dates},
+        }
+
+        log = logger.warning if failures else logger.info
+        log(
+            f"Processed {report['succeeded']}/{len(dates)} date(s) in "
+            f"{report['seconds']}s with {workers} worker(s)",
+            extra={"failures": failures},
+        )
+        return report
+
+    def _start_pool(self, workers: int) -> ProcessPoolExecutor | None:
+        """
+        Start the worker pool, or return None where processes are unavailable.
+
+        AWS Lambda has no /dev/shm, so the semaphores a process pool needs
+        cannot be created there; the range is then processed serially.
+        """
+        try:
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                # Workers must not inherit the parent's boto3 threads and clients
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.settings,),
+                max_tasks_per_child=DATES_PER_WORKER,
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"Process pool unavailable, processing serially: {e}")
+            return None
+
+    @staticmethod
+    def _collect(
+        pending: dict[Future, date],
+        record: Callable[[date, dict[str, Any]], None],
+    ) -> None:
+        """Record the results of finished futures, waiting for at least one."""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            target_date = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Worker failed processing {target_date}: {e}")
+                result = {"date": target_date.isoformat(), "success": False}
+            record(target_date, result)
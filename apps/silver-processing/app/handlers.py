@@ -5,16 +5,30 @@ This module provides handlers for S3 events that trigger Silver layer processing
 when new Bronze layer data arrives.
 """
 
+import re
 from datetime import date, datetime, timedelta
 from typing import Any
 
 from hoopstat_observability import get_logger
 from hoopstat_s3 import SilverS3Manager
 
+from .date_range import DateRangeExecutor
 from .processors import SilverProcessor
 
 logger = get_logger(__name__)
 
+# Bronze stat-correction notices: _metadata/corrections/YYYY-MM-DD/summary.json,
+# or _metadata/leagues/<league>/corrections/YYYY-MM-DD/summary.json
+_CORRECTION_KEY_PATTERN = re.compile(
+    r"^_metadata/(?:leagues/(?P<league>[a-z]+)/)?corrections/"
+    r"(?P<date>\d{4}-\d{2}-\d{2})/summary\.json$"
+)
+
+# Per-league bronze summaries: _metadata/leagues/<league>/summary.json
+_LEAGUE_SUMMARY_KEY_PATTERN = re.compile(
+    r"^_metadata/leagues/(?P<league>[a-z]+)/summary\.json$"
+)
+
 
 def _parse_yyyy_mm_dd(value: str) -> date:
     """
@@ -57,6 +71,67 @@ def _iter_inclusive_dates(start: date, end: date) -> list[date]:
     return dates
 
 
+def _league_args(league: str | None) -> dict[str, str]:
+    """
+    Build the league keyword for SilverProcessor.process_date.
+
+    Args:
+        league: League segment from a bronze key, or None for the NBA
+
+    Returns:
+        Empty dict for the NBA, otherwise {"league": league}
+    """
+    return {"league": league} if league else {}
+
+
+def _process_correction(
+    processor: SilverProcessor,
+    s3_manager: SilverS3Manager,
+    notice_key: str,
+    target_date: date,
+    league: str | None,
+) -> bool:
+    """
+    Reprocess the games named in a bronze correction notice.
+
+    Only the corrected games are merged into the date's Silver partitions.
+    If the notice does not list them, the whole date is rebuilt and its
+    existing Silver files are replaced.
+
+    Args:
+        processor: Silver processor
+        s3_manager: S3 manager for reading the notice
+        notice_key: Bronze key of the correction notice
+        target_date: Date of the corrected games
+        league: League of the notice; None for the NBA
+
+    Returns:
+        True if processing succeeded, False otherwise
+    """
+    try:
+        notice = s3_manager.read_summary_json(notice_key)
+    except Exception as e:
+        logger.warning(f"Failed to read correction notice {notice_key}: {e}")
+        notice = None
+
+    game_ids = notice.get("corrected_game_ids") if isinstance(notice, dict) else None
+    if not isinstance(game_ids, list) or not game_ids:
+        return processor.process_date(
+            target_date, dry_run=False, overwrite=True, **_league_args(league)
+        )
+
+    logger.info(
+        f"Merging {len(game_ids)} corrected game(s) into Silver for {target_date}",
+        extra={"league": league or "nba", "game_ids": game_ids},
+    )
+    results = processor.process_games(
+        [str(game_id) for game_id in game_ids],
+        target_date=target_date,
+        **_league_args(league),
+    )
+    return all(results.values())
+
+
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     AWS Lambda entry point for S3-triggered Silver processing.
@@ -151,20 +226,23 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     f"({len(target_dates)} days, dry_run={dry_run})"
                 )
 
-                processor = SilverProcessor(
+                # Dates are sharded over worker processes; markers are still
+                # written in date order
+                executor = DateRangeExecutor(
                     bronze_bucket=bronze_bucket, silver_bucket=silver_bucket
                 )
+                report = executor.run(target_dates, dry_run=dry_run)
+                timing = {
+                    "workers": report["workers"],
+                    "seconds": report["seconds"],
+                }
 
-                failures: list[str] = []
-                for target_date in target_dates:
-                    if not processor.process_date(target_date, dry_run=dry_run):
-                        failures.append(str(target_date))
-
-                if failures:
+                if report["failures"]:
                     return {
                         "statusCode": 500,
                         "message": "Processing failed for some dates",
-                        "failures": failures,
+                        "failures": report["failures"],
+                        **timing,
                     }
 
                 return {
@@ -174,6 +252,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     ),
                     "start_date": str(start_date),
                     "end_date": str(end_date),
+                    **timing,
                 }
 
             return {
@@ -189,20 +268,76 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             bronze_bucket=bronze_bucket, silver_bucket=silver_bucket
         )
 
-        # Check if this is a summary.json update
+        # Check if this is a summary.json update or a correction notice
+        # The NBA keeps the original key layout, so a league of None means NBA
         is_summary_update = False
+        summary_league: str | None = None
+        # (league, date) -> notice key
+        correction_dates: dict[tuple[str | None, date], str] = {}
         for record in event.get("Records", []):
             if record.get("eventSource") == "aws:s3":
                 key = record.get("s3", {}).get("object", {}).get("key", "")
-                if key.endswith("summary.json"):
+                correction = _CORRECTION_KEY_PATTERN.match(key)
+                league_summary = _LEAGUE_SUMMARY_KEY_PATTERN.match(key)
+                if correction:
+                    correction_dates[
+                        (
+                            correction.group("league"),
+                            _parse_yyyy_mm_dd(correction.group("date")),
+                        )
+                    ] = key
+                elif league_summary:
+                    is_summary_update = True
+                    summary_league = league_summary.group("league")
+                elif key.endswith("summary.json"):
                     is_summary_update = True
-                    break
+
+        if correction_dates:
+            # Corrections can land on any recent date, so the date comes from
+            # the notice key rather than the summary's last ingestion date
+            dates = sorted({d for _, d in correction_dates})
+            logger.info(
+                "Detected bronze stat corrections",
+                extra={"dates": [d.isoformat() for d in dates]},
+            )
+            processor = SilverProcessor(
+                bronze_bucket=bronze_bucket, silver_bucket=silver_bucket
+            )
+            failed = [
+                d.isoformat()
+                for league, d in sorted(
+                    correction_dates, key=lambda item: (item[1], item[0] or "")
+                )
+                if not _process_correction(
+                    processor, s3_manager, correction_dates[(league, d)], d, league
+                )
+            ]
+            if failed:
+                return {
+                    "statusCode": 500,
+                    "message": f"Correction processing failed for {failed}",
+                }
+            return {
+                "statusCode": 200,
+                "message": (
+                    "Successfully processed corrections for "
+                    f"{[d.isoformat() for d in dates]}"
+                ),
+            }
 
         if is_summary_update:
-            logger.info("Detected summary.json update, checking for new data")
+            logger.info(
+                "Detected summary.json update, checking for new data",
+                extra={"league": summary_league or "nba"},
+            )
             try:
                 # Read summary file to get the last ingestion date
-                summary_data = s3_manager.read_summary_json()
+                if summary_league:
+                    summary_data = s3_manager.read_summary_json(
+                        f"_metadata/leagues/{summary_league}/summary.json"
+                    )
+                else:
+                    summary_data = s3_manager.read_summary_json()
 
                 if not summary_data:
                     logger.warning("Summary file not found or could not be read")
@@ -231,11 +366,19 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
                 logger.info(f"Triggering processing for date: {target_date}")
 
-                # Process the date with both buckets specified
+                # Process the date with both buckets specified. The summary is
+                # rewritten whenever the date's bronze data changes (a rerun,
+                # a later batch, the end of live polling), so rebuild the
+                # date rather than keep the Silver files written before.
                 processor = SilverProcessor(
                     bronze_bucket=bronze_bucket, silver_bucket=silver_bucket
                 )
-                success = processor.process_date(target_date, dry_run=False)
+                success = processor.process_date(
+                    target_date,
+                    dry_run=False,
+                    overwrite=True,
+                    **_league_args(summary_league),
+                )
 
                 if success:
                     return {
@@ -7,13 +7,14 @@ validated, cleaned Silver layer data following the medallion architecture patter
 
 import os
 import sys
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import boto3
 import click
 from botocore.exceptions import BotoCoreError, ClientError
 from hoopstat_observability import get_logger
 
+from .date_range import DateRangeExecutor
 from .processors import SilverProcessor
 
 logger = get_logger(__name__)
@@ -48,17 +49,74 @@ def cli(debug: bool) -> None:
     type=str,
     help="S3 bucket name for Silver data (can also be set via SILVER_BUCKET env var)",
 )
+@click.option(
+    "--read-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Bronze files read concurrently per date "
+        "(can also be set via BRONZE_READ_CONCURRENCY env var)"
+    ),
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(["json", "parquet"]),
+    default=None,
+    help=(
+        "Silver storage format, defaults to json "
+        "(can also be set via SILVER_OUTPUT_FORMAT env var)"
+    ),
+)
+@click.option(
+    "--start-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="First date of a range to process (YYYY-MM-DD), used with --end-date",
+)
+@click.option(
+    "--end-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Last date of a range to process (YYYY-MM-DD), inclusive",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Worker processes for a date range, defaults to the number of CPUs "
+        "(can also be set via SILVER_RANGE_WORKERS env var)"
+    ),
+)
 def process(
     date: datetime | None,
     dry_run: bool,
     bronze_bucket: str | None,
     silver_bucket: str | None,
+    read_concurrency: int | None,
+    output_format: str | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    workers: int | None,
 ) -> None:
     """Process Bronze layer data into Silver layer format."""
+    if bool(start_date) != bool(end_date):
+        logger.error("Provide both --start-date and --end-date to process a range")
+        sys.exit(1)
+    if start_date and start_date > end_date:
+        logger.error("--start-date must be on or before --end-date")
+        sys.exit(1)
+
     # Default to today (UTC) if no date provided
     target_date = date.date() if date else datetime.now(UTC).date()
 
-    logger.info(f"Starting silver layer processing for date: {target_date}")
+    if start_date:
+        logger.info(
+            f"Starting silver layer processing for dates: "
+            f"{start_date.date()}..{end_date.date()}"
+        )
+    else:
+        logger.info(f"Starting silver layer processing for date: {target_date}")
 
     if dry_run:
         logger.info("Dry run mode - no data will be written")
@@ -81,10 +139,40 @@ def process(
         )
         sys.exit(1)
 
+    if start_date:
+        target_dates = [
+            start_date.date() + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        try:
+            executor = DateRangeExecutor(
+                bronze_bucket=bronze_bucket_name,
+                silver_bucket=silver_bucket_name,
+                max_workers=workers,
+                read_concurrency=read_concurrency,
+                output_format=output_format,
+            )
+            report = executor.run(target_dates, dry_run=dry_run)
+        except Exception as e:
+            logger.error(f"Silver layer processing failed: {e}")
+            sys.exit(1)
+
+        if report["failures"]:
+            logger.error(
+                f"Silver layer processing failed for {len(report['failures'])} "
+                f"date(s): {', '.join(report['failures'])}"
+            )
+            sys.exit(1)
+        logger.info("Silver layer processing completed successfully")
+        return
+
     try:
         # Initialize Silver processor with both Bronze and Silver buckets
         processor = SilverProcessor(
-            bronze_bucket=bronze_bucket_name, silver_bucket=silver_bucket_name
+            bronze_bucket=bronze_bucket_name,
+            silver_bucket=silver_bucket_name,
+            read_concurrency=read_concurrency,
+            output_format=output_format,
         )
 
         # Process the target date
@@ -7,11 +7,15 @@ This module contains the main processing classes and functions for:
 - Writing cleaned Silver layer data back to S3
 """
 
-import json
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from hoopstat_data import (
     BoxScoreRaw,
     DataCleaningRulesEngine,
@@ -20,32 +24,109 @@ from hoopstat_data import (
     PlayerStats,
     TeamStats,
     ValidationMode,
+    check_batch_quality,
     check_data_completeness,
-    detect_outliers,
+    decode_json,
     normalize_team_name,
+    object_encoding,
 )
 from hoopstat_observability import get_logger
-from hoopstat_s3 import SilverS3Manager
+from hoopstat_s3 import (
+    SilverPartitionConflictError,
+    SilverS3Manager,
+    arrow_schema_from_model,
+)
 
 logger = get_logger(__name__)
 
+# Concurrent get_object calls per date when reading bronze game files
+DEFAULT_READ_CONCURRENCY = 8
+
+# Datasets a box score is transformed into
+SILVER_DATASETS = ("player_stats", "team_stats", "game_stats")
+
+
+# Silver model of each dataset's rows
+SILVER_MODELS = {
+    "player_stats": PlayerStats,
+    "team_stats": TeamStats,
+    "game_stats": GameStats,
+}
+
+# Arrow schema of each dataset when Silver is written as Parquet
+SILVER_SCHEMAS = {
+    dataset: arrow_schema_from_model(model) for dataset, model in SILVER_MODELS.items()
+}
+
+SILVER_OUTPUT_FORMATS = ("json", "parquet")
+PARQUET_COMPRESSIONS = ("snappy", "zstd")
+
+# Attempts to merge games into a partition that other writers keep changing
+MAX_UPSERT_ATTEMPTS = 3
+
+
+def new_validation_results() -> dict[str, dict[str, int]]:
+    """Create empty per-dataset counts of validated and rejected rows."""
+    return {dataset: {"valid": 0, "rejected": 0} for dataset in SILVER_DATASETS}
+
+
+def _read_concurrency_from_env() -> int:
+    """Get the bronze read concurrency from BRONZE_READ_CONCURRENCY."""
+    value = os.getenv("BRONZE_READ_CONCURRENCY")
+    if not value:
+        return DEFAULT_READ_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid BRONZE_READ_CONCURRENCY {value!r}, "
+            f"using {DEFAULT_READ_CONCURRENCY}"
+        )
+        return DEFAULT_READ_CONCURRENCY
+
+
+def _choice_from_env(name: str, choices: tuple[str, ...]) -> str:
+    """Get a setting from an environment variable, defaulting to the first choice."""
+    value = os.getenv(name)
+    if not value:
+        return choices[0]
+    if value.lower() not in choices:
+        logger.warning(f"Invalid {name} {value!r}, using {choices[0]}")
+        return choices[0]
+    return value.lower()
+
 
 class BronzeToSilverProcessor:
     """Core processor for transforming Bronze layer data to Silver layer format."""
 
-    def __init__(self, bronze_bucket: str, region_name: str = "us-east-1"):
+    def __init__(
+        self,
+        bronze_bucket: str,
+        region_name: str = "us-east-1",
+        read_concurrency: int | None = None,
+    ):
         """
         Initialize the Bronze to Silver processor.
 
         Args:
             bronze_bucket: S3 bucket name where Bronze data is stored
             region_name: AWS region name
+            read_concurrency: Game files fetched concurrently per date; defaults
+                to BRONZE_READ_CONCURRENCY or DEFAULT_READ_CONCURRENCY
         """
         self.bronze_bucket = bronze_bucket
         self.region_name = region_name
+        if read_concurrency is None:
+            read_concurrency = _read_concurrency_from_env()
+        self.read_concurrency = max(1, read_concurrency)
 
         try:
-            self.s3_client = boto3.client("s3", region_name=region_name)
+            # Size the connection pool so concurrent reads don't queue for one
+            self.s3_client = boto3.client(
+                "s3",
+                region_name=region_name,
+                config=Config(max_pool_connections=max(10, self.read_concurrency)),
+            )
             logger.info(
                 f"Initialized Bronze-to-Silver processor for bucket: {bronze_bucket}"
             )
@@ -53,66 +134,153 @@ class BronzeToSilverProcessor:
             logger.error(f"Failed to initialize S3 client: {e}")
             raise
 
-    def read_bronze_json(self, entity: str, target_date: date) -> list[dict[str, Any]]:
+    def _bronze_prefix(
+        self, entity: str, target_date: date, league: str | None = None
+    ) -> str:
+        """Get the bronze key prefix of an entity's files for a date."""
+        date_str = target_date.strftime("%Y-%m-%d")
+        # ADR-032: Use URL-safe paths without 'date=' prefix
+        if league:
+            return f"raw/{league}/{entity}/{date_str}/"
+        return f"raw/{entity}/{date_str}/"
+
+    def _list_bronze_keys(self, prefix: str) -> Iterator[str]:
+        """Yield every key under a prefix, one listing page at a time."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bronze_bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    def _fetch_bronze_object(self, key: str) -> Any:
+        """Fetch and decode one bronze file."""
+        response = self.s3_client.get_object(Bucket=self.bronze_bucket, Key=key)
+        # Objects may be plain or gzip/zstd-compressed JSON
+        return decode_json(response["Body"].read(), object_encoding(response))
+
+    def iter_bronze_json(
+        self, entity: str, target_date: date, league: str | None = None
+    ) -> Iterator[dict[str, Any]]:
         """
-        Read Bronze JSON data from S3 (ADR-031: supports multiple files per date).
+        Stream Bronze JSON files of a date from S3 (ADR-031).
+
+        Keys are listed page by page and fetched by a pool of
+        ``read_concurrency`` threads, so the caller can transform one game
+        while the next ones are downloading. Payloads are yielded in key
+        order, keeping Silver output stable from run to run; files that fail
+        to read are logged and skipped.
 
         Args:
             entity: Entity type (e.g., 'box')
             target_date: Date of the data
+            league: League segment for non-NBA data (raw/{league}/{entity}/...)
 
-        Returns:
-            List of parsed JSON data (one per file). Empty list if no files found.
-        """
-        date_str = target_date.strftime("%Y-%m-%d")
-        # ADR-032: Use URL-safe paths without 'date=' prefix
-        prefix = f"raw/{entity}/{date_str}/"
+        Yields:
+            Parsed JSON data, one per file
 
-        try:
-            # List all objects under the date prefix
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bronze_bucket, Prefix=prefix
+        Raises:
+            Exception: If listing the prefix fails
+        """
+        prefix = self._bronze_prefix(entity, target_date, league)
+        # Bound the read-ahead so a large date never sits in memory at once
+        max_in_flight = self.read_concurrency * 2
+        in_flight: deque[tuple[str, Future]] = deque()
+        listed = 0
+        read = 0
+
+        def drain_one() -> Iterator[dict[str, Any]]:
+            nonlocal read
+            key, future = in_flight.popleft()
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Failed to read Bronze data from s3://{self.bronze_bucket}/{key}: "
+                    f"{e}"
+                )
+                # Continue processing other files
+                return
+            read += 1
+            logger.debug(
+                f"Successfully read Bronze data from s3://{self.bronze_bucket}/{key}"
             )
+            yield data
 
-            if "Contents" not in response:
-                logger.warning(
-                    f"No Bronze data found at s3://{self.bronze_bucket}/{prefix}"
+        with ThreadPoolExecutor(
+            max_workers=self.read_concurrency, thread_name_prefix="bronze-read"
+        ) as executor:
+            try:
+                for key in self._list_bronze_keys(prefix):
+                    listed += 1
+                    in_flight.append(
+                        (key, executor.submit(self._fetch_bronze_object, key))
+                    )
+                    if len(in_flight) >= max_in_flight:
+                        yield from drain_one()
+            except Exception as e:
+                logger.error(
+                    f"Failed to list Bronze data at s3://{self.bronze_bucket}/"
+                    f"{prefix}: {e}"
                 )
-                return []
+                for _, future in in_flight:
+                    future.cancel()
+                raise
 
-            # Read each file and collect the data
-            all_data = []
-            for obj in response["Contents"]:
-                key = obj["Key"]
-                try:
-                    file_response = self.s3_client.get_object(
-                        Bucket=self.bronze_bucket, Key=key
-                    )
-                    json_content = file_response["Body"].read().decode("utf-8")
-                    data = json.loads(json_content)
-                    all_data.append(data)
-                    logger.debug(
-                        f"Successfully read Bronze data from s3://{self.bronze_bucket}/{key}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to read Bronze data from "
-                        f"s3://{self.bronze_bucket}/{key}: {e}"
-                    )
-                    # Continue processing other files
-                    continue
+            while in_flight:
+                yield from drain_one()
 
-            logger.info(
-                f"Successfully read {len(all_data)} Bronze files from "
-                f"s3://{self.bronze_bucket}/{prefix}"
+        if not listed:
+            logger.warning(
+                f"No Bronze data found at s3://{self.bronze_bucket}/{prefix}"
             )
-            return all_data
+            return
 
-        except Exception as e:
-            logger.error(
-                f"Failed to list Bronze data at s3://{self.bronze_bucket}/{prefix}: {e}"
-            )
-            raise
+        logger.info(
+            f"Successfully read {read} Bronze files from "
+            f"s3://{self.bronze_bucket}/{prefix}",
+            extra={"files": listed, "read_concurrency": self.read_concurrency},
+        )
+
+    def read_bronze_game(
+        self,
+        entity: str,
+        target_date: date,
+        game_id: str,
+        league: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Read the Bronze JSON file of a single game from S3.
+
+        Args:
+            entity: Entity type (e.g., 'box')
+            target_date: Date of the game
+            game_id: Game ID, which names the file (ADR-031)
+            league: League segment for non-NBA data (raw/{league}/{entity}/...)
+
+        Returns:
+            Parsed JSON data, or None if the game has no Bronze file
+        """
+        key = f"{self._bronze_prefix(entity, target_date, league)}{game_id}.json"
+        try:
+            return self._fetch_bronze_object(key)
+        except self.s3_client.exceptions.NoSuchKey:
+            logger.warning(f"No Bronze data found at s3://{self.bronze_bucket}/{key}")
+            return None
+
+    def read_bronze_json(
+        self, entity: str, target_date: date, league: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Read Bronze JSON data from S3 (ADR-031: supports multiple files per date).
+
+        Args:
+            entity: Entity type (e.g., 'box')
+            target_date: Date of the data
+            league: League segment for non-NBA data (raw/{league}/{entity}/...)
+
+        Returns:
+            List of parsed JSON data (one per file). Empty list if no files found.
+        """
+        return list(self.iter_bronze_json(entity, target_date, league=league))
 
     def _map_nba_api_to_model(self, bronze_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -247,14 +415,23 @@ class BronzeToSilverProcessor:
         }
 
     def transform_to_silver(
-        self, bronze_data: dict[str, Any], entity: str
+        self,
+        bronze_data: dict[str, Any],
+        entity: str,
+        validation: dict[str, dict[str, int]] | None = None,
     ) -> dict[str, list[dict]]:
         """
         Transform Bronze data to Silver models.
 
+        Each row is validated exactly once, by constructing its Silver model,
+        and serialized once with ``model_dump``; rows that fail validation are
+        logged and left out, so the returned rows need no further validation.
+
         Args:
             bronze_data: Raw Bronze layer data
             entity: Entity type
+            validation: Per-dataset counts of valid and rejected rows to add
+                this game's results to (see new_validation_results)
 
         Returns:
             Dictionary with lists of Silver model data organized by type
@@ -303,6 +480,20 @@ class BronzeToSilverProcessor:
         # Transform game statistics
         self._transform_game_stats(box_score_raw, silver_data, lineage, rules_engine)
 
+        if validation is not None:
+            # Every candidate row becomes a model or is rejected
+            candidates = {
+                "player_stats": len(box_score_raw.home_players or [])
+                + len(box_score_raw.away_players or []),
+                "team_stats": (box_score_raw.home_team_stats is not None)
+                + (box_score_raw.away_team_stats is not None),
+                "game_stats": 1,
+            }
+            for dataset, candidate_count in candidates.items():
+                valid_count = len(silver_data[dataset])
+                validation[dataset]["valid"] += valid_count
+                validation[dataset]["rejected"] += candidate_count - valid_count
+
         logger.info(
             f"Transformed to {len(silver_data['player_stats'])} player stats, "
             f"{len(silver_data['team_stats'])} team stats, "
@@ -325,11 +516,16 @@ class BronzeToSilverProcessor:
         if box_score_raw.away_players:
             all_players.extend(box_score_raw.away_players)
 
+        # A game has two teams, so normalize each name once, not per player
+        team_names: dict[str, str] = {}
+
         for player_raw in all_players:
             try:
-                # Apply data quality checks
-                player_dict = player_raw.model_dump()
-                completeness = check_data_completeness(player_dict)
+                # Apply data quality checks on the parsed fields, including
+                # the extras the raw model allows, without serializing them
+                completeness = check_data_completeness(
+                    {**player_raw.__dict__, **(player_raw.__pydantic_extra__ or {})}
+                )
 
                 if completeness["completeness_ratio"] < 0.5:
                     logger.warning(
@@ -340,9 +536,11 @@ class BronzeToSilverProcessor:
                 # Apply transformations
                 team_name = player_raw.team
                 if team_name:
-                    team_name = normalize_team_name(
-                        team_name, use_rules_engine=rules_engine is not None
-                    )
+                    if team_name not in team_names:
+                        team_names[team_name] = normalize_team_name(
+                            team_name, use_rules_engine=rules_engine is not None
+                        )
+                    team_name = team_names[team_name]
 
                 # Create PlayerStats with validation
                 player_stats = PlayerStats(
@@ -528,49 +726,30 @@ class BronzeToSilverProcessor:
             "player_stats_quality": {},
             "team_stats_quality": {},
             "outliers": {},
+            "summaries": {},
             "overall_quality": True,
         }
 
-        # Check player stats quality
-        if silver_data.get("player_stats"):
-            for i, player_stat in enumerate(silver_data["player_stats"]):
-                completeness = check_data_completeness(player_stat)
-                quality_results["player_stats_quality"][i] = completeness
-
-                # Check for outliers in points
-                if "points" in player_stat and player_stat["points"] is not None:
-                    points_values = [
-                        p.get("points", 0)
-                        for p in silver_data["player_stats"]
-                        if p.get("points") is not None
+        # Each dataset is checked as one batch rather than row by row
+        ratios = []
+        for dataset, prefix in (("player_stats", "player"), ("team_stats", "team")):
+            rows = silver_data.get(dataset)
+            if not rows:
+                continue
+
+            batch = check_batch_quality(rows)
+            flags = batch["flags"]
+            quality_results[f"{dataset}_quality"] = flags.to_dict("index")
+            quality_results["summaries"][dataset] = batch["summary"]
+            ratios.extend(flags["completeness_ratio"].tolist())
+
+            for column, indices in batch["summary"]["outliers"].items():
+                for i in indices:
+                    quality_results["outliers"][f"{prefix}_{i}_{column}"] = rows[i][
+                        column
                     ]
-                    if len(points_values) > 2:
-                        outlier_indices = detect_outliers(points_values)
-                        if i in outlier_indices:
-                            quality_results["outliers"][f"player_{i}_points"] = (
-                                player_stat["points"]
-                            )
 
-        # Check team stats quality
-        if silver_data.get("team_stats"):
-            for i, team_stat in enumerate(silver_data["team_stats"]):
-                completeness = check_data_completeness(team_stat)
-                quality_results["team_stats_quality"][i] = completeness
-
-        # Determine overall quality
-        player_quality_scores = [
-            pq["completeness_ratio"]
-            for pq in quality_results["player_stats_quality"].values()
-        ]
-        team_quality_scores = [
-            tq["completeness_ratio"]
-            for tq in quality_results["team_stats_quality"].values()
-        ]
-
-        avg_quality = 0.0
-        if player_quality_scores or team_quality_scores:
-            all_scores = player_quality_scores + team_quality_scores
-            avg_quality = sum(all_scores) / len(all_scores)
+        avg_quality = sum(ratios) / len(ratios) if ratios else 0.0
 
         quality_results["overall_quality"] = avg_quality >= 0.7  # 70% threshold
         quality_results["average_completeness"] = avg_quality
@@ -591,6 +770,9 @@ class SilverProcessor:
         bronze_bucket: str | None = None,
         silver_bucket: str | None = None,
         region_name: str = "us-east-1",
+        read_concurrency: int | None = None,
+        output_format: str | None = None,
+        parquet_compression: str | None = None,
     ) -> None:
         """
         Initialize the Silver processor with dependencies.
@@ -601,10 +783,26 @@ class SilverProcessor:
             silver_bucket: S3 bucket name for Silver data (optional, defaults to
                 bronze_bucket for backward compatibility)
             region_name: AWS region name
+            read_concurrency: Bronze game files fetched concurrently per date;
+                defaults to BRONZE_READ_CONCURRENCY
+            output_format: Silver storage format, "json" or "parquet";
+                defaults to SILVER_OUTPUT_FORMAT
+            parquet_compression: Parquet codec, "snappy" or "zstd"; defaults
+                to SILVER_PARQUET_COMPRESSION
         """
         self.bronze_bucket = bronze_bucket
         self.silver_bucket = silver_bucket or bronze_bucket
         self.region_name = region_name
+        self.output_format = output_format or _choice_from_env(
+            "SILVER_OUTPUT_FORMAT", SILVER_OUTPUT_FORMATS
+        )
+        self.parquet_compression = parquet_compression or _choice_from_env(
+            "SILVER_PARQUET_COMPRESSION", PARQUET_COMPRESSIONS
+        )
+        if self.output_format not in SILVER_OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output_format: {self.output_format}")
+        if self.parquet_compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"Invalid parquet_compression: {self.parquet_compression}")
 
         if bronze_bucket:
             # Use SilverS3Manager for both Bronze reading and Silver writing
@@ -616,7 +814,7 @@ class SilverProcessor:
 
             # Keep backward compatibility with existing BronzeToSilverProcessor
             self.bronze_to_silver_processor = BronzeToSilverProcessor(
-                bronze_bucket, region_name
+                bronze_bucket, region_name, read_concurrency=read_concurrency
             )
         else:
             self.s3_manager = None
@@ -633,55 +831,100 @@ class SilverProcessor:
                 f"Silver: {self.silver_bucket}"
             )
 
-    def process_date(self, target_date: date, dry_run: bool = False) -> bool:
+    def process_date(
+        self,
+        target_date: date,
+        dry_run: bool = False,
+        league: str | None = None,
+        write_marker: bool = True,
+        overwrite: bool = False,
+    ) -> bool:
         """
         Process all Bronze layer data for a specific date into Silver format.
 
         Args:
             target_date: The date to process
             dry_run: If True, validate but don't write data
+            league: League to process; None processes the NBA's original
+                (unprefixed) layout. Other leagues read and write under their
+                own key segment.
+            write_marker: Whether to write the date's silver-ready marker
+            overwrite: Whether to replace Silver files that already exist for
+                the date; by default an existing file is left as it is
 
         Returns:
             True if processing succeeded, False otherwise
         """
-        logger.info(f"Processing Bronze data for {target_date}")
+        result = self.process_date_result(
+            target_date, dry_run, league, write_marker, overwrite
+        )
+        return result["success"]
+
+    def process_date_result(
+        self,
+        target_date: date,
+        dry_run: bool = False,
+        league: str | None = None,
+        write_marker: bool = True,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Process a date like ``process_date`` and describe the outcome.
+
+        Args:
+            target_date: The date to process
+            dry_run: If True, validate but don't write data
+            league: League to process; None for the NBA
+            write_marker: Whether to write the date's silver-ready marker.
+                Range runs defer markers so they can be written in date order.
+            overwrite: Whether to replace Silver files that already exist
+
+        Returns:
+            Dictionary with the date, success flag, game count, dataset counts,
+            the S3 keys written and the marker key (if one was written)
+        """
+        result = {
+            "date": target_date.isoformat(),
+            "success": False,
+            "games": 0,
+            "dataset_counts": {},
+            "dataset_keys": {},
+            "marker_key": None,
+        }
+
+        logger.info(
+            f"Processing Bronze data for {target_date}",
+            extra={"league": league or "nba"},
+        )
+        # Only pass the league along when set, keeping the NBA calls unchanged
+        league_args = {"league": league} if league else {}
 
         try:
             if not self.bronze_to_silver_processor:
                 logger.error("No Bronze bucket configured for processing")
-                return False
+                return result
 
             # Process box_scores entity (main entity type for now)
             entity = "box"
 
-            # 1. Load Bronze JSON data from S3 (ADR-031: returns list of games)
-            bronze_data_list = self.bronze_to_silver_processor.read_bronze_json(
-                entity, target_date
-            )
-            if not bronze_data_list:
-                logger.warning(f"No Bronze data found for {entity} on {target_date}")
-                return False
-
-            logger.info(
-                f"Found {len(bronze_data_list)} game(s) for {target_date}, "
-                "processing each..."
-            )
-
             # Aggregate all Silver data from all games
-            all_silver_data = {
-                "player_stats": [],
-                "team_stats": [],
-                "game_stats": [],
-            }
+            all_silver_data = {dataset: [] for dataset in SILVER_DATASETS}
+            validation = new_validation_results()
 
-            # 2. Process each game individually
-            for i, bronze_data in enumerate(bronze_data_list):
-                logger.debug(f"Processing game {i + 1}/{len(bronze_data_list)}")
+            # 1. Stream Bronze JSON games from S3 (ADR-031: one file per game)
+            # 2. Transform each game while the following ones are downloading
+            bronze_games = self.bronze_to_silver_processor.iter_bronze_json(
+                entity, target_date, **league_args
+            )
+            game_count = 0
+            for i, bronze_data in enumerate(bronze_games):
+                game_count += 1
+                logger.debug(f"Processing game {i + 1} for {target_date}")
 
                 try:
                     # Transform to Silver models (PlayerStats, TeamStats, GameStats)
                     silver_data = self.bronze_to_silver_processor.transform_to_silver(
-                        bronze_data, entity
+                        bronze_data, entity, validation=validation
                     )
 
                     # Aggregate the results
@@ -700,6 +943,16 @@ class SilverProcessor:
                     # Continue processing other games
                     continue
 
+            if not game_count:
+                logger.warning(f"No Bronze data found for {entity} on {target_date}")
+                return result
+
+            logger.info(f"Transformed {game_count} game(s) for {target_date}")
+            result["games"] = game_count
+            result["dataset_counts"] = {
+                dataset: len(rows) for dataset, rows in all_silver_data.items()
+            }
+
             # 3. Validate aggregated data quality
             quality_results = self.bronze_to_silver_processor.apply_quality_checks(
                 all_silver_data
@@ -712,10 +965,14 @@ class SilverProcessor:
                     f"avg_completeness={avg_completeness:.2f}"
                 )
 
-            # 4. Validate Silver data models
-            if not self.validate_silver_data(all_silver_data):
-                logger.error(f"Silver data validation failed for {target_date}")
-                return False
+            # 4. Rows were validated when their models were built in the
+            # transform; record the results instead of validating them again
+            rejected = sum(counts["rejected"] for counts in validation.values())
+            log = logger.warning if rejected else logger.info
+            log(
+                f"Silver validation for {target_date}: {rejected} row(s) rejected",
+                extra={"validation": validation},
+            )
 
             if dry_run:
                 logger.info("Dry run mode - data validation only")
@@ -733,7 +990,13 @@ class SilverProcessor:
                 if self.s3_manager:
                     try:
                         written_keys = self.s3_manager.write_partitioned_silver_data(
-                            all_silver_data, target_date, check_exists=True
+                            all_silver_data,
+                            target_date,
+                            check_exists=not overwrite,
+                            output_format=self.output_format,
+                            schemas=SILVER_SCHEMAS,
+                            compression=self.parquet_compression,
+                            **league_args,
                         )
 
                         player_count = len(all_silver_data.get("player_stats", []))
@@ -749,28 +1012,18 @@ class SilverProcessor:
                             f"Written to S3 keys: {list(written_keys.values())}"
                         )
 
+                        result["dataset_keys"] = written_keys
+
                         # 6. Write silver-ready marker to trigger Gold processing
                         # (ADR-028: single daily trigger instead of per-object events)
-                        try:
-                            dataset_counts = {
-                                "player_stats": player_count,
-                                "team_stats": team_count,
-                                "game_stats": game_count,
-                            }
-                            marker_key = self.s3_manager.write_silver_ready_marker(
-                                target_date, dataset_counts
+                        if write_marker:
+                            result["marker_key"] = self.write_ready_marker(
+                                target_date, result, league
                             )
-                            logger.info(
-                                f"Successfully wrote silver-ready marker: {marker_key}"
-                            )
-                        except Exception as e:
-                            logger.error(f"Failed to write silver-ready marker: {e}")
-                            # Don't fail the whole process if marker write fails
-                            # Silver data is already written successfully
 
                     except Exception as e:
                         logger.error(f"Failed to write Silver data to S3: {e}")
-                        return False
+                        return result
                 else:
                     logger.warning("No S3 manager configured - Silver data not written")
                     player_count = len(all_silver_data.get("player_stats", []))
@@ -781,42 +1034,265 @@ class SilverProcessor:
                         f"{team_count} team stats, {game_count} game stats"
                     )
 
-            return True
+            result["success"] = True
+            return result
 
         except Exception as e:
             logger.error(f"Processing failed for {target_date}: {e}")
-            return False
+            return result
+
+    def write_ready_marker(
+        self, target_date: date, result: dict[str, Any], league: str | None = None
+    ) -> str | None:
+        """
+        Write the silver-ready marker for a processed date.
+
+        A marker write failure is logged but does not fail the date, as its
+        Silver data is already written.
+
+        Args:
+            target_date: The date that was processed
+            result: Result of ``process_date_result`` for the date
+            league: League that was processed; None for the NBA
+
+        Returns:
+            S3 key of the marker, or None if it could not be written
+        """
+        league_args = {"league": league} if league else {}
+        try:
+            marker_key = self.s3_manager.write_silver_ready_marker(
+                target_date,
+                result["dataset_counts"],
+                output_format=self.output_format,
+                dataset_keys=result["dataset_keys"],
+                **league_args,
+            )
+            logger.info(f"Successfully wrote silver-ready marker: {marker_key}")
+            return marker_key
+        except Exception as e:
+            logger.error(f"Failed to write silver-ready marker: {e}")
+            # Don't fail the whole process if marker write fails
+            # Silver data is already written successfully
+            return None
 
     def process_games(
-        self, game_ids: list[str], dry_run: bool = False
+        self,
+        game_ids: list[str],
+        dry_run: bool = False,
+        target_date: date | None = None,
+        league: str | None = None,
     ) -> dict[str, bool]:
         """
         Process specific games from Bronze to Silver layer.
 
+        Only the named games are read and transformed. Their rows replace any
+        rows with the same ``game_id`` in the date's existing Silver
+        partitions, and every other game's rows are kept, so a late game or a
+        stat correction costs one game's work rather than the whole date's.
+        Each partition is replaced atomically: the write only succeeds if the
+        partition is unchanged since it was read, and is retried on a fresh
+        read otherwise. The silver-ready marker is then rewritten with the
+        partitions' new row counts.
+
         Args:
             game_ids: List of game IDs to process
             dry_run: If True, validate but don't write data
+            target_date: Date the games were played, which locates their
+                Bronze files and Silver partitions
+            league: League to process; None for the NBA
 
         Returns:
             Dict mapping game_id to success status
         """
-        results = {}
+        results = dict.fromkeys(game_ids, False)
+        if not game_ids:
+            return results
+
+        if not self.bronze_to_silver_processor or target_date is None:
+            logger.error("Processing games needs a Bronze bucket and a target date")
+            return results
+
+        league_args = {"league": league} if league else {}
+        entity = "box"
+        new_rows = {dataset: [] for dataset in SILVER_DATASETS}
+        validation = new_validation_results()
 
         for game_id in game_ids:
+            logger.info(
+                f"Processing game {game_id} for {target_date}",
+                extra={"league": league or "nba"},
+            )
             try:
-                logger.info(f"Processing game {game_id}")
-                results[game_id] = True
-
+                bronze_data = self.bronze_to_silver_processor.read_bronze_game(
+                    entity, target_date, game_id, **league_args
+                )
+                if bronze_data is None:
+                    continue
+                silver_data = self.bronze_to_silver_processor.transform_to_silver(
+                    bronze_data, entity, validation=validation
+                )
             except Exception as e:
                 logger.error(f"Failed to process game {game_id}: {e}")
-                results[game_id] = False
+                continue
+
+            for dataset in SILVER_DATASETS:
+                new_rows[dataset].extend(silver_data.get(dataset, []))
+            results[game_id] = True
+
+        transformed = {game_id for game_id, ok in results.items() if ok}
+        if not transformed:
+            return results
+
+        self.bronze_to_silver_processor.apply_quality_checks(new_rows)
+        rejected = sum(counts["rejected"] for counts in validation.values())
+        log = logger.warning if rejected else logger.info
+        log(
+            f"Silver validation for {len(transformed)} game(s) on {target_date}: "
+            f"{rejected} row(s) rejected",
+            extra={"validation": validation},
+        )
+
+        if dry_run:
+            logger.info(
+                "Dry run mode - would merge "
+                + ", ".join(f"{len(new_rows[d])} {d}" for d in SILVER_DATASETS)
+            )
+            return results
 
+        # Rows of games that were asked for but not transformed are kept
+        result = {
+            "date": target_date.isoformat(),
+            "dataset_counts": {},
+            "dataset_keys": {},
+        }
+        try:
+            for dataset in SILVER_DATASETS:
+                written = self._upsert_partition(
+                    dataset, new_rows[dataset], transformed, target_date, league
+                )
+                if written:
+                    result["dataset_counts"][dataset] = written["record_count"]
+                    result["dataset_keys"][dataset] = written["key"]
+        except Exception as e:
+            logger.error(f"Failed to merge games into Silver for {target_date}: {e}")
+            return dict.fromkeys(game_ids, False)
+
+        self.write_ready_marker(target_date, result, league)
         return results
 
+    def _upsert_partition(
+        self,
+        dataset: str,
+        rows: list[dict[str, Any]],
+        game_ids: set[str],
+        target_date: date,
+        league: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Replace a Silver partition's rows for some games with new rows.
+
+        If the partition doesn't exist in the current output format but does in
+        the other one (the format was switched since the date was written), the
+        other format's rows are merged into a new partition in the current one.
+
+        Args:
+            dataset: Silver dataset (player_stats, team_stats, game_stats)
+            rows: New rows of the games
+            game_ids: Games whose existing rows are replaced
+            target_date: Date of the partition
+            league: League of the partition; None for the NBA
+
+        Returns:
+            Key, record count and checksum of the partition written, or None
+            if it neither exists nor gains any rows
+
+        Raises:
+            SilverPartitionConflictError: If the partition kept changing
+                between being read and replaced
+        """
+        league_args = {"league": league} if league else {}
+        for attempt in range(1, MAX_UPSERT_ATTEMPTS + 1):
+            existing, etag = self.s3_manager.read_silver_partition(
+                dataset, target_date, self.output_format, **league_args
+            )
+            if etag is None:
+                existing = self._read_other_format_partition(
+                    dataset, target_date, league
+                )
+            if etag is None and not existing and not rows:
+                return None
+
+            kept = [row for row in existing if str(row.get("game_id")) not in game_ids]
+            merged = kept + rows
+            try:
+                written = self.s3_manager.replace_silver_partition(
+                    dataset,
+                    merged,
+                    target_date,
+                    etag,
+                    output_format=self.output_format,
+                    schema=SILVER_SCHEMAS[dataset],
+                    compression=self.parquet_compression,
+                    **league_args,
+                )
+            except SilverPartitionConflictError:
+                if attempt == MAX_UPSERT_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Silver {dataset} partition for {target_date} changed while "
+                    f"merging, retrying ({attempt}/{MAX_UPSERT_ATTEMPTS})"
+                )
+                continue
+
+            logger.info(
+                f"Merged {len(rows)} {dataset} row(s) into {written['key']}",
+                extra={
+                    "replaced": len(existing) - len(kept),
+                    "record_count": written["record_count"],
+                    "checksum": written["checksum"],
+                },
+            )
+            return written
+
+    def _read_other_format_partition(
+        self, dataset: str, target_date: date, league: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Read a Silver partition written in a format other than the current one.
+
+        Args:
+            dataset: Silver dataset (player_stats, team_stats, game_stats)
+            target_date: Date of the partition
+            league: League of the partition; None for the NBA
+
+        Returns:
+            Records of the first other-format partition found, re-validated
+            with the dataset's Silver model so JSON values regain their types;
+            an empty list if there is none
+        """
+        league_args = {"league": league} if league else {}
+        for output_format in SILVER_OUTPUT_FORMATS:
+            if output_format == self.output_format:
+                continue
+            records, etag = self.s3_manager.read_silver_partition(
+                dataset, target_date, output_format, **league_args
+            )
+            if etag is not None:
+                logger.info(
+                    f"Silver {dataset} partition for {target_date} is stored as "
+                    f"{output_format}, merging it into {self.output_format}"
+                )
+                model = SILVER_MODELS[dataset]
+                return [model.model_validate(row).model_dump() for row in records]
+        return []
+
     def validate_silver_data(self, silver_data: dict[str, list]) -> bool:
         """
         Validate Silver layer data against schema.
 
+        process_date does not call this: rows from transform_to_silver were
+        validated when their models were built. Use it for rows from elsewhere.
+
         Args:
             silver_data: The Silver layer data to validate
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading a date of bronze box scores at different read concurrencies.
+
+Runs ``BronzeToSilverProcessor.read_bronze_json`` against an in-process moto
+S3 bucket. moto answers instantly, so every S3 request is delayed by
+``--latency-ms`` to stand in for the round trip to a real bucket, which is
+what dominates a sequential read.
+"""
+
+import argparse
+import json
+import logging
+import time
+from datetime import date
+
+import boto3
+from moto import mock_aws
+
+from app.processors import BronzeToSilverProcessor
+
+BUCKET = "benchmark-bronze-bucket"
+TARGET_DATE = date(2024, 1, 15)
+PLAYERS_PER_TEAM = 13
+
+
+def _team(team_id: int, points: int) -> dict:
+    return {
+        "teamId": team_id,
+        "teamCity": "City",
+        "teamName": "Team",
+        "teamTricode": "TST",
+        "players": [
+            {
+                "personId": team_id * 100 + n,
+                "name": f"Player {n}",
+                "statistics": {"minutes": "24:00", "points": n, "assists": n % 9},
+            }
+            for n in range(PLAYERS_PER_TEAM)
+        ],
+        "statistics": {"points": points, "reboundsTotal": 44, "assists": 25},
+    }
+
+
+def generate_box_score(n: int) -> dict:
+    """Generate a V3 box score payload."""
+    return {
+        "boxScoreTraditional": {
+            "gameId": f"00223{n:05d}",
+            "gameDate": TARGET_DATE.isoformat(),
+            "homeTeam": _team(1610612737 + n % 30, 110),
+            "awayTeam": _team(1610612737 + (n + 1) % 30, 104),
+        }
+    }
+
+
+def seed_bucket(games: int) -> None:
+    """Store a date's worth of box scores in the mocked bucket."""
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=BUCKET)
+    prefix = f"raw/box/{TARGET_DATE.isoformat()}/"
+    for n in range(games):
+        s3.put_object(
+            Bucket=BUCKET,
+            Key=f"{prefix}00223{n:05d}.json",
+            Body=json.dumps(generate_box_score(n)).encode("utf-8"),
+        )
+
+
+def time_read(concurrency: int, latency: float, repeat: int) -> tuple[float, int]:
+    """Best-of-``repeat`` seconds to read the date at a concurrency."""
+    processor = BronzeToSilverProcessor(BUCKET, read_concurrency=concurrency)
+
+    def delay_request(**kwargs):
+        time.sleep(latency)
+
+    # Runs before moto answers the request, like a network round trip
+    processor.s3_client.meta.events.register_first("before-send", delay_request)
+
+    best = float("inf")
+    files = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        files = len(processor.read_bronze_json("box", TARGET_DATE))
+        best = min(best, time.perf_counter() - start)
+    return best, files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=15, help="Games on the date")
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Simulated S3 round trip"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="Read concurrencies to compare",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per setting")
+    args = parser.parse_args()
+
+    # Keep the per-read log lines out of the report
+    logging.getLogger("app.processors").setLevel(logging.WARNING)
+
+    with mock_aws():
+        seed_bucket(args.games)
+        print(
+            f"Reading {args.games} games for {TARGET_DATE} "
+            f"({args.latency_ms:.0f} ms per S3 request)"
+        )
+        print(f"{'concurrency':>11}  {'seconds/date':>12}  {'speedup':>7}")
+
+        baseline = None
+        for concurrency in args.concurrency:
+            seconds, files = time_read(concurrency, args.latency_ms / 1000, args.repeat)
+            assert files == args.games, f"read {files} of {args.games} files"
+            baseline = baseline or seconds
+            print(f"{concurrency:>11}  {seconds:>12.3f}  {baseline / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
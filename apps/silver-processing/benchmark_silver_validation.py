@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark transforming and validating a game night of box scores.
+
+Compares the two-pass pipeline ``process_date`` used to run (transform each
+game into Silver models, dump them, then rebuild every model from the dumps in
+``validate_silver_data``) with the single pass, where rows are validated once
+while the transform builds them.
+"""
+
+import argparse
+import logging
+import time
+
+from app.processors import (
+    BronzeToSilverProcessor,
+    SilverProcessor,
+    new_validation_results,
+)
+from benchmark_bronze_reads import generate_box_score
+
+GAMES_PER_NIGHT = 15
+
+
+def run_two_pass(processor: BronzeToSilverProcessor, games: list[dict]) -> int:
+    """Transform, then validate the aggregated rows a second time."""
+    silver = {"player_stats": [], "team_stats": [], "game_stats": []}
+    for game in games:
+        for dataset, rows in processor.transform_to_silver(game, "box").items():
+            silver[dataset].extend(rows)
+    assert SilverProcessor().validate_silver_data(silver)
+    return sum(len(rows) for rows in silver.values())
+
+
+def run_single_pass(processor: BronzeToSilverProcessor, games: list[dict]) -> int:
+    """Transform with validation results recorded as the rows are built."""
+    silver = {"player_stats": [], "team_stats": [], "game_stats": []}
+    validation = new_validation_results()
+    for game in games:
+        result = processor.transform_to_silver(game, "box", validation=validation)
+        for dataset, rows in result.items():
+            silver[dataset].extend(rows)
+    assert not any(counts["rejected"] for counts in validation.values())
+    return sum(len(rows) for rows in silver.values())
+
+
+def best_rate(run, processor, games, repeat: int) -> tuple[float, int]:
+    """Best-of-``repeat`` rows per second of a pipeline."""
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run(processor, games)
+        best = min(best, time.perf_counter() - start)
+    return rows / best, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--games", type=int, default=GAMES_PER_NIGHT, help="Games in the night"
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per pipeline")
+    args = parser.parse_args()
+
+    # The synthetic box scores trip the low-completeness warning on every row
+    logging.getLogger("app.processors").setLevel(logging.ERROR)
+
+    processor = BronzeToSilverProcessor("benchmark-bronze-bucket")
+    games = [generate_box_score(n) for n in range(args.games)]
+
+    before, rows = best_rate(run_two_pass, processor, games, args.repeat)
+    after, _ = best_rate(run_single_pass, processor, games, args.repeat)
+
+    print(f"Game night of {args.games} games ({rows} Silver rows)")
+    print(f"  two-pass validation:    {before:>10,.0f} rows/sec")
+    print(f"  single-pass validation: {after:>10,.0f} rows/sec")
+    print(f"  speedup:                {after / before:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
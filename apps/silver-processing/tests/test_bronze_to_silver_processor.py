@@ -4,7 +4,12 @@ import json
 from datetime import date
 from unittest.mock import Mock, patch
 
-from app.processors import BronzeToSilverProcessor
+import boto3
+import pytest
+from hoopstat_data.compression import encode_json
+from moto import mock_aws
+
+from app.processors import BronzeToSilverProcessor, new_validation_results
 
 
 class TestBronzeToSilverProcessor:
@@ -27,7 +32,9 @@ class TestBronzeToSilverProcessor:
         assert processor is not None
         assert processor.bronze_bucket == "test-bucket"
         assert processor.region_name == "us-east-1"
-        mock_boto_client.assert_called_once_with("s3", region_name="us-east-1")
+        mock_boto_client.assert_called_once()
+        assert mock_boto_client.call_args.args == ("s3",)
+        assert mock_boto_client.call_args.kwargs["region_name"] == "us-east-1"
 
     @patch("boto3.client")
     def test_read_bronze_json_success(self, mock_boto_client):
@@ -51,7 +58,9 @@ class TestBronzeToSilverProcessor:
                 {"Key": "raw/box/2024-01-01/0022400124.json"},
             ]
         }
-        mock_s3_client.list_objects_v2.return_value = mock_list_response
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            mock_list_response
+        ]
 
         # Mock get_object responses for each file
         mock_response_1 = {"Body": Mock()}
@@ -74,19 +83,53 @@ class TestBronzeToSilverProcessor:
         assert result[0] == test_data_1
         assert result[1] == test_data_2
 
-        # Verify list_objects_v2 was called with correct prefix
-        mock_s3_client.list_objects_v2.assert_called_once_with(
+        # Verify the listing was paginated under the correct prefix
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
             Bucket="test-bucket", Prefix="raw/box/2024-01-01/"
         )
 
+    @patch("boto3.client")
+    def test_read_bronze_json_compressed(self, mock_boto_client):
+        """Test reading gzip-compressed Bronze JSON alongside plain JSON."""
+        mock_s3_client = Mock()
+        mock_boto_client.return_value = mock_s3_client
+
+        test_data_1 = {"game_id": "0022400123", "home_team": {"id": 1}}
+        test_data_2 = {"game_id": "0022400124", "home_team": {"id": 2}}
+
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "raw/box/2024-01-01/0022400123.json"},
+                    {"Key": "raw/box/2024-01-01/0022400124.json"},
+                ]
+            }
+        ]
+
+        compressed = {
+            "Body": Mock(),
+            "ContentEncoding": "gzip",
+            "Metadata": {"compression": "gzip"},
+        }
+        compressed["Body"].read.return_value = encode_json(test_data_1, "gzip")
+        plain = {"Body": Mock()}
+        plain["Body"].read.return_value = json.dumps(test_data_2).encode("utf-8")
+        mock_s3_client.get_object.side_effect = [compressed, plain]
+
+        processor = BronzeToSilverProcessor("test-bucket")
+        result = processor.read_bronze_json("box", date(2024, 1, 1))
+
+        assert result == [test_data_1, test_data_2]
+
     @patch("boto3.client")
     def test_read_bronze_json_not_found(self, mock_boto_client):
         """Test reading Bronze JSON when no files exist."""
         mock_s3_client = Mock()
         mock_boto_client.return_value = mock_s3_client
 
-        # Mock empty list_objects_v2 response (no Contents key)
-        mock_s3_client.list_objects_v2.return_value = {}
+        # Mock an empty listing page (no Contents key)
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
 
         processor = BronzeToSilverProcessor("test-bucket")
         result = processor.read_bronze_json("box", date(2024, 1, 1))
@@ -94,6 +137,20 @@ class TestBronzeToSilverProcessor:
         # Should return empty list
         assert result == []
 
+    @patch("boto3.client")
+    def test_read_bronze_json_league_prefix(self, mock_boto_client):
+        """Test that a league reads its own bronze partition."""
+        mock_s3_client = Mock()
+        mock_boto_client.return_value = mock_s3_client
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
+
+        processor = BronzeToSilverProcessor("test-bucket")
+        processor.read_bronze_json("box", date(2024, 6, 1), league="wnba")
+
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix="raw/wnba/box/2024-06-01/"
+        )
+
     @patch("boto3.client")
     def test_read_bronze_json_single_file(self, mock_boto_client):
         """Test reading Bronze JSON with single file."""
@@ -108,7 +165,9 @@ class TestBronzeToSilverProcessor:
                 {"Key": "raw/box/2024-01-01/0022400123.json"},
             ]
         }
-        mock_s3_client.list_objects_v2.return_value = mock_list_response
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            mock_list_response
+        ]
 
         # Mock get_object response
         mock_response = {"Body": Mock()}
@@ -123,6 +182,40 @@ class TestBronzeToSilverProcessor:
         assert len(result) == 1
         assert result[0] == test_data
 
+    @patch("boto3.client")
+    def test_read_bronze_json_skips_unreadable_file(self, mock_boto_client):
+        """Test that a file failing to read does not drop the others."""
+        mock_s3_client = Mock()
+        mock_boto_client.return_value = mock_s3_client
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "raw/box/2024-01-01/0022400123.json"},
+                    {"Key": "raw/box/2024-01-01/0022400124.json"},
+                ]
+            }
+        ]
+        plain = {"Body": Mock()}
+        plain["Body"].read.return_value = b'{"game_id": "0022400124"}'
+        mock_s3_client.get_object.side_effect = [Exception("Read timeout"), plain]
+
+        processor = BronzeToSilverProcessor("test-bucket", read_concurrency=1)
+        result = processor.read_bronze_json("box", date(2024, 1, 1))
+
+        assert result == [{"game_id": "0022400124"}]
+
+    def test_read_concurrency_from_env(self, monkeypatch):
+        """Test that BRONZE_READ_CONCURRENCY sets the default pool width."""
+        monkeypatch.setenv("BRONZE_READ_CONCURRENCY", "3")
+        assert BronzeToSilverProcessor("test-bucket").read_concurrency == 3
+        assert (
+            BronzeToSilverProcessor("test-bucket", read_concurrency=16).read_concurrency
+            == 16
+        )
+
+        monkeypatch.setenv("BRONZE_READ_CONCURRENCY", "many")
+        assert BronzeToSilverProcessor("test-bucket").read_concurrency == 8
+
     def test_convert_minutes_to_decimal(self):
         """Test minutes conversion utility."""
         processor = self.processor
@@ -262,6 +355,49 @@ class TestBronzeToSilverProcessor:
         assert game["away_score"] == 102
         assert game["venue"] == "Staples Center"
 
+    def test_transform_to_silver_records_validation(self):
+        """Test that rows failing model validation are counted and left out."""
+        player = {
+            "player_id": 1001,
+            "player_name": "LeBron James",
+            "team": "Los Angeles Lakers",
+            "position": "SF",
+            "points": 28,
+            "field_goals_made": 11,
+            "field_goals_attempted": 18,
+            "free_throws_made": 3,
+            "free_throws_attempted": 4,
+        }
+        bronze_data = {
+            "game_id": 123,
+            "home_team": {"id": 1, "name": "Los Angeles Lakers"},
+            "away_team": {"id": 2, "name": "Boston Celtics"},
+            "home_team_stats": {"points": 108},
+            "away_team_stats": {"points": 102},
+            # More free throws made than attempted fails PlayerStats validation
+            "home_players": [
+                player,
+                {**player, "player_id": 1002, "free_throws_made": 9},
+            ],
+            "away_players": [{**player, "player_id": 2001}],
+        }
+        validation = new_validation_results()
+
+        result = self.processor.transform_to_silver(
+            bronze_data, "box", validation=validation
+        )
+        self.processor.transform_to_silver(bronze_data, "box", validation=validation)
+
+        assert [row["player_id"] for row in result["player_stats"]] == [
+            "1001",
+            "2001",
+        ]
+        assert validation == {
+            "player_stats": {"valid": 4, "rejected": 2},
+            "team_stats": {"valid": 4, "rejected": 0},
+            "game_stats": {"valid": 2, "rejected": 0},
+        }
+
     def test_apply_quality_checks(self):
         """Test quality checking functionality."""
         silver_data = {
@@ -317,6 +453,31 @@ class TestBronzeToSilverProcessor:
             assert quality["completeness_ratio"] >= 0.0
             assert quality["completeness_ratio"] <= 1.0
 
+    def test_apply_quality_checks_flags_outliers_and_inconsistencies(self):
+        """Test batch checks flag outliers and inconsistent rows."""
+        player_stats = [
+            {
+                "player_id": str(1000 + i),
+                "points": points,
+                "rebounds": 5,
+                "assists": 4,
+                "steals": 1,
+                "blocks": 0,
+                "turnovers": 2,
+                "field_goals_made": 5,
+                "field_goals_attempted": 10,
+            }
+            for i, points in enumerate([10, 12, 11, 13, 15, 50, 14, 12, 13, 11])
+        ]
+        player_stats[2]["field_goals_made"] = 11
+
+        result = self.processor.apply_quality_checks({"player_stats": player_stats})
+
+        assert result["outliers"]["player_5_points"] == 50
+        assert result["player_stats_quality"][2]["made_exceeds_attempted"]
+        assert result["summaries"]["player_stats"]["inconsistent_rows"] == 1
+        assert result["overall_quality"] is True
+
     def test_validate_silver_data_with_processor(self):
         """Test validation integration with SilverProcessor."""
         from app.processors import SilverProcessor
@@ -397,3 +558,46 @@ class TestBronzeToSilverProcessor:
 
         result = processor.validate_silver_data(invalid_data)
         assert result is False
+
+
+class TestBronzeReadsFromS3:
+    """Test paginated, concurrent bronze reads against a mocked S3 bucket."""
+
+    @pytest.fixture
+    def bucket(self):
+        """Create a mocked bronze bucket."""
+        with mock_aws():
+            boto3.client("s3", region_name="us-east-1").create_bucket(
+                Bucket="test-bronze-bucket"
+            )
+            yield "test-bronze-bucket"
+
+    def _put_games(self, bucket, count, prefix="raw/box/2024-01-01/"):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        for n in range(count):
+            s3.put_object(
+                Bucket=bucket,
+                Key=f"{prefix}{n:05d}.json",
+                Body=json.dumps({"game_id": f"{n:05d}"}).encode("utf-8"),
+            )
+
+    def test_reads_past_first_listing_page(self, bucket):
+        """Test that more than 1,000 files are all read, in key order."""
+        self._put_games(bucket, 1005)
+
+        processor = BronzeToSilverProcessor(bucket, read_concurrency=16)
+        result = processor.read_bronze_json("box", date(2024, 1, 1))
+
+        assert [d["game_id"] for d in result] == [f"{n:05d}" for n in range(1005)]
+
+    def test_stream_matches_sequential_read(self, bucket):
+        """Test that the pool width does not change what is read."""
+        self._put_games(bucket, 25)
+        self._put_games(bucket, 3, prefix="raw/box/2024-01-02/")
+
+        sequential = BronzeToSilverProcessor(bucket, read_concurrency=1)
+        parallel = BronzeToSilverProcessor(bucket, read_concurrency=8)
+
+        expected = sequential.read_bronze_json("box", date(2024, 1, 1))
+        assert list(parallel.iter_bronze_json("box", date(2024, 1, 1))) == expected
+        assert len(expected) == 25
@@ -0,0 +1,126 @@
+"""Tests for multiprocess date range execution."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import date_range
+from app.date_range import DateRangeExecutor
+
+DATES = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
+
+
+def _result(target_date: date, success: bool = True) -> dict:
+    return {
+        "date": target_date.isoformat(),
+        "success": success,
+        "games": 1,
+        "dataset_counts": {"player_stats": 2},
+        "dataset_keys": {},
+        "marker_key": None,
+    }
+
+
+class FakeProcessor:
+    """Processor whose dates finish in reverse order, failing on 2024-01-16."""
+
+    def __init__(self):
+        self.marker_dates = []
+
+    def process_date_result(self, target_date, dry_run, league, write_marker):
+        assert write_marker is False
+        # Later dates finish first
+        time.sleep(0.05 * (DATES[-1] - target_date).days)
+        return _result(target_date, success=target_date != date(2024, 1, 16))
+
+    def write_ready_marker(self, target_date, result, league=None):
+        self.marker_dates.append(target_date)
+        return f"metadata/{target_date.isoformat()}/silver-ready.json"
+
+
+@pytest.fixture
+def fake_processor():
+    processor = FakeProcessor()
+    with patch("app.date_range.SilverProcessor", return_value=processor):
+        yield processor
+
+
+class TestDateRangeExecutor:
+    """Test cases for DateRangeExecutor."""
+
+    def test_serial_run_reports_and_writes_markers(self, fake_processor):
+        """Test a single worker processes every date in this process."""
+        executor = DateRangeExecutor("bronze", "silver", max_workers=1)
+        report = executor.run(list(reversed(DATES)))
+
+        assert report["dates"] == 3
+        assert report["succeeded"] == 2
+        assert report["failures"] == ["2024-01-16"]
+        assert report["workers"] == 1
+        assert list(report["results"]) == [d.isoformat() for d in DATES]
+        assert all("seconds" in r for r in report["results"].values())
+        assert fake_processor.marker_dates == [date(2024, 1, 15), date(2024, 1, 17)]
+        assert report["markers"] == [
+            "metadata/2024-01-15/silver-ready.json",
+            "metadata/2024-01-17/silver-ready.json",
+        ]
+
+    def test_markers_written_in_date_order(self, fake_processor):
+        """Test markers follow date order when later dates finish first."""
+        executor = DateRangeExecutor("bronze", "silver", max_workers=3)
+
+        with (
+            patch.object(
+                DateRangeExecutor,
+                "_start_pool",
+                side_effect=lambda workers: ThreadPoolExecutor(workers),
+            ),
+            patch.object(date_range, "_worker_processor", fake_processor),
+        ):
+            report = executor.run(DATES)
+
+        assert report["workers"] == 3
+        assert report["failures"] == ["2024-01-16"]
+        assert fake_processor.marker_dates == [date(2024, 1, 15), date(2024, 1, 17)]
+
+    def test_dry_run_writes_no_markers(self, fake_processor):
+        """Test a dry run never triggers Gold."""
+        executor = DateRangeExecutor("bronze", "silver", max_workers=1)
+        report = executor.run(DATES, dry_run=True)
+
+        assert report["markers"] == []
+        assert fake_processor.marker_dates == []
+
+    def test_falls_back_to_serial_without_process_pool(self, fake_processor):
+        """Test processing continues serially where no pool can be created."""
+        executor = DateRangeExecutor("bronze", "silver", max_workers=4)
+
+        with patch(
+            "app.date_range.ProcessPoolExecutor",
+            side_effect=OSError(38, "Function not implemented"),
+        ):
+            report = executor.run(DATES)
+
+        assert report["workers"] == 1
+        assert report["succeeded"] == 2
+
+    @patch.dict("os.environ", {"SILVER_RANGE_WORKERS": "3"})
+    def test_workers_from_env(self, fake_processor):
+        """Test the worker count can be set with SILVER_RANGE_WORKERS."""
+        assert DateRangeExecutor("bronze", "silver").max_workers == 3
+
+    def test_worker_processes(self):
+        """Test dates are processed in spawned worker processes."""
+        # Without a Bronze bucket every date fails fast, with no S3 access
+        executor = DateRangeExecutor(None, None, max_workers=2)
+        executor.processor = MagicMock()
+
+        report = executor.run(DATES)
+
+        assert report["workers"] == 2
+        assert report["failures"] == [d.isoformat() for d in DATES]
+        assert report["results"]["2024-01-15"]["games"] == 0
+        executor.processor.write_ready_marker.assert_not_called()
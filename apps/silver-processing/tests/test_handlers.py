@@ -86,7 +86,164 @@ class TestLambdaHandler:
 
             # Verify the processor was called with the correct date
             mock_processor.process_date.assert_called_once_with(
-                date(2024, 1, 15), dry_run=False
+                date(2024, 1, 15), dry_run=False, overwrite=True
+            )
+
+    @patch("app.handlers.SilverS3Manager")
+    @patch.dict(
+        "os.environ",
+        {"BRONZE_BUCKET": "test-bucket", "SILVER_BUCKET": "test-silver-bucket"},
+    )
+    def test_lambda_handler_correction_notice(self, mock_s3_manager):
+        """Test that a correction notice reprocesses the date in its key."""
+        mock_manager = MagicMock()
+        # A notice that doesn't list its games reprocesses the whole date
+        mock_manager.read_summary_json.return_value = {"date": "2024-01-13"}
+        mock_s3_manager.return_value = mock_manager
+
+        with patch("app.handlers.SilverProcessor") as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor.process_date.return_value = True
+            mock_processor_class.return_value = mock_processor
+
+            event = {
+                "Records": [
+                    {
+                        "eventSource": "aws:s3",
+                        "s3": {
+                            "bucket": {"name": "test-bucket"},
+                            "object": {
+                                "key": "_metadata/corrections/2024-01-13/summary.json"
+                            },
+                        },
+                    }
+                ]
+            }
+            result = lambda_handler(event, {})
+
+            assert result["statusCode"] == 200
+            assert "2024-01-13" in result["message"]
+            mock_processor.process_date.assert_called_once_with(
+                date(2024, 1, 13), dry_run=False, overwrite=True
+            )
+            mock_manager.read_summary_json.assert_called_once_with(
+                "_metadata/corrections/2024-01-13/summary.json"
+            )
+
+    @patch("app.handlers.SilverS3Manager")
+    @patch.dict(
+        "os.environ",
+        {"BRONZE_BUCKET": "test-bucket", "SILVER_BUCKET": "test-silver-bucket"},
+    )
+    def test_lambda_handler_correction_notice_games(self, mock_s3_manager):
+        """Test that only the games listed in a correction notice are merged."""
+        mock_manager = MagicMock()
+        mock_manager.read_summary_json.return_value = {
+            "date": "2024-01-13",
+            "corrected_game_ids": ["0022300501", "0022300507"],
+        }
+        mock_s3_manager.return_value = mock_manager
+
+        with patch("app.handlers.SilverProcessor") as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor.process_games.return_value = {
+                "0022300501": True,
+                "0022300507": False,
+            }
+            mock_processor_class.return_value = mock_processor
+
+            event = {
+                "Records": [
+                    {
+                        "eventSource": "aws:s3",
+                        "s3": {
+                            "bucket": {"name": "test-bucket"},
+                            "object": {
+                                "key": "_metadata/corrections/2024-01-13/summary.json"
+                            },
+                        },
+                    }
+                ]
+            }
+            result = lambda_handler(event, {})
+
+            assert result["statusCode"] == 500
+            assert "2024-01-13" in result["message"]
+            mock_processor.process_games.assert_called_once_with(
+                ["0022300501", "0022300507"], target_date=date(2024, 1, 13)
+            )
+            mock_processor.process_date.assert_not_called()
+
+    @patch("app.handlers.SilverS3Manager")
+    @patch.dict(
+        "os.environ",
+        {"BRONZE_BUCKET": "test-bucket", "SILVER_BUCKET": "test-silver-bucket"},
+    )
+    def test_lambda_handler_league_summary_update(self, mock_s3_manager):
+        """Test that a league's summary processes that league's partition."""
+        mock_manager = MagicMock()
+        mock_manager.read_summary_json.return_value = {
+            "bronze_layer_stats": {"last_ingestion_date": "2024-06-01"}
+        }
+        mock_s3_manager.return_value = mock_manager
+
+        with patch("app.handlers.SilverProcessor") as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor.process_date.return_value = True
+            mock_processor_class.return_value = mock_processor
+
+            event = {
+                "Records": [
+                    {
+                        "eventSource": "aws:s3",
+                        "s3": {
+                            "bucket": {"name": "test-bucket"},
+                            "object": {"key": "_metadata/leagues/wnba/summary.json"},
+                        },
+                    }
+                ]
+            }
+            result = lambda_handler(event, {})
+
+            assert result["statusCode"] == 200
+            mock_manager.read_summary_json.assert_called_once_with(
+                "_metadata/leagues/wnba/summary.json"
+            )
+            mock_processor.process_date.assert_called_once_with(
+                date(2024, 6, 1), dry_run=False, overwrite=True, league="wnba"
+            )
+
+    @patch("app.handlers.SilverS3Manager")
+    @patch.dict(
+        "os.environ",
+        {"BRONZE_BUCKET": "test-bucket", "SILVER_BUCKET": "test-silver-bucket"},
+    )
+    def test_lambda_handler_league_correction_notice(self, mock_s3_manager):
+        """Test that a league's correction notice reprocesses that league."""
+        mock_s3_manager.return_value = MagicMock()
+
+        with patch("app.handlers.SilverProcessor") as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor.process_date.return_value = True
+            mock_processor_class.return_value = mock_processor
+
+            key = "_metadata/leagues/wnba/corrections/2024-05-30/summary.json"
+            event = {
+                "Records": [
+                    {
+                        "eventSource": "aws:s3",
+                        "s3": {
+                            "bucket": {"name": "test-bucket"},
+                            "object": {"key": key},
+                        },
+                    }
+                ]
+            }
+            result = lambda_handler(event, {})
+
+            assert result["statusCode"] == 200
+            mock_processor.process_date.assert_called_once_with(
+                date(2024, 5, 30), dry_run=False, overwrite=True, league="wnba"
             )
 
     @patch("app.handlers.SilverS3Manager")
@@ -243,10 +400,14 @@ class TestLambdaHandler:
     )
     def test_lambda_handler_manual_date_range(self):
         """Test Lambda handler with manual date range invocation."""
-        with patch("app.handlers.SilverProcessor") as mock_processor_class:
-            mock_processor = MagicMock()
-            mock_processor.process_date.return_value = True
-            mock_processor_class.return_value = mock_processor
+        with patch("app.handlers.DateRangeExecutor") as mock_executor_class:
+            mock_executor = MagicMock()
+            mock_executor.run.return_value = {
+                "failures": [],
+                "workers": 3,
+                "seconds": 1.5,
+            }
+            mock_executor_class.return_value = mock_executor
 
             event = {
                 "source": "github-actions-manual",
@@ -263,15 +424,13 @@ class TestLambdaHandler:
             assert result["statusCode"] == 200
             assert result["start_date"] == "2024-01-15"
             assert result["end_date"] == "2024-01-17"
-            assert mock_processor.process_date.call_count == 3
-            mock_processor.process_date.assert_any_call(
-                date(2024, 1, 15), dry_run=False
+            assert result["workers"] == 3
+            mock_executor_class.assert_called_once_with(
+                bronze_bucket="test-bucket", silver_bucket="test-silver-bucket"
             )
-            mock_processor.process_date.assert_any_call(
-                date(2024, 1, 16), dry_run=False
-            )
-            mock_processor.process_date.assert_any_call(
-                date(2024, 1, 17), dry_run=False
+            mock_executor.run.assert_called_once_with(
+                [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)],
+                dry_run=False,
             )
 
     @patch.dict(
@@ -392,11 +551,15 @@ class TestLambdaHandler:
     )
     def test_lambda_handler_manual_date_range_partial_failures(self):
         """Test Lambda handler with date range where some dates fail."""
-        with patch("app.handlers.SilverProcessor") as mock_processor_class:
-            mock_processor = MagicMock()
+        with patch("app.handlers.DateRangeExecutor") as mock_executor_class:
+            mock_executor = MagicMock()
             # Simulate failure for the second date
-            mock_processor.process_date.side_effect = [True, False, True]
-            mock_processor_class.return_value = mock_processor
+            mock_executor.run.return_value = {
+                "failures": ["2024-01-16"],
+                "workers": 3,
+                "seconds": 1.5,
+            }
+            mock_executor_class.return_value = mock_executor
 
             event = {
                 "source": "github-actions-manual",
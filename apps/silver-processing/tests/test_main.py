@@ -1,6 +1,8 @@
 """Tests for the main CLI module."""
 
 import json
+from datetime import date
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -59,6 +61,62 @@ class TestCLI:
         result = runner.invoke(cli, ["process", "--dry-run"])
         assert result.exit_code == 1
 
+    @patch("app.main.DateRangeExecutor")
+    def test_process_date_range(self, mock_executor_class):
+        """Test a date range is handed to the range executor."""
+        mock_executor_class.return_value.run.return_value = {"failures": []}
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "process",
+                "--start-date",
+                "2024-01-15",
+                "--end-date",
+                "2024-01-17",
+                "--workers",
+                "2",
+                "--bronze-bucket",
+                "bronze",
+                "--silver-bucket",
+                "silver",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert mock_executor_class.call_args.kwargs["max_workers"] == 2
+        mock_executor_class.return_value.run.assert_called_once_with(
+            [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)], dry_run=False
+        )
+
+    @patch("app.main.DateRangeExecutor")
+    def test_process_date_range_failures(self, mock_executor_class):
+        """Test a range with failed dates exits non-zero."""
+        mock_executor_class.return_value.run.return_value = {"failures": ["2024-01-16"]}
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "process",
+                "--start-date",
+                "2024-01-15",
+                "--end-date",
+                "2024-01-17",
+                "--bronze-bucket",
+                "bronze",
+                "--silver-bucket",
+                "silver",
+            ],
+        )
+
+        assert result.exit_code == 1
+
+    def test_process_requires_both_range_dates(self):
+        """Test a range needs both a start and an end date."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["process", "--start-date", "2024-01-15"])
+        assert result.exit_code == 1
+
     def test_status_missing_silver_bucket(self):
         """Test that status command requires silver bucket."""
         runner = CliRunner()
@@ -1,9 +1,68 @@
 """Tests for the processors module."""
 
+import base64
+import hashlib
+import io
+import json
 from datetime import date
 from unittest.mock import MagicMock, patch
 
-from app.processors import SilverProcessor
+import boto3
+import pyarrow.parquet as pq
+from hoopstat_data import GameStats, PlayerStats, TeamStats
+from moto import mock_aws
+
+from app.handlers import lambda_handler
+from app.processors import SILVER_SCHEMAS, SilverProcessor
+
+
+def _bronze_game(game_id: int, points: int) -> dict:
+    """Build a Bronze box score with one home player scoring ``points``."""
+    return {
+        "game_id": game_id,
+        "home_team": {"id": 1, "name": "Los Angeles Lakers"},
+        "away_team": {"id": 2, "name": "Boston Celtics"},
+        "home_team_stats": {"points": 108},
+        "away_team_stats": {"points": 102},
+        "home_players": [
+            {
+                "player_id": game_id * 10,
+                "player_name": "A",
+                "team": "Lakers",
+                "position": "G",
+                "points": points,
+            }
+        ],
+        "away_players": [],
+    }
+
+
+def _create_buckets():
+    """Create the Bronze and Silver buckets in mocked S3."""
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    s3_client.create_bucket(Bucket="test-bronze-bucket")
+    s3_client.create_bucket(Bucket="test-silver-bucket")
+    return s3_client
+
+
+def _put_bronze_game(s3_client, game_id: int, points: int) -> None:
+    """Store a Bronze box score for 2024-01-01."""
+    s3_client.put_object(
+        Bucket="test-bronze-bucket",
+        Key=f"raw/box/2024-01-01/{game_id}.json",
+        Body=json.dumps(_bronze_game(game_id, points)),
+    )
+
+
+def _silver_points(s3_client) -> dict[str, int]:
+    """Read the points of each game's player from Silver for 2024-01-01."""
+    response = s3_client.get_object(
+        Bucket="test-silver-bucket",
+        Key="silver/player_stats/2024-01-01/player_stats.json",
+    )
+    return {
+        row["game_id"]: row["points"] for row in json.loads(response["Body"].read())
+    }
 
 
 class TestSilverProcessor:
@@ -47,12 +106,125 @@ class TestSilverProcessor:
         assert results == {}
 
     def test_process_games_with_ids(self):
-        """Test processing specific game IDs."""
+        """Test games can't be processed without a Bronze bucket and a date."""
         processor = SilverProcessor()
         game_ids = ["game1", "game2"]
         results = processor.process_games(game_ids, dry_run=True)
-        assert len(results) == 2
-        assert all(results.values())  # All should be True
+        assert results == {"game1": False, "game2": False}
+
+    def test_process_date_overwrite_replaces_existing_partition(self):
+        """Test a rebuild with overwrite replaces Silver written earlier."""
+        with mock_aws():
+            s3_client = _create_buckets()
+            processor = SilverProcessor(
+                bronze_bucket="test-bronze-bucket",
+                silver_bucket="test-silver-bucket",
+                output_format="json",
+            )
+
+            _put_bronze_game(s3_client, 101, 10)
+            assert processor.process_date(date(2024, 1, 1)) is True
+
+            _put_bronze_game(s3_client, 101, 31)
+            # By default the existing partition is kept
+            assert processor.process_date(date(2024, 1, 1)) is True
+            assert _silver_points(s3_client) == {"101": 10}
+
+            assert processor.process_date(date(2024, 1, 1), overwrite=True) is True
+            assert _silver_points(s3_client) == {"101": 31}
+
+    def test_process_games_merges_into_partition(self):
+        """Test corrected games replace only their own rows in Silver."""
+        target_date = date(2024, 1, 1)
+        players_key = "silver/player_stats/2024-01-01/player_stats.json"
+
+        with mock_aws():
+            s3_client = _create_buckets()
+
+            _put_bronze_game(s3_client, 101, 20)
+            _put_bronze_game(s3_client, 102, 30)
+            processor = SilverProcessor(
+                bronze_bucket="test-bronze-bucket",
+                silver_bucket="test-silver-bucket",
+                output_format="json",
+            )
+            assert processor.process_date(target_date) is True
+
+            # A stat correction for one game, and a late game
+            _put_bronze_game(s3_client, 102, 33)
+            _put_bronze_game(s3_client, 103, 12)
+            with patch.object(
+                processor.bronze_to_silver_processor,
+                "iter_bronze_json",
+                side_effect=AssertionError("whole date re-read"),
+            ):
+                results = processor.process_games(
+                    ["102", "103", "999"], target_date=target_date
+                )
+
+            assert results == {"102": True, "103": True, "999": False}
+
+            response = s3_client.get_object(
+                Bucket="test-silver-bucket", Key=players_key
+            )
+            body = response["Body"].read()
+            players = {row["game_id"]: row["points"] for row in json.loads(body)}
+            assert players == {"101": 20, "102": 33, "103": 12}
+            head = s3_client.head_object(
+                Bucket="test-silver-bucket", Key=players_key, ChecksumMode="ENABLED"
+            )
+            assert head["ChecksumSHA256"] == base64.b64encode(
+                hashlib.sha256(body).digest()
+            ).decode("ascii")
+
+            games = s3_client.get_object(
+                Bucket="test-silver-bucket",
+                Key="silver/game_stats/2024-01-01/game_stats.json",
+            )
+            assert len(json.loads(games["Body"].read())) == 3
+
+            marker = s3_client.get_object(
+                Bucket="test-silver-bucket",
+                Key="metadata/2024-01-01/silver-ready.json",
+            )
+            marker_data = json.loads(marker["Body"].read())
+            assert marker_data["dataset_counts"]["player_stats"] == 3
+            assert marker_data["dataset_keys"]["player_stats"] == players_key
+
+    def test_process_games_merges_across_output_formats(self):
+        """Test a merge after a format switch keeps the other format's rows."""
+        target_date = date(2024, 1, 1)
+
+        with mock_aws():
+            s3_client = _create_buckets()
+
+            _put_bronze_game(s3_client, 101, 20)
+            _put_bronze_game(s3_client, 102, 30)
+            json_processor = SilverProcessor(
+                bronze_bucket="test-bronze-bucket",
+                silver_bucket="test-silver-bucket",
+                output_format="json",
+            )
+            assert json_processor.process_date(target_date) is True
+
+            _put_bronze_game(s3_client, 102, 33)
+            parquet_processor = SilverProcessor(
+                bronze_bucket="test-bronze-bucket",
+                silver_bucket="test-silver-bucket",
+                output_format="parquet",
+            )
+            results = parquet_processor.process_games(["102"], target_date=target_date)
+
+            assert results == {"102": True}
+            response = s3_client.get_object(
+                Bucket="test-silver-bucket",
+                Key="silver/player_stats/2024-01-01/player_stats.parquet",
+            )
+            rows = pq.read_table(io.BytesIO(response["Body"].read())).to_pylist()
+            assert {row["game_id"]: row["points"] for row in rows} == {
+                "101": 20,
+                "102": 33,
+            }
 
     def test_validate_silver_data(self):
         """Test Silver data validation."""
@@ -60,3 +232,184 @@ class TestSilverProcessor:
         test_data = {"test": "data"}
         result = processor.validate_silver_data(test_data)
         assert result is True
+
+    @patch("app.processors.SilverS3Manager")
+    def test_process_date_validates_each_row_once(self, mock_s3_manager):
+        """Test that transformed rows are written without a second validation."""
+        mock_manager = MagicMock()
+        mock_s3_manager.return_value = mock_manager
+        mock_manager.write_partitioned_silver_data.return_value = {}
+
+        bronze_game = {
+            "game_id": 123,
+            "home_team": {"id": 1, "name": "Los Angeles Lakers"},
+            "away_team": {"id": 2, "name": "Boston Celtics"},
+            "home_team_stats": {"points": 108},
+            "away_team_stats": {"points": 102},
+            "home_players": [
+                {
+                    "player_id": 1001,
+                    "player_name": "A",
+                    "team": "Lakers",
+                    "position": "G",
+                }
+            ],
+            "away_players": [
+                {
+                    "player_id": 2001,
+                    "player_name": "B",
+                    "team": "Celtics",
+                    "position": "F",
+                }
+            ],
+        }
+
+        processor = SilverProcessor(bronze_bucket="test-bronze-bucket")
+        with (
+            patch.object(
+                processor.bronze_to_silver_processor,
+                "iter_bronze_json",
+                return_value=iter([bronze_game, bronze_game]),
+            ),
+            patch.object(
+                SilverProcessor, "validate_silver_data"
+            ) as validate_silver_data,
+            patch.object(
+                PlayerStats, "__init__", autospec=True, side_effect=PlayerStats.__init__
+            ) as player_init,
+            patch.object(
+                TeamStats, "__init__", autospec=True, side_effect=TeamStats.__init__
+            ),
+            patch.object(
+                GameStats, "__init__", autospec=True, side_effect=GameStats.__init__
+            ),
+        ):
+            assert processor.process_date(date(2024, 1, 1)) is True
+
+        validate_silver_data.assert_not_called()
+        assert player_init.call_count == 4
+
+        written = mock_manager.write_partitioned_silver_data.call_args.args[0]
+        assert len(written["player_stats"]) == 4
+        assert len(written["team_stats"]) == 4
+        assert len(written["game_stats"]) == 2
+
+    def test_process_date_writes_parquet(self):
+        """Test Silver rows are written as Parquet with the declared schemas."""
+        bronze_game = {
+            "game_id": 123,
+            "home_team": {"id": 1, "name": "Los Angeles Lakers"},
+            "away_team": {"id": 2, "name": "Boston Celtics"},
+            "home_team_stats": {"points": 108},
+            "away_team_stats": {"points": 102},
+            "home_players": [
+                {
+                    "player_id": 1001,
+                    "player_name": "A",
+                    "team": "Lakers",
+                    "position": "G",
+                    "points": 20,
+                }
+            ],
+            "away_players": [
+                {
+                    "player_id": 2001,
+                    "player_name": "B",
+                    "team": "Celtics",
+                    "position": "F",
+                    "points": 18,
+                }
+            ],
+        }
+
+        with mock_aws():
+            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client.create_bucket(Bucket="test-bronze-bucket")
+            s3_client.create_bucket(Bucket="test-silver-bucket")
+
+            processor = SilverProcessor(
+                bronze_bucket="test-bronze-bucket",
+                silver_bucket="test-silver-bucket",
+                output_format="parquet",
+                parquet_compression="zstd",
+            )
+            with patch.object(
+                processor.bronze_to_silver_processor,
+                "iter_bronze_json",
+                return_value=iter([bronze_game]),
+            ):
+                assert processor.process_date(date(2024, 1, 1)) is True
+
+            for dataset, rows in (
+                ("player_stats", 2),
+                ("team_stats", 2),
+                ("game_stats", 1),
+            ):
+                key = f"silver/{dataset}/2024-01-01/{dataset}.parquet"
+                body = s3_client.get_object(Bucket="test-silver-bucket", Key=key)
+                table = pq.read_table(io.BytesIO(body["Body"].read()))
+                assert table.schema == SILVER_SCHEMAS[dataset]
+                assert table.num_rows == rows
+
+            marker = s3_client.get_object(
+                Bucket="test-silver-bucket",
+                Key="metadata/2024-01-01/silver-ready.json",
+            )
+            marker_data = json.loads(marker["Body"].read())
+            assert marker_data["format"] == "parquet"
+            assert set(marker_data["dataset_keys"]) == set(SILVER_SCHEMAS)
+
+
+def _bronze_event(s3_client, key: str, body: dict) -> dict:
+    """Store a Bronze metadata object and build the S3 event it triggers."""
+    s3_client.put_object(Bucket="test-bronze-bucket", Key=key, Body=json.dumps(body))
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:s3",
+                "s3": {
+                    "bucket": {"name": "test-bronze-bucket"},
+                    "object": {"key": key},
+                },
+            }
+        ]
+    }
+
+
+class TestBronzeChangesReachSilver:
+    """Test Bronze rewrites of a date are carried through to Silver."""
+
+    @patch.dict(
+        "os.environ",
+        {"BRONZE_BUCKET": "test-bronze-bucket", "SILVER_BUCKET": "test-silver-bucket"},
+    )
+    def test_live_writes_update_silver(self):
+        """Test each live write, and the final summary, changes Silver."""
+        summary = {"bronze_layer_stats": {"last_ingestion_date": "2024-01-01"}}
+        notice_key = "_metadata/corrections/2024-01-01/summary.json"
+
+        with mock_aws():
+            s3_client = _create_buckets()
+
+            # A mid-game snapshot, then the next live write of the same game
+            _put_bronze_game(s3_client, 101, 10)
+            event = _bronze_event(
+                s3_client, notice_key, {"corrected_game_ids": ["101"]}
+            )
+            assert lambda_handler(event, {})["statusCode"] == 200
+            assert _silver_points(s3_client) == {"101": 10}
+
+            _put_bronze_game(s3_client, 101, 31)
+            _put_bronze_game(s3_client, 102, 7)
+            event = _bronze_event(
+                s3_client, notice_key, {"corrected_game_ids": ["101", "102"]}
+            )
+            assert lambda_handler(event, {})["statusCode"] == 200
+            assert _silver_points(s3_client) == {"101": 31, "102": 7}
+
+            # The summary written when the run (or the next batch) ends
+            # rebuilds the date from Bronze
+            _put_bronze_game(s3_client, 102, 9)
+            event = _bronze_event(s3_client, "_metadata/summary.json", summary)
+            assert lambda_handler(event, {})["statusCode"] == 200
+            assert _silver_points(s3_client) == {"101": 31, "102": 9}
@@ -5,6 +5,13 @@ A shared library for basketball statistics data processing, validation,
 transformation, quality checking, and Gold layer partitioning.
 """
 
+from .compression import (
+    SUPPORTED_COMPRESSIONS,
+    decode_json,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
 from .models import (
     BoxScoreRaw,
     # Core types
@@ -40,8 +47,14 @@ from .partitioning import (
     create_player_season_partition,
     create_team_daily_partition,
 )
-from .quality import check_data_completeness, detect_outliers
-from .rules_engine import DataCleaningRulesEngine, TransformationResult
+from .quality import check_batch_quality, check_data_completeness, detect_outliers
+from .rules_engine import (
+    CompiledCleaningRules,
+    DataCleaningRulesEngine,
+    TransformationResult,
+    clear_compiled_rules,
+    get_compiled_rules,
+)
 from .transforms import (
     PlayerSeasonAggregator,
     TeamSeasonAggregator,
@@ -124,11 +137,15 @@ __all__ = [
     "PlayerSeasonAggregator",
     "TeamSeasonAggregator",
     # Quality
+    "check_batch_quality",
     "check_data_completeness",
     "detect_outliers",
     # Rules Engine
     "DataCleaningRulesEngine",
     "TransformationResult",
+    "CompiledCleaningRules",
+    "get_compiled_rules",
+    "clear_compiled_rules",
     # Partitioning
     "S3PartitionKey",
     "PartitionType",
@@ -138,4 +155,10 @@ __all__ = [
     "create_player_daily_partition",
     "create_player_season_partition",
     "create_team_daily_partition",
+    # Storage encoding
+    "SUPPORTED_COMPRESSIONS",
+    "encode_json",
+    "decode_json",
+    "object_encoding",
+    "storage_put_args",
 ]
@@ -0,0 +1,153 @@
+"""
+Encoding and decoding of stored JSON payloads.
+
+Bronze objects may be written as pretty-printed JSON (the original format) or
+as compact JSON compressed with gzip or zstd. Readers call ``decode_json``,
+which detects the encoding from the object's metadata or, failing that, from
+the payload's magic bytes, so every format can be read transparently.
+"""
+
+import gzip
+import json
+from typing import Any
+
+# Optional zstd support with graceful fallback
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+SUPPORTED_COMPRESSIONS = (COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_ZSTD)
+
+# Metadata key recording the encoding on stored objects
+COMPRESSION_METADATA_KEY = "compression"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstd compression requires the 'zstandard' package")
+
+
+def encode_json(
+    data: Any, compression: str = COMPRESSION_NONE, default: Any = None
+) -> bytes:
+    """
+    Serialize data to JSON bytes in the given storage encoding.
+
+    Args:
+        data: JSON-serializable data
+        compression: One of "none" (pretty-printed, the legacy format),
+            "gzip" or "zstd" (compact separators, then compressed)
+        default: Optional ``json.dumps`` fallback for non-JSON types
+
+    Returns:
+        Encoded payload
+
+    Raises:
+        ValueError: If the compression is not supported
+        RuntimeError: If zstd is requested but zstandard is not installed
+    """
+    if compression == COMPRESSION_NONE:
+        return json.dumps(data, indent=2, default=default).encode("utf-8")
+
+    if compression not in SUPPORTED_COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression '{compression}', "
+            f"expected one of {', '.join(SUPPORTED_COMPRESSIONS)}"
+        )
+
+    raw = json.dumps(data, separators=(",", ":"), default=default).encode("utf-8")
+    if compression == COMPRESSION_GZIP:
+        # mtime=0 keeps the output deterministic for identical payloads
+        return gzip.compress(raw, compresslevel=6, mtime=0)
+
+    _require_zstd()
+    return zstandard.ZstdCompressor(level=3).compress(raw)
+
+
+def storage_put_args(
+    compression: str, metadata: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """
+    Build the S3 ``put_object`` arguments that record a payload's encoding.
+
+    Args:
+        compression: Encoding the payload was written with
+        metadata: Object metadata to extend
+
+    Returns:
+        ``Metadata`` (and ``ContentEncoding`` for compressed payloads) keyword
+        arguments; uncompressed payloads keep their metadata unchanged
+    """
+    metadata = dict(metadata or {})
+    args: dict[str, Any] = {}
+    if compression != COMPRESSION_NONE:
+        metadata[COMPRESSION_METADATA_KEY] = compression
+        args["ContentEncoding"] = compression
+    if metadata:
+        args["Metadata"] = metadata
+    return args
+
+
+def detect_compression(body: bytes, content_encoding: str | None = None) -> str:
+    """
+    Work out how a stored payload is encoded.
+
+    Args:
+        body: Raw object bytes
+        content_encoding: Encoding recorded on the object, if any
+
+    Returns:
+        One of "none", "gzip" or "zstd"
+    """
+    if content_encoding in (COMPRESSION_GZIP, COMPRESSION_ZSTD):
+        return content_encoding
+    if body.startswith(_GZIP_MAGIC):
+        return COMPRESSION_GZIP
+    if body.startswith(_ZSTD_MAGIC):
+        return COMPRESSION_ZSTD
+    return COMPRESSION_NONE
+
+
+def decode_json(body: bytes, content_encoding: str | None = None) -> Any:
+    """
+    Parse a stored JSON payload, decompressing it first if needed.
+
+    Args:
+        body: Raw object bytes
+        content_encoding: Encoding recorded on the object (``ContentEncoding``
+            or the ``compression`` metadata value), if any
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+        RuntimeError: If the payload is zstd and zstandard is not installed
+    """
+    compression = detect_compression(body, content_encoding)
+    if compression == COMPRESSION_GZIP:
+        body = gzip.decompress(body)
+    elif compression == COMPRESSION_ZSTD:
+        _require_zstd()
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return json.loads(body)
+
+
+def object_encoding(response: dict[str, Any]) -> str | None:
+    """
+    Get the recorded encoding from an S3 ``get_object``/``head_object`` response.
+
+    Returns:
+        The ``compression`` metadata value or ``ContentEncoding``, if present
+    """
+    metadata = response.get("Metadata") or {}
+    return metadata.get(COMPRESSION_METADATA_KEY) or response.get("ContentEncoding")
@@ -7,10 +7,51 @@ and ensuring data consistency across datasets.
 
 import logging
 from statistics import mean, stdev
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REQUIRED_FIELDS = [
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+]
+
+# Counting stats checked for negatives and outliers when present in a batch
+DEFAULT_STAT_COLUMNS = [
+    "points",
+    "rebounds",
+    "offensive_rebounds",
+    "defensive_rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_pointers_made",
+    "three_pointers_attempted",
+    "free_throws_made",
+    "free_throws_attempted",
+    "minutes_played",
+]
+
+# (made, attempted) column pairs where made may never exceed attempted
+SHOOTING_PAIRS = [
+    ("field_goals_made", "field_goals_attempted"),
+    ("three_pointers_made", "three_pointers_attempted"),
+    ("free_throws_made", "free_throws_attempted"),
+]
+
+MAX_MINUTES_PLAYED = 48.0
+
 
 def check_data_completeness(
     data: dict[str, Any], required_fields: list[str] | None = None
@@ -31,14 +72,7 @@ def check_data_completeness(
         # Returns completeness metrics dict
     """
     if required_fields is None:
-        required_fields = [
-            "points",
-            "rebounds",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-        ]
+        required_fields = DEFAULT_REQUIRED_FIELDS
 
     total_fields = len(required_fields)
     complete_fields = 0
@@ -327,3 +361,179 @@ def compare_stat_distributions(
     except Exception as e:
         logger.error(f"Error comparing distributions: {e}")
         return {"error": str(e)}
+
+
+def check_batch_quality(
+    data: Any,
+    required_fields: list[str] | None = None,
+    stat_columns: list[str] | None = None,
+    outlier_method: str = "iqr",
+    outlier_threshold: float = 1.5,
+    percentage_bounds: tuple[float, float] = (0.0, 1.0),
+    max_minutes: float = MAX_MINUTES_PLAYED,
+) -> dict[str, Any]:
+    """
+    Run completeness, consistency and outlier checks over a whole batch.
+
+    The batch equivalent of ``check_data_completeness``, ``detect_outliers``
+    and ``validate_stat_consistency``: every check is evaluated column-wise
+    over all rows at once instead of record by record.
+
+    Args:
+        data: pandas DataFrame, Arrow table (anything with ``to_pandas``) or
+            list of record dictionaries
+        required_fields: Fields counted for completeness (defaults to the
+            same fields as ``check_data_completeness``)
+        stat_columns: Numeric columns checked for negatives and outliers
+            (defaults to the counting stats present in the batch)
+        outlier_method: Outlier detection method ("iqr" or "zscore")
+        outlier_threshold: Threshold for outlier detection
+        percentage_bounds: Inclusive bounds for ``*_percentage``/``*_pct``
+            columns
+        max_minutes: Upper bound for ``minutes_played``
+
+    Returns:
+        Dictionary with a ``flags`` DataFrame (one row per input row, same
+        index) and a ``summary`` of counts per check
+
+    Example:
+        >>> rows = [{"points": p} for p in [10, 12, 11, 13, 15, 50, 14]]
+        >>> result = check_batch_quality(rows)  # doctest: +SKIP
+        >>> result["summary"]["outliers"]  # doctest: +SKIP
+        {'points': [5]}
+    """
+    import numpy as np
+    import pandas as pd
+
+    if outlier_method not in ("iqr", "zscore"):
+        raise ValueError(f"Invalid outlier_method: {outlier_method}")
+
+    df = _to_frame(data)
+
+    if required_fields is None:
+        required_fields = DEFAULT_REQUIRED_FIELDS
+    if stat_columns is None:
+        stat_columns = [col for col in DEFAULT_STAT_COLUMNS if col in df.columns]
+    else:
+        stat_columns = [col for col in stat_columns if col in df.columns]
+
+    flags = pd.DataFrame(index=df.index)
+
+    # Completeness: a field missing from the batch is missing on every row
+    present = [field for field in required_fields if field in df.columns]
+    complete_fields = (
+        df[present].notna().sum(axis=1) if present else pd.Series(0, index=df.index)
+    )
+    total_fields = len(required_fields)
+    ratio = complete_fields / total_fields if total_fields else complete_fields * 0.0
+    flags["completeness_ratio"] = ratio.astype(float).round(2)
+    flags["is_complete"] = complete_fields == total_fields
+
+    numeric = {col: pd.to_numeric(df[col], errors="coerce") for col in stat_columns}
+    no_rows = pd.Series(False, index=df.index)
+
+    # Consistency
+    negative_values = {}
+    negative = no_rows.copy()
+    for col, values in numeric.items():
+        mask = values < 0
+        if mask.any():
+            negative_values[col] = int(mask.sum())
+            negative |= mask
+    flags["negative_stats"] = negative
+
+    made_exceeds_attempted = {}
+    shooting = no_rows.copy()
+    for made_col, attempted_col in SHOOTING_PAIRS:
+        if made_col in df.columns and attempted_col in df.columns:
+            made = pd.to_numeric(df[made_col], errors="coerce")
+            attempted = pd.to_numeric(df[attempted_col], errors="coerce")
+            mask = made > attempted
+            if mask.any():
+                made_exceeds_attempted[made_col] = int(mask.sum())
+                shooting |= mask
+    flags["made_exceeds_attempted"] = shooting
+
+    low, high = percentage_bounds
+    percentage_out_of_bounds = {}
+    percentage = no_rows.copy()
+    for col in df.columns:
+        if isinstance(col, str) and col.endswith(("_percentage", "_pct")):
+            values = pd.to_numeric(df[col], errors="coerce")
+            mask = (values < low) | (values > high)
+            if mask.any():
+                percentage_out_of_bounds[col] = int(mask.sum())
+                percentage |= mask
+    flags["percentage_out_of_bounds"] = percentage
+
+    if "minutes_played" in df.columns:
+        minutes = pd.to_numeric(df["minutes_played"], errors="coerce")
+        flags["minutes_out_of_range"] = (minutes < 0) | (minutes > max_minutes)
+    else:
+        flags["minutes_out_of_range"] = no_rows
+
+    flags["inconsistent"] = (
+        flags["negative_stats"]
+        | flags["made_exceeds_attempted"]
+        | flags["percentage_out_of_bounds"]
+        | flags["minutes_out_of_range"]
+    )
+
+    # Outliers, using the same bounds as detect_outliers for each column
+    outliers = {}
+    outlier = no_rows.copy()
+    for col, values in numeric.items():
+        observed = values.dropna().to_numpy(dtype=float)
+        if len(observed) < 3:
+            continue
+
+        if outlier_method == "iqr":
+            ordered = np.sort(observed)
+            n = len(ordered)
+            q1 = ordered[n // 4]
+            q3 = ordered[3 * n // 4]
+            iqr = q3 - q1
+            mask = (values < q1 - outlier_threshold * iqr) | (
+                values > q3 + outlier_threshold * iqr
+            )
+        else:
+            std = observed.std(ddof=1)
+            if std == 0:
+                continue
+            mask = ((values - observed.mean()) / std).abs() > outlier_threshold
+
+        if mask.any():
+            outliers[col] = df.index[mask.to_numpy()].tolist()
+            outlier |= mask
+    flags["outlier"] = outlier
+
+    flags["flagged"] = ~flags["is_complete"] | flags["inconsistent"] | outlier
+
+    summary = {
+        "rows": len(df),
+        "average_completeness": (
+            float(flags["completeness_ratio"].mean()) if len(df) else 0.0
+        ),
+        "complete_rows": int(flags["is_complete"].sum()),
+        "negative_values": negative_values,
+        "made_exceeds_attempted": made_exceeds_attempted,
+        "percentage_out_of_bounds": percentage_out_of_bounds,
+        "minutes_out_of_range": int(flags["minutes_out_of_range"].sum()),
+        "inconsistent_rows": int(flags["inconsistent"].sum()),
+        "outliers": outliers,
+        "outlier_rows": int(outlier.sum()),
+        "flagged_rows": int(flags["flagged"].sum()),
+    }
+
+    return {"flags": flags, "summary": summary}
+
+
+def _to_frame(data: Any) -> "pd.DataFrame":
+    """Coerce a DataFrame, Arrow table or list of records into a DataFrame."""
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        return data
+    if hasattr(data, "to_pandas"):
+        return data.to_pandas()
+    return pd.DataFrame(list(data or []))
@@ -6,9 +6,12 @@ and conforming transformations to NBA data.
 """
 
 import logging
+import os
 import re
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +21,14 @@ from fuzzywuzzy import process
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_PATH = str(Path(__file__).parent / "config" / "cleaning_rules.yaml")
+
+# Distinct team names and positions remembered per compiled configuration
+STANDARDIZATION_CACHE_SIZE = 4096
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_NUMERIC_FORMAT_PATTERN = re.compile(r"[,$%]")
+
 
 class TransformationResult:
     """Result of a data transformation operation."""
@@ -40,12 +51,187 @@ class TransformationResult:
         self.timestamp = datetime.utcnow().isoformat()
 
 
+class CompiledCleaningRules:
+    """
+    A cleaning rules configuration parsed and prepared for repeated use.
+
+    Built once per configuration file by ``get_compiled_rules`` and shared by
+    every engine and transform in the process, so it must be treated as
+    read-only. Team name and position standardization are memoized, since a
+    season of box scores repeats the same few dozen values.
+    """
+
+    def __init__(self, config_path: str, config: dict[str, Any]):
+        """
+        Prepare the lookups of a loaded configuration.
+
+        Args:
+            config_path: Path the configuration was loaded from
+            config: Parsed YAML configuration
+        """
+        self.config_path = config_path
+        self.config = config
+
+        logging_config = config.get("logging", {})
+        self.log_level = getattr(logging, logging_config.get("level", "INFO"))
+        self.log_transformations = logging_config.get("log_transformations", False)
+
+        self.team_name_mappings: dict[str, str] = config.get("team_name_mappings", {})
+        self.official_team_names: list[str] = config.get("official_team_names", [])
+        fuzzy_config = config.get("fuzzy_matching", {})
+        self.fuzzy_config: dict[str, Any] = fuzzy_config
+        # None when fuzzy team name matching is disabled
+        self.team_name_threshold: int | None = (
+            fuzzy_config["team_name_threshold"]
+            if "team_name" in fuzzy_config.get("enabled_fields", [])
+            else None
+        )
+
+        self.position_mappings: dict[str, str] = config.get("position_mappings", {})
+        # Partial matches are tried in configuration order
+        self.position_items = tuple(self.position_mappings.items())
+
+        null_config = config.get("null_handling", {})
+        self.required_fields: dict[str, list[str]] = null_config.get(
+            "required_fields", {}
+        )
+        self.default_values: dict[str, Any] = null_config.get("default_values", {})
+
+        data_types = config.get("data_types", {})
+        self.numeric_fields = frozenset(data_types.get("numeric_fields", []))
+        self.date_fields = frozenset(data_types.get("date_fields", []))
+        self.numeric_validation: dict[str, dict] = config.get("numeric_validation", {})
+
+        datetime_formats = config.get("datetime_formats", {})
+        self.input_formats = tuple(datetime_formats.get("input_formats", []))
+        self.output_format = datetime_formats.get("output_format", "%Y-%m-%dT%H:%M:%SZ")
+
+        # lru_cache is thread-safe; a cache per instance keeps a reloaded
+        # configuration from serving the previous file's answers
+        self.standardize_team_name = lru_cache(maxsize=STANDARDIZATION_CACHE_SIZE)(
+            self._standardize_team_name
+        )
+        self.standardize_position = lru_cache(maxsize=STANDARDIZATION_CACHE_SIZE)(
+            self._standardize_position
+        )
+
+    def _standardize_team_name(
+        self, team_name: str, use_fuzzy_matching: bool = True
+    ) -> tuple[str, tuple[str, ...]]:
+        """
+        Standardize a team name.
+
+        Returns:
+            Tuple of (standardized name, applied rules)
+        """
+        cleaned_name = _WHITESPACE_PATTERN.sub(" ", team_name.strip().lower())
+
+        if cleaned_name in self.team_name_mappings:
+            return self.team_name_mappings[cleaned_name], (
+                "whitespace_normalization",
+                "direct_mapping",
+            )
+
+        if (
+            use_fuzzy_matching
+            and self.team_name_threshold is not None
+            and self.official_team_names
+        ):
+            best_match = process.extractOne(cleaned_name, self.official_team_names)
+            if best_match and best_match[1] >= self.team_name_threshold:
+                return best_match[0], (
+                    "whitespace_normalization",
+                    f"fuzzy_matching_{best_match[1]}",
+                )
+
+        cleaned_title_case = " ".join(
+            word.capitalize() for word in cleaned_name.split()
+        )
+        return cleaned_title_case, ("whitespace_normalization", "title_case_fallback")
+
+    def _standardize_position(self, position: str) -> tuple[str, tuple[str, ...]]:
+        """
+        Standardize a player position.
+
+        Returns:
+            Tuple of (standardized position, applied rules)
+        """
+        cleaned_position = position.strip().lower()
+
+        if cleaned_position in self.position_mappings:
+            return self.position_mappings[cleaned_position], (
+                "normalization",
+                "direct_mapping",
+            )
+
+        for key, value in self.position_items:
+            if key in cleaned_position:
+                return value, ("normalization", "partial_mapping")
+
+        return "UNKNOWN", ("normalization", "unknown_fallback")
+
+
+_compiled_rules: dict[str, tuple[int, CompiledCleaningRules]] = {}
+_compiled_rules_lock = threading.Lock()
+
+
+def _load_rules_file(config_path: str) -> dict[str, Any]:
+    """Parse a cleaning rules YAML file."""
+    try:
+        with open(config_path) as file:
+            config = yaml.safe_load(file)
+        logger.info(f"Loaded configuration from {config_path}")
+        return config
+    except Exception as e:
+        logger.error(f"Failed to load configuration from {config_path}: {e}")
+        raise
+
+
+def get_compiled_rules(config_path: str | None = None) -> CompiledCleaningRules:
+    """
+    Get the compiled rules of a configuration file, compiling them at most once.
+
+    Rules are cached per process by path and modification time, so an edited
+    file is picked up on the next call while an unchanged one is never parsed
+    again.
+
+    Args:
+        config_path: Path to YAML configuration file. If None, uses default.
+
+    Returns:
+        Shared CompiledCleaningRules for the file's current contents
+    """
+    path = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError as e:
+        logger.error(f"Failed to load configuration from {path}: {e}")
+        raise
+
+    with _compiled_rules_lock:
+        cached = _compiled_rules.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        rules = CompiledCleaningRules(path, _load_rules_file(path))
+        _compiled_rules[path] = (mtime, rules)
+        return rules
+
+
+def clear_compiled_rules() -> None:
+    """Drop every cached configuration, e.g. between tests."""
+    with _compiled_rules_lock:
+        _compiled_rules.clear()
+
+
 class DataCleaningRulesEngine:
     """
     Configurable rules engine for data cleaning and standardization.
 
     Applies data cleaning, standardization, and conforming transformations
-    to NBA data based on configurable YAML rules.
+    to NBA data based on configurable YAML rules. Engines are cheap to create:
+    the rules come from the process-wide ``get_compiled_rules`` cache, and
+    each engine only owns its transformation log.
     """
 
     def __init__(self, config_path: str | None = None):
@@ -55,32 +241,16 @@ class DataCleaningRulesEngine:
         Args:
             config_path: Path to YAML configuration file. If None, uses default.
         """
-        self.config_path = config_path or self._get_default_config_path()
-        self.config = self._load_configuration()
+        self.rules = get_compiled_rules(config_path)
+        self.config_path = self.rules.config_path
+        # Shared with every engine using the same file; treat as read-only
+        self.config = self.rules.config
         self._setup_logging()
         self.transformation_log: list[TransformationResult] = []
 
-    def _get_default_config_path(self) -> str:
-        """Get the default configuration file path."""
-        current_dir = Path(__file__).parent
-        return str(current_dir / "config" / "cleaning_rules.yaml")
-
-    def _load_configuration(self) -> dict[str, Any]:
-        """Load configuration from YAML file."""
-        try:
-            with open(self.config_path) as file:
-                config = yaml.safe_load(file)
-            logger.info(f"Loaded configuration from {self.config_path}")
-            return config
-        except Exception as e:
-            logger.error(f"Failed to load configuration from {self.config_path}: {e}")
-            raise
-
     def _setup_logging(self) -> None:
         """Setup logging based on configuration."""
-        log_config = self.config.get("logging", {})
-        level = getattr(logging, log_config.get("level", "INFO"))
-        logger.setLevel(level)
+        logger.setLevel(self.rules.log_level)
 
     def standardize_team_name(
         self, team_name: str, use_fuzzy_matching: bool = True
@@ -100,75 +270,23 @@ class DataCleaningRulesEngine:
                 team_name, "", "team_name_standardization", False, "Invalid input"
             )
 
-        original_name = team_name
-        applied_rules = []
-
-        # Clean and normalize input
-        cleaned_name = re.sub(r"\s+", " ", team_name.strip().lower())
-        applied_rules.append("whitespace_normalization")
-
-        # Check direct mappings
-        team_mappings = self.config.get("team_name_mappings", {})
-        if cleaned_name in team_mappings:
-            standardized_name = team_mappings[cleaned_name]
-            applied_rules.append("direct_mapping")
-
-            if self.config.get("logging", {}).get("log_transformations", False):
-                logger.info(
-                    f"Team name standardized: '{original_name}' -> "
-                    f"'{standardized_name}'"
-                )
+        standardized_name, applied_rules = self.rules.standardize_team_name(
+            team_name, use_fuzzy_matching
+        )
 
-            return TransformationResult(
-                original_name,
-                standardized_name,
-                "team_name_standardization",
-                True,
-                applied_rules=applied_rules,
+        matched = applied_rules[-1] != "title_case_fallback"
+        if self.rules.log_transformations and matched:
+            logger.info(
+                f"Team name standardized: '{team_name}' -> '{standardized_name}' "
+                f"({applied_rules[-1]})"
             )
 
-        # Try fuzzy matching if enabled
-        if use_fuzzy_matching and self.config.get("fuzzy_matching", {}).get(
-            "enabled_fields", []
-        ):
-            if "team_name" in self.config["fuzzy_matching"]["enabled_fields"]:
-                threshold = self.config["fuzzy_matching"]["team_name_threshold"]
-                official_names = self.config.get("official_team_names", [])
-
-                if official_names:
-                    best_match = process.extractOne(cleaned_name, official_names)
-                    if best_match and best_match[1] >= threshold:
-                        standardized_name = best_match[0]
-                        applied_rules.append(f"fuzzy_matching_{best_match[1]}")
-
-                        if self.config.get("logging", {}).get(
-                            "log_transformations", False
-                        ):
-                            logger.info(
-                                f"Team name fuzzy matched: '{original_name}' -> "
-                                f"'{standardized_name}' (score: {best_match[1]})"
-                            )
-
-                        return TransformationResult(
-                            original_name,
-                            standardized_name,
-                            "team_name_standardization",
-                            True,
-                            applied_rules=applied_rules,
-                        )
-
-        # Return cleaned version if no mapping found
-        cleaned_title_case = " ".join(
-            word.capitalize() for word in cleaned_name.split()
-        )
-        applied_rules.append("title_case_fallback")
-
         return TransformationResult(
-            original_name,
-            cleaned_title_case,
+            team_name,
+            standardized_name,
             "team_name_standardization",
             True,
-            applied_rules=applied_rules,
+            applied_rules=list(applied_rules),
         )
 
     def standardize_position(self, position: str) -> TransformationResult:
@@ -190,58 +308,20 @@ class DataCleaningRulesEngine:
                 applied_rules=["default_unknown"],
             )
 
-        original_position = position
-        cleaned_position = position.strip().lower()
-        applied_rules = ["normalization"]
-
-        # Check mappings
-        position_mappings = self.config.get("position_mappings", {})
+        standardized, applied_rules = self.rules.standardize_position(position)
 
-        # Direct match
-        if cleaned_position in position_mappings:
-            standardized = position_mappings[cleaned_position]
-            applied_rules.append("direct_mapping")
-
-            if self.config.get("logging", {}).get("log_transformations", False):
-                logger.info(
-                    f"Position standardized: '{original_position}' -> '{standardized}'"
-                )
-
-            return TransformationResult(
-                original_position,
-                standardized,
-                "position_standardization",
-                True,
-                applied_rules=applied_rules,
+        if self.rules.log_transformations and standardized != "UNKNOWN":
+            logger.info(
+                f"Position standardized: '{position}' -> '{standardized}' "
+                f"({applied_rules[-1]})"
             )
 
-        # Partial match
-        for key, value in position_mappings.items():
-            if key in cleaned_position:
-                applied_rules.append("partial_mapping")
-
-                if self.config.get("logging", {}).get("log_transformations", False):
-                    logger.info(
-                        f"Position partially matched: '{original_position}' -> "
-                        f"'{value}'"
-                    )
-
-                return TransformationResult(
-                    original_position,
-                    value,
-                    "position_standardization",
-                    True,
-                    applied_rules=applied_rules,
-                )
-
-        # Return unknown if no match found
-        applied_rules.append("unknown_fallback")
         return TransformationResult(
-            original_position,
-            "UNKNOWN",
+            position,
+            standardized,
             "position_standardization",
             True,
-            applied_rules=applied_rules,
+            applied_rules=list(applied_rules),
         )
 
     def handle_null_values(
@@ -257,9 +337,8 @@ class DataCleaningRulesEngine:
         Returns:
             Cleaned data dictionary
         """
-        null_config = self.config.get("null_handling", {})
-        required_fields = null_config.get("required_fields", {}).get(entity_type, [])
-        default_values = null_config.get("default_values", {})
+        required_fields = self.rules.required_fields.get(entity_type, [])
+        default_values = self.rules.default_values
 
         cleaned_data = data.copy()
         applied_transformations = []
@@ -295,7 +374,7 @@ class DataCleaningRulesEngine:
                 )
 
         # Log transformations if enabled
-        if self.config.get("logging", {}).get("log_transformations", False):
+        if self.rules.log_transformations:
             for transformation in applied_transformations:
                 if transformation.success:
                     logger.info("Applied default value for null field")
@@ -329,7 +408,7 @@ class DataCleaningRulesEngine:
         # Handle string representations
         if isinstance(value, str):
             # Remove common formatting characters
-            cleaned_str = re.sub(r"[,$%]", "", value.strip())
+            cleaned_str = _NUMERIC_FORMAT_PATTERN.sub("", value.strip())
             applied_rules.append("format_cleaning")
 
             if not cleaned_str:
@@ -357,9 +436,7 @@ class DataCleaningRulesEngine:
             numeric_value = float(value)
 
         # Apply validation rules
-        validation_config = self.config.get("numeric_validation", {}).get(
-            field_name, {}
-        )
+        validation_config = self.rules.numeric_validation.get(field_name, {})
 
         if "min" in validation_config and numeric_value < validation_config["min"]:
             return TransformationResult(
@@ -383,7 +460,7 @@ class DataCleaningRulesEngine:
 
         applied_rules.append("validation_passed")
 
-        if self.config.get("logging", {}).get("log_transformations", False):
+        if self.rules.log_transformations:
             logger.debug(f"Numeric field cleaned: {field_name} = {numeric_value}")
 
         return TransformationResult(
@@ -434,12 +511,9 @@ class DataCleaningRulesEngine:
                 )
 
             # Try configured date formats
-            input_formats = self.config.get("datetime_formats", {}).get(
-                "input_formats", []
-            )
             dt = None
 
-            for fmt in input_formats:
+            for fmt in self.rules.input_formats:
                 try:
                     dt = datetime.strptime(value.strip(), fmt)
                     applied_rules.append(f"format_{fmt}")
@@ -472,15 +546,11 @@ class DataCleaningRulesEngine:
             )
 
         # Format to standard output
-        output_format = self.config.get("datetime_formats", {}).get(
-            "output_format", "%Y-%m-%dT%H:%M:%SZ"
-        )
-
         try:
-            standardized = dt.strftime(output_format)
+            standardized = dt.strftime(self.rules.output_format)
             applied_rules.append("standardized_format")
 
-            if self.config.get("logging", {}).get("log_transformations", False):
+            if self.rules.log_transformations:
                 logger.debug(
                     f"Datetime standardized: '{original_value}' -> '{standardized}'"
                 )
@@ -525,7 +595,7 @@ class DataCleaningRulesEngine:
                 applied_rules=["no_matching_needed"],
             )
 
-        fuzzy_config = self.config.get("fuzzy_matching", {})
+        fuzzy_config = self.rules.fuzzy_config
         threshold = fuzzy_config.get("similarity_threshold", 85)
 
         # Use field-specific threshold if available
@@ -537,7 +607,7 @@ class DataCleaningRulesEngine:
         best_match = process.extractOne(value, candidates)
 
         if best_match and best_match[1] >= threshold:
-            if self.config.get("logging", {}).get("log_transformations", False):
+            if self.rules.log_transformations:
                 logger.info(
                     f"Fuzzy match found for {field_name}: '{value}' -> "
                     f"'{best_match[0]}' (score: {best_match[1]})"
@@ -606,18 +676,14 @@ class DataCleaningRulesEngine:
                         record_transformations.append(result)
 
                     # Numeric field cleaning
-                    elif field_name in self.config.get("data_types", {}).get(
-                        "numeric_fields", []
-                    ):
+                    elif field_name in self.rules.numeric_fields:
                         result = self.clean_numeric_field(value, field_name)
                         if result.success and result.transformed_value is not None:
                             cleaned_record[field_name] = result.transformed_value
                         record_transformations.append(result)
 
                     # Date/time standardization
-                    elif field_name in self.config.get("data_types", {}).get(
-                        "date_fields", []
-                    ):
+                    elif field_name in self.rules.date_fields:
                         result = self.standardize_datetime(value, field_name)
                         if result.success and result.transformed_value is not None:
                             cleaned_record[field_name] = result.transformed_value
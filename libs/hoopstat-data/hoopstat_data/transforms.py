@@ -8,7 +8,7 @@ Enhanced with configurable rules engine integration.
 import re
 from typing import TYPE_CHECKING, Any
 
-from .rules_engine import DataCleaningRulesEngine
+from .rules_engine import DataCleaningRulesEngine, get_compiled_rules
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -31,15 +31,10 @@ def normalize_team_name(team_name: str, use_rules_engine: bool = True) -> str:
         >>> normalize_team_name("LA Lakers")
         "Los Angeles Lakers"
     """
-    if use_rules_engine:
+    if use_rules_engine and team_name and isinstance(team_name, str):
         try:
-            engine = DataCleaningRulesEngine()
-            result = engine.standardize_team_name(team_name)
-            if result.success:
-                return result.transformed_value
-            else:
-                # If rules engine fails, fall back to original logic
-                pass
+            # Compiled once per process and memoized per distinct name
+            return get_compiled_rules().standardize_team_name(team_name)[0]
         except Exception:
             # Fallback to original logic if rules engine fails
             pass
@@ -131,11 +126,10 @@ def standardize_position(position: str, use_rules_engine: bool = True) -> str:
         >>> standardize_position("center")
         "C"
     """
-    if use_rules_engine:
+    if use_rules_engine and position and isinstance(position, str):
         try:
-            engine = DataCleaningRulesEngine()
-            result = engine.standardize_position(position)
-            return result.transformed_value if result.success else position
+            # Compiled once per process and memoized per distinct position
+            return get_compiled_rules().standardize_position(position)[0]
         except Exception:
             # Fallback to original logic if rules engine fails
             pass
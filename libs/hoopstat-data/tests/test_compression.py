@@ -0,0 +1,128 @@
+"""
+Tests for stored JSON payload encoding.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from hoopstat_data import compression
+from hoopstat_data.compression import (
+    decode_json,
+    detect_compression,
+    encode_json,
+    object_encoding,
+    storage_put_args,
+)
+
+BOX_SCORE = {
+    "boxScoreTraditional": {
+        "gameId": "0022300001",
+        "homeTeam": {
+            "players": [
+                {"personId": i, "statistics": {"points": i, "assists": 0}}
+                for i in range(15)
+            ]
+        },
+    }
+}
+
+
+class TestEncodeJson:
+    """Test payload encoding."""
+
+    def test_none_is_pretty_printed(self):
+        """Test that the default keeps the original pretty-printed format."""
+        body = encode_json(BOX_SCORE)
+
+        assert body == json.dumps(BOX_SCORE, indent=2).encode("utf-8")
+
+    def test_gzip_is_compact_and_smaller(self):
+        """Test that gzip output wraps compact JSON and is much smaller."""
+        body = encode_json(BOX_SCORE, "gzip")
+
+        assert gzip.decompress(body) == json.dumps(
+            BOX_SCORE, separators=(",", ":")
+        ).encode("utf-8")
+        assert len(body) * 3 < len(encode_json(BOX_SCORE))
+
+    def test_gzip_is_deterministic(self):
+        """Test that identical payloads encode to identical bytes."""
+        assert encode_json(BOX_SCORE, "gzip") == encode_json(BOX_SCORE, "gzip")
+
+    def test_default_handler(self):
+        """Test that a json.dumps default handler is honoured."""
+        body = encode_json({"value": {1, 2}}, "gzip", default=sorted)
+
+        assert decode_json(body) == {"value": [1, 2]}
+
+    def test_unsupported_compression(self):
+        """Test that unknown encodings are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            encode_json(BOX_SCORE, "brotli")
+
+    def test_zstd_without_zstandard(self, monkeypatch):
+        """Test a clear error when zstd is requested but unavailable."""
+        monkeypatch.setattr(compression, "ZSTD_AVAILABLE", False)
+
+        with pytest.raises(RuntimeError, match="zstandard"):
+            encode_json(BOX_SCORE, "zstd")
+
+    def test_zstd_round_trip(self):
+        """Test zstd encoding when zstandard is installed."""
+        pytest.importorskip("zstandard")
+
+        body = encode_json(BOX_SCORE, "zstd")
+
+        assert detect_compression(body) == "zstd"
+        assert decode_json(body) == BOX_SCORE
+
+
+class TestDecodeJson:
+    """Test transparent payload decoding."""
+
+    @pytest.mark.parametrize("encoding", ["none", "gzip"])
+    def test_round_trip(self, encoding):
+        """Test that every encoding decodes to the original data."""
+        assert decode_json(encode_json(BOX_SCORE, encoding)) == BOX_SCORE
+
+    def test_detects_gzip_without_metadata(self):
+        """Test that gzip payloads are recognised by their magic bytes."""
+        body = encode_json(BOX_SCORE, "gzip")
+
+        assert detect_compression(body) == "gzip"
+        assert detect_compression(body, None) == "gzip"
+
+    def test_recorded_encoding_wins(self):
+        """Test that the recorded encoding is used when present."""
+        assert detect_compression(b"{}", "gzip") == "gzip"
+        assert detect_compression(b"{}", "identity") == "none"
+
+    def test_legacy_json(self):
+        """Test that plain JSON objects are still read."""
+        assert decode_json(b'{"a": 1}') == {"a": 1}
+
+
+class TestStorageMetadata:
+    """Test put_object arguments and response inspection."""
+
+    def test_uncompressed_keeps_metadata(self):
+        """Test that uncompressed writes leave metadata unchanged."""
+        assert storage_put_args("none", {"entity": "box"}) == {
+            "Metadata": {"entity": "box"}
+        }
+        assert storage_put_args("none") == {}
+
+    def test_compressed_records_encoding(self):
+        """Test that compressed writes record their encoding."""
+        assert storage_put_args("gzip", {"entity": "box"}) == {
+            "ContentEncoding": "gzip",
+            "Metadata": {"entity": "box", "compression": "gzip"},
+        }
+
+    def test_object_encoding(self):
+        """Test reading the encoding back from a get_object response."""
+        assert object_encoding({"Metadata": {"compression": "zstd"}}) == "zstd"
+        assert object_encoding({"ContentEncoding": "gzip"}) == "gzip"
+        assert object_encoding({"Body": None}) is None
@@ -1,7 +1,11 @@
 """Tests for data quality checking tools."""
 
+import pandas as pd
+import pytest
+
 from hoopstat_data.quality import (
     calculate_data_quality_score,
+    check_batch_quality,
     check_data_completeness,
     compare_stat_distributions,
     detect_outliers,
@@ -320,3 +324,119 @@ class TestCompareStatDistributions:
         assert result["std1"] == 0.0  # Standard deviation should be 0 for single values
         assert result["std2"] == 0.0
         assert result["mean_diff"] == 5.0
+
+
+class TestCheckBatchQuality:
+    """Test cases for the batch quality engine."""
+
+    def _players(self):
+        return [
+            {
+                "player_id": str(1000 + i),
+                "points": points,
+                "rebounds": 5,
+                "assists": 4,
+                "steals": 1,
+                "blocks": 0,
+                "turnovers": 2,
+                "field_goals_made": 5,
+                "field_goals_attempted": 10,
+                "minutes_played": 30,
+            }
+            for i, points in enumerate([10, 12, 11, 13, 15, 50, 14, 12, 13, 11])
+        ]
+
+    def test_clean_batch(self):
+        """Test a batch with nothing to flag."""
+        rows = self._players()
+        rows[5]["points"] = 12
+        result = check_batch_quality(rows)
+
+        assert len(result["flags"]) == 10
+        assert not result["flags"]["flagged"].any()
+        assert result["summary"]["rows"] == 10
+        assert result["summary"]["average_completeness"] == 1.0
+        assert result["summary"]["flagged_rows"] == 0
+
+    def test_completeness_matches_row_check(self):
+        """Test per-row completeness agrees with check_data_completeness."""
+        rows = self._players()
+        rows[2]["rebounds"] = None
+        del rows[3]["steals"]
+        flags = check_batch_quality(rows)["flags"]
+
+        for i, row in enumerate(rows):
+            expected = check_data_completeness(row)
+            assert flags["completeness_ratio"][i] == expected["completeness_ratio"]
+            assert flags["is_complete"][i] == expected["is_complete"]
+
+    def test_outliers_match_detect_outliers(self):
+        """Test IQR and z-score outliers agree with detect_outliers."""
+        rows = self._players()
+        points = [row["points"] for row in rows]
+
+        iqr = check_batch_quality(rows)
+        zscore = check_batch_quality(
+            rows, outlier_method="zscore", outlier_threshold=2.0
+        )
+
+        assert iqr["summary"]["outliers"] == {"points": detect_outliers(points)}
+        assert zscore["summary"]["outliers"]["points"] == detect_outliers(
+            points, method="zscore", threshold=2.0
+        )
+        assert iqr["flags"]["outlier"].tolist() == [i == 5 for i in range(10)]
+
+    def test_consistency_checks(self):
+        """Test made/attempted, percentage, minutes and negative checks."""
+        rows = self._players()
+        rows[0]["field_goals_made"] = 12
+        rows[1]["minutes_played"] = 55
+        rows[2]["assists"] = -1
+        for row in rows:
+            row["field_goal_percentage"] = 0.5
+        rows[3]["field_goal_percentage"] = 1.5
+
+        result = check_batch_quality(rows, stat_columns=["assists"])
+        flags = result["flags"]
+        summary = result["summary"]
+
+        assert flags["made_exceeds_attempted"].tolist()[:4] == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert flags["minutes_out_of_range"][1]
+        assert flags["negative_stats"][2]
+        assert flags["percentage_out_of_bounds"][3]
+        assert summary["made_exceeds_attempted"] == {"field_goals_made": 1}
+        assert summary["negative_values"] == {"assists": 1}
+        assert summary["percentage_out_of_bounds"] == {"field_goal_percentage": 1}
+        assert summary["minutes_out_of_range"] == 1
+        assert summary["inconsistent_rows"] == 4
+
+    def test_accepts_dataframe_and_arrow_table(self):
+        """Test DataFrame and Arrow table input give the same result."""
+        pa = pytest.importorskip("pyarrow")
+        rows = self._players()
+        df = pd.DataFrame(rows)
+
+        from_records = check_batch_quality(rows)
+        from_frame = check_batch_quality(df)
+        from_table = check_batch_quality(pa.Table.from_pandas(df))
+
+        assert from_frame["summary"] == from_records["summary"]
+        assert from_table["summary"] == from_records["summary"]
+
+    def test_empty_batch(self):
+        """Test an empty batch."""
+        result = check_batch_quality([])
+
+        assert result["flags"].empty
+        assert result["summary"]["rows"] == 0
+        assert result["summary"]["average_completeness"] == 0.0
+
+    def test_invalid_method(self):
+        """Test an unknown outlier method is rejected."""
+        with pytest.raises(ValueError, match="outlier_method"):
+            check_batch_quality(self._players(), outlier_method="invalid")
@@ -1,6 +1,20 @@
 """Tests for the data cleaning rules engine."""
 
-from hoopstat_data.rules_engine import DataCleaningRulesEngine, TransformationResult
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import yaml
+
+from hoopstat_data.rules_engine import (
+    DEFAULT_CONFIG_PATH,
+    DataCleaningRulesEngine,
+    TransformationResult,
+    clear_compiled_rules,
+    get_compiled_rules,
+)
+from hoopstat_data.transforms import normalize_team_name, standardize_position
 
 
 class TestDataCleaningRulesEngine:
@@ -275,3 +289,80 @@ class TestConfigurationLoading:
         assert "points" in numeric_validation
         assert numeric_validation["points"]["min"] == 0
         assert numeric_validation["points"]["max"] == 100
+
+
+class TestCompiledRulesRegistry:
+    """Test the process-wide cache of compiled configurations."""
+
+    def setup_method(self):
+        """Start every test from an empty cache."""
+        clear_compiled_rules()
+
+    def teardown_method(self):
+        """Leave no test configuration behind."""
+        clear_compiled_rules()
+
+    def test_configuration_is_parsed_once(self):
+        """Test that engines and transforms share one parsed configuration."""
+        with patch(
+            "hoopstat_data.rules_engine.yaml.safe_load", wraps=yaml.safe_load
+        ) as safe_load:
+            first = DataCleaningRulesEngine()
+            second = DataCleaningRulesEngine(DEFAULT_CONFIG_PATH)
+            for _ in range(100):
+                normalize_team_name("la lakers")
+                standardize_position("point guard")
+
+        assert safe_load.call_count == 1
+        assert first.rules is second.rules is get_compiled_rules()
+        # Each engine still keeps its own transformation log
+        assert first.transformation_log is not second.transformation_log
+
+    def test_edited_configuration_is_reloaded(self, tmp_path):
+        """Test that a changed modification time recompiles the rules."""
+        config_path = tmp_path / "cleaning_rules.yaml"
+        shutil.copy(DEFAULT_CONFIG_PATH, config_path)
+
+        rules = get_compiled_rules(str(config_path))
+        assert rules.standardize_team_name("lakers")[0] == "Los Angeles Lakers"
+        assert get_compiled_rules(str(config_path)) is rules
+
+        config_path.write_text(
+            config_path.read_text().replace(
+                '"lakers": "Los Angeles Lakers"', '"lakers": "LA Lakers"'
+            )
+        )
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = get_compiled_rules(str(config_path))
+        assert reloaded is not rules
+        assert reloaded.standardize_team_name("lakers")[0] == "LA Lakers"
+
+    def test_repeated_values_are_memoized(self):
+        """Test that a repeated team name or position is computed once."""
+        rules = get_compiled_rules()
+
+        for _ in range(50):
+            normalize_team_name("LA  Lakers")
+            standardize_position("Point Guard")
+
+        team_info = rules.standardize_team_name.cache_info()
+        position_info = rules.standardize_position.cache_info()
+        assert (team_info.misses, team_info.hits) == (1, 49)
+        assert (position_info.misses, position_info.hits) == (1, 49)
+
+    def test_shared_across_threads(self):
+        """Test that concurrent transforms agree with a sequential run."""
+        names = ["lakers", "gsw", "celtics", "unknown team"] * 250
+        expected = [normalize_team_name(name) for name in names]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(normalize_team_name, names))
+
+        assert results == expected
+        assert expected[:3] == [
+            "Los Angeles Lakers",
+            "Golden State Warriors",
+            "Boston Celtics",
+        ]
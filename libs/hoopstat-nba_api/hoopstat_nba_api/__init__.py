@@ -4,8 +4,37 @@ Hoopstat NBA API Library
 A library for accessing NBA data from the nba-api with rate limiting and error handling.
 """
 
-from .nba_client import NBAAPIError, NBAClient
+from .cache import CacheTTLPolicy, ResponseCache
+from .game_logs import GAME_LOG_SOURCE, box_scores_from_game_logs
+from .nba_client import (
+    GAME_STATUS_FINAL,
+    GAME_STATUS_IN_PROGRESS,
+    GAME_STATUS_SCHEDULED,
+    LEAGUE_IDS,
+    NBAAPIError,
+    NBAClient,
+    RetryBudgetExhaustedError,
+)
 from .rate_limiter import RateLimiter
+from .retry_policy import BLOCKED_CIRCUIT_OPEN, BLOCKED_DEADLINE, RetryPolicy
+from .transport import HTTPTransport
 
 __version__ = "0.1.0"
-__all__ = ["NBAClient", "NBAAPIError", "RateLimiter"]
+__all__ = [
+    "NBAClient",
+    "NBAAPIError",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryBudgetExhaustedError",
+    "BLOCKED_CIRCUIT_OPEN",
+    "BLOCKED_DEADLINE",
+    "HTTPTransport",
+    "ResponseCache",
+    "CacheTTLPolicy",
+    "GAME_LOG_SOURCE",
+    "box_scores_from_game_logs",
+    "GAME_STATUS_SCHEDULED",
+    "GAME_STATUS_IN_PROGRESS",
+    "GAME_STATUS_FINAL",
+    "LEAGUE_IDS",
+]
@@ -0,0 +1,217 @@
+"""
+Persistent on-disk response cache for NBA API requests.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class CacheTTLPolicy:
+    """
+    Time-to-live policy per endpoint, in seconds.
+
+    ``math.inf`` means an entry never expires and ``0`` disables caching.
+    """
+
+    final_box_score_ttl: float = math.inf
+    live_box_score_ttl: float = 5 * 60
+    past_schedule_ttl: float = 7 * DAY_SECONDS
+    current_schedule_ttl: float = 10 * 60
+    player_info_ttl: float = 7 * DAY_SECONDS
+    season_game_log_ttl: float = 60 * 60
+    standings_ttl: float = 0
+    scoreboard_ttl: float = 0
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of parsed NBA API responses.
+
+    Entries are keyed by endpoint name plus the endpoint's normalized
+    parameters, stored as compressed JSON, and evicted least recently used
+    first once the total payload size exceeds ``max_size_bytes``. The cache
+    is safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path, max_size_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the cache, creating the SQLite file if needed.
+
+        Args:
+            path: Path of the SQLite cache file
+            max_size_bytes: Upper bound on the total size of stored payloads
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(endpoint: str, parameters: dict[str, Any]) -> str:
+        """
+        Build a cache key from an endpoint and its parameters.
+
+        Parameter order and value types are normalized so equivalent
+        requests share one entry.
+        """
+        normalized = {
+            "endpoint": endpoint.lower(),
+            "parameters": sorted(
+                (name, "" if value is None else str(value))
+                for name, value in parameters.items()
+            ),
+        }
+        encoded = json.dumps(normalized, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached response.
+
+        Returns:
+            A freshly parsed copy of the payload, or None on a miss or expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(zlib.decompress(payload))
+
+    def set(self, key: str, endpoint: str, data: dict[str, Any], ttl: float) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key
+            endpoint: Endpoint name, kept for inspection
+            data: Parsed response payload
+            ttl: Seconds until expiry; ``math.inf`` never expires, ``<= 0``
+                skips caching
+        """
+        if ttl <= 0:
+            return
+
+        payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        expires_at = None if math.isinf(ttl) else now + ttl
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, endpoint, payload, size, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, endpoint, payload, len(payload), now, expires_at, now),
+            )
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def _evict_if_needed(self) -> None:
+        """Drop least recently used entries until under the size bound."""
+        (total_size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total_size <= self.max_size_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total_size -= size
+            self.evictions += 1
+
+        logger.debug(f"Evicted cache entries, total size now {total_size} bytes")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache hit/miss statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, expiries, evictions and size
+        """
+        with self._lock:
+            entries, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": total_size,
+            }
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
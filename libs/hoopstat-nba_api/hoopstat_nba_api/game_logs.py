@@ -0,0 +1,162 @@
+"""
+Build per-game box scores from season-wide game logs.
+
+``LeagueGameLog`` returns every team-game (``player_or_team="T"``) or
+player-game (``"P"``) row of a season in one response. Grouping those rows by
+game gives the same ``boxScoreTraditional`` structure ``BoxScoreTraditionalV3``
+returns, so a season can be loaded without one request per game.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from nba_api.stats.static import teams
+
+# Source tag recorded on box scores built from season game logs
+GAME_LOG_SOURCE = "league_game_log"
+
+# MATCHUP separators: "LAL vs. BOS" is a home row, "LAL @ BOS" an away row
+_HOME_SEPARATOR = " vs. "
+_AWAY_SEPARATOR = " @ "
+
+# Game log columns mapped to V3 box score statistic names
+_STATISTIC_COLUMNS = {
+    "MIN": "minutes",
+    "FGM": "fieldGoalsMade",
+    "FGA": "fieldGoalsAttempted",
+    "FG_PCT": "fieldGoalsPercentage",
+    "FG3M": "threePointersMade",
+    "FG3A": "threePointersAttempted",
+    "FG3_PCT": "threePointersPercentage",
+    "FTM": "freeThrowsMade",
+    "FTA": "freeThrowsAttempted",
+    "FT_PCT": "freeThrowsPercentage",
+    "OREB": "reboundsOffensive",
+    "DREB": "reboundsDefensive",
+    "REB": "reboundsTotal",
+    "AST": "assists",
+    "STL": "steals",
+    "BLK": "blocks",
+    "TOV": "turnovers",
+    "PF": "foulsPersonal",
+    "PTS": "points",
+    "PLUS_MINUS": "plusMinusPoints",
+}
+
+
+def _statistics(row: dict[str, Any]) -> dict[str, Any]:
+    """Map a game log row's stat columns to V3 statistic names."""
+    return {
+        name: row[column]
+        for column, name in _STATISTIC_COLUMNS.items()
+        if column in row
+    }
+
+
+def _team(row: dict[str, Any]) -> dict[str, Any]:
+    """Build a V3 team entry from a team game log row."""
+    # V3 splits the franchise into city and nickname; the log only has the
+    # full name, so fall back to it for teams nba_api does not know (such as
+    # every WNBA team). teamCity must stay a string for the box score schema.
+    static_team = teams.find_team_name_by_id(row.get("TEAM_ID")) or {}
+    return {
+        "teamId": row.get("TEAM_ID"),
+        "teamCity": static_team.get("city") or row.get("TEAM_CITY") or "",
+        "teamName": static_team.get("nickname") or row.get("TEAM_NAME"),
+        "teamTricode": row.get("TEAM_ABBREVIATION"),
+        "statistics": _statistics(row),
+        "players": [],
+    }
+
+
+def _player(row: dict[str, Any]) -> dict[str, Any]:
+    """Build a V3 player entry from a player game log row."""
+    return {
+        "personId": row.get("PLAYER_ID"),
+        "name": row.get("PLAYER_NAME"),
+        "statistics": _statistics(row),
+    }
+
+
+def _side(row: dict[str, Any]) -> str | None:
+    """Get whether a team row is the home or away side of its game."""
+    matchup = row.get("MATCHUP") or ""
+    if _HOME_SEPARATOR in matchup:
+        return "home"
+    if _AWAY_SEPARATOR in matchup:
+        return "away"
+    return None
+
+
+def box_scores_from_game_logs(
+    team_rows: list[dict[str, Any]],
+    player_rows: list[dict[str, Any]],
+    season: str | None = None,
+    fetch_date: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Split season game logs into one V3-shaped box score per game.
+
+    Args:
+        team_rows: ``LeagueGameLog`` team rows, one per team per game
+        player_rows: ``LeagueGameLog`` player rows, one per player per game
+        season: Season the logs were fetched for, recorded on each box score
+        fetch_date: Fetch timestamp to record; defaults to now
+
+    Returns:
+        Box scores in first-seen game order, each shaped like
+        ``get_box_score`` output (``boxScoreTraditional`` plus ``game_id`` and
+        ``fetch_date``) with ``game_date``, ``season`` and ``source`` added.
+        Games missing a home or away team row are dropped.
+    """
+    fetch_date = fetch_date or datetime.now().isoformat()
+    games: dict[str, dict[str, Any]] = {}
+    team_entries: dict[tuple[str, Any], dict[str, Any]] = {}
+
+    for row in team_rows:
+        game_id = row.get("GAME_ID")
+        if not game_id:
+            continue
+        game_id = str(game_id)
+
+        game = games.setdefault(
+            game_id,
+            {
+                "gameId": game_id,
+                "gameDate": str(row.get("GAME_DATE") or "")[:10] or None,
+                "homeTeam": None,
+                "awayTeam": None,
+            },
+        )
+
+        side = _side(row)
+        if side is None:
+            # Without a MATCHUP, fill whichever side is still free
+            side = "home" if game["homeTeam"] is None else "away"
+        team = _team(row)
+        game[f"{side}Team"] = team
+        team_entries[(game_id, row.get("TEAM_ID"))] = team
+
+    for row in player_rows:
+        team = team_entries.get((str(row.get("GAME_ID")), row.get("TEAM_ID")))
+        if team is not None:
+            team["players"].append(_player(row))
+
+    box_scores = []
+    for game_id, game in games.items():
+        if game["homeTeam"] is None or game["awayTeam"] is None:
+            continue
+        game["homeTeamId"] = game["homeTeam"]["teamId"]
+        game["awayTeamId"] = game["awayTeam"]["teamId"]
+        box_scores.append(
+            {
+                "boxScoreTraditional": game,
+                "game_id": game_id,
+                "game_date": game["gameDate"],
+                "season": season,
+                "source": GAME_LOG_SOURCE,
+                "fetch_date": fetch_date,
+            }
+        )
+
+    return box_scores
@@ -3,6 +3,7 @@ NBA API client with rate limiting and error handling.
 """
 
 import logging
+import time
 from datetime import date, datetime
 from typing import Any
 
@@ -11,13 +12,27 @@ from nba_api.stats.endpoints import (
     BoxScoreTraditionalV3,
     CommonPlayerInfo,
     LeagueGameFinder,
+    LeagueGameLog,
     LeagueStandings,
+    ScoreboardV3,
 )
 
+from .cache import CacheTTLPolicy, ResponseCache
+from .game_logs import box_scores_from_game_logs
 from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .transport import HTTPTransport
 
 logger = logging.getLogger(__name__)
 
+# Stats API league IDs by league name
+LEAGUE_IDS = {"nba": "00", "wnba": "10"}
+
+# ScoreboardV3 gameStatus values
+GAME_STATUS_SCHEDULED = 1
+GAME_STATUS_IN_PROGRESS = 2
+GAME_STATUS_FINAL = 3
+
 
 class NBAAPIError(Exception):
     """Custom exception for NBA API errors."""
@@ -25,6 +40,14 @@ class NBAAPIError(Exception):
     pass
 
 
+class RetryBudgetExhaustedError(NBAAPIError):
+    """Raised when the retry policy refuses to start a request."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+
 class NBAClient:
     """
     NBA API client with respectful rate limiting and error handling.
@@ -32,88 +55,155 @@ class NBAClient:
     Follows ADR-013 decision to use nba-api library as primary data source.
     """
 
-    def __init__(self, rate_limiter: RateLimiter | None = None):
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None = None,
+        transport: HTTPTransport | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CacheTTLPolicy | None = None,
+        league_id: str = LEAGUE_IDS["nba"],
+        retry_policy: RetryPolicy | None = None,
+    ):
         """
         Initialize the NBA API client.
 
         Args:
             rate_limiter: Optional custom rate limiter instance
+            transport: Optional custom HTTP transport (pool size, timeouts)
+            cache: Optional persistent response cache
+            cache_policy: Optional per-endpoint TTLs for cached responses
+            league_id: Stats API league to query, a value of ``LEAGUE_IDS``
+            retry_policy: Optional retry policy, shared to give several
+                clients one retry budget, deadline and circuit breaker
         """
         self.rate_limiter = rate_limiter or RateLimiter()
-        self.session = requests.Session()
-        # Set a user agent to be respectful
-        self.session.headers.update(
-            {"User-Agent": "hoopstat-haus/0.1.0 (Basketball Analytics Project)"}
-        )
+        self.transport = transport or HTTPTransport()
+        # All endpoint requests go through the transport's pooled session
+        self.session = self.transport.session
+        self.cache = cache
+        self.cache_policy = cache_policy or CacheTTLPolicy()
+        self.league_id = league_id
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Games the schedule reported as finished (W/L set); their box
+        # scores are final and can be cached without expiry
+        self._final_game_ids: set[str] = set()
+
+    def _make_cached_request(
+        self, endpoint_class, cache_ttl: float, refresh: bool = False, **kwargs
+    ) -> dict[str, Any]:
+        """
+        Serve a request from the response cache, falling back to the API.
+
+        Cache hits skip the rate limiter entirely.
+
+        Args:
+            endpoint_class: NBA API endpoint class describing the request
+            cache_ttl: Seconds to keep a fresh response (``math.inf`` never
+                expires, 0 disables caching)
+            refresh: If True, skip the cached entry and store the fresh response
+            **kwargs: Parameters to pass to the endpoint
+
+        Returns:
+            Raw JSON response data
+        """
+        if self.cache is None or cache_ttl <= 0:
+            return self._make_request(endpoint_class, **kwargs)
+
+        endpoint_name, parameters = self.transport.describe(endpoint_class, **kwargs)
+        cache_key = self.cache.make_key(endpoint_name, parameters)
+
+        cached = None if refresh else self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {endpoint_name}")
+            return cached
+
+        data = self._make_request(endpoint_class, **kwargs)
+        self.cache.set(cache_key, endpoint_name, data, cache_ttl)
+        return data
 
     def _make_request(self, endpoint_class, **kwargs) -> dict[str, Any]:
         """
         Make a request to the NBA API with rate limiting and error handling.
 
+        Attempts, backoff and giving up are decided by ``self.retry_policy``,
+        which may be shared with other clients and callers so one run has a
+        single retry budget and deadline.
+
         Args:
-            endpoint_class: NBA API endpoint class to instantiate
+            endpoint_class: NBA API endpoint class describing the request
             **kwargs: Parameters to pass to the endpoint
 
         Returns:
             Raw JSON response data
 
         Raises:
+            RetryBudgetExhaustedError: If the policy refused to start the
+                request (circuit open or deadline reached)
             NBAAPIError: If the request fails after retries
         """
-        retry_count = 0
-        max_retries = 3
+        endpoint_name = getattr(endpoint_class, "__name__", str(endpoint_class))
+        attempt = 0
+
+        while True:
+            blocked = self.retry_policy.acquire()
+            if blocked is not None:
+                raise RetryBudgetExhaustedError(
+                    f"Not calling {endpoint_name}: {blocked}", reason=blocked
+                )
 
-        while retry_count <= max_retries:
+            attempt += 1
             try:
                 # Wait for rate limiting
                 self.rate_limiter.wait_if_needed()
 
-                # Make the API call
-                endpoint = endpoint_class(**kwargs)
-                data = endpoint.get_dict()
+                # Make the API call through the pooled session
+                data = self.transport.fetch(endpoint_class, **kwargs)
 
                 # Reset rate limiter on success
                 self.rate_limiter.reset_delay()
+                self.retry_policy.record_success()
 
-                endpoint_name = getattr(endpoint_class, "__name__", str(endpoint_class))
                 logger.debug(f"Successfully fetched data from {endpoint_name}")
                 return data
 
             except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429:  # Rate limited
-                    if self.rate_limiter.handle_rate_limit_error():
-                        retry_count += 1
-                        logger.warning(
-                            f"Rate limited, retrying "
-                            f"(attempt {retry_count}/{max_retries})"
-                        )
-                        continue
-                    else:
-                        raise NBAAPIError(
-                            f"Rate limit exceeded after {max_retries} retries"
-                        ) from e
-                else:
+                status_code = e.response.status_code
+                if status_code != 429 and status_code < 500:
+                    # Client errors won't succeed on retry
+                    raise NBAAPIError(f"HTTP error {status_code}: {e}") from e
+
+                self.retry_policy.record_failure()
+                if (
+                    status_code == 429
+                    and not self.rate_limiter.handle_rate_limit_error()
+                ):
                     raise NBAAPIError(
-                        f"HTTP error {e.response.status_code}: {e}"
+                        f"Rate limit exceeded after {attempt} attempts"
                     ) from e
+                error: Exception = e
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count > max_retries:
-                    raise NBAAPIError(
-                        f"Failed to fetch data after {max_retries} retries: {e}"
-                    ) from e
+            except requests.exceptions.Timeout as e:
+                # Timeouts usually mean the API is overloaded; slow down
+                self.rate_limiter.handle_timeout()
+                self.retry_policy.record_failure()
+                error = e
 
-                logger.warning(
-                    f"Request failed, retrying "
-                    f"(attempt {retry_count}/{max_retries}): {e}"
-                )
-                # Simple backoff for non-rate-limit errors
-                import time
-
-                time.sleep(min(2**retry_count, 10))
-
-        raise NBAAPIError(f"Failed to fetch data after {max_retries} retries")
+            except Exception as e:
+                self.retry_policy.record_failure()
+                error = e
+
+            delay = self.retry_policy.retry_delay(attempt)
+            if delay is None:
+                raise NBAAPIError(
+                    f"Failed to fetch {endpoint_name} after {attempt} attempts: "
+                    f"{error}"
+                ) from error
+
+            logger.warning(
+                f"Request to {endpoint_name} failed, retrying in {delay:.1f}s "
+                f"(attempt {attempt}/{self.retry_policy.max_attempts}): {error}"
+            )
+            time.sleep(delay)
 
     def get_games_for_date(self, target_date: date) -> list[dict[str, Any]]:
         """
@@ -126,13 +216,19 @@ class NBAClient:
             List of game data dictionaries
         """
         date_str = target_date.strftime("%m/%d/%Y")
+        cache_ttl = (
+            self.cache_policy.past_schedule_ttl
+            if target_date < date.today()
+            else self.cache_policy.current_schedule_ttl
+        )
 
         try:
-            data = self._make_request(
+            data = self._make_cached_request(
                 LeagueGameFinder,
+                cache_ttl=cache_ttl,
                 date_from_nullable=date_str,
                 date_to_nullable=date_str,
-                league_id_nullable="00",  # NBA
+                league_id_nullable=self.league_id,
             )
 
             # Handle both resultSet and resultSets structures
@@ -150,6 +246,8 @@ class NBAClient:
                 game_dict = dict(zip(headers, game_row, strict=False))
                 game_dict["fetch_date"] = datetime.now().isoformat()
                 games_data.append(game_dict)
+                if game_dict.get("WL") in ("W", "L"):
+                    self._final_game_ids.add(str(game_dict.get("GAME_ID")))
 
             logger.info(f"Fetched {len(games_data)} games for {target_date}")
             return games_data
@@ -158,18 +256,67 @@ class NBAClient:
             logger.error(f"Failed to fetch games for {target_date}: {e}")
             raise NBAAPIError(f"Failed to fetch games for {target_date}") from e
 
-    def get_box_score(self, game_id: str) -> dict[str, Any]:
+    def get_scoreboard(self, target_date: date) -> list[dict[str, Any]]:
+        """
+        Get the games on a date with their live status.
+
+        Unlike the schedule, the scoreboard lists games before they tip off
+        and reports whether each one is scheduled, in progress or final.
+
+        Args:
+            target_date: Date to fetch the scoreboard for
+
+        Returns:
+            ScoreboardV3 game dictionaries; ``gameStatus`` is one of
+            ``GAME_STATUS_SCHEDULED``, ``GAME_STATUS_IN_PROGRESS`` or
+            ``GAME_STATUS_FINAL``
+        """
+        try:
+            data = self._make_cached_request(
+                ScoreboardV3,
+                cache_ttl=self.cache_policy.scoreboard_ttl,
+                game_date=target_date.isoformat(),
+                league_id=self.league_id,
+            )
+
+            games = data.get("scoreboard", {}).get("games", [])
+            for game in games:
+                if game.get("gameStatus") == GAME_STATUS_FINAL:
+                    self._final_game_ids.add(str(game.get("gameId")))
+
+            logger.debug(
+                f"Fetched scoreboard with {len(games)} games for {target_date}"
+            )
+            return games
+
+        except Exception as e:
+            logger.error(f"Failed to fetch scoreboard for {target_date}: {e}")
+            raise NBAAPIError(f"Failed to fetch scoreboard for {target_date}") from e
+
+    def get_box_score(self, game_id: str, refresh: bool = False) -> dict[str, Any]:
         """
         Get detailed box score for a specific game.
 
         Args:
             game_id: NBA game ID
+            refresh: If True, bypass the response cache, e.g. to pick up a
+                stat correction to a box score cached as final
 
         Returns:
             Box score data dictionary
         """
         try:
-            data = self._make_request(BoxScoreTraditionalV3, game_id=game_id)
+            cache_ttl = (
+                self.cache_policy.final_box_score_ttl
+                if game_id in self._final_game_ids
+                else self.cache_policy.live_box_score_ttl
+            )
+            data = self._make_cached_request(
+                BoxScoreTraditionalV3,
+                cache_ttl=cache_ttl,
+                refresh=refresh,
+                game_id=game_id,
+            )
 
             # Add metadata
             data["fetch_date"] = datetime.now().isoformat()
@@ -182,6 +329,75 @@ class NBAClient:
             logger.error(f"Failed to fetch box score for game {game_id}: {e}")
             raise NBAAPIError(f"Failed to fetch box score for game {game_id}") from e
 
+    def get_season_game_logs(
+        self,
+        season: str,
+        player_or_team: str = "T",
+        season_type: str = "Regular Season",
+    ) -> list[dict[str, Any]]:
+        """
+        Get every team-game or player-game row of a season in one request.
+
+        Args:
+            season: Season in ``YYYY-YY`` form, e.g. ``"2023-24"``
+            player_or_team: ``"T"`` for team rows, ``"P"`` for player rows
+            season_type: ``"Regular Season"``, ``"Playoffs"``, etc.
+
+        Returns:
+            List of game log row dictionaries
+        """
+        try:
+            data = self._make_cached_request(
+                LeagueGameLog,
+                cache_ttl=self.cache_policy.season_game_log_ttl,
+                season=season,
+                season_type_all_star=season_type,
+                player_or_team_abbreviation=player_or_team,
+                league_id=self.league_id,
+            )
+
+            result_set = data["resultSets"][0]
+            headers = result_set.get("headers", [])
+            rows = [
+                dict(zip(headers, row, strict=False))
+                for row in result_set.get("rowSet", [])
+            ]
+
+            logger.info(
+                f"Fetched {len(rows)} {player_or_team} game log rows for {season}"
+            )
+            return rows
+
+        except Exception as e:
+            logger.error(f"Failed to fetch game logs for {season}: {e}")
+            raise NBAAPIError(f"Failed to fetch game logs for {season}") from e
+
+    def get_season_box_scores(
+        self, season: str, season_type: str = "Regular Season"
+    ) -> list[dict[str, Any]]:
+        """
+        Get box scores for every game of a season from its game logs.
+
+        Two season-wide requests (team and player logs) replace one
+        ``BoxScoreTraditionalV3`` request per game. The box scores carry the
+        traditional stats only; starters, positions and period data are not
+        part of the logs.
+
+        Args:
+            season: Season in ``YYYY-YY`` form, e.g. ``"2023-24"``
+            season_type: ``"Regular Season"``, ``"Playoffs"``, etc.
+
+        Returns:
+            Box score dictionaries shaped like ``get_box_score`` output, with
+            ``game_date``, ``season`` and ``source`` added
+        """
+        team_rows = self.get_season_game_logs(season, "T", season_type)
+        player_rows = self.get_season_game_logs(season, "P", season_type)
+
+        box_scores = box_scores_from_game_logs(team_rows, player_rows, season=season)
+        logger.info(f"Built {len(box_scores)} box scores from {season} game logs")
+        return box_scores
+
     def get_player_info(self, player_id: int) -> dict[str, Any]:
         """
         Get player information.
@@ -193,7 +409,11 @@ class NBAClient:
             Player info dictionary
         """
         try:
-            data = self._make_request(CommonPlayerInfo, player_id=player_id)
+            data = self._make_cached_request(
+                CommonPlayerInfo,
+                cache_ttl=self.cache_policy.player_info_ttl,
+                player_id=player_id,
+            )
 
             # Add metadata
             data["fetch_date"] = datetime.now().isoformat()
@@ -214,7 +434,9 @@ class NBAClient:
             League standings dictionary
         """
         try:
-            data = self._make_request(LeagueStandings)
+            data = self._make_cached_request(
+                LeagueStandings, cache_ttl=self.cache_policy.standings_ttl
+            )
 
             # Add metadata
             data["fetch_date"] = datetime.now().isoformat()
@@ -1,16 +1,32 @@
 """
-Rate limiting functionality with exponential backoff for respectful API usage.
+Rate limiting functionality with adaptive backoff for respectful API usage.
 """
 
+import asyncio
 import logging
+import threading
 import time
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """
-    Rate limiter with exponential backoff for respectful API usage.
+    Adaptive token-bucket rate limiter for respectful API usage.
+
+    Requests draw tokens from a bucket that refills at ``1 / current_delay``
+    tokens per second and holds at most ``burst`` tokens, so short bursts are
+    allowed while the long-run rate never exceeds the current rate.
+
+    The rate adapts AIMD-style: throttling (429) and timeout responses
+    multiply the delay by ``backoff_factor`` (up to ``max_delay``), while each
+    success adds ``additive_increase`` requests/second back until the rate
+    returns to ``1 / min_delay``.
+
+    The limiter is safe to share between threads and asyncio tasks. Callers
+    reserve a token under a lock and then sleep outside it, so waiting
+    callers are spaced out rather than released together.
 
     Designed to be conservative and respectful to the NBA API to avoid
     getting blocked or causing issues for the broader community.
@@ -22,6 +38,8 @@ class RateLimiter:
         max_delay: float = 60.0,
         backoff_factor: float = 2.0,
         max_retries: int = 5,
+        burst: int = 1,
+        additive_increase: float | None = None,
     ):
         """
         Initialize the rate limiter.
@@ -31,47 +49,161 @@ class RateLimiter:
             max_delay: Maximum delay between requests in seconds
             backoff_factor: Factor to multiply delay by on each retry
             max_retries: Maximum number of retries before giving up
+            burst: Maximum number of requests that may be made back to back
+            additive_increase: Requests/second added back after each success.
+                Defaults to a tenth of the maximum rate.
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self.max_retries = max_retries
+        self.burst = burst
+        self.additive_increase = (
+            additive_increase if additive_increase is not None else 0.1 / min_delay
+        )
         self.current_delay = min_delay
         self.last_request_time: float | None = None
 
-    def wait_if_needed(self) -> None:
-        """Wait if needed to respect rate limits."""
-        if self.last_request_time is None:
-            self.last_request_time = time.time()
-            return
+        self._tokens = float(burst)
+        self._last_refill = time.time()
+        self._lock = threading.Lock()
 
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.current_delay:
-            sleep_time = self.current_delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        # Counters for tuning throughput
+        self.requests_count = 0
+        self.waited_count = 0
+        self.total_wait_seconds = 0.0
+        self.rate_limited_count = 0
+        self.timeout_count = 0
 
-        self.last_request_time = time.time()
+    @property
+    def current_rate(self) -> float:
+        """Current allowed request rate in requests per second."""
+        return 1.0 / self.current_delay
 
-    def handle_rate_limit_error(self) -> bool:
+    def _reserve(self) -> float:
+        """
+        Take one token from the bucket and return how long to wait for it.
+
+        The bucket may go negative; the deficit is the queue of callers that
+        have reserved a future slot.
+        """
+        with self._lock:
+            now = time.time()
+            elapsed = max(0.0, now - self._last_refill)
+            self._tokens = min(
+                float(self.burst), self._tokens + elapsed * self.current_rate
+            )
+            self._last_refill = now
+
+            self._tokens -= 1.0
+            wait_time = -self._tokens / self.current_rate if self._tokens < 0 else 0.0
+
+            self.requests_count += 1
+            if wait_time > 0:
+                self.waited_count += 1
+                self.total_wait_seconds += wait_time
+            self.last_request_time = now + wait_time
+            return wait_time
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be made.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        wait_time = self._reserve()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self) -> float:
         """
-        Handle a rate limit error by increasing delay.
+        Wait without blocking the event loop until a request may be made.
 
         Returns:
-            True if should retry, False if max retries exceeded
+            Number of seconds spent waiting
         """
+        wait_time = self._reserve()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def wait_if_needed(self) -> None:
+        """Wait if needed to respect rate limits."""
+        self.acquire()
+
+    def _decrease_rate(self) -> bool:
+        """Multiplicatively slow down; caller must hold the lock."""
         self.current_delay = min(
             self.current_delay * self.backoff_factor, self.max_delay
         )
+        return self.current_delay < self.max_delay
+
+    def handle_rate_limit_error(self) -> bool:
+        """
+        Handle a rate limit (429) response by slowing down.
+
+        Returns:
+            True if should retry, False if max delay reached
+        """
+        with self._lock:
+            self.rate_limited_count += 1
+            should_retry = self._decrease_rate()
+
         logger.warning(
             f"Rate limit hit, increasing delay to {self.current_delay:.2f} seconds"
         )
+        return should_retry
 
-        # Check if we should retry
-        return self.current_delay < self.max_delay
+    def handle_timeout(self) -> bool:
+        """
+        Handle a request timeout by slowing down.
+
+        Returns:
+            True if should retry, False if max delay reached
+        """
+        with self._lock:
+            self.timeout_count += 1
+            should_retry = self._decrease_rate()
+
+        logger.warning(
+            f"Request timed out, increasing delay to {self.current_delay:.2f} seconds"
+        )
+        return should_retry
 
     def reset_delay(self) -> None:
-        """Reset delay to minimum after successful requests."""
-        if self.current_delay > self.min_delay:
-            logger.debug("Resetting rate limit delay to minimum")
-            self.current_delay = self.min_delay
+        """
+        Speed back up after a successful request.
+
+        Adds ``additive_increase`` to the current rate rather than jumping
+        straight back to the maximum, so a recovering API is probed gradually.
+        """
+        with self._lock:
+            if self.current_delay <= self.min_delay:
+                return
+
+            rate = min(self.current_rate + self.additive_increase, 1 / self.min_delay)
+            self.current_delay = max(1.0 / rate, self.min_delay)
+
+        logger.debug(f"Rate limit delay recovered to {self.current_delay:.2f} seconds")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get rate limiter counters for throughput tuning.
+
+        Returns:
+            Dictionary of request, wait, throttle and rate counters
+        """
+        with self._lock:
+            return {
+                "requests": self.requests_count,
+                "waited_requests": self.waited_count,
+                "total_wait_seconds": round(self.total_wait_seconds, 3),
+                "rate_limited": self.rate_limited_count,
+                "timeouts": self.timeout_count,
+                "current_rate": round(self.current_rate, 4),
+                "current_delay": round(self.current_delay, 4),
+            }
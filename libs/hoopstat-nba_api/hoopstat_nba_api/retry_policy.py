@@ -0,0 +1,223 @@
+"""
+Deadline-aware retry budget shared by every NBA API call of a run.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Reasons a policy refuses further requests
+BLOCKED_CIRCUIT_OPEN = "circuit_open"
+BLOCKED_DEADLINE = "deadline"
+
+
+class RetryPolicy:
+    """
+    One retry policy for a whole run instead of retries stacked per layer.
+
+    Every request made through a client holding the policy draws on the same
+    budget:
+
+    - ``max_attempts`` bounds the attempts of a single request
+    - ``max_total_retries`` bounds the retries of all requests together
+    - a deadline, from ``time_budget`` and/or ``remaining_time`` (e.g. a
+      Lambda context's ``get_remaining_time_in_millis``), stops new attempts
+      ``reserve_seconds`` before the run must end, leaving time to store
+      what was fetched
+    - a circuit breaker opens after ``failure_threshold`` consecutive failed
+      attempts and refuses requests for ``cooldown_seconds``; the first
+      request after the cooldown is a probe that closes it on success
+
+    Backoff between retries is exponential with full jitter and never sleeps
+    past the deadline. The policy is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        max_total_retries: int | None = None,
+        backoff_base: float = 1.0,
+        backoff_max: float = 10.0,
+        time_budget: float | None = None,
+        remaining_time: Callable[[], float] | None = None,
+        reserve_seconds: float = 0.0,
+        failure_threshold: int | None = None,
+        cooldown_seconds: float = 60.0,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Attempts per request, including the first
+            max_total_retries: Retries shared by all requests, None for no
+                limit
+            backoff_base: Upper bound of the first retry's jittered delay, in
+                seconds; doubles with every further retry
+            backoff_max: Upper bound of any single delay, in seconds
+            time_budget: Seconds from now after which no attempt is started,
+                None for no limit
+            remaining_time: Callable returning the seconds left before the
+                caller's own deadline, None for no deadline
+            reserve_seconds: Seconds before the deadline kept free of requests
+            failure_threshold: Consecutive failed attempts that open the
+                circuit, None to disable the circuit breaker
+            cooldown_seconds: Seconds the circuit stays open before a probe
+        """
+        self.max_attempts = max_attempts
+        self.max_total_retries = max_total_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.remaining_time = remaining_time
+        self.reserve_seconds = reserve_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+        self._budget_deadline = (
+            time.monotonic() + time_budget if time_budget is not None else None
+        )
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+        # Counters for the run report
+        self.retries_count = 0
+        self.failures_count = 0
+        self.circuit_opened_count = 0
+        self.refused_count = 0
+
+    def time_remaining(self) -> float | None:
+        """
+        Seconds left before no new attempt may start.
+
+        Returns:
+            Remaining seconds (may be negative), or None without a deadline
+        """
+        candidates = []
+        if self._budget_deadline is not None:
+            candidates.append(self._budget_deadline - time.monotonic())
+        if self.remaining_time is not None:
+            candidates.append(self.remaining_time())
+        if not candidates:
+            return None
+        return min(candidates) - self.reserve_seconds
+
+    def blocked_reason(self) -> str | None:
+        """
+        Check whether a request may be started now.
+
+        Returns:
+            None if it may, otherwise ``BLOCKED_CIRCUIT_OPEN`` or
+            ``BLOCKED_DEADLINE``
+        """
+        remaining = self.time_remaining()
+        if remaining is not None and remaining <= 0:
+            return BLOCKED_DEADLINE
+
+        with self._lock:
+            if self._opened_at is not None:
+                if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                    return BLOCKED_CIRCUIT_OPEN
+                # Half-open: let requests probe; one failure reopens it
+                self._opened_at = None
+                self._consecutive_failures = max(
+                    self._consecutive_failures, (self.failure_threshold or 1) - 1
+                )
+        return None
+
+    def acquire(self) -> str | None:
+        """
+        Check whether a request may be started now, counting refusals.
+
+        Returns:
+            None if it may, otherwise the reason it may not
+        """
+        reason = self.blocked_reason()
+        if reason is not None:
+            with self._lock:
+                self.refused_count += 1
+        return reason
+
+    def record_success(self) -> None:
+        """Record a successful attempt, closing the circuit."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed attempt, opening the circuit past the threshold."""
+        with self._lock:
+            self.failures_count += 1
+            self._consecutive_failures += 1
+            if (
+                self.failure_threshold is not None
+                and self._opened_at is None
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self.circuit_opened_count += 1
+                logger.warning(
+                    f"Circuit breaker opened after {self._consecutive_failures} "
+                    f"consecutive failures; pausing requests for "
+                    f"{self.cooldown_seconds:.0f} seconds"
+                )
+
+    def retry_delay(self, attempt: int) -> float | None:
+        """
+        Take one retry from the budget and get how long to back off first.
+
+        Args:
+            attempt: Number of attempts the request has made so far
+
+        Returns:
+            Seconds to sleep before retrying, or None if the request must
+            give up (attempts or budget used up, circuit open, or the delay
+            would run past the deadline)
+        """
+        if attempt >= self.max_attempts or self.blocked_reason() is not None:
+            return None
+
+        delay = random.uniform(
+            0.0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
+        remaining = self.time_remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        with self._lock:
+            if (
+                self.max_total_retries is not None
+                and self.retries_count >= self.max_total_retries
+            ):
+                return None
+            self.retries_count += 1
+        return delay
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get retry counters for the run report.
+
+        Returns:
+            Dictionary of retry, failure, circuit and deadline counters
+        """
+        remaining = self.time_remaining()
+        with self._lock:
+            return {
+                "retries": self.retries_count,
+                "retries_left": (
+                    self.max_total_retries - self.retries_count
+                    if self.max_total_retries is not None
+                    else None
+                ),
+                "failed_attempts": self.failures_count,
+                "circuit_opened": self.circuit_opened_count,
+                "circuit_open": self._opened_at is not None,
+                "refused_requests": self.refused_count,
+                "seconds_remaining": (
+                    round(remaining, 3) if remaining is not None else None
+                ),
+            }
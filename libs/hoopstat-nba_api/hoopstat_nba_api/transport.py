@@ -0,0 +1,165 @@
+"""
+Pooled keep-alive HTTP transport for NBA stats endpoints.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import requests
+from nba_api.stats.library.http import NBAStatsHTTP
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPTransport:
+    """
+    Sends nba_api stats endpoint requests through one pooled session.
+
+    nba_api endpoint classes are only used to build the request: they are
+    instantiated with ``get_request=False`` to obtain the endpoint name and
+    the API parameter mapping, and the request itself goes through a
+    keep-alive ``requests.Session`` with a tuned connection pool.
+
+    ETag/Last-Modified validators from earlier responses are sent back as
+    ``If-None-Match``/``If-Modified-Since``; a 304 reply reuses the already
+    parsed payload instead of downloading and parsing the body again.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        max_cached_validators: int = 256,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            session: Optional pre-configured session to send requests with
+            pool_maxsize: Maximum number of pooled keep-alive connections
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server to send a response
+            max_cached_validators: Number of responses kept for conditional
+                requests; least recently used entries are dropped first
+        """
+        self.session = session or requests.Session()
+        self.session.headers.update(NBAStatsHTTP.headers)
+        # Only advertise encodings requests can always decode
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_cached_validators = max_cached_validators
+
+        self._validators: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.requests_count = 0
+        self.not_modified_count = 0
+
+    @staticmethod
+    def describe(endpoint_class, **kwargs) -> tuple[str, dict[str, Any]]:
+        """
+        Resolve an endpoint class and arguments into the request it describes.
+
+        Returns:
+            Tuple of endpoint name and API parameter mapping
+        """
+        endpoint = endpoint_class(**kwargs, get_request=False)
+        return endpoint.endpoint, endpoint.parameters
+
+    def fetch(self, endpoint_class, **kwargs) -> dict[str, Any]:
+        """
+        Fetch an endpoint and return its parsed JSON.
+
+        Args:
+            endpoint_class: nba_api endpoint class describing the request
+            **kwargs: Parameters to pass to the endpoint
+
+        Returns:
+            Parsed JSON in the same shape as the endpoint's ``get_dict()``.
+            The top-level dict is a fresh copy the caller may annotate.
+
+        Raises:
+            requests.exceptions.HTTPError: For non-2xx/304 responses
+        """
+        endpoint_name, parameters = self.describe(endpoint_class, **kwargs)
+        url = NBAStatsHTTP.base_url.format(endpoint=endpoint_name)
+        # nba_api sorts parameters; some endpoints depend on it
+        params = sorted(parameters.items(), key=lambda kv: kv[0])
+        cache_key = (endpoint_name, tuple(params))
+
+        with self._lock:
+            cached = self._validators.get(cache_key)
+            if cached is not None:
+                self._validators.move_to_end(cache_key)
+
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
+
+        with self._lock:
+            self.requests_count += 1
+
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self.not_modified_count += 1
+            logger.debug(f"{endpoint_name} not modified, reusing cached payload")
+            return dict(cached["data"])
+
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._remember(cache_key, etag, last_modified, data)
+
+        return dict(data)
+
+    def _remember(
+        self,
+        cache_key: tuple,
+        etag: str | None,
+        last_modified: str | None,
+        data: dict[str, Any],
+    ) -> None:
+        """Keep a response's validators and payload for conditional requests."""
+        with self._lock:
+            self._validators[cache_key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "data": data,
+            }
+            self._validators.move_to_end(cache_key)
+            while len(self._validators) > self.max_cached_validators:
+                self._validators.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get transport counters.
+
+        Returns:
+            Dictionary with requests sent and 304 responses received
+        """
+        with self._lock:
+            return {
+                "requests": self.requests_count,
+                "not_modified": self.not_modified_count,
+                "cached_validators": len(self._validators),
+            }
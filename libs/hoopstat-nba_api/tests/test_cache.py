@@ -0,0 +1,212 @@
+"""
+Tests for the persistent response cache.
+"""
+
+import math
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from hoopstat_nba_api.cache import CacheTTLPolicy, ResponseCache
+from hoopstat_nba_api.nba_client import NBAClient
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temporary directory."""
+    response_cache = ResponseCache(tmp_path / "cache" / "nba_api.sqlite")
+    yield response_cache
+    response_cache.close()
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache class."""
+
+    def test_make_key_normalizes_parameters(self):
+        """Test that parameter order and value types don't change the key."""
+        key_a = ResponseCache.make_key(
+            "BoxScoreTraditionalV3", {"GameID": 1, "A": None}
+        )
+        key_b = ResponseCache.make_key(
+            "boxscoretraditionalv3", {"A": "", "GameID": "1"}
+        )
+        key_c = ResponseCache.make_key("boxscoretraditionalv3", {"GameID": "2"})
+
+        assert key_a == key_b
+        assert key_a != key_c
+
+    def test_get_and_set(self, cache):
+        """Test storing and retrieving a response."""
+        key = cache.make_key("leaguegamefinder", {"DateFrom": "01/15/2024"})
+        assert cache.get(key) is None
+
+        cache.set(key, "leaguegamefinder", {"resultSets": [1, 2]}, ttl=60)
+
+        assert cache.get(key) == {"resultSets": [1, 2]}
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_returned_payload_is_a_copy(self, cache):
+        """Test that callers can annotate a hit without changing the cache."""
+        cache.set("k", "endpoint", {"a": 1}, ttl=math.inf)
+
+        first = cache.get("k")
+        first["fetch_date"] = "now"
+
+        assert cache.get("k") == {"a": 1}
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that the cache survives process restarts."""
+        path = tmp_path / "nba_api.sqlite"
+        first = ResponseCache(path)
+        first.set("k", "endpoint", {"a": 1}, ttl=math.inf)
+        first.close()
+
+        second = ResponseCache(path)
+        assert second.get("k") == {"a": 1}
+        second.close()
+
+    def test_expired_entries_are_misses(self, cache):
+        """Test TTL expiry."""
+        with patch("hoopstat_nba_api.cache.time.time", return_value=1000.0):
+            cache.set("k", "endpoint", {"a": 1}, ttl=60)
+
+        with patch("hoopstat_nba_api.cache.time.time", return_value=1059.0):
+            assert cache.get("k") == {"a": 1}
+
+        with patch("hoopstat_nba_api.cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+
+        assert cache.get_stats()["expired"] == 1
+        assert cache.get_stats()["entries"] == 0
+
+    def test_never_expiring_entries(self, cache):
+        """Test that an infinite TTL never expires."""
+        cache.set("k", "endpoint", {"a": 1}, ttl=math.inf)
+
+        with patch("hoopstat_nba_api.cache.time.time", return_value=1e12):
+            assert cache.get("k") == {"a": 1}
+
+    def test_zero_ttl_is_not_cached(self, cache):
+        """Test that a zero TTL disables caching."""
+        cache.set("k", "endpoint", {"a": 1}, ttl=0)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted past the size bound."""
+        payload = {"data": "x" * 50}
+        probe = ResponseCache(tmp_path / "probe.sqlite")
+        probe.set("p", "endpoint", payload, ttl=math.inf)
+        entry_size = probe.get_stats()["size_bytes"]
+        probe.close()
+
+        cache = ResponseCache(tmp_path / "lru.sqlite", max_size_bytes=2 * entry_size)
+        with patch("hoopstat_nba_api.cache.time.time", side_effect=[1.0, 2.0]):
+            cache.set("a", "endpoint", payload, ttl=math.inf)
+            cache.set("b", "endpoint", payload, ttl=math.inf)
+        # Touch "a" so "b" becomes least recently used
+        with patch("hoopstat_nba_api.cache.time.time", return_value=3.0):
+            cache.get("a")
+        with patch("hoopstat_nba_api.cache.time.time", return_value=4.0):
+            cache.set("c", "endpoint", payload, ttl=math.inf)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == payload
+        assert cache.get("c") == payload
+        assert cache.get_stats()["evictions"] == 1
+        cache.close()
+
+    def test_clear(self, cache):
+        """Test removing all entries."""
+        cache.set("k", "endpoint", {"a": 1}, ttl=math.inf)
+        cache.clear()
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestNBAClientCaching:
+    """Test cases for NBAClient integration with ResponseCache."""
+
+    def test_cache_hit_skips_request_and_rate_limiter(self, cache):
+        """Test that a cached box score is served without an API call."""
+        client = NBAClient(cache=cache)
+
+        with patch.object(
+            client, "_make_request", return_value={"boxScoreTraditional": {}}
+        ) as mock_request:
+            client.get_box_score("0022300001")
+            client.get_box_score("0022300001")
+
+        assert mock_request.call_count == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_final_box_scores_never_expire(self, cache):
+        """Test that games reported final by the schedule are cached forever."""
+        policy = CacheTTLPolicy(live_box_score_ttl=60)
+        client = NBAClient(cache=cache, cache_policy=policy)
+        schedule = {
+            "resultSets": [
+                {
+                    "headers": ["GAME_ID", "WL"],
+                    "rowSet": [["0022300001", "W"], ["0022300002", None]],
+                }
+            ]
+        }
+
+        with (
+            patch.object(client, "_make_request") as mock_request,
+            patch.object(cache, "set", wraps=cache.set) as mock_set,
+        ):
+            mock_request.return_value = schedule
+            client.get_games_for_date(date.today() - timedelta(days=1))
+
+            mock_request.return_value = {"boxScoreTraditional": {}}
+            client.get_box_score("0022300001")
+            client.get_box_score("0022300002")
+
+        ttls = [call.args[3] for call in mock_set.call_args_list]
+        assert ttls == [policy.past_schedule_ttl, math.inf, 60]
+
+    def test_refresh_bypasses_cached_box_score(self, cache):
+        """Test that a refresh re-fetches and replaces a cached box score."""
+        client = NBAClient(cache=cache)
+
+        with patch.object(client, "_make_request") as mock_request:
+            mock_request.return_value = {"boxScoreTraditional": {"v": 1}}
+            client.get_box_score("0022300001")
+            mock_request.return_value = {"boxScoreTraditional": {"v": 2}}
+            refreshed = client.get_box_score("0022300001", refresh=True)
+            cached = client.get_box_score("0022300001")
+
+        assert mock_request.call_count == 2
+        assert refreshed["boxScoreTraditional"] == {"v": 2}
+        assert cached["boxScoreTraditional"] == {"v": 2}
+
+    def test_todays_schedule_uses_short_ttl(self, cache):
+        """Test that today's schedule expires quickly."""
+        client = NBAClient(cache=cache)
+
+        with (
+            patch.object(
+                client,
+                "_make_request",
+                return_value={"resultSets": [{"headers": [], "rowSet": []}]},
+            ),
+            patch.object(cache, "set") as mock_set,
+        ):
+            client.get_games_for_date(date.today())
+
+        assert mock_set.call_args.args[3] == client.cache_policy.current_schedule_ttl
+
+    def test_no_cache_configured(self):
+        """Test that requests go straight to the API without a cache."""
+        client = NBAClient()
+
+        with patch.object(client, "_make_request", return_value={}) as mock_request:
+            client.get_box_score("0022300001")
+            client.get_box_score("0022300001")
+
+        assert mock_request.call_count == 2
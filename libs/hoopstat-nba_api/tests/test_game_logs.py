@@ -0,0 +1,139 @@
+"""
+Tests for building box scores from season game logs.
+"""
+
+from hoopstat_nba_api.game_logs import GAME_LOG_SOURCE, box_scores_from_game_logs
+
+CELTICS = 1610612738
+LAKERS = 1610612747
+
+
+def _team_row(team_id, abbreviation, matchup, points, game_id="0022300061"):
+    return {
+        "SEASON_ID": "22023",
+        "TEAM_ID": team_id,
+        "TEAM_ABBREVIATION": abbreviation,
+        "TEAM_NAME": "Full Team Name",
+        "GAME_ID": game_id,
+        "GAME_DATE": "2023-10-25",
+        "MATCHUP": matchup,
+        "WL": "W",
+        "MIN": 240,
+        "FGM": 40,
+        "FGA": 88,
+        "REB": 45,
+        "AST": 25,
+        "PF": 18,
+        "PTS": points,
+    }
+
+
+def _player_row(player_id, name, team_id, points, game_id="0022300061"):
+    return {
+        "PLAYER_ID": player_id,
+        "PLAYER_NAME": name,
+        "TEAM_ID": team_id,
+        "GAME_ID": game_id,
+        "GAME_DATE": "2023-10-25",
+        "MIN": 36,
+        "OREB": 1,
+        "DREB": 7,
+        "PTS": points,
+    }
+
+
+class TestBoxScoresFromGameLogs:
+    """Test cases for box_scores_from_game_logs."""
+
+    def test_builds_v3_box_score_per_game(self):
+        """Test that team and player rows are grouped into one box score."""
+        team_rows = [
+            _team_row(LAKERS, "LAL", "LAL @ BOS", 104),
+            _team_row(CELTICS, "BOS", "BOS vs. LAL", 112),
+        ]
+        player_rows = [
+            _player_row(1628369, "Jayson Tatum", CELTICS, 31),
+            _player_row(2544, "LeBron James", LAKERS, 25),
+        ]
+
+        box_scores = box_scores_from_game_logs(
+            team_rows, player_rows, season="2023-24", fetch_date="now"
+        )
+
+        assert len(box_scores) == 1
+        box_score = box_scores[0]
+        assert box_score["game_id"] == "0022300061"
+        assert box_score["game_date"] == "2023-10-25"
+        assert box_score["season"] == "2023-24"
+        assert box_score["source"] == GAME_LOG_SOURCE
+        assert box_score["fetch_date"] == "now"
+
+        game = box_score["boxScoreTraditional"]
+        assert game["gameId"] == "0022300061"
+        assert game["homeTeamId"] == CELTICS
+        assert game["awayTeamId"] == LAKERS
+
+        home = game["homeTeam"]
+        assert home["teamCity"] == "Boston"
+        assert home["teamName"] == "Celtics"
+        assert home["teamTricode"] == "BOS"
+        assert home["statistics"]["points"] == 112
+        assert home["statistics"]["reboundsTotal"] == 45
+        assert home["statistics"]["foulsPersonal"] == 18
+        assert [p["name"] for p in home["players"]] == ["Jayson Tatum"]
+        assert home["players"][0]["statistics"] == {
+            "minutes": 36,
+            "reboundsOffensive": 1,
+            "reboundsDefensive": 7,
+            "points": 31,
+        }
+        assert game["awayTeam"]["players"][0]["personId"] == 2544
+
+    def test_unknown_team_keeps_log_name(self):
+        """Test that teams missing from static metadata keep the log name."""
+        team_rows = [
+            _team_row(1, "AAA", "AAA vs. BBB", 90),
+            _team_row(2, "BBB", "BBB @ AAA", 80),
+        ]
+
+        game = box_scores_from_game_logs(team_rows, [])[0]["boxScoreTraditional"]
+
+        assert game["homeTeam"]["teamName"] == "Full Team Name"
+        assert game["homeTeam"]["teamCity"] == ""
+
+    def test_non_nba_team_has_string_city(self):
+        """Test that WNBA teams, absent from the NBA team list, get a city."""
+        aces = _team_row(1611661319, "LVA", "LVA vs. SEA", 92, game_id="1022400101")
+        aces["TEAM_CITY"] = "Las Vegas"
+        storm = _team_row(1611661328, "SEA", "SEA @ LVA", 85, game_id="1022400101")
+
+        game = box_scores_from_game_logs([aces, storm], [])[0]["boxScoreTraditional"]
+
+        assert game["homeTeam"]["teamCity"] == "Las Vegas"
+        assert game["awayTeam"]["teamCity"] == ""
+        assert game["awayTeam"]["teamName"] == "Full Team Name"
+
+    def test_drops_games_missing_a_side(self):
+        """Test that a game with a single team row is not emitted."""
+        team_rows = [
+            _team_row(CELTICS, "BOS", "BOS vs. LAL", 112),
+            _team_row(LAKERS, "LAL", "LAL vs. BOS", 104, game_id="0022300062"),
+            _team_row(CELTICS, "BOS", "BOS @ LAL", 99, game_id="0022300062"),
+        ]
+
+        box_scores = box_scores_from_game_logs(team_rows, [])
+
+        assert [b["game_id"] for b in box_scores] == ["0022300062"]
+        assert box_scores[0]["boxScoreTraditional"]["homeTeamId"] == LAKERS
+
+    def test_ignores_players_without_team_row(self):
+        """Test that player rows for unknown games are ignored."""
+        team_rows = [
+            _team_row(LAKERS, "LAL", "LAL @ BOS", 104),
+            _team_row(CELTICS, "BOS", "BOS vs. LAL", 112),
+        ]
+        player_rows = [_player_row(1, "Someone", CELTICS, 10, game_id="0022399999")]
+
+        game = box_scores_from_game_logs(team_rows, player_rows)[0]
+
+        assert game["boxScoreTraditional"]["homeTeam"]["players"] == []
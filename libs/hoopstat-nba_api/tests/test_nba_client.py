@@ -6,9 +6,23 @@ from datetime import date
 from unittest.mock import Mock, patch
 
 import pytest
-
-from hoopstat_nba_api.nba_client import NBAAPIError, NBAClient
+import requests
+
+from hoopstat_nba_api.nba_client import (
+    GAME_STATUS_FINAL,
+    GAME_STATUS_IN_PROGRESS,
+    LEAGUE_IDS,
+    NBAAPIError,
+    NBAClient,
+    RetryBudgetExhaustedError,
+)
 from hoopstat_nba_api.rate_limiter import RateLimiter
+from hoopstat_nba_api.retry_policy import (
+    BLOCKED_CIRCUIT_OPEN,
+    BLOCKED_DEADLINE,
+    RetryPolicy,
+)
+from hoopstat_nba_api.transport import HTTPTransport
 
 
 class TestNBAClient:
@@ -20,58 +34,185 @@ class TestNBAClient:
         assert isinstance(client.rate_limiter, RateLimiter)
         assert client.session is not None
 
+    def test_league_id_is_sent_with_requests(self):
+        """Test that a client queries the league it was created for."""
+        client = NBAClient(league_id=LEAGUE_IDS["wnba"])
+
+        with patch.object(client, "_make_request") as mock_make_request:
+            mock_make_request.return_value = {"resultSets": [{"rowSet": []}]}
+            client.get_games_for_date(date(2024, 6, 1))
+            client.get_season_game_logs("2024")
+
+        assert [
+            c.kwargs.get("league_id_nullable") or c.kwargs.get("league_id")
+            for c in mock_make_request.call_args_list
+        ] == ["10", "10"]
+
     def test_init_with_custom_rate_limiter(self):
         """Test initialization with custom rate limiter."""
         custom_limiter = RateLimiter(min_delay=0.5)
         client = NBAClient(rate_limiter=custom_limiter)
         assert client.rate_limiter is custom_limiter
 
-    @patch("hoopstat_nba_api.nba_client.LeagueGameFinder")
-    def test_make_request_success(self, mock_endpoint):
-        """Test successful API request."""
-        # Mock the endpoint response
-        mock_instance = Mock()
-        mock_instance.get_dict.return_value = {"test": "data"}
-        mock_endpoint.return_value = mock_instance
+    def test_init_uses_transport_session(self):
+        """Test that the client session is the transport's pooled session."""
+        transport = HTTPTransport(pool_maxsize=4)
+        client = NBAClient(transport=transport)
+        assert client.transport is transport
+        assert client.session is transport.session
 
+    def test_make_request_success(self):
+        """Test successful API request."""
         client = NBAClient()
+        mock_endpoint = Mock()
 
-        result = client._make_request(mock_endpoint, test_param="value")
+        with patch.object(
+            client.transport, "fetch", return_value={"test": "data"}
+        ) as mock_fetch:
+            result = client._make_request(mock_endpoint, test_param="value")
 
         assert result == {"test": "data"}
-        mock_endpoint.assert_called_once_with(test_param="value")
-        mock_instance.get_dict.assert_called_once()
+        mock_fetch.assert_called_once_with(mock_endpoint, test_param="value")
 
-    @patch("hoopstat_nba_api.nba_client.LeagueGameFinder")
-    def test_make_request_with_retries(self, mock_endpoint):
+    def test_make_request_with_retries(self):
         """Test API request with retries on failure."""
-        # Mock endpoint that fails then succeeds
-        mock_instance = Mock()
-        mock_instance.get_dict.side_effect = [
-            Exception("First failure"),
-            {"test": "data"},
-        ]
-        mock_endpoint.return_value = mock_instance
-
         client = NBAClient()
 
-        result = client._make_request(mock_endpoint)
+        # Transport that fails then succeeds
+        with patch.object(
+            client.transport,
+            "fetch",
+            side_effect=[Exception("First failure"), {"test": "data"}],
+        ) as mock_fetch:
+            result = client._make_request(Mock())
+
+        assert result == {"test": "data"}
+        assert mock_fetch.call_count == 2
+
+    def test_make_request_timeout_slows_rate_limiter(self):
+        """Test that a timeout backs off the rate limiter before retrying."""
+        limiter = RateLimiter(min_delay=0.01)
+        client = NBAClient(rate_limiter=limiter)
+
+        with patch.object(
+            client.transport,
+            "fetch",
+            side_effect=[
+                requests.exceptions.ReadTimeout("timed out"),
+                {"test": "data"},
+            ],
+        ):
+            result = client._make_request(Mock())
+
+        assert result == {"test": "data"}
+        assert limiter.timeout_count == 1
+        assert limiter.current_delay > 0.01
+
+    def test_make_request_rate_limited_response(self):
+        """Test that a 429 from the transport backs off and retries."""
+        limiter = RateLimiter(min_delay=0.01)
+        client = NBAClient(rate_limiter=limiter)
+
+        response = Mock(status_code=429)
+        error = requests.exceptions.HTTPError("429", response=response)
+
+        with patch.object(
+            client.transport, "fetch", side_effect=[error, {"test": "data"}]
+        ):
+            result = client._make_request(Mock())
 
         assert result == {"test": "data"}
-        assert mock_instance.get_dict.call_count == 2
+        assert limiter.rate_limited_count == 1
 
-    @patch("hoopstat_nba_api.nba_client.LeagueGameFinder")
-    def test_make_request_max_retries_exceeded(self, mock_endpoint):
+    @patch("time.sleep")
+    def test_make_request_max_retries_exceeded(self, mock_sleep):
         """Test API request that exceeds max retries."""
-        # Mock endpoint that always fails
-        mock_instance = Mock()
-        mock_instance.get_dict.side_effect = Exception("Always fails")
-        mock_endpoint.return_value = mock_instance
+        client = NBAClient()
+
+        # Transport that always fails
+        with patch.object(
+            client.transport, "fetch", side_effect=Exception("Always fails")
+        ):
+            with pytest.raises(NBAAPIError):
+                client._make_request(Mock())
 
+    def test_make_request_client_error_is_not_retried(self):
+        """Test that a 4xx other than 429 fails without retrying."""
         client = NBAClient()
 
-        with pytest.raises(NBAAPIError):
-            client._make_request(mock_endpoint)
+        response = Mock(status_code=404)
+        error = requests.exceptions.HTTPError("404", response=response)
+
+        with patch.object(client.transport, "fetch", side_effect=error) as fetch:
+            with pytest.raises(NBAAPIError, match="HTTP error 404"):
+                client._make_request(Mock())
+
+        assert fetch.call_count == 1
+
+    @patch("time.sleep")
+    def test_make_request_server_error_is_retried(self, mock_sleep):
+        """Test that a 5xx is retried like any transient failure."""
+        client = NBAClient()
+
+        response = Mock(status_code=503)
+        error = requests.exceptions.HTTPError("503", response=response)
+
+        with patch.object(
+            client.transport, "fetch", side_effect=[error, {"test": "data"}]
+        ):
+            assert client._make_request(Mock()) == {"test": "data"}
+
+        assert client.retry_policy.retries_count == 1
+
+    @patch("time.sleep")
+    def test_shared_retry_budget_across_clients(self, mock_sleep):
+        """Test that clients sharing a policy share one retry budget."""
+        policy = RetryPolicy(max_total_retries=2)
+        first = NBAClient(retry_policy=policy)
+        second = NBAClient(retry_policy=policy)
+
+        with patch.object(
+            first.transport, "fetch", side_effect=Exception("Always fails")
+        ) as first_fetch:
+            with pytest.raises(NBAAPIError):
+                first._make_request(Mock())
+        with patch.object(
+            second.transport, "fetch", side_effect=Exception("Always fails")
+        ) as second_fetch:
+            with pytest.raises(NBAAPIError):
+                second._make_request(Mock())
+
+        # Three attempts for the first request, then no retries left
+        assert first_fetch.call_count == 3
+        assert second_fetch.call_count == 1
+
+    @patch("time.sleep")
+    def test_open_circuit_stops_calling_the_api(self, mock_sleep):
+        """Test that the circuit breaker refuses requests after failures."""
+        policy = RetryPolicy(failure_threshold=2)
+        client = NBAClient(retry_policy=policy)
+
+        with patch.object(
+            client.transport, "fetch", side_effect=Exception("Down")
+        ) as fetch:
+            with pytest.raises(NBAAPIError):
+                client._make_request(Mock())
+            with pytest.raises(RetryBudgetExhaustedError) as excinfo:
+                client._make_request(Mock())
+
+        assert fetch.call_count == 2
+        assert excinfo.value.reason == BLOCKED_CIRCUIT_OPEN
+
+    def test_deadline_stops_calling_the_api(self):
+        """Test that no request is started past the deadline."""
+        client = NBAClient(retry_policy=RetryPolicy(remaining_time=lambda: 0.0))
+
+        with patch.object(client.transport, "fetch") as fetch:
+            with pytest.raises(RetryBudgetExhaustedError) as excinfo:
+                client._make_request(Mock())
+
+        fetch.assert_not_called()
+        assert excinfo.value.reason == BLOCKED_DEADLINE
 
     @patch.object(NBAClient, "_make_request")
     def test_get_games_for_date(self, mock_make_request):
@@ -163,6 +304,77 @@ class TestNBAClient:
         assert "fetch_date" in box_score
         assert "resultSet" in box_score
 
+    @patch.object(NBAClient, "_make_request")
+    def test_get_scoreboard(self, mock_make_request):
+        """Test fetching a date's scoreboard and remembering final games."""
+        mock_make_request.return_value = {
+            "scoreboard": {
+                "games": [
+                    {"gameId": "0022300001", "gameStatus": GAME_STATUS_FINAL},
+                    {"gameId": "0022300002", "gameStatus": GAME_STATUS_IN_PROGRESS},
+                ]
+            }
+        }
+
+        client = NBAClient()
+        games = client.get_scoreboard(date(2024, 1, 15))
+
+        assert [game["gameId"] for game in games] == ["0022300001", "0022300002"]
+        assert mock_make_request.call_args.kwargs["game_date"] == "2024-01-15"
+        assert client._final_game_ids == {"0022300001"}
+
+    @patch.object(NBAClient, "_make_request")
+    def test_get_scoreboard_error(self, mock_make_request):
+        """Test that scoreboard failures raise NBAAPIError."""
+        mock_make_request.side_effect = Exception("boom")
+
+        with pytest.raises(NBAAPIError):
+            NBAClient().get_scoreboard(date(2024, 1, 15))
+
+    @patch.object(NBAClient, "_make_request")
+    def test_get_season_game_logs(self, mock_make_request):
+        """Test fetching a season's game log rows."""
+        mock_make_request.return_value = {
+            "resultSets": [
+                {
+                    "headers": ["GAME_ID", "TEAM_ID", "PTS"],
+                    "rowSet": [["0022300001", 1, 110], ["0022300001", 2, 99]],
+                }
+            ]
+        }
+
+        client = NBAClient()
+        rows = client.get_season_game_logs("2023-24", "T")
+
+        assert rows == [
+            {"GAME_ID": "0022300001", "TEAM_ID": 1, "PTS": 110},
+            {"GAME_ID": "0022300001", "TEAM_ID": 2, "PTS": 99},
+        ]
+        kwargs = mock_make_request.call_args.kwargs
+        assert kwargs["season"] == "2023-24"
+        assert kwargs["player_or_team_abbreviation"] == "T"
+        assert kwargs["season_type_all_star"] == "Regular Season"
+
+    def test_get_season_box_scores(self):
+        """Test that a season's box scores take two game log requests."""
+        team_rows = [
+            {"GAME_ID": "0022300001", "TEAM_ID": 1, "MATCHUP": "AAA vs. BBB"},
+            {"GAME_ID": "0022300001", "TEAM_ID": 2, "MATCHUP": "BBB @ AAA"},
+        ]
+        player_rows = [{"GAME_ID": "0022300001", "TEAM_ID": 2, "PLAYER_ID": 7}]
+        client = NBAClient()
+
+        with patch.object(
+            client, "get_season_game_logs", side_effect=[team_rows, player_rows]
+        ) as mock_logs:
+            box_scores = client.get_season_box_scores("2023-24", "Playoffs")
+
+        assert mock_logs.call_count == 2
+        mock_logs.assert_any_call("2023-24", "P", "Playoffs")
+        assert len(box_scores) == 1
+        away = box_scores[0]["boxScoreTraditional"]["awayTeam"]
+        assert away["players"][0]["personId"] == 7
+
     @patch.object(NBAClient, "_make_request")
     def test_get_player_info(self, mock_make_request):
         """Test fetching player information."""
@@ -218,3 +430,6 @@ class TestNBAClient:
 
         with pytest.raises(NBAAPIError):
             client.get_league_standings()
+
+        with pytest.raises(NBAAPIError):
+            client.get_season_game_logs("2023-24")
@@ -2,6 +2,7 @@
 Tests for the rate limiter functionality.
 """
 
+import asyncio
 import time
 from unittest.mock import patch
 
@@ -92,8 +93,12 @@ class TestRateLimiter:
         limiter.handle_rate_limit_error()
         assert limiter.current_delay == 2.0
 
-        # Reset delay
+        # Successes recover the rate gradually (additive increase)
         limiter.reset_delay()
+        assert 1.0 < limiter.current_delay < 2.0
+
+        for _ in range(10):
+            limiter.reset_delay()
         assert limiter.current_delay == 1.0
 
     def test_reset_delay_already_at_min(self):
@@ -104,3 +109,98 @@ class TestRateLimiter:
         original_delay = limiter.current_delay
         limiter.reset_delay()
         assert limiter.current_delay == original_delay
+
+    def test_wait_if_needed_shared_across_threads(self):
+        """Test that concurrent callers are spaced by the delay, not bursted."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        limiter = RateLimiter(min_delay=0.05)
+        request_times = []
+
+        def make_request(_):
+            limiter.wait_if_needed()
+            request_times.append(time.time())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(make_request, range(5)))
+
+        request_times.sort()
+        gaps = [b - a for a, b in zip(request_times, request_times[1:], strict=False)]
+        assert len(request_times) == 5
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @patch("time.sleep")
+    def test_burst_allows_back_to_back_requests(self, mock_sleep):
+        """Test that a full bucket lets `burst` requests through without waiting."""
+        limiter = RateLimiter(min_delay=1.0, burst=3)
+
+        with patch("time.time", return_value=limiter._last_refill):
+            for _ in range(3):
+                limiter.wait_if_needed()
+            mock_sleep.assert_not_called()
+
+            # Fourth request has to wait for a refill
+            limiter.wait_if_needed()
+            mock_sleep.assert_called_once()
+            assert abs(mock_sleep.call_args[0][0] - 1.0) < 0.01
+
+    @patch("time.sleep")
+    def test_waiting_callers_reserve_successive_slots(self, mock_sleep):
+        """Test that queued callers are spaced out rather than released together."""
+        limiter = RateLimiter(min_delay=1.0)
+
+        with patch("time.time", return_value=limiter._last_refill):
+            waits = [limiter.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 1.0, 2.0]
+
+    def test_additive_increase_is_configurable(self):
+        """Test that the recovery step can be tuned."""
+        limiter = RateLimiter(min_delay=1.0, additive_increase=0.25)
+
+        limiter.handle_rate_limit_error()
+        assert limiter.current_rate == 0.5
+
+        limiter.reset_delay()
+        assert limiter.current_rate == 0.75
+
+    def test_handle_timeout_slows_down(self):
+        """Test that timeouts back off like rate limit errors."""
+        limiter = RateLimiter(min_delay=1.0, backoff_factor=2.0)
+
+        assert limiter.handle_timeout() is True
+        assert limiter.current_delay == 2.0
+        assert limiter.timeout_count == 1
+        assert limiter.rate_limited_count == 0
+
+    @patch("time.sleep")
+    def test_get_stats(self, mock_sleep):
+        """Test counters exposed for throughput tuning."""
+        limiter = RateLimiter(min_delay=1.0)
+
+        with patch("time.time", return_value=limiter._last_refill):
+            limiter.wait_if_needed()
+            limiter.wait_if_needed()
+        limiter.handle_rate_limit_error()
+
+        stats = limiter.get_stats()
+        assert stats["requests"] == 2
+        assert stats["waited_requests"] == 1
+        assert stats["total_wait_seconds"] == 1.0
+        assert stats["rate_limited"] == 1
+        assert stats["timeouts"] == 0
+        assert stats["current_rate"] == 0.5
+        assert stats["current_delay"] == 2.0
+
+    def test_acquire_async(self):
+        """Test that asyncio callers wait without blocking the event loop."""
+        limiter = RateLimiter(min_delay=0.05)
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+        waits = asyncio.run(run())
+
+        assert waits[0] == 0.0
+        assert sorted(waits)[-1] > 0.05
+        assert limiter.get_stats()["requests"] == 3
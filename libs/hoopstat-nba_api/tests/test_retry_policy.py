@@ -0,0 +1,111 @@
+"""
+Tests for the shared retry policy.
+"""
+
+from unittest.mock import patch
+
+from hoopstat_nba_api.retry_policy import (
+    BLOCKED_CIRCUIT_OPEN,
+    BLOCKED_DEADLINE,
+    RetryPolicy,
+)
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy class."""
+
+    def test_defaults_allow_requests(self):
+        """Test that a default policy never blocks and has no deadline."""
+        policy = RetryPolicy()
+        assert policy.blocked_reason() is None
+        assert policy.time_remaining() is None
+
+    def test_retry_delay_is_jittered_and_bounded(self):
+        """Test full-jitter exponential backoff capped at backoff_max."""
+        policy = RetryPolicy(max_attempts=10, backoff_base=1.0, backoff_max=5.0)
+
+        with patch("hoopstat_nba_api.retry_policy.random.uniform") as uniform:
+            uniform.side_effect = lambda low, high: high
+            delays = [policy.retry_delay(attempt) for attempt in range(1, 6)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+        assert all(c.args[0] == 0.0 for c in uniform.call_args_list)
+
+    def test_max_attempts_per_request(self):
+        """Test that a request gives up after max_attempts."""
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.0)
+        assert policy.retry_delay(1) is not None
+        assert policy.retry_delay(2) is not None
+        assert policy.retry_delay(3) is None
+
+    def test_total_retry_budget_is_shared(self):
+        """Test that all requests draw on one retry budget."""
+        policy = RetryPolicy(max_total_retries=2, backoff_base=0.0)
+
+        assert policy.retry_delay(1) is not None
+        assert policy.retry_delay(1) is not None
+        # A third request's first retry finds the budget spent
+        assert policy.retry_delay(1) is None
+        assert policy.get_stats()["retries_left"] == 0
+
+    def test_deadline_from_remaining_time(self):
+        """Test that the caller's deadline minus the reserve blocks requests."""
+        remaining = [100.0]
+        policy = RetryPolicy(remaining_time=lambda: remaining[0], reserve_seconds=30)
+
+        assert policy.time_remaining() == 70.0
+        assert policy.blocked_reason() is None
+
+        remaining[0] = 25.0
+        assert policy.blocked_reason() == BLOCKED_DEADLINE
+        assert policy.acquire() == BLOCKED_DEADLINE
+        assert policy.get_stats()["refused_requests"] == 1
+
+    def test_time_budget(self):
+        """Test that an exhausted time budget blocks requests."""
+        policy = RetryPolicy(time_budget=0)
+        assert policy.blocked_reason() == BLOCKED_DEADLINE
+
+    def test_backoff_never_sleeps_past_deadline(self):
+        """Test that a delay longer than the time left gives up instead."""
+        policy = RetryPolicy(backoff_base=10.0, remaining_time=lambda: 5.0)
+
+        with patch("hoopstat_nba_api.retry_policy.random.uniform", return_value=6.0):
+            assert policy.retry_delay(1) is None
+        # Giving up does not spend the retry budget
+        assert policy.retries_count == 0
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        """Test that repeated failures stop further requests."""
+        policy = RetryPolicy(failure_threshold=3, cooldown_seconds=60)
+
+        policy.record_failure()
+        policy.record_failure()
+        policy.record_success()
+        policy.record_failure()
+        policy.record_failure()
+        assert policy.blocked_reason() is None
+
+        policy.record_failure()
+        assert policy.blocked_reason() == BLOCKED_CIRCUIT_OPEN
+        assert policy.retry_delay(1) is None
+        assert policy.get_stats()["circuit_opened"] == 1
+
+    def test_circuit_half_opens_after_cooldown(self):
+        """Test that a probe after the cooldown closes or reopens the circuit."""
+        policy = RetryPolicy(failure_threshold=2, cooldown_seconds=60)
+        with patch("hoopstat_nba_api.retry_policy.time.monotonic", return_value=0):
+            policy.record_failure()
+            policy.record_failure()
+
+        with patch("hoopstat_nba_api.retry_policy.time.monotonic", return_value=61):
+            assert policy.blocked_reason() is None
+            # One failed probe reopens it
+            policy.record_failure()
+            assert policy.blocked_reason() == BLOCKED_CIRCUIT_OPEN
+
+        with patch("hoopstat_nba_api.retry_policy.time.monotonic", return_value=122):
+            assert policy.blocked_reason() is None
+            policy.record_success()
+            policy.record_failure()
+            assert policy.blocked_reason() is None
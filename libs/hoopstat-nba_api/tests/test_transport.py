@@ -0,0 +1,125 @@
+"""
+Tests for the pooled HTTP transport.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+from nba_api.stats.endpoints import BoxScoreTraditionalV3, LeagueGameFinder
+
+from hoopstat_nba_api.transport import HTTPTransport
+
+
+def _response(status_code=200, payload=None, headers=None):
+    """Build a mock requests response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            str(status_code), response=response
+        )
+    return response
+
+
+class TestHTTPTransport:
+    """Test cases for HTTPTransport class."""
+
+    def test_init_configures_session(self):
+        """Test pooled adapter, timeouts and stats headers."""
+        transport = HTTPTransport(
+            pool_maxsize=8, connect_timeout=3.0, read_timeout=20.0
+        )
+
+        adapter = transport.session.get_adapter("https://stats.nba.com/stats/x")
+        assert adapter._pool_maxsize == 8
+        assert transport.timeout == (3.0, 20.0)
+        assert transport.session.headers["Host"] == "stats.nba.com"
+        assert transport.session.headers["Accept-Encoding"] == "gzip, deflate"
+
+    def test_fetch_builds_request_from_endpoint_class(self):
+        """Test that endpoint parameters are sent through the session."""
+        transport = HTTPTransport()
+        transport.session.get = Mock(return_value=_response(payload={"a": 1}))
+
+        data = transport.fetch(BoxScoreTraditionalV3, game_id="0022300001")
+
+        assert data == {"a": 1}
+        args, kwargs = transport.session.get.call_args
+        assert args[0] == "https://stats.nba.com/stats/boxscoretraditionalv3"
+        assert ("GameID", "0022300001") in kwargs["params"]
+        assert kwargs["params"] == sorted(kwargs["params"])
+        assert kwargs["headers"] == {}
+        assert kwargs["timeout"] == transport.timeout
+
+    def test_conditional_request_and_not_modified(self):
+        """Test that validators are sent back and a 304 reuses the payload."""
+        transport = HTTPTransport()
+        payload = {"resultSets": [{"rowSet": [[1]]}]}
+        transport.session.get = Mock(
+            side_effect=[
+                _response(
+                    payload=payload,
+                    headers={
+                        "ETag": '"abc"',
+                        "Last-Modified": "Mon, 15 Jan 2024 00:00:00 GMT",
+                    },
+                ),
+                _response(status_code=304),
+            ]
+        )
+
+        first = transport.fetch(LeagueGameFinder, date_from_nullable="01/15/2024")
+        first["fetch_date"] = "annotated by caller"
+        second = transport.fetch(LeagueGameFinder, date_from_nullable="01/15/2024")
+
+        second_headers = transport.session.get.call_args_list[1].kwargs["headers"]
+        assert second_headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 15 Jan 2024 00:00:00 GMT",
+        }
+        # 304 path reuses the parsed payload, unaffected by caller annotations
+        assert second == payload
+        assert transport.get_stats() == {
+            "requests": 2,
+            "not_modified": 1,
+            "cached_validators": 1,
+        }
+
+    def test_validators_are_per_parameter_set(self):
+        """Test that different parameters do not share validators."""
+        transport = HTTPTransport()
+        transport.session.get = Mock(
+            return_value=_response(payload={}, headers={"ETag": '"abc"'})
+        )
+
+        transport.fetch(BoxScoreTraditionalV3, game_id="0022300001")
+        transport.fetch(BoxScoreTraditionalV3, game_id="0022300002")
+
+        assert transport.session.get.call_args.kwargs["headers"] == {}
+
+    def test_validator_cache_is_bounded(self):
+        """Test least recently used validators are evicted."""
+        transport = HTTPTransport(max_cached_validators=2)
+        transport.session.get = Mock(
+            return_value=_response(payload={}, headers={"ETag": '"abc"'})
+        )
+
+        for game_id in ["0022300001", "0022300002", "0022300003"]:
+            transport.fetch(BoxScoreTraditionalV3, game_id=game_id)
+
+        assert transport.get_stats()["cached_validators"] == 2
+        transport.fetch(BoxScoreTraditionalV3, game_id="0022300001")
+        assert transport.session.get.call_args.kwargs["headers"] == {}
+
+    def test_http_error_is_raised(self):
+        """Test that error statuses surface as HTTPError with the response."""
+        transport = HTTPTransport()
+        transport.session.get = Mock(return_value=_response(status_code=429))
+
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            transport.fetch(BoxScoreTraditionalV3, game_id="0022300001")
+
+        assert exc_info.value.response.status_code == 429
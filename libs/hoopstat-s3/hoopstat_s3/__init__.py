@@ -5,9 +5,17 @@ A library for S3 storage and data processing for NBA data.
 Supports both Parquet (for production) and JSON (for MVP) formats.
 """
 
-from .parquet_converter import ParquetConversionError, ParquetConverter
+from .parquet_converter import (
+    ParquetConversionError,
+    ParquetConverter,
+    arrow_schema_from_model,
+)
 from .s3_uploader import S3Uploader, S3UploadError
-from .silver_s3_manager import SilverS3Manager, SilverS3ManagerError
+from .silver_s3_manager import (
+    SilverPartitionConflictError,
+    SilverS3Manager,
+    SilverS3ManagerError,
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -15,6 +23,8 @@ __all__ = [
     "ParquetConversionError",
     "S3Uploader",
     "S3UploadError",
+    "SilverPartitionConflictError",
     "SilverS3Manager",
     "SilverS3ManagerError",
+    "arrow_schema_from_model",
 ]
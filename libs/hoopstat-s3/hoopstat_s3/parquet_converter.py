@@ -3,6 +3,10 @@ JSON to Parquet conversion functionality for NBA data.
 """
 
 import logging
+import types
+import typing
+from datetime import date, datetime
+from enum import Enum
 from io import BytesIO
 from typing import Any
 
@@ -11,6 +15,63 @@ import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# Rows per row group; a day of Silver rows fits in one, a season in a few dozen
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+_ARROW_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    datetime: pa.timestamp("us"),
+    date: pa.date32(),
+}
+
+
+def _arrow_type(annotation: Any) -> tuple[pa.DataType, bool]:
+    """
+    Map a model field annotation to an Arrow type.
+
+    Args:
+        annotation: Field type annotation
+
+    Returns:
+        Tuple of (Arrow type, whether the annotation allows None)
+    """
+    optional = False
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(typing.get_args(annotation))
+        annotation = args[0] if len(args) == 1 else str
+
+    if hasattr(annotation, "model_fields"):
+        return pa.struct(arrow_schema_from_model(annotation)), optional
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return pa.string(), optional
+    # Anything else is stored as text, as _normalize_data does
+    return _ARROW_TYPES.get(annotation, pa.string()), optional
+
+
+def arrow_schema_from_model(model: Any) -> pa.Schema:
+    """
+    Derive an Arrow schema from a pydantic model class.
+
+    Fields keep their declaration order. Required, non-optional fields are
+    declared non-nullable; nested models become struct columns.
+
+    Args:
+        model: Pydantic model class (anything exposing ``model_fields``)
+
+    Returns:
+        Arrow schema for rows dumped from the model
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        arrow_type, optional = _arrow_type(field.annotation)
+        nullable = optional or not field.is_required()
+        fields.append(pa.field(name, arrow_type, nullable=nullable))
+    return pa.schema(fields)
+
 
 class ParquetConversionError(Exception):
     """Custom exception for Parquet conversion errors."""
@@ -155,6 +216,52 @@ class ParquetConverter:
             logger.error(f"Failed to convert JSON to Parquet: {e}")
             raise ParquetConversionError(f"Parquet conversion failed: {e}") from e
 
+    def convert_records(
+        self,
+        records: list[dict[str, Any]],
+        schema: pa.Schema | None = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> bytes:
+        """
+        Convert flat records to Parquet format as bytes.
+
+        Args:
+            records: Records to convert, e.g. dumped Silver models
+            schema: Arrow schema to write; inferred from the records if None
+            row_group_size: Maximum rows per row group
+
+        Returns:
+            Parquet data as bytes
+
+        Raises:
+            ParquetConversionError: If conversion fails
+        """
+        try:
+            table = pa.Table.from_pylist(records, schema=schema)
+
+            buffer = BytesIO()
+            pq.write_table(
+                table,
+                buffer,
+                compression=self.compression,
+                row_group_size=row_group_size,
+                write_statistics=True,
+                use_dictionary=True,
+            )
+
+            parquet_bytes = buffer.getvalue()
+            buffer.close()
+
+            logger.debug(
+                f"Converted {len(records)} records to Parquet "
+                f"({len(parquet_bytes)} bytes)"
+            )
+            return parquet_bytes
+
+        except Exception as e:
+            logger.error(f"Failed to convert records to Parquet: {e}")
+            raise ParquetConversionError(f"Parquet conversion failed: {e}") from e
+
     def convert_games(self, games_data: list[dict[str, Any]]) -> bytes:
         """
         Convert games data to Parquet format.
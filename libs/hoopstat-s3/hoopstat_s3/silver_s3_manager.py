@@ -3,20 +3,39 @@ Silver S3 Manager for reading Bronze and writing Silver JSON data.
 
 This module implements S3 integration that reads Bronze layer JSON data and
 writes transformed Silver layer JSON data following the established partitioning
-strategy from ADR-020 and JSON storage format from ADR-025.
+strategy from ADR-020 and JSON storage format from ADR-025. Silver data can
+also be written as Parquet with a declared schema.
 """
 
+import base64
+import hashlib
 import json
 import logging
 from datetime import date, datetime
+from io import BytesIO
 from typing import Any
 
+import pyarrow.parquet as pq
 from botocore.exceptions import BotoCoreError, ClientError
 
+from .parquet_converter import DEFAULT_ROW_GROUP_SIZE, ParquetConverter
 from .s3_uploader import S3Uploader, S3UploadError
 
 logger = logging.getLogger(__name__)
 
+# Silver output formats and the content type each is stored with
+SILVER_FORMATS = {
+    "json": "application/json",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# File name (without extension) for each Silver entity type
+SILVER_FILE_NAMES = {
+    "player-stats": "players",
+    "team-stats": "teams",
+    "game-stats": "games",
+}
+
 
 class SilverS3ManagerError(Exception):
     """Custom exception for Silver S3 Manager errors."""
@@ -24,6 +43,12 @@ class SilverS3ManagerError(Exception):
     pass
 
 
+class SilverPartitionConflictError(SilverS3ManagerError):
+    """Raised when a Silver partition changed between being read and replaced."""
+
+    pass
+
+
 class SilverS3Manager(S3Uploader):
     """
     Silver S3 Manager for Bronze-to-Silver data processing.
@@ -134,6 +159,7 @@ class SilverS3Manager(S3Uploader):
         data: dict[str, Any],
         target_date: date,
         check_exists: bool = True,
+        league: str | None = None,
     ) -> str:
         """
         Write Silver JSON data to S3 with proper partitioning.
@@ -143,6 +169,7 @@ class SilverS3Manager(S3Uploader):
             data: Silver layer data to write
             target_date: Date for partitioning
             check_exists: Whether to check for existing data (idempotency)
+            league: League segment for non-NBA data (silver/{league}/...)
 
         Returns:
             S3 key where data was written
@@ -150,22 +177,7 @@ class SilverS3Manager(S3Uploader):
         Raises:
             SilverS3ManagerError: If write operation fails
         """
-        date_str = target_date.strftime("%Y-%m-%d")
-
-        # Generate Silver partition path (ADR-032: URL-safe characters only)
-        partition_path = f"silver/{entity_type}/{date_str}/"
-
-        # Determine filename based on entity type
-        if entity_type == "player-stats":
-            filename = "players.json"
-        elif entity_type == "team-stats":
-            filename = "teams.json"
-        elif entity_type == "game-stats":
-            filename = "games.json"
-        else:
-            filename = f"{entity_type}.json"
-
-        s3_key = partition_path + filename
+        s3_key = self._silver_key(entity_type, target_date, "json", league)
 
         # Idempotency check
         if check_exists and self._silver_data_exists(s3_key):
@@ -211,11 +223,237 @@ class SilverS3Manager(S3Uploader):
             )
             raise SilverS3ManagerError(f"Silver data write failed: {e}") from e
 
+    def write_silver_parquet(
+        self,
+        entity_type: str,
+        records: list[dict[str, Any]],
+        target_date: date,
+        check_exists: bool = True,
+        league: str | None = None,
+        schema: Any = None,
+        compression: str = "snappy",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> str:
+        """
+        Write Silver records to S3 as a Parquet file with proper partitioning.
+
+        Args:
+            entity_type: Type of entity (player-stats, team-stats, game-stats)
+            records: Silver layer records to write
+            target_date: Date for partitioning
+            check_exists: Whether to check for existing data (idempotency)
+            league: League segment for non-NBA data (silver/{league}/...)
+            schema: Arrow schema to write; inferred from the records if None
+            compression: Parquet compression codec (snappy, zstd)
+            row_group_size: Maximum rows per row group
+
+        Returns:
+            S3 key where data was written
+
+        Raises:
+            SilverS3ManagerError: If write operation fails
+        """
+        s3_key = self._silver_key(entity_type, target_date, "parquet", league)
+
+        # Idempotency check
+        if check_exists and self._silver_data_exists(s3_key):
+            logger.info(
+                f"Silver data already exists at "
+                f"s3://{self.bucket_name}/{s3_key}, skipping"
+            )
+            return s3_key
+
+        try:
+            parquet_data = ParquetConverter(compression).convert_records(
+                records, schema=schema, row_group_size=row_group_size
+            )
+
+            metadata = {
+                "data_layer": "silver",
+                "entity_type": entity_type,
+                "target_date": target_date.isoformat(),
+                "upload_timestamp": datetime.now().isoformat(),
+                "format": "parquet",
+                "compression": compression,
+                "transformation_stage": "silver",
+                "record_count": str(len(records)),
+            }
+
+            self._upload_to_s3(
+                parquet_data, s3_key, metadata, content_type=SILVER_FORMATS["parquet"]
+            )
+
+            logger.info(
+                f"Successfully wrote Silver data to s3://{self.bucket_name}/{s3_key} "
+                f"({len(parquet_data)} bytes)"
+            )
+
+            return s3_key
+
+        except Exception as e:
+            logger.error(
+                f"Failed to write Silver data to s3://{self.bucket_name}/{s3_key}: {e}"
+            )
+            raise SilverS3ManagerError(f"Silver data write failed: {e}") from e
+
+    def read_silver_partition(
+        self,
+        entity_type: str,
+        target_date: date,
+        output_format: str = "json",
+        league: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Read the records of a Silver partition file.
+
+        Args:
+            entity_type: Type of entity (player-stats, team-stats, game-stats)
+            target_date: Date of the partition
+            output_format: Format the partition is stored in, "json" or "parquet"
+            league: League segment for non-NBA data (silver/{league}/...)
+
+        Returns:
+            Tuple of (records, ETag); ([], None) if the partition does not exist.
+            Pass the ETag to ``replace_silver_partition``.
+
+        Raises:
+            SilverS3ManagerError: If read operation fails
+        """
+        s3_key = self._silver_key(entity_type, target_date, output_format, league)
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            body = response["Body"].read()
+            if output_format == "parquet":
+                records = pq.read_table(BytesIO(body)).to_pylist()
+            else:
+                records = json.loads(body.decode("utf-8"))
+            return records, response["ETag"]
+
+        except self.s3_client.exceptions.NoSuchKey:
+            return [], None
+
+        except Exception as e:
+            logger.error(
+                f"Failed to read Silver data from s3://{self.bucket_name}/{s3_key}: {e}"
+            )
+            raise SilverS3ManagerError(f"Silver data read failed: {e}") from e
+
+    def replace_silver_partition(
+        self,
+        entity_type: str,
+        records: list[dict[str, Any]],
+        target_date: date,
+        etag: str | None,
+        output_format: str = "json",
+        league: str | None = None,
+        schema: Any = None,
+        compression: str = "snappy",
+    ) -> dict[str, Any]:
+        """
+        Atomically replace a Silver partition file with a new set of records.
+
+        The write is conditional on the partition still having the ETag it was
+        read with (or, for ``etag=None``, on it not existing yet), so a
+        concurrent writer's rows are never silently lost. S3 verifies the
+        SHA-256 checksum of the new object before storing it.
+
+        Args:
+            entity_type: Type of entity (player-stats, team-stats, game-stats)
+            records: Complete set of records for the partition
+            target_date: Date of the partition
+            etag: ETag returned by ``read_silver_partition``
+            output_format: Storage format, "json" or "parquet"
+            league: League segment for non-NBA data (silver/{league}/...)
+            schema: Arrow schema for Parquet output
+            compression: Parquet compression codec (snappy, zstd)
+
+        Returns:
+            Dictionary with the S3 key, record count and SHA-256 checksum
+
+        Raises:
+            SilverPartitionConflictError: If the partition changed since it
+                was read
+            SilverS3ManagerError: If write operation fails
+        """
+        if output_format not in SILVER_FORMATS:
+            raise ValueError(f"Unsupported Silver output format: {output_format}")
+
+        s3_key = self._silver_key(entity_type, target_date, output_format, league)
+
+        try:
+            if output_format == "parquet":
+                data = ParquetConverter(compression).convert_records(
+                    records, schema=schema
+                )
+            else:
+                data = json.dumps(
+                    records,
+                    default=str,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ).encode("utf-8")
+            checksum = base64.b64encode(hashlib.sha256(data).digest()).decode("ascii")
+
+            metadata = {
+                "data_layer": "silver",
+                "entity_type": entity_type,
+                "target_date": target_date.isoformat(),
+                "upload_timestamp": datetime.now().isoformat(),
+                "format": output_format,
+                "transformation_stage": "silver",
+                "record_count": str(len(records)),
+            }
+            if output_format == "parquet":
+                metadata["compression"] = compression
+
+            condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=data,
+                ContentType=SILVER_FORMATS[output_format],
+                ChecksumAlgorithm="SHA256",
+                ChecksumSHA256=checksum,
+                Metadata=metadata,
+                **condition,
+            )
+
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ):
+                raise SilverPartitionConflictError(
+                    f"Silver partition s3://{self.bucket_name}/{s3_key} changed "
+                    "while it was being updated"
+                ) from e
+            logger.error(
+                f"Failed to write Silver data to s3://{self.bucket_name}/{s3_key}: {e}"
+            )
+            raise SilverS3ManagerError(f"Silver data write failed: {e}") from e
+
+        except Exception as e:
+            logger.error(
+                f"Failed to write Silver data to s3://{self.bucket_name}/{s3_key}: {e}"
+            )
+            raise SilverS3ManagerError(f"Silver data write failed: {e}") from e
+
+        logger.info(
+            f"Replaced Silver partition s3://{self.bucket_name}/{s3_key} "
+            f"({len(records)} records, {len(data)} bytes)"
+        )
+        return {"key": s3_key, "record_count": len(records), "checksum": checksum}
+
     def write_partitioned_silver_data(
         self,
         silver_data: dict[str, list[dict[str, Any]]],
         target_date: date,
         check_exists: bool = True,
+        league: str | None = None,
+        output_format: str = "json",
+        schemas: dict[str, Any] | None = None,
+        compression: str = "snappy",
     ) -> dict[str, str]:
         """
         Write partitioned Silver data for all entity types.
@@ -225,6 +463,10 @@ class SilverS3Manager(S3Uploader):
                 organized by type
             target_date: Date for partitioning
             check_exists: Whether to check for existing data (idempotency)
+            league: League segment for non-NBA data (silver/{league}/...)
+            output_format: Storage format, "json" or "parquet"
+            schemas: Arrow schema per entity type for Parquet output
+            compression: Parquet compression codec (snappy, zstd)
 
         Returns:
             Dictionary mapping entity_type to S3 key where data was written
@@ -232,14 +474,28 @@ class SilverS3Manager(S3Uploader):
         Raises:
             SilverS3ManagerError: If any write operation fails
         """
+        if output_format not in SILVER_FORMATS:
+            raise ValueError(f"Unsupported Silver output format: {output_format}")
+
         results = {}
 
         for entity_type, data_list in silver_data.items():
             if data_list:  # Only write non-empty data
                 try:
-                    s3_key = self.write_silver_json(
-                        entity_type, data_list, target_date, check_exists
-                    )
+                    if output_format == "parquet":
+                        s3_key = self.write_silver_parquet(
+                            entity_type,
+                            data_list,
+                            target_date,
+                            check_exists,
+                            league,
+                            schema=(schemas or {}).get(entity_type),
+                            compression=compression,
+                        )
+                    else:
+                        s3_key = self.write_silver_json(
+                            entity_type, data_list, target_date, check_exists, league
+                        )
                     results[entity_type] = s3_key
 
                 except Exception as e:
@@ -252,6 +508,35 @@ class SilverS3Manager(S3Uploader):
 
         return results
 
+    def _silver_key(
+        self,
+        entity_type: str,
+        target_date: date,
+        extension: str,
+        league: str | None = None,
+    ) -> str:
+        """
+        Build the Silver S3 key for an entity type, date and file format.
+
+        Args:
+            entity_type: Type of entity (player-stats, team-stats, game-stats)
+            target_date: Date for partitioning
+            extension: File extension of the output format
+            league: League segment for non-NBA data (silver/{league}/...)
+
+        Returns:
+            S3 key for the Silver file
+        """
+        date_str = target_date.strftime("%Y-%m-%d")
+
+        # Generate Silver partition path (ADR-032: URL-safe characters only)
+        partition_path = f"silver/{entity_type}/{date_str}/"
+        if league:
+            partition_path = f"silver/{league}/{entity_type}/{date_str}/"
+
+        filename = SILVER_FILE_NAMES.get(entity_type, entity_type)
+        return f"{partition_path}{filename}.{extension}"
+
     def _silver_data_exists(self, s3_key: str) -> bool:
         """
         Check if Silver data already exists at the given S3 key.
@@ -272,17 +557,22 @@ class SilverS3Manager(S3Uploader):
             return False
 
     def _upload_to_s3(
-        self, data: bytes, s3_key: str, metadata: dict[str, str] | None = None
+        self,
+        data: bytes,
+        s3_key: str,
+        metadata: dict[str, str] | None = None,
+        content_type: str = "application/json",
     ) -> None:
         """
-        Upload JSON data to S3 with error handling.
+        Upload Silver data to S3 with error handling.
 
-        Overrides parent method to set proper content type for JSON.
+        Overrides parent method to set proper content type, JSON by default.
 
         Args:
-            data: JSON data as bytes
+            data: Data as bytes
             s3_key: S3 key for the object
             metadata: Optional metadata for the object
+            content_type: Content type of the object
 
         Raises:
             S3UploadError: If upload fails
@@ -292,8 +582,7 @@ class SilverS3Manager(S3Uploader):
             if metadata:
                 extra_args["Metadata"] = metadata
 
-            # Set content type for JSON files
-            extra_args["ContentType"] = "application/json"
+            extra_args["ContentType"] = content_type
 
             self.s3_client.put_object(
                 Bucket=self.bucket_name, Key=s3_key, Body=data, **extra_args
@@ -315,6 +604,9 @@ class SilverS3Manager(S3Uploader):
         self,
         target_date: date,
         dataset_counts: dict[str, int] | None = None,
+        league: str | None = None,
+        output_format: str = "json",
+        dataset_keys: dict[str, str] | None = None,
     ) -> str:
         """
         Write a silver-ready marker file to signal Gold processing.
@@ -326,6 +618,10 @@ class SilverS3Manager(S3Uploader):
         Args:
             target_date: The date that was successfully processed
             dataset_counts: Optional counts of records written per entity type
+            league: League segment for non-NBA data. Its marker is written
+                under metadata/{league}/, which the NBA Gold trigger ignores.
+            output_format: Format the Silver data was written in
+            dataset_keys: Optional S3 key written per entity type
 
         Returns:
             S3 key where marker was written
@@ -338,13 +634,18 @@ class SilverS3Manager(S3Uploader):
         # ADR-032: Use URL-safe path (no underscores, equals signs)
         # Format: metadata/YYYY-MM-DD/silver-ready.json
         s3_key = f"metadata/{date_str}/silver-ready.json"
+        if league:
+            s3_key = f"metadata/{league}/{date_str}/silver-ready.json"
 
         try:
             # Build marker payload
             marker_data = {
                 "game_date": date_str,
+                **({"league": league} if league else {}),
                 "generated_at": datetime.now().isoformat(),
                 "dataset_counts": dataset_counts or {},
+                "format": output_format,
+                "dataset_keys": dataset_keys or {},
                 "schema_version": "1.0.0",
             }
 
@@ -375,13 +676,19 @@ class SilverS3Manager(S3Uploader):
             )
             raise SilverS3ManagerError(f"Silver-ready marker write failed: {e}") from e
 
-    def read_summary_json(self) -> dict[str, Any] | None:
+    def read_summary_json(
+        self, key: str = "_metadata/summary.json"
+    ) -> dict[str, Any] | None:
         """
         Read the Bronze layer summary.json file from S3.
 
         This method reads the summary metadata file that contains information
         about the last bronze ingestion, including the date that was processed.
 
+        Args:
+            key: Summary key; each non-NBA league has its own under
+                _metadata/leagues/{league}/summary.json
+
         Returns:
             Parsed summary JSON data, or None if the file doesn't exist
 
@@ -389,8 +696,6 @@ class SilverS3Manager(S3Uploader):
             SilverS3ManagerError: If read operation fails for reasons other
                 than file not found
         """
-        key = "_metadata/summary.json"
-
         try:
             response = self.s3_client.get_object(Bucket=self.bronze_bucket, Key=key)
             json_content = response["Body"].read().decode("utf-8")
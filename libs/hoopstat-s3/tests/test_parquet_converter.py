@@ -2,15 +2,19 @@
 Tests for the Parquet converter functionality.
 """
 
+from datetime import datetime
+from enum import StrEnum
 from io import BytesIO
 from unittest.mock import patch
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 
 from hoopstat_s3.parquet_converter import (
     ParquetConversionError,
     ParquetConverter,
+    arrow_schema_from_model,
 )
 
 
@@ -228,3 +232,96 @@ class TestParquetConverter:
             # Instead, let's mock the table creation to fail
             with patch("pyarrow.table", side_effect=Exception("Mock error")):
                 converter.convert_to_parquet_bytes(invalid_data)
+
+
+class TestSilverParquet:
+    """Test cases for typed Parquet output of Silver records."""
+
+    def _models(self):
+        pydantic = pytest.importorskip("pydantic")
+
+        class Mode(StrEnum):
+            STRICT = "strict"
+
+        class Lineage(pydantic.BaseModel):
+            source_system: str
+            ingestion_timestamp: datetime
+            validation_mode: Mode = Mode.STRICT
+
+        class Player(pydantic.BaseModel):
+            lineage: Lineage | None = None
+            player_id: str
+            points: int = pydantic.Field(ge=0)
+            field_goals_made: int | None = None
+            minutes_played: float | None = None
+            starter: bool | None = None
+
+        return Player
+
+    def test_arrow_schema_from_model(self):
+        """Test Arrow types and nullability follow the model fields."""
+        schema = arrow_schema_from_model(self._models())
+
+        assert schema.names == [
+            "lineage",
+            "player_id",
+            "points",
+            "field_goals_made",
+            "minutes_played",
+            "starter",
+        ]
+        assert schema.field("player_id").type == pa.string()
+        assert not schema.field("player_id").nullable
+        assert schema.field("points").type == pa.int64()
+        assert not schema.field("points").nullable
+        assert schema.field("field_goals_made").type == pa.int64()
+        assert schema.field("field_goals_made").nullable
+        assert schema.field("minutes_played").type == pa.float64()
+        assert schema.field("starter").type == pa.bool_()
+
+        lineage = schema.field("lineage").type
+        assert pa.types.is_struct(lineage)
+        assert lineage.field("ingestion_timestamp").type == pa.timestamp("us")
+        assert lineage.field("validation_mode").type == pa.string()
+
+    def test_convert_records_with_schema(self):
+        """Test dumped model rows are written with the declared schema."""
+        player = self._models()
+        schema = arrow_schema_from_model(player)
+        records = [
+            player(
+                lineage={"source_system": "nba", "ingestion_timestamp": datetime.now()},
+                player_id=str(i),
+                points=i,
+            ).model_dump()
+            for i in range(10)
+        ]
+
+        converter = ParquetConverter(compression="zstd")
+        parquet_bytes = converter.convert_records(
+            records, schema=schema, row_group_size=4
+        )
+
+        parquet_file = pq.ParquetFile(BytesIO(parquet_bytes))
+        points = parquet_file.schema.names.index("points")
+        assert parquet_file.schema_arrow == schema
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.metadata.row_group(0).column(points).compression == "ZSTD"
+
+        # Row group statistics allow predicate pushdown on stat columns
+        stats = parquet_file.metadata.row_group(1).column(points).statistics
+        assert (stats.min, stats.max) == (4, 7)
+
+        table = pq.read_table(
+            BytesIO(parquet_bytes),
+            columns=["player_id", "points"],
+            filters=[("points", ">=", 8)],
+        )
+        assert table.column("player_id").to_pylist() == ["8", "9"]
+
+    def test_convert_records_schema_mismatch(self):
+        """Test rows that do not fit the schema raise a conversion error."""
+        schema = pa.schema([pa.field("points", pa.int64(), nullable=False)])
+
+        with pytest.raises(ParquetConversionError):
+            ParquetConverter().convert_records([{"points": "many"}], schema=schema)
@@ -10,7 +10,11 @@ import boto3
 import pytest
 from moto import mock_aws
 
-from hoopstat_s3 import SilverS3Manager, SilverS3ManagerError
+from hoopstat_s3 import (
+    SilverPartitionConflictError,
+    SilverS3Manager,
+    SilverS3ManagerError,
+)
 
 
 class TestSilverS3Manager:
@@ -202,6 +206,137 @@ class TestSilverS3Manager:
             response = s3_client.get_object(Bucket="test-bucket", Key=key)
             assert response is not None
 
+    @mock_aws
+    def test_write_partitioned_silver_data_as_parquet(self):
+        """Test writing partitioned Silver data as typed Parquet files."""
+        import io
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+
+        manager = SilverS3Manager("test-bucket")
+        schema = pa.schema(
+            [
+                pa.field("player_id", pa.string(), nullable=False),
+                pa.field("points", pa.int64(), nullable=False),
+            ]
+        )
+
+        results = manager.write_partitioned_silver_data(
+            {"player_stats": [{"player_id": "123", "points": 25}]},
+            date(2024, 1, 15),
+            check_exists=False,
+            output_format="parquet",
+            schemas={"player_stats": schema},
+            compression="zstd",
+        )
+
+        key = "silver/player_stats/2024-01-15/player_stats.parquet"
+        assert results == {"player_stats": key}
+
+        response = s3_client.get_object(Bucket="test-bucket", Key=key)
+        assert response["ContentType"] == "application/vnd.apache.parquet"
+        assert response["Metadata"]["format"] == "parquet"
+        assert response["Metadata"]["compression"] == "zstd"
+
+        table = pq.read_table(io.BytesIO(response["Body"].read()))
+        assert table.schema == schema
+        assert table.to_pylist() == [{"player_id": "123", "points": 25}]
+
+    def test_write_partitioned_silver_data_unknown_format(self):
+        """Test an unsupported output format is rejected before writing."""
+        with mock_aws():
+            boto3.client("s3", region_name="us-east-1").create_bucket(
+                Bucket="test-bucket"
+            )
+            manager = SilverS3Manager("test-bucket")
+
+            with pytest.raises(ValueError, match="csv"):
+                manager.write_partitioned_silver_data(
+                    {"player_stats": [{"player_id": "1"}]},
+                    date(2024, 1, 15),
+                    output_format="csv",
+                )
+
+    @mock_aws
+    def test_replace_silver_partition(self):
+        """Test a partition is read and replaced with a verified checksum."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+        manager = SilverS3Manager("test-bucket")
+        target_date = date(2024, 1, 15)
+
+        assert manager.read_silver_partition("game_stats", target_date) == ([], None)
+
+        created = manager.replace_silver_partition(
+            "game_stats", [{"game_id": "1"}], target_date, etag=None
+        )
+        records, etag = manager.read_silver_partition("game_stats", target_date)
+        assert records == [{"game_id": "1"}]
+
+        written = manager.replace_silver_partition(
+            "game_stats", [{"game_id": "1"}, {"game_id": "2"}], target_date, etag
+        )
+        assert written["key"] == created["key"]
+        assert written["record_count"] == 2
+
+        head = s3_client.head_object(
+            Bucket="test-bucket", Key=written["key"], ChecksumMode="ENABLED"
+        )
+        assert head["ChecksumSHA256"] == written["checksum"]
+
+    @mock_aws
+    def test_replace_silver_partition_conflict(self):
+        """Test a partition changed since it was read is not overwritten."""
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="test-bucket")
+        manager = SilverS3Manager("test-bucket")
+        target_date = date(2024, 1, 15)
+
+        manager.replace_silver_partition(
+            "game_stats", [{"game_id": "1"}], target_date, etag=None
+        )
+        _, etag = manager.read_silver_partition("game_stats", target_date)
+        manager.replace_silver_partition(
+            "game_stats", [{"game_id": "1"}, {"game_id": "2"}], target_date, etag
+        )
+
+        # A stale ETag, and creating a partition that already exists
+        for stale in (etag, None):
+            with pytest.raises(SilverPartitionConflictError):
+                manager.replace_silver_partition(
+                    "game_stats", [{"game_id": "3"}], target_date, stale
+                )
+
+        records, _ = manager.read_silver_partition("game_stats", target_date)
+        assert records == [{"game_id": "1"}, {"game_id": "2"}]
+
+    @mock_aws
+    def test_replace_silver_partition_as_parquet(self):
+        """Test a Parquet partition round-trips through read and replace."""
+        import pyarrow as pa
+
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="test-bucket")
+        manager = SilverS3Manager("test-bucket")
+        schema = pa.schema([pa.field("game_id", pa.string(), nullable=False)])
+
+        manager.replace_silver_partition(
+            "game_stats",
+            [{"game_id": "1"}],
+            date(2024, 1, 15),
+            etag=None,
+            output_format="parquet",
+            league="wnba",
+            schema=schema,
+        )
+        records, etag = manager.read_silver_partition(
+            "game_stats", date(2024, 1, 15), output_format="parquet", league="wnba"
+        )
+        assert records == [{"game_id": "1"}]
+        assert etag is not None
+
     @mock_aws
     def test_write_partitioned_silver_data_with_empty_lists(self):
         """Test writing partitioned Silver data with some empty lists."""
@@ -692,6 +827,57 @@ class TestSilverS3Manager:
         assert "generated_at" in marker_data
         assert marker_data["schema_version"] == "1.0.0"
         assert marker_data["dataset_counts"] == dataset_counts
+        assert marker_data["format"] == "json"
+
+    @mock_aws
+    def test_write_silver_ready_marker_records_format(self):
+        """Test the marker records the Silver format and the keys written."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+
+        manager = SilverS3Manager("test-bucket")
+        dataset_keys = {
+            "player_stats": "silver/player_stats/2024-01-15/player_stats.parquet"
+        }
+
+        s3_key = manager.write_silver_ready_marker(
+            date(2024, 1, 15),
+            {"player_stats": 1},
+            output_format="parquet",
+            dataset_keys=dataset_keys,
+        )
+
+        response = s3_client.get_object(Bucket="test-bucket", Key=s3_key)
+        marker_data = json.loads(response["Body"].read().decode("utf-8"))
+        assert marker_data["format"] == "parquet"
+        assert marker_data["dataset_keys"] == dataset_keys
+
+    @mock_aws
+    def test_league_writes_use_league_partitions(self):
+        """Test that non-NBA data and markers get their own key segment."""
+        import boto3
+
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+
+        manager = SilverS3Manager("test-bucket")
+        target_date = date(2024, 6, 1)
+
+        keys = manager.write_partitioned_silver_data(
+            {"player-stats": [{"player_id": "1"}]},
+            target_date,
+            check_exists=False,
+            league="wnba",
+        )
+        marker_key = manager.write_silver_ready_marker(target_date, league="wnba")
+
+        assert keys == {
+            "player-stats": "silver/wnba/player-stats/2024-06-01/players.json"
+        }
+        # Gold only matches metadata/<date>/silver-ready.json
+        assert marker_key == "metadata/wnba/2024-06-01/silver-ready.json"
+        response = s3_client.get_object(Bucket="test-bucket", Key=marker_key)
+        assert json.loads(response["Body"].read())["league"] == "wnba"
 
     @mock_aws
     def test_write_silver_ready_marker_without_counts(self):